@@ -0,0 +1,285 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *************************************************
+# |docname| - Convert many source files in parallel
+# *************************************************
+# The ``CodeChat-convert`` command converts a tree of source files to reST, Markdown, or PreTeXt, placing each output file next to its source file (for example, ``foo.py`` produces ``foo.py.rst``). It spreads this work over a pool of processes, skips source files whose output is already up to date, and reports the time taken to convert each file as it finishes. For example:
+#
+# .. code-block:: console
+#
+#   $ CodeChat-convert --format markdown src "docs/**/*.c"
+#
+# Run ``CodeChat-convert --help`` for a list of its options.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import glob
+import os
+import sys
+import time
+
+# Third-party imports
+# -------------------
+# None.
+
+# Local application imports
+# -------------------------
+from .CodeToMarkdown import code_to_markdown_file
+from .CodeToPretext import code_to_pretext_file
+from .CodeToRest import code_to_rest_file
+from .CommentDelimiterInfo import GlobMatcher, get_supported_globs
+from .ConversionCache import ConversionCache
+from .SourceClassifier import _get_filename_index, _unambiguous_lexer_class, get_lexer
+
+# Finding source files
+# ====================
+# For each output format, give the function which converts a file to this format and the extension it adds to the name of the source file.
+_CONVERTERS = {
+    "rest": (code_to_rest_file, ".rst"),
+    "markdown": (code_to_markdown_file, ".md"),
+    "pretext": (code_to_pretext_file, ".ptx"),
+}
+
+
+# Return a sorted list of the source files named by ``paths``, without duplicates. Each path may be a file, a directory (which is searched recursively for files matching the supported globs, skipping hidden directories such as ``.git``), or a glob pattern (``**`` matches any number of directories).
+def find_source_files(
+    # An iterable of paths, each a string.
+    paths,
+    # See `use_snapshot <get_supported_globs>`.
+    use_snapshot=False,
+):
+    source_files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                source_files.update(
+                    os.path.join(dirpath, filename)
+                    for filename in filenames
+                    if _is_supported(filename, use_snapshot)
+                )
+        elif os.path.isfile(path):
+            # Convert a file named explicitly, even if it doesn't match a glob; the lexer may still recognize it.
+            source_files.add(path)
+        else:
+            source_files.update(
+                match
+                for match in glob.glob(path, recursive=True)
+                if os.path.isfile(match)
+            )
+    return sorted(source_files)
+
+
+# A `GlobMatcher` for the `supported globs <get_supported_globs>`, keyed by ``use_snapshot``, created when it's first needed.
+_supported_globs_matchers = {}
+
+
+# Return True if ``filename`` matches one of the supported globs.
+def _is_supported(filename, use_snapshot):
+    if use_snapshot not in _supported_globs_matchers:
+        _supported_globs_matchers[use_snapshot] = GlobMatcher(
+            get_supported_globs(use_snapshot)
+        )
+    return _supported_globs_matchers[use_snapshot].match(filename)
+
+
+# Return True if the output file produced from ``source_path`` exists and is newer than ``source_path``.
+def _is_up_to_date(source_path, output_path):
+    try:
+        return os.path.getmtime(output_path) >= os.path.getmtime(source_path)
+    except OSError:
+        return False
+
+
+# Converting files
+# ================
+# Each worker process keeps a `ConversionCache` (if requested) for all the files it converts.
+_worker_cache = None
+
+
+# Return a list containing one of ``source_files`` for each lexer needed to convert them, for those files whose lexer can be determined from the filename alone. Passing this short list to each worker lets it create these lexers before converting any file.
+def _lexer_filenames(source_files):
+    filenames = {}
+    for source_path in source_files:
+        lexer_class = _unambiguous_lexer_class(source_path)
+        if lexer_class:
+            filenames.setdefault(lexer_class, source_path)
+    return list(filenames.values())
+
+
+# Initialize a worker process. Converting the first file in a worker process would otherwise pay the cost of building the index of lexers by filename, so do this now (unless the worker inherited this index from its parent process). Likewise, Pygments compiles the regular expressions for a lexer class when it creates the first instance of that class; since `get_lexer` caches the lexers it creates, create the lexers named by ``lexer_filenames`` now, so that each conversion reuses an already-compiled lexer. These are created in the worker, rather than in the parent process, since only a forked worker inherits its parent's lexers; a worker started using ``spawn`` (the default on Windows and macOS) doesn't.
+def _init_worker(
+    # The directory containing a `ConversionCache`, or None to not use one.
+    cache_dir,
+    # A list of filenames produced by ``_lexer_filenames``.
+    lexer_filenames,
+):
+    global _worker_cache
+    _get_filename_index()
+    for filename in lexer_filenames:
+        # The code isn't used, since the filename determines the lexer.
+        get_lexer(filename=filename, code="\n")
+    _worker_cache = None if cache_dir is None else ConversionCache(cache_dir)
+
+
+# Convert one file, returning a tuple of ``(source_path, seconds, error)``, where ``error`` is None on success or a string describing the failure. Since `get_lexer` caches the lexers it creates, files converted by the same worker process share lexers.
+def _convert_file(
+    # The path to the source file.
+    source_path,
+    # A key of ``_CONVERTERS``.
+    output_format,
+    # See `docstrings <docstrings>`.
+    docstrings,
+):
+    converter, suffix = _CONVERTERS[output_format]
+    start = time.perf_counter()
+    try:
+        converter(
+            source_path,
+            source_path + suffix,
+            docstrings=docstrings,
+            cache=_worker_cache,
+        )
+        error = None
+    except Exception as e:
+        error = "{}: {}".format(type(e).__name__, e)
+    return source_path, time.perf_counter() - start, error
+
+
+# Command-line interface
+# ======================
+def main(
+    # The command-line arguments; if None, use ``sys.argv``.
+    args=None,
+):
+    parser = argparse.ArgumentParser(
+        prog="CodeChat-convert",
+        description="Convert source files to reST, Markdown, or PreTeXt in parallel.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Source files, directories to search for supported source files, or glob patterns.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=_CONVERTERS,
+        default="rest",
+        help="The output format (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        # ``os.cpu_count`` returns None if the number of CPUs can't be determined.
+        default=os.cpu_count() or 1,
+        help="The number of worker processes (default: the number of CPUs).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert all files, even those whose output is newer than the source file.",
+    )
+    parser.add_argument(
+        "--no-docstrings",
+        dest="docstrings",
+        action="store_false",
+        help="Leave Python docstrings as code.",
+    )
+    parser.add_argument(
+        "--cache-dir", help="Store converted files in a cache in this directory."
+    )
+    parser.add_argument(
+        "--use-snapshot",
+        action="store_true",
+        help="Find source files using the snapshot of supported globs shipped with CodeChat, which is faster but omits lexers provided by plugins.",
+    )
+    args = parser.parse_args(args)
+
+    suffix = _CONVERTERS[args.format][1]
+    source_files = find_source_files(args.paths, args.use_snapshot)
+    to_convert = [
+        source_path
+        for source_path in source_files
+        if args.force or not _is_up_to_date(source_path, source_path + suffix)
+    ]
+    print(
+        "Converting {} of {} files.".format(len(to_convert), len(source_files)),
+        flush=True,
+    )
+
+    start = time.perf_counter()
+    lexer_filenames = _lexer_filenames(to_convert)
+    # Run in this process when there's only one job, which avoids the cost of starting a pool.
+    if args.jobs <= 1:
+        _init_worker(args.cache_dir, lexer_filenames)
+        failures = _report(
+            _convert_file(source_path, args.format, args.docstrings)
+            for source_path in to_convert
+        )
+    else:
+        with ProcessPoolExecutor(
+            args.jobs,
+            initializer=_init_worker,
+            initargs=(args.cache_dir, lexer_filenames),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _convert_file, source_path, args.format, args.docstrings
+                )
+                for source_path in to_convert
+            ]
+            # Report each file as soon as it's converted, rather than in the order the files were submitted; otherwise, one slow file delays the report of every file after it.
+            failures = _report(future.result() for future in as_completed(futures))
+    print(
+        "Converted {} files in {:.2f} s; {} failed.".format(
+            len(to_convert), time.perf_counter() - start, failures
+        )
+    )
+    return 1 if failures else 0
+
+
+# Print the time taken to convert each file as its result arrives, returning the number of files which failed to convert.
+def _report(
+    # An iterable of results from ``_convert_file``.
+    results,
+):
+    failures = 0
+    for source_path, seconds, error in results:
+        if error:
+            failures += 1
+            print(
+                "{:9.1f} ms  {}  FAILED: {}".format(seconds * 1000, source_path, error),
+                flush=True,
+            )
+        else:
+            print("{:9.1f} ms  {}".format(seconds * 1000, source_path), flush=True)
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -42,7 +42,7 @@
 #
 # Standard library
 # ----------------
-from io import StringIO
+# None.
 
 # Third-party imports
 # -------------------
@@ -50,7 +50,14 @@ from io import StringIO
 
 # Local application imports
 # -------------------------
-from .SourceClassifier import source_lexer, get_lexer, _debug_print, codechat_style
+from .SourceClassifier import (
+    source_lexer,
+    get_lexer,
+    _debug_print,
+    codechat_style,
+    _profile_output,
+    _write_file,
+)
 
 
 # API
@@ -66,20 +73,52 @@ from .SourceClassifier import source_lexer, get_lexer, _debug_print, codechat_st
 def code_to_markdown_string(
     # _`code_str`: the code to translate to markdown.
     code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See `cache <cache>`.
+    cache=None,
     # See `options <options>`.
     **options
 ):
-    # Use a StringIO to capture writes into a string.
-    output_md = StringIO()
+    lexer = get_lexer(code=code_str, **options)
+    if cache is None:
+        return _code_to_markdown(code_str, lexer, docstrings)
+    return cache.convert("markdown", code_str, lexer, docstrings, _code_to_markdown)
+
+
+# Convert code to Markdown using the given lexer; see `code_to_markdown_string`_.
+def _code_to_markdown(code_str, lexer, docstrings):
+    return "".join(_iter_markdown(code_str, lexer, docstrings))
+
+
+# .. _iter_markdown:
+#
+# iter_markdown
+# -------------
+# Like `code_to_markdown_string`_, but yield the Markdown in pieces as it's produced, instead of returning it as one string. This avoids holding the entire Markdown in memory.
+def iter_markdown(
+    # See code_str_.
+    code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See `cache <cache>`. Since the cache stores complete outputs, this yields the Markdown as one piece when a cache is used.
+    cache=None,
+    # See `options <options>`.
+    **options
+):
+    if cache is None:
+        return _iter_markdown(code_str, get_lexer(code=code_str, **options), docstrings)
+    return iter([code_to_markdown_string(code_str, docstrings, cache, **options)])
+
+
+# Yield the Markdown produced from code using the given lexer; see `iter_markdown`_.
+def _iter_markdown(code_str, lexer, docstrings):
     # Include a header containing some `CodeChat style`.
-    output_md.write(codechat_style + "\n\n")
-    ast_syntax_error, classified_lines = source_lexer(
-        code_str, get_lexer(code=code_str, **options)
-    )
+    yield codechat_style + "\n\n"
+    ast_syntax_error, classified_lines = source_lexer(code_str, lexer, docstrings)
     if ast_syntax_error:
-        output_md.write("# Error\n{}\n".format(ast_syntax_error))
-    _generate_markdown(classified_lines, output_md)
-    return output_md.getvalue()
+        yield "# Error\n{}\n".format(ast_syntax_error)
+    yield from _profile_output(classified_lines, _generate_markdown(classified_lines))
 
 
 # .. _code_to_markdown_file:
@@ -114,9 +153,8 @@ def code_to_markdown_file(
         code_str = fi.read()
     # If not already present, provide the filename of the source to help in identifying a lexer.
     options.setdefault("filename", source_path)
-    rst = code_to_markdown_string(code_str, **options)
-    with open(md_path, "w", encoding=output_encoding) as fo:
-        fo.write(rst)
+    # Write the Markdown as it's produced, rather than first gathering all of it into a string.
+    _write_file(md_path, iter_markdown(code_str, **options), output_encoding)
 
 
 # Converting classified code to markdown
@@ -127,17 +165,13 @@ _fence = "`" * 100
 
 # _generate_markdown
 # ------------------
-# Generate markdown from the classified code. To do this, create a state machine,
+# Generate markdown from the classified code, yielding it in pieces. To do this, create a state machine,
 # where current_type defines the state. When the state changes, exit the
 # previous state (output a closing fence or closing ``</div>``, then enter the
 # new state (output a fenced code block or an opening ``<div style=...>``.
 def _generate_markdown(
     # An iterable of (type, string) pairs, one per line.
     classified_lines,
-    # .. _out_file:
-    #
-    # A file-like output to which the markdown text is written.
-    out_file,
 ):
     # Keep track of the current type. Begin with neither comment nor code.
     current_type = -2
@@ -153,48 +187,44 @@ def _generate_markdown(
         # See if there's a change in state.
         if current_type != type_:
             # Exit the current state.
-            _exit_state(current_type, out_file)
+            yield _exit_state(current_type)
 
             # Enter the new state.
             #
             # Code state: emit the beginning of a fenced block.
             if type_ == -1:
-                out_file.write(_fence + "\n")
+                yield _fence + "\n"
             # Comment state: emit an opening indent for non-zero indents.
             else:
                 # Add an indent if needed.
                 if type_ > 0:
-                    out_file.write(
-                        '\n<div class="CodeChat-indent" style="margin-left:{}em;">\n\n'.format(
-                            0.5 * type_
-                        )
+                    yield '\n<div class="CodeChat-indent" style="margin-left:{}em;">\n\n'.format(
+                        0.5 * type_
                     )
 
-        out_file.write(string)
+        yield string
 
         # Update the state.
         current_type = type_
         line += 1
 
     # When done, exit the last state.
-    _exit_state(current_type, out_file)
+    yield _exit_state(current_type)
 
 
 # _exit_state
 # -----------
-# Output text produced when exiting a state. Supports `_generate_markdown`_.
+# Return the text produced when exiting a state. Supports `_generate_markdown`_.
 def _exit_state(
     # The type (classification) of the last line.
     type_,
-    # See out_file_.
-    out_file,
 ):
     # Code state: emit an ending fence.
     if type_ == -1:
-        out_file.write(_fence + "\n")
+        return _fence + "\n"
     # Comment state: emit a closing indent.
     elif type_ > 0:
-        out_file.write("\n</div>\n\n")
+        return "\n</div>\n\n"
     # Initial state or non-indented comment. Nothing needed.
     else:
-        pass
+        return ""
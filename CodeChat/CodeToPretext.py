@@ -30,7 +30,6 @@
 # Standard library
 # ----------------
 import html
-from io import StringIO
 import re
 
 # Third-party imports
@@ -39,7 +38,13 @@ import re
 
 # Local application imports
 # -------------------------
-from .SourceClassifier import source_lexer, get_lexer, _debug_print
+from .SourceClassifier import (
+    source_lexer,
+    get_lexer,
+    _debug_print,
+    _profile_output,
+    _write_file,
+)
 
 
 # API
@@ -55,23 +60,53 @@ from .SourceClassifier import source_lexer, get_lexer, _debug_print
 def code_to_pretext_string(
     # _`code_str`: the code to translate to PreTeXt.
     code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See `cache <cache>`.
+    cache=None,
     # See `options <options>`.
     **options,
 ):
-    # Use a StringIO to capture writes into a string.
-    output_ptx = StringIO()
-    ast_syntax_error, classified_lines = source_lexer(
-        code_str, get_lexer(code=code_str, **options)
-    )
+    lexer = get_lexer(code=code_str, **options)
+    if cache is None:
+        return _code_to_pretext(code_str, lexer, docstrings)
+    return cache.convert("pretext", code_str, lexer, docstrings, _code_to_pretext)
+
+
+# Convert code to PreTeXt using the given lexer; see `code_to_pretext_string`_.
+def _code_to_pretext(code_str, lexer, docstrings):
+    return "".join(_iter_pretext(code_str, lexer, docstrings))
+
+
+# .. _iter_pretext:
+#
+# iter_pretext
+# ------------
+# Like `code_to_pretext_string`_, but yield the PreTeXt in pieces as it's produced, instead of returning it as one string. This avoids holding the entire PreTeXt in memory.
+def iter_pretext(
+    # See code_str_.
+    code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See `cache <cache>`. Since the cache stores complete outputs, this yields the PreTeXt as one piece when a cache is used.
+    cache=None,
+    # See `options <options>`.
+    **options,
+):
+    if cache is None:
+        return _iter_pretext(code_str, get_lexer(code=code_str, **options), docstrings)
+    return iter([code_to_pretext_string(code_str, docstrings, cache, **options)])
+
+
+# Yield the PreTeXt produced from code using the given lexer; see `iter_pretext`_.
+def _iter_pretext(code_str, lexer, docstrings):
+    ast_syntax_error, classified_lines = source_lexer(code_str, lexer, docstrings)
     # Remove the newline from a syntax error, so that source line numbers match exactly with the lines output by this function.
     if ast_syntax_error:
-        output_ptx.write(
-            f"<warning>CodeChat parse error: {html.escape(ast_syntax_error, False)[:-1]}</warning>"
-        )
-    output_ptx.write("<program><input>")
-    _generate_pretext(classified_lines, output_ptx)
-    output_ptx.write("</input></program>")
-    return output_ptx.getvalue()
+        yield f"<warning>CodeChat parse error: {html.escape(ast_syntax_error, False)[:-1]}</warning>"
+    yield "<program><input>"
+    yield from _profile_output(classified_lines, _generate_pretext(classified_lines))
+    yield "</input></program>"
 
 
 # .. _code_to_pretext_file:
@@ -106,9 +141,8 @@ def code_to_pretext_file(
         code_str = fi.read()
     # If not already present, provide the filename of the source to help in identifying a lexer.
     options.setdefault("filename", source_path)
-    rst = code_to_pretext_string(code_str, **options)
-    with open(pt_path, "w", encoding=output_encoding) as fo:
-        fo.write(rst)
+    # Write the PreTeXt as it's produced, rather than first gathering all of it into a string.
+    _write_file(pt_path, iter_pretext(code_str, **options), output_encoding)
 
 
 # Converting classified code to PreTeXt
@@ -116,30 +150,30 @@ def code_to_pretext_file(
 # A regex to match part of an opening XML tag in a comment context, allowing for leading whitespace. At this time, a comment must always begin with a ``<p>`` tag and end with a closing ``</p>`` tag.
 xml_partial_opening_tag_regex = re.compile(r"^\s*<p\s*>")
 xml_closing_tag_regex = re.compile(r"</p\s*>\s*$")
+# These regexes are checked on each change of state, so look up their search methods once.
+_xml_partial_opening_tag_search = xml_partial_opening_tag_regex.search
+_xml_closing_tag_search = xml_closing_tag_regex.search
 
 
 # _generate_pretext
 # -----------------
-# Generate PreTeXt from the classified code. To do this, create a state machine, where current_type defines the state. When the state changes, exit the previous state, then enter the new state.
+# Generate PreTeXt from the classified code, yielding it in pieces. To do this, create a state machine, where current_type defines the state. When the state changes, exit the previous state, then enter the new state.
+#
+# Exiting a comment may add a closing ``</p>`` to the end of its last line, so the output for each line is held until the following line (or the end of the code) shows whether it's the last line of a comment. This one line of lookahead keeps the output forward-only, so it can be written to any text sink.
 def _generate_pretext(
     # An iterable of (type, string) pairs, one per line.
     classified_lines,
-    # .. _out_file:
-    #
-    # A file-like output to which the pretext source is written.
-    out_file,
 ):
-    # Determine the number of characters produced when a newline is written.
-    newline_chars = out_file.write("\n")
-    # Undo this write.
-    out_file.seek(out_file.tell() - newline_chars, 0)
-
     # Keep track of the current type. Begin with neither comment nor code.
     current_type = -2
 
     # Keep track of the current line number.
     line = 1
 
+    # The previous line from the program, and the output produced for it, which hasn't been yielded yet.
+    last_string = ""
+    last_output = ""
+
     for type_, string in classified_lines:
         _debug_print(
             "type_ = {}, line = {}, string = {}\n".format(type_, line, [string])
@@ -148,7 +182,7 @@ def _generate_pretext(
         # See if there's a change in state.
         if current_type != type_:
             # Exit the current state.
-            _exit_state(current_type, string, out_file, newline_chars)
+            last_output = _exit_state(current_type, last_string, last_output)
 
             # Enter the new state.
             #
@@ -159,11 +193,13 @@ def _generate_pretext(
             # Comment state:
             else:
                 # Add an opening ``<p>`` if there's no XML tag at the beginning of this string.
-                if not re.search(xml_partial_opening_tag_regex, string):
+                if not _xml_partial_opening_tag_search(string):
                     string = "<p>" + string
 
+        yield last_output
+        last_string = string
         # Escape characters in code; pass comments through with appropriate leading whitespace.
-        out_file.write(
+        last_output = (
             html.escape(string, False) if type_ == -1 else " " * type_ + string
         )
 
@@ -172,31 +208,31 @@ def _generate_pretext(
         line += 1
 
     # When done, exit the last state.
-    _exit_state(current_type, string, out_file, newline_chars)
+    yield _exit_state(current_type, last_string, last_output)
 
 
 # _exit_state
 # -----------
-# Output text produced when exiting a state. Supports `_generate_pretext`_.
+# Return the output for the last line of a state, adding any text produced when exiting this state. Supports `_generate_pretext`_.
 def _exit_state(
     # The type (classification) of the last line.
     type_,
-    # One line from the program being translated.
+    # The last line of the state, from the program being translated.
     string,
-    # See out_file_.
-    out_file,
-    # The number of character written by a newline.
-    newline_chars,
+    # The output produced for this line.
+    output,
 ):
     # Code state: do nothing.
     if type_ == -1:
-        pass
+        return output
     # Comment state: emit a closing ``</p>`` tag if it wasn't provided.
     elif type_ >= 0:
-        if not re.search(xml_closing_tag_regex, string):
-            # Append it to the end of the string by backing up one character (the existing newline at the end of the current line).
-            out_file.seek(out_file.tell() - newline_chars, 0)
-            out_file.write("</p>\n")
+        if not _xml_closing_tag_search(string):
+            # Place it before the newline at the end of the line.
+            if output.endswith("\n"):
+                output = output[:-1]
+            return output + "</p>\n"
+        return output
     # Initial state. Nothing needed.
     else:
-        pass
+        return output
@@ -32,9 +32,10 @@
 #
 # Standard library
 # ----------------
+import copy
+from functools import lru_cache
 import html
 import importlib.resources
-from io import StringIO
 from pathlib import Path
 import re
 
@@ -49,7 +50,14 @@ from docutils import statemachine, utils
 
 # Local application imports
 # -------------------------
-from .SourceClassifier import source_lexer, get_lexer, _debug_print, codechat_style
+from .SourceClassifier import (
+    source_lexer,
+    get_lexer,
+    _debug_print,
+    codechat_style,
+    _profile_output,
+    _write_file,
+)
 
 
 # API
@@ -66,22 +74,57 @@ from .SourceClassifier import source_lexer, get_lexer, _debug_print, codechat_st
 def code_to_rest_string(
     # _`code_str`: the code to translate to reST.
     code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # _`cache`: A `ConversionCache` which stores the output of this function, so that converting the same code again reads this output from the cache; None disables caching.
+    cache=None,
     # See `options <options>`.
     **options,
 ):
     lexer = get_lexer(code=code_str, **options)
     if not lexer:
         raise ValueError("Unable to determine a lexer for this string.")
+    if cache is None:
+        return _code_to_rest(code_str, lexer, docstrings)
+    return cache.convert("rest", code_str, lexer, docstrings, _code_to_rest)
 
-    # Use a StringIO to capture writes into a string.
-    output_rst = StringIO()
+
+# Convert code to reST using the given lexer; see `code_to_rest_string`_.
+def _code_to_rest(code_str, lexer, docstrings):
+    return "".join(_iter_rest(code_str, lexer, docstrings))
+
+
+# .. _iter_rest:
+#
+# iter_rest
+# ---------
+# Like code_to_rest_string_, but yield the reST in pieces as it's produced, instead of returning it as one string. This avoids holding the entire reST in memory.
+def iter_rest(
+    # See code_str_.
+    code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See cache_. Since the cache stores complete outputs, this yields the reST as one piece when a cache is used.
+    cache=None,
+    # See `options <options>`.
+    **options,
+):
+    if cache is None:
+        lexer = get_lexer(code=code_str, **options)
+        if not lexer:
+            raise ValueError("Unable to determine a lexer for this string.")
+        return _iter_rest(code_str, lexer, docstrings)
+    return iter([code_to_rest_string(code_str, docstrings, cache, **options)])
+
+
+# Yield the reST produced from code using the given lexer; see iter_rest_.
+def _iter_rest(code_str, lexer, docstrings):
     # Include a header containing some `CodeChat style`. Don't put this in a separate ``.js`` file, since docutils doesn't have an easy way to include it.
-    output_rst.write(rest_codechat_style)
-    ast_syntax_error, classified_lines = source_lexer(code_str, lexer)
+    yield rest_codechat_style
+    ast_syntax_error, classified_lines = source_lexer(code_str, lexer, docstrings)
     if ast_syntax_error:
-        output_rst.write(".. error:: {}\n\n".format(ast_syntax_error))
-    _generate_rest(classified_lines, output_rst)
-    return output_rst.getvalue()
+        yield ".. error:: {}\n\n".format(ast_syntax_error)
+    yield from _profile_output(classified_lines, _generate_rest(classified_lines))
 
 
 # .. _code_to_rest_file:
@@ -114,15 +157,13 @@ def code_to_rest_file(
         rst_path = source_path + ".rst"
     # Use docutil's I/O classes to better handle and sniff encodings.
     #
-    # Note: both these classes automatically close themselves after a
-    # read or write.
+    # Note: this class automatically closes itself after a read.
     fi = io.FileInput(source_path=source_path, encoding=input_encoding)
-    fo = io.FileOutput(destination_path=rst_path, encoding=output_encoding)
     code_str = fi.read()
     # If not already present, provide the filename of the source to help in identifying a lexer.
     options.setdefault("filename", source_path)
-    rst = code_to_rest_string(code_str, **options)
-    fo.write(rst)
+    # Write the reST as it's produced, rather than first gathering all of it into a string.
+    _write_file(rst_path, iter_rest(code_str, **options), output_encoding)
 
 
 # .. _code_to_html_string:
@@ -141,29 +182,38 @@ def code_to_html_string(
     **options,
 ):
     rest = code_to_rest_string(code_str, **options)
+    settings = copy.copy(_html_settings())
+    # Capture errors to a string and return it.
+    settings.warning_stream = warning_stream
+    # Don't accumulate dependencies from earlier conversions which used these settings.
+    settings.record_dependencies = utils.DependencyList()
     # `docutils
     # <http://docutils.sourceforge.net/docs/user/tools.html#rst2html-py>`_
     # converts reST to HTML.
-    html = core.publish_string(
-        rest,
-        writer_name="html",
-        settings_overrides={
-            # Include our custom css file: provide the path to the default css and
-            # then to our css. The style sheet dirs must include docutils defaults.
-            "stylesheet_path": ",".join(Writer.default_stylesheets + ["CodeChat.css"]),
-            "stylesheet_dirs": Writer.default_stylesheet_dirs + html_static_path(),
-            # Make sure to use Unicode everywhere.
-            "output_encoding": "unicode",
-            "input_encoding": "unicode",
-            # Don't stop processing, no matter what.
-            "halt_level": 5,
-            # Capture errors to a string and return it.
-            "warning_stream": warning_stream,
-        },
-    )
+    html = core.publish_string(rest, writer_name="html", settings=settings)
     return html
 
 
+# Return the docutils settings used by code_to_html_string_. Building these settings takes about as long as converting a short source file, so build them once; each conversion then uses a copy.
+@lru_cache(maxsize=None)
+def _html_settings():
+    publisher = core.Publisher()
+    publisher.set_components("standalone", "restructuredtext", "html")
+    return publisher.get_settings(
+        # Include our custom css file: provide the path to the default css and
+        # then to our css. The style sheet dirs must include docutils defaults.
+        stylesheet_path=",".join(Writer.default_stylesheets + ["CodeChat.css"]),
+        stylesheet_dirs=Writer.default_stylesheet_dirs + html_static_path(),
+        # Make sure to use Unicode everywhere.
+        output_encoding="unicode",
+        input_encoding="unicode",
+        # Don't stop processing, no matter what.
+        halt_level=5,
+        # Propagate exceptions, as docutils does by default when used programmatically.
+        traceback=True,
+    )
+
+
 # .. _code_to_html_file:
 #
 # code_to_html_file
@@ -416,17 +466,13 @@ rest_codechat_style = ".. raw:: html\n\n " + codechat_style + "\n\n"
 #
 # _generate_rest
 # --------------
-# Generate reST from the classified code. To do this, create a state machine,
+# Generate reST from the classified code, yielding it in pieces. To do this, create a state machine,
 # where current_type defines the state. When the state changes, exit the
 # previous state (output a closing fence or closing ``</div>``, then enter the
 # new state (output a fenced code block or an opening ``<div style=...>``.
 def _generate_rest(
     # An iterable of (type, string) pairs, one per line.
     classified_lines,
-    # .. _out_file:
-    #
-    # A file-like output to which the reST text is written.
-    out_file,
 ):
     # Keep track of the current type. Begin with a 0-indent comment.
     current_type = -2
@@ -442,18 +488,18 @@ def _generate_rest(
         # See if there's a change in state.
         if current_type != type_:
             # Exit the current state.
-            _exit_state(current_type, out_file)
+            yield _exit_state(current_type)
 
             # Enter the new state.
             #
             # Code state: emit the beginning of a fenced block.
             if type_ == -1:
-                out_file.write("\n.. fenced-code::\n\n Beginning fence\n")
+                yield "\n.. fenced-code::\n\n Beginning fence\n"
             # Comment state: emit an opening indent for non-zero indents.
             else:
                 # Add an indent if needed.
                 if type_ > 0:
-                    out_file.write(
+                    yield (
                         "\n.. raw:: html\n\n"
                         ' <div class="CodeChat-indent" style="margin-left:{}em;">\n\n'.format(
                             0.5 * type_
@@ -469,40 +515,38 @@ def _generate_rest(
                 # any following indents a separate syntactical element. See the
                 # end of `reST comment syntax <http://docutils.sourceforge.net/docs/ref/rst/restructuredtext.html#comments>`_
                 # for more discussion.
-                out_file.write("\n.. set-line:: {}\n\n..\n\n".format(line - 4))
+                yield "\n.. set-line:: {}\n\n..\n\n".format(line - 4)
 
         # Output string based on state. All code needs an initial space to
         # place it inside the fenced-code block.
         if type_ == -1:
-            out_file.write(" ")
-        out_file.write(string)
+            yield " "
+        yield string
 
         # Update the state.
         current_type = type_
         line += 1
 
     # When done, exit the last state.
-    _exit_state(current_type, out_file)
+    yield _exit_state(current_type)
 
 
 # _exit_state
 # ^^^^^^^^^^^
-# Output text produced when exiting a state. Supports `_generate_rest`_.
+# Return the text produced when exiting a state. Supports `_generate_rest`_.
 def _exit_state(
     # The type (classification) of the last line.
     type_,
-    # See out_file_.
-    out_file,
 ):
     # Code state: emit an ending fence.
     if type_ == -1:
-        out_file.write(" Ending fence\n\n..\n\n")
+        return " Ending fence\n\n..\n\n"
     # Comment state: emit a closing indent.
     elif type_ > 0:
-        out_file.write("\n.. raw:: html\n\n </div>\n\n..\n\n")
+        return "\n.. raw:: html\n\n </div>\n\n..\n\n"
     # Initial state. Nothing needed.
     else:
-        pass
+        return ""
 
 
 # Supporting reST directives and roles
@@ -600,6 +644,11 @@ class _FencedCodeBlock(CodeBlock):
 # This directive allows changing the line number at which errors will be
 # reported. ``.. set-line:: 10`` makes the current line report as line 10,
 # regardless of its actual location in the file.
+#
+# `_generate_rest`_ emits one of these directives per comment, so renumbering from the current line to the end of the file each time would take time proportional to the number of comments times the number of lines. Instead, renumber only up to the next set-line directive, since that directive will renumber the lines which follow it.
+_set_line_regex = re.compile(r"\.\. set-line::")
+
+
 class _SetLine(Directive):
     required_arguments = 1
     optional_arguments = 0
@@ -624,8 +673,7 @@ class _SetLine(Directive):
 
         # Walk through the current ``input_lines`` up through all its parents.
         while il:
-            # Walk from the current line to the end of the current file, rewriting the
-            # offset (that is, the effective line number).
+            # Walk from the current line to the next set-line directive or the end of the current file, rewriting the offset (that is, the effective line number).
             line_ = line
             for index in range(line_offset, len(il.items)):
                 source, old_offset = il.items[index]
@@ -635,6 +683,9 @@ class _SetLine(Directive):
                 # ``current_source``.
                 if source != current_source:
                     break
+                # Only an unindented set-line directive is certain to be run (an indented one might be part of a literal block, for example), so stop only at these.
+                if index > line_offset and _set_line_regex.match(il.data[index]):
+                    break
                 il.items[index] = (source, line_)
                 line_ += 1
 
@@ -722,7 +773,6 @@ def add_highlight_language(
 #
 # Implementation note: this is mostly copied directly from ``docutils.parsers.rst.directives.misc.Include``, version 0.21.
 class _CodeInclude(Directive):
-
     """
     Include content read from a separate source file.
 
@@ -844,9 +894,10 @@ class _CodeInclude(Directive):
                 if Path(path).match(glob):
                     code_to_rest_options["alias"] = lexer_alias
 
-        # Translate the source code to reST.
+        # Translate the source code to reST. If Sphinx is running, use its setting for docstrings.
         lexer = get_lexer(filename=path, code=rawtext, **code_to_rest_options)
-        rawtext = code_to_rest_string(rawtext, lexer=lexer)
+        docstrings = env.app.config.CodeChat_docstrings if env else True
+        rawtext = code_to_rest_string(rawtext, lexer=lexer, docstrings=docstrings)
 
         # If the ``class`` option is specified, wrap the code in a div with the specified classes.
         classes = self.options.get("class")
@@ -0,0 +1,291 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************
+# |docname| - A fast scanner for Python
+# ****************************************
+# For Python code, `scan_python` finds the groups `source_lexer` needs using the standard library's `tokenize <https://docs.python.org/3/library/tokenize.html>`_ module instead of the Pygments lexer: comments are inline comments, the text between tokens is whitespace, and every other token is code. `source_lexer` uses this scanner when the `fast engine <Engines>` is selected; see `CFamilyScanner.py` for the scanners used for other languages.
+#
+# As there, the result must be identical to the groups ``_group_lexer_tokens`` produces from the Pygments lexer's tokens (as of Pygments 2.19; see ``FAST_ENGINE_PYGMENTS_VERSION``). Since ``_pygments_lexer`` already parses the code to find its docstrings, this scanner uses only code which parses; the Pygments lexer agrees with ``tokenize`` on such code, with a few exceptions handled below:
+#
+# - The Pygments lexer treats any triple-quoted string which begins a line as a docstring, ending it at the first closing quotes, even if they're escaped.
+# - It lexes the text between the braces of an f-string, or some ``{`` in other strings, as code, and may end such a string elsewhere than Python does. This scanner lets the Pygments lexer's own rules classify these strings.
+# - A ``match`` or ``case`` soft keyword which begins a line, followed by a ``_`` keyword, is lexed by a separate rule; likewise, this scanner passes these to the Pygments lexer.
+# - The keyword ``yield from`` is one token, so the space between its words isn't whitespace.
+# - A ``#!`` line which begins the file isn't a comment.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from inspect import cleandoc
+from io import StringIO
+from itertools import groupby
+from operator import itemgetter
+import re
+import tokenize
+
+# Third-party imports
+# -------------------
+from pygments.lexers import PythonLexer
+from pygments.token import Token, _TokenType
+
+# Local application imports
+# -------------------------
+from .CFamilyScanner import _Unsupported
+from .SourceClassifier import (
+    _GROUP,
+    _get_group_table,
+    _lexer_comment_info,
+    _python_docstrings,
+)
+
+# Scanning
+# ========
+# The groups produced by this scanner.
+_WS = _GROUP.whitespace
+_INLINE = _GROUP.inline_comment
+_BLOCK = _GROUP.block_comment
+_OTHER = _GROUP.other
+
+
+# .. _scan_python:
+#
+# scan_python
+# -----------
+# Return a list of ``(group, string)`` pairs for ``text``, the same as ``_group_lexer_tokens`` produces from the tokens of ``lexer``. Return None if ``lexer`` isn't the Python lexer, or if this scanner can't classify this text exactly.
+def scan_python(
+    # The code to classify, already preprocessed by ``_pygments_get_tokens_preprocess``.
+    text,
+    # The Pygments lexer whose groups should be reproduced.
+    lexer,
+    # True to convert docstrings to comments, as in `source_lexer`.
+    docstrings,
+    # The result of ``_python_docstrings`` for ``text``, if it's already known; otherwise, None.
+    python_docstrings=None,
+):
+    # A lexer's filters may change its tokens, which this module can't reproduce.
+    if type(lexer) is not PythonLexer or lexer.filters:
+        return None
+    # Find docstrings as ``_pygments_lexer`` does. Give up on code which doesn't parse, even if docstrings aren't wanted, since the Pygments lexer may not agree with ``tokenize`` on it.
+    ast_docstring, ast_syntax_error = python_docstrings or _python_docstrings(text)
+    if ast_syntax_error:
+        return None
+    try:
+        tokens = _scan_python(text, lexer, ast_docstring if docstrings else {})
+    except (_Unsupported, tokenize.TokenError, SyntaxError):
+        return None
+    # Merge adjacent tokens in the same group, as ``_group_lexer_tokens`` does.
+    return [
+        (group, "".join(map(itemgetter(1), pairs)))
+        for group, pairs in groupby(tokens, itemgetter(0))
+    ]
+
+
+# Return a list of ``(group, string)`` pairs for ``text``, which may contain adjacent pairs in the same group.
+def _scan_python(
+    # The code to classify.
+    text,
+    # The Python lexer.
+    lexer,
+    # The docstrings found by ``_python_docstrings``.
+    ast_docstring,
+):
+    group_table = _get_group_table(*_lexer_comment_info(lexer)[1:])
+    # The index of the first character of each line, since ``tokenize`` gives the line and column of each token.
+    line_starts = [0]
+    line_starts += (m.end() for m in _NEWLINE.finditer(text))
+    tokens = []
+    # The end of the text classified so far.
+    pos = 0
+    # The last token classified by this scanner, or None if Pygments classified it.
+    last = None
+    for tok_type, string, (row, col), (end_row, end_col), _ in tokenize.generate_tokens(
+        StringIO(text).readline
+    ):
+        if tok_type in _SKIPPED:
+            continue
+        start = line_starts[row - 1] + col
+        end = line_starts[end_row - 1] + end_col
+        # Skip tokens already classified by the Pygments lexer, which must end where a token ends.
+        if start < pos:
+            if end > pos:
+                raise _Unsupported()
+            continue
+
+        if start > pos:
+            tokens.append(
+                (
+                    (
+                        _OTHER
+                        if last == "yield" and string == "from" and start == pos + 1
+                        else _WS
+                    ),
+                    text[pos:start],
+                )
+            )
+        last = None
+        if tok_type == tokenize.COMMENT:
+            tokens.append(
+                (_OTHER if start == 0 and _HASHBANG.match(string) else _INLINE, string)
+            )
+        elif tok_type == tokenize.STRING:
+            prefix, quote = _STRING_START.match(string).groups()
+            line_start = line_starts[row - 1]
+            if (
+                len(quote) == 3
+                and _DOC_PREFIX.match(prefix)
+                and (line_start == start or text[line_start:start].isspace())
+            ):
+                # Pygments ends this string at the first closing quotes.
+                doc_start = start + len(prefix)
+                if text.find(quote, doc_start + 3) + 3 != end:
+                    raise _Unsupported()
+                if prefix:
+                    tokens.append((_OTHER, prefix))
+                doc = text[doc_start:end]
+                # Convert docstrings to comments, as ``_group_lexer_tokens`` does.
+                if ast_docstring.get(end_row) == doc[3:-3]:
+                    doc = cleandoc(doc)
+                    tokens.append((_BLOCK, doc[0:3] + " " + doc[3:]))
+                else:
+                    tokens.append((_OTHER, doc))
+            elif "\\" in string or "{" in string or "f" in prefix or "F" in prefix:
+                end = _append_pygments(tokens, lexer, group_table, text, start, end)
+            else:
+                tokens.append((_OTHER, string))
+        elif tok_type in _FSTRING_START:
+            end = _append_pygments(tokens, lexer, group_table, text, start, end)
+        elif tok_type in _CODE:
+            soft_keyword_end = (
+                _soft_keyword_end(text, line_starts[row - 1], end)
+                if string == "match" or string == "case"
+                else None
+            )
+            if soft_keyword_end is None:
+                tokens.append((_OTHER, string))
+                last = string
+            else:
+                tokens.extend(
+                    (group_table[tokentype], value)
+                    for _, tokentype, value in lexer.get_tokens_unprocessed(
+                        text[start:soft_keyword_end]
+                    )
+                )
+                end = soft_keyword_end
+        else:
+            raise _Unsupported()
+        pos = end
+
+    if pos < len(text):
+        tokens.append((_WS, text[pos:]))
+    return tokens
+
+
+# Given a ``match`` or ``case`` ending at ``end``, return the end of the text which the Pygments lexer's soft keyword rules lex separately, or None if these rules don't apply.
+def _soft_keyword_end(text, line_start, end):
+    m = _SOFT_KEYWORD.match(text, line_start)
+    if m is None or m.end() != end:
+        return None
+    m = _SOFT_KEYWORD_INNER.match(text, end)
+    return None if m is None else m.end()
+
+
+# Classify the token from ``pos`` to ``end`` using the Pygments lexer, appending the groups of its tokens to ``tokens``. Return the end of the text the lexer classified, which may include the tokens following this one.
+def _append_pygments(tokens, lexer, group_table, text, pos, end):
+    pos = _lex_pygments(tokens, lexer, group_table, text, pos)
+    # If the lexer ends this token early, the rest of it is lexed as code.
+    if pos < end:
+        raise _Unsupported()
+    return pos
+
+
+# Lex the text beginning at ``pos`` using the Pygments lexer, starting in its root state and stopping when it returns to this state, appending the groups of its tokens to ``tokens``. Return the end of the lexed text. This code was adapted from ``pygments.lexer.RegexLexer.get_tokens_unprocessed``, v. 2.19.
+def _lex_pygments(tokens, lexer, group_table, text, pos):
+    tokendefs = lexer._tokens
+    statestack = ["root"]
+    statetokens = tokendefs["root"]
+    while True:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is not None:
+                    if type(action) is _TokenType:
+                        tokens.append((group_table[action], m.group()))
+                    else:
+                        tokens.extend(
+                            (group_table[tokentype], value)
+                            for _, tokentype, value in action(lexer, m)
+                        )
+                pos = m.end()
+                if new_state is not None:
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == "#push":
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == "#push":
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                break
+        else:
+            if pos == len(text):
+                return pos
+            # At an unmatched newline, Pygments returns to the root state.
+            if text[pos] == "\n":
+                tokens.append((_WS, "\n"))
+                return pos + 1
+            tokens.append((group_table[Token.Error], text[pos]))
+            pos += 1
+            continue
+        if len(statestack) == 1:
+            return pos
+
+
+_NEWLINE = re.compile("\n")
+_HASHBANG = re.compile(r"#!.")
+_STRING_START = re.compile(r"(\w*)('''|\"\"\"|'|\")")
+_DOC_PREFIX = re.compile(r"[rRuUbB]{,2}$")
+_SOFT_KEYWORD = re.compile(PythonLexer.tokens["soft-keywords"][0][0], PythonLexer.flags)
+_SOFT_KEYWORD_INNER = re.compile(
+    PythonLexer.tokens["soft-keywords-inner"][0][0], PythonLexer.flags
+)
+
+# The ``tokenize`` token types which contain only whitespace, or nothing.
+_SKIPPED = {
+    tokenize.NEWLINE,
+    tokenize.NL,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENDMARKER,
+}
+# The token types which are code.
+_CODE = {tokenize.NAME, tokenize.NUMBER, tokenize.OP}
+# From Python 3.12, an f-string is several tokens, beginning with this one.
+_FSTRING_START = {getattr(tokenize, "FSTRING_START", None)} - {None}
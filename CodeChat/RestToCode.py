@@ -33,7 +33,7 @@
 # For the docutils default style sheet and template
 from docutils import io
 from pygments.lexers import find_lexer_class
-from lxml import html
+from lxml import etree, html
 
 # Local application imports
 # -------------------------
@@ -241,55 +241,35 @@ def rest_to_code_string(
     rest_str = remove_codechat_style(rest_str)
     # Split the reST string into lines. These are compiled into the line_list.
     line_list = rest_str.split("\n")
-    string_out = ""
-    # While there are still lines left, convert them.
-    while i < len(line_list):
-        # This try/except pair is put in place to catch unexpected input.
-        # If the try doesn't work, it checks to see if it is even valid reST input.
-        try:
-            line_list[i + 1]
+    # Collect the lines of code in a list, then join them once at the end; repeatedly appending to a string copies it each time, which makes this quadratic in the length of the output.
+    code_lines = []
+    # This try/except pair is put in place to catch unexpected input.
+    # If the try doesn't work, it checks to see if it is even valid reST input.
+    try:
+        # While there are still lines left, convert them. Each pass through this loop converts one fenced code block, ``<div>`` comment, or comment.
+        while i < len(line_list):
+            next_line = line_list[i + 1]
             # This is translation for regular code, not comments
-            if line_list[i + 1] == ".. fenced-code::":
+            if next_line == ".. fenced-code::":
                 # Makes sure that the lines that are supposed to be there are there.
-                if line_list[i + 2] != "" or line_list[i + 3] != " Beginning fence":
+                if not _lines_match(line_list, i + 2, ["", " Beginning fence"]):
                     # See Boolean_.
                     boolean = True
                     break
                 i += 4
                 while line_list[i] != " Ending fence":
-                    # Take the front space off
-                    s = line_list[i].split(" ", 1)
-                    f = s[1] + "\n"
-                    # Add the line of code to the output string.
-                    string_out += f
+                    # Take the front space off, then add the line of code to the output.
+                    code_lines.append(line_list[i].split(" ", 1)[1] + "\n")
                     i += 1
-                try:
-                    # skips over the added code not including the setline part of the code.
-                    # Makes sure that the lines that are supposed to be there are there.
-                    if (
-                        line_list[i + 1] != ""
-                        or line_list[i + 2] != ".."
-                        or line_list[i + 3] != ""
-                    ):
-                        # See Boolean_.
-                        boolean = True
-                        break
-                    i += 4
-                # this exception catches the case that the file ends with code rather than a comment
-                except Exception:
-                    # Makes sure that the lines that are supposed to be there are there.
-                    if (
-                        line_list[i + 1] != ""
-                        or line_list[i + 2] != ".."
-                        or line_list[i + 3] != ""
-                    ):
-                        # See Boolean_.
-                        boolean = True
-                        break
-                    i += 3
+                # Skips over the added code not including the setline part of the code. A file which ends with code rather than a comment still ends with these lines.
+                if not _lines_match(line_list, i + 1, ["", "..", ""]):
+                    # See Boolean_.
+                    boolean = True
+                    break
+                i += 4
 
             # This is to find the ``<div>`` comments and turn them into comments.
-            elif line_list[i + 1] == ".. raw:: html":
+            elif next_line == ".. raw:: html":
                 # Makes sure that the lines that are supposed to be there are there.
                 if line_list[i + 2] != "" or not line_list[i + 3].startswith(
                     ' <div class="CodeChat-indent" style="margin-left'
@@ -303,20 +283,14 @@ def rest_to_code_string(
                 s = line_list[i].split(":", 1)
                 # Splits ``'{size}em;">'`` into ``'{size}'`` and ``'m;">'``
                 s2 = s[1].split("e", 1)
-                # Turns ``'{size}'`` into a number of divs. Ex. ``1.0`` or ``3.5``
-                size = float(s2[0])
-                # Gets the number of spaces needed to put the comment(s) back where it was.
-                # Also, needs to be ``int()`` in order to work in the for loop. size starts out as a float.
-                size = int(size * 2)
+                # Turns ``'{size}'`` into the number of spaces needed to put the comment(s) back where it was. Ex. ``1.0`` or ``3.5`` em becomes 2 or 7 spaces.
+                spaces = " " * int(float(s2[0]) * 2)
 
                 # Makes sure that the lines that are supposed to be there are there.
                 if (
-                    line_list[i + 1] != ""
-                    or line_list[i + 2] != ""
+                    not _lines_match(line_list, i + 1, ["", ""])
                     or line_list[i + 3][0:13] != ".. set-line::"
-                    or line_list[i + 4] != ""
-                    or line_list[i + 5] != ".."
-                    or line_list[i + 6] != ""
+                    or not _lines_match(line_list, i + 4, ["", "..", ""])
                 ):
                     # See Boolean_.
                     boolean = True
@@ -325,23 +299,14 @@ def rest_to_code_string(
                 i += 7
 
                 while line_list[i + 1] != ".. raw:: html":
-                    spaces = ""
-                    for index in range(size):
-                        spaces += " "
                     # All ``<div>`` comments are considered to be inline comments.
-                    s = formulate_comment(line_list[i], lang, False, 0, None)
-                    f = spaces + s
-                    string_out += f
+                    code_lines.append(
+                        spaces + formulate_comment(line_list[i], lang, False, 0, None)
+                    )
                     i += 1
 
                 # Makes sure that the lines that are supposed to be there are there.
-                if (
-                    line_list[i + 2] != ""
-                    or line_list[i + 3] != " </div>"
-                    or line_list[i + 4] != ""
-                    or line_list[i + 5] != ".."
-                    or line_list[i + 6] != ""
-                ):
+                if not _lines_match(line_list, i + 2, ["", " </div>", "", "..", ""]):
                     # See Boolean_.
                     boolean = True
                     break
@@ -349,29 +314,24 @@ def rest_to_code_string(
                 i += 7
 
             #
-            elif line_list[i + 1][0:13] == ".. set-line::":
+            elif next_line[0:13] == ".. set-line::":
                 # Makes sure that the lines that are supposed to be there are there.
-                if (
-                    line_list[i + 2] != ""
-                    or line_list[i + 3] != ".."
-                    or line_list[i + 4] != ""
-                ):
+                if not _lines_match(line_list, i + 2, ["", "..", ""]):
                     # See Boolean_.
                     boolean = True
                     break
                 i += 5
+                # At the end of the reST, there's nothing left to convert; the loop above checks the remaining line.
+                if i + 1 >= len(line_list):
+                    continue
 
-                temp_i = i
-                line_counter = 0
-                # Check to see how many lines the comment has.
-                while line_list[temp_i + 1] != ".. fenced-code::":
-                    line_counter += 1
-                    temp_i += 1
-                    try:
-                        line_list[temp_i + 1]
-                    except Exception:
-                        temp_i += 1
-                        break
+                # Find the end of this comment: the line before the next ``.. fenced-code::``, or the end of the reST. Its last line (a blank line, before a fenced code block) isn't part of the comment. Since this search stops at the next fenced code block, which the loop above then converts, it examines each line only once.
+                try:
+                    end = line_list.index(".. fenced-code::", i + 1) - 1
+                    line_counter = end - i
+                except ValueError:
+                    end = len(line_list)
+                    line_counter = end - i - 1
                 # .. _number_consecutive_comments:
                 #
                 # This line sets the lower limit for consecutive comments turning into block comments
@@ -383,44 +343,44 @@ def rest_to_code_string(
                     position = line_counter
 
                 # Actually formulate the comments.
-                while line_list[i + 1] != ".. fenced-code::":
-                    f = formulate_comment(
-                        line_list[i], lang, is_block_comment, position, line_counter
+                while i < end:
+                    code_lines.append(
+                        formulate_comment(
+                            line_list[i], lang, is_block_comment, position, line_counter
+                        )
                     )
-                    string_out += f
                     position -= 1
                     i += 1
-                    # This catches the case that the string runs out of lines.
-                    # This ensures that the while loop does not loop forever due to the next line being ``None``
-                    try:
-                        line_list[i + 1]
-                    except Exception:
-                        f = formulate_comment(
-                            line_list[i], lang, is_block_comment, position, line_counter
-                        )
-                        string_out += f
-                        i += 1
-                        break
             else:
                 # See Boolean_.
                 boolean = True
                 break
 
-            if boolean:
-                break
-        except Exception:
-            if line_list[i] != "":
-                # See Boolean_.
-                boolean = True
-            i += 1
-            break
+    except Exception:
+        if i >= len(line_list) or line_list[i] != "":
+            # See Boolean_.
+            boolean = True
 
     # _`Boolean`: If Boolean is set to True, there was a line of invalid reST, so the program returns an error string.
     if boolean:
         # Return an error message.
-        string_out += "This was not recognized as valid reST. Please check your input and try again."
+        code_lines.append(
+            "This was not recognized as valid reST. Please check your input and try again."
+        )
 
-    return string_out
+    return "".join(code_lines)
+
+
+# Return True if the lines of ``line_list`` starting at index ``start`` equal ``expected_lines``. Like a chain of ``line_list[start] != ... or line_list[start + 1] != ...`` comparisons, this raises an IndexError only if it runs out of lines before finding a mismatch.
+def _lines_match(line_list, start, expected_lines):
+    actual_lines = line_list[start : start + len(expected_lines)]
+    if actual_lines == expected_lines:
+        return True
+    if len(actual_lines) < len(expected_lines) and (
+        actual_lines == expected_lines[: len(actual_lines)]
+    ):
+        raise IndexError("list index out of range")
+    return False
 
 
 # |
@@ -474,92 +434,6 @@ def html_to_code_string(
     # See lang_.
     lang,
 ):
-    string_out = "\n.. set-line:: -3\n\n..\n\n"
-
-    def traverse_etree(element):
-        nonlocal string_out
-        if isinstance(element.tag, str):
-            tag = element.tag
-            if tag == "p":
-                string_out += "\n.. set-line:: -3\n\n..\n\n"
-                if element.get("id") is not None:
-                    s = element.get("id")
-                    s = s.replace("-", "_")
-                    string_out += ".. _{}:\n\n".format(s)
-                if element.text is not None:
-                    # ``element.text`` starts out as ``NoneType``, so tell the program to convert it to a string.
-                    string_out += str(element.text)
-            elif tag == "div":
-                div(element)
-                if element.get("class") == "contents topic":
-                    return
-            elif tag == "pre":
-                s = str(element.text)
-                s = s.replace("\n", "\n ")
-                s, _ = s.rsplit(" ", 1)
-                string_out += "\n.. fenced-code::\n\n Beginning fence\n {} Ending fence\n\n..\n\n".format(
-                    s
-                )
-            elif tag == "a":
-                link(element)
-            elif tag == "b":
-                string_out += "**{}**".format(element.text)
-                if element.tail is not None:
-                    string_out += str(element.tail)
-            elif tag == "i" or tag == "em":
-                string_out += "*{}*".format(element.text)
-                if element.tail is not None:
-                    string_out += str(element.tail)
-            elif tag == "span":
-                if element.get("class") == "target":
-                    string_out += "_`{}`".format(element.text)
-                if element.tail is not None:
-                    string_out += str(element.tail)
-            elif tag == "tt":
-                if element.get("class") == "docutils literal":
-                    string_out += "``{}".format(element.text)
-
-        for child in element:
-            traverse_etree(child)
-
-        if isinstance(element.tag, str):
-            tag = element.tag
-            if tag == "p":
-                string_out += "\n"
-            elif tag == "div":
-                div_end(element)
-            elif tag == "tt":
-                string_out += "``"
-                if element.tail is not None:
-                    string_out += str(element.tail)
-
-    def div(element):
-        nonlocal string_out
-        if element.get("style") is not None:
-            string_out += '\n.. raw:: html\n\n <div style="{}">\n\n'.format(
-                element.get("style")
-            )
-        elif element.get("class") == "contents topic":
-            string_out += "\n.. contents::\n\n"
-
-    def div_end(element):
-        nonlocal string_out
-        if element.get("style") is not None:
-            string_out += "\n\n.. raw:: html\n\n </div>\n\n..\n\n"
-
-    def link(element):
-        nonlocal string_out
-        if element.get("class") == "reference internal":
-            target = element.get("href")
-            _, target = target.split("#")
-            target = target.replace("-", "_")
-            string_out += "`{} <{}_>`_".format(element.text, target)
-        elif element.get("class") == "reference external":
-            target = element.get("href")
-            string_out += "`{} <{}>`_".format(element.text, target)
-        if element.tail is not None:
-            string_out += str(element.tail)
-
     # Take out the xml encoding; it messes up the tree
     for i in range(1):
         try:
@@ -585,12 +459,196 @@ def html_to_code_string(
     # html_str = html_str.replace('</tt>', '``')
     root = html.fromstring(html_str)
 
-    traverse_etree(root)
-    # need to write a recursive function so it can catch all the levels of divs
-
     # string_out = rest_to_code_string(string_out, lang)
 
-    return string_out
+    return _html_prefix + "".join(_iter_html_tree(root))
+
+
+# |
+#
+# _`iter_html_to_code`: Like html_to_code_string_, but read the HTML from a file and yield the output in pieces as it's produced. This parses the HTML incrementally, emitting the output for each element as soon as the element (and any text which the output needs) has been parsed, then freeing it. So, memory use stays bounded when converting very large HTML files; the output matches html_to_code_string_ for HTML documents, such as those produced by docutils.
+def iter_html_to_code(
+    # _`html_file`: A file-like object opened for reading, in either text or binary mode. In binary mode, lxml determines the encoding of the HTML.
+    html_file,
+    # See lang_.
+    lang,
+    # The number of characters (or bytes) to read from html_file_ at a time.
+    chunk_size=2**16,
+):
+    yield _html_prefix
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    # The open elements whose output is being streamed, from the root down. Each is a list of ``[element, started]``, where ``started`` is True once the output for the start of the element has been produced.
+    open_elements = []
+    # An element (and its subtree) being held until it's completely parsed, or None. Elements whose output includes their tail are held, as are elements whose children produce no output.
+    held_element = None
+    # A held element whose end has been parsed, but whose tail (which follows its end) may not have been parsed yet, or None.
+    finished_element = None
+
+    def process_events():
+        nonlocal held_element, finished_element
+        for event, element in parser.read_events():
+            # Any event after the end of ``finished_element`` means its tail has been parsed.
+            if finished_element is not None:
+                yield "".join(_iter_html_tree(finished_element))
+                _free_html_element(finished_element, False)
+                finished_element = None
+
+            if held_element is not None:
+                # Ignore all events inside the held element.
+                if event == "end" and element is held_element:
+                    if element.tag in _HTML_TAIL_TAGS:
+                        finished_element = element
+                    else:
+                        _free_html_element(element, True)
+                    held_element = None
+                continue
+
+            # The text of an element ends when its first child starts or when it ends; produce the output for its start then.
+            if open_elements and not open_elements[-1][1]:
+                yield _html_start(open_elements[-1][0])[0]
+                open_elements[-1][1] = True
+
+            if event == "start":
+                if element.tag in _HTML_TAIL_TAGS:
+                    held_element = element
+                elif _html_is_contents(element):
+                    # The output for the table of contents needs only its attributes, which are available now.
+                    yield _html_start(element)[0]
+                    held_element = element
+                else:
+                    open_elements.append([element, False])
+            else:
+                open_elements.pop()
+                yield _html_end(element)
+                _free_html_element(element, True)
+
+    while True:
+        data = html_file.read(chunk_size)
+        if not data:
+            break
+        parser.feed(data)
+        yield from process_events()
+    parser.close()
+    yield from process_events()
+    # The tail of the last element, if any, has been parsed.
+    if finished_element is not None:
+        yield "".join(_iter_html_tree(finished_element))
+
+
+# Supporting functions for converting HTML
+# ----------------------------------------
+# The output which html_to_code_string_ places before the output from the HTML.
+_html_prefix = "\n.. set-line:: -3\n\n..\n\n"
+
+# The tags whose output includes the element's tail.
+_HTML_TAIL_TAGS = {"a", "b", "i", "em", "span", "tt"}
+
+
+# Return True if ``element`` is a table of contents, whose children produce no output.
+def _html_is_contents(element):
+    return element.tag == "div" and element.get("class") == "contents topic"
+
+
+# Yield the output for ``root`` and its descendants. This walks the tree using a stack, rather than recursively, so that deeply-nested HTML doesn't exceed Python's recursion limit.
+def _iter_html_tree(root):
+    # Each entry is ``(element, ended)``; ``ended`` is True after the element's children have been visited.
+    stack = [(root, False)]
+    while stack:
+        element, ended = stack.pop()
+        if ended:
+            yield _html_end(element)
+        else:
+            s, visit_children = _html_start(element)
+            yield s
+            if visit_children:
+                stack.append((element, True))
+                stack.extend((child, False) for child in reversed(element))
+
+
+# Return ``(output, visit_children)``, giving the output for the start of ``element`` and True if its children (and its end) should be converted.
+def _html_start(element):
+    tag = element.tag
+    # Comments and processing instructions produce no output.
+    if not isinstance(tag, str):
+        return "", True
+    if tag == "p":
+        s = "\n.. set-line:: -3\n\n..\n\n"
+        if element.get("id") is not None:
+            s += ".. _{}:\n\n".format(element.get("id").replace("-", "_"))
+        if element.text is not None:
+            # ``element.text`` starts out as ``NoneType``, so tell the program to convert it to a string.
+            s += str(element.text)
+        return s, True
+    elif tag == "div":
+        s = ""
+        if element.get("style") is not None:
+            s = '\n.. raw:: html\n\n <div style="{}">\n\n'.format(element.get("style"))
+        elif _html_is_contents(element):
+            s = "\n.. contents::\n\n"
+        return s, not _html_is_contents(element)
+    elif tag == "pre":
+        s = str(element.text)
+        s = s.replace("\n", "\n ")
+        s, _ = s.rsplit(" ", 1)
+        return (
+            "\n.. fenced-code::\n\n Beginning fence\n {} Ending fence\n\n..\n\n".format(
+                s
+            ),
+            True,
+        )
+    elif tag == "a":
+        s = ""
+        if element.get("class") == "reference internal":
+            target = element.get("href")
+            _, target = target.split("#")
+            target = target.replace("-", "_")
+            s = "`{} <{}_>`_".format(element.text, target)
+        elif element.get("class") == "reference external":
+            target = element.get("href")
+            s = "`{} <{}>`_".format(element.text, target)
+    elif tag == "b":
+        s = "**{}**".format(element.text)
+    elif tag == "i" or tag == "em":
+        s = "*{}*".format(element.text)
+    elif tag == "span":
+        s = ""
+        if element.get("class") == "target":
+            s = "_`{}`".format(element.text)
+    elif tag == "tt":
+        if element.get("class") == "docutils literal":
+            return "``{}".format(element.text), True
+        return "", True
+    else:
+        return "", True
+    # The remaining tags are followed by their tail.
+    if element.tail is not None:
+        s += str(element.tail)
+    return s, True
+
+
+# Return the output for the end of ``element``.
+def _html_end(element):
+    tag = element.tag
+    if tag == "p":
+        return "\n"
+    elif tag == "div":
+        if element.get("style") is not None:
+            return "\n\n.. raw:: html\n\n </div>\n\n..\n\n"
+    elif tag == "tt":
+        s = "``"
+        if element.tail is not None:
+            s += str(element.tail)
+        return s
+    return ""
+
+
+# Free the memory used by ``element``, whose output has been produced, along with its preceding siblings. Unless ``keep_tail``, also discard its tail.
+def _free_html_element(element, keep_tail):
+    element.clear(keep_tail=keep_tail)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
 
 
 """    # Take out the 2 style sheets; they are not needed
@@ -30,12 +30,25 @@
 # Standard library
 # ----------------
 import ast
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
+from fnmatch import translate
+from functools import lru_cache
 import inspect
+import json
+import os
+import re
+import sys
+import threading
+import time
 
 # Third-party imports
 # -------------------
+import pygments
 from pygments.lexers import (
+    find_lexer_class,
+    get_all_lexers,
     get_lexer_for_filename,
     get_lexer_by_name,
     get_lexer_for_mimetype,
@@ -85,22 +98,144 @@ def get_lexer(
     if lexer:
         return lexer
     if alias:
-        return get_lexer_by_name(alias, **options)
+        return _cached_lexer("alias", alias, options)
     if filename:
         if code:
-            # Given code, try to guess a more accurate lexer.
-            lexer_ = guess_lexer_for_filename(filename, code, **options)
-            # Only use this guess if we support it.
+            # If only one lexer claims this file, there's nothing to guess.
+            lexer_class = _unambiguous_lexer_class(filename)
+            if lexer_class:
+                return _cached_lexer("class", lexer_class, options)
+            # Given code, try to guess a more accurate lexer. The guess runs each candidate lexer's ``analyse_text`` over the code, so examine only the beginning of the file.
+            lexer_ = guess_lexer_for_filename(
+                filename, code[:GUESS_LEXER_PREFIX_LENGTH], **options
+            )
+            # Only use this guess if we support it. Hand back the cached instance of the guessed lexer, so that all files which guess the same lexer share it.
             if lexer_.name in COMMENT_DELIMITER_INFO:
-                return lexer_
-        # If guessing fails or isn't available, look up a lexer based on the file name.
-        return get_lexer_for_filename(filename, **options)
+                return _cached_lexer("class", type(lexer_), options)
+        # If guessing fails or isn't available, look up a lexer based on the file name. Pygments only examines the file's basename, so use that as the key.
+        return _cached_lexer("filename", os.path.basename(filename), options)
     if mimetype:
-        return get_lexer_for_mimetype(mimetype, **options)
+        return _cached_lexer("mimetype", mimetype, options)
     if code:
         return guess_lexer(code, **options)
 
 
+# .. _lexer cache:
+#
+# Lexer cache
+# ^^^^^^^^^^^
+# Finding a lexer by alias, filename, or MIME type walks the Pygments lexer tables, then instantiates a new lexer. A Sphinx build does this for every source file, so keep a bounded, thread-safe cache of lexer instances. Lexers returned from the cache are shared; don't modify them (for example, by calling ``add_filter``).
+#
+# The maximum number of lexer instances to cache.
+LEXER_CACHE_SIZE = 256
+
+# How to look up a lexer for each kind of key.
+_LEXER_LOOKUP = {
+    "alias": get_lexer_by_name,
+    "filename": get_lexer_for_filename,
+    "mimetype": get_lexer_for_mimetype,
+    # Instantiate the given lexer class.
+    "class": lambda lexer_class, **options: lexer_class(**options),
+}
+
+
+# Return a (possibly cached) lexer given a key.
+def _cached_lexer(
+    # The kind of key; one of the keys of ``_LEXER_LOOKUP``.
+    kind,
+    # The alias, filename, MIME type, or lexer class to look up.
+    value,
+    # See options_.
+    options,
+):
+    try:
+        options_key = tuple(sorted(options.items()))
+        hash(options_key)
+    except TypeError:
+        # Options with unhashable values (such as a list of filters) can't be cached.
+        return _LEXER_LOOKUP[kind](value, **options)
+    return _lexer_for_key(kind, value, options_key)
+
+
+# The cache itself. Lookups which fail raise an exception, so they aren't cached.
+@lru_cache(maxsize=LEXER_CACHE_SIZE)
+def _lexer_for_key(kind, value, options_key):
+    return _LEXER_LOOKUP[kind](value, **dict(options_key))
+
+
+# .. _lexer_cache_info:
+#
+# lexer_cache_info
+# ^^^^^^^^^^^^^^^^
+# Return the hits, misses, maximum size, and current size of the `lexer cache`, as a `named tuple <https://docs.python.org/3/library/functools.html#functools.lru_cache>`_.
+def lexer_cache_info():
+    return _lexer_for_key.cache_info()
+
+
+# .. _clear_lexer_cache:
+#
+# clear_lexer_cache
+# ^^^^^^^^^^^^^^^^^
+# Empty the `lexer cache`, resetting its statistics.
+def clear_lexer_cache():
+    _lexer_for_key.cache_clear()
+
+
+# .. _filename index:
+#
+# Filename index
+# ^^^^^^^^^^^^^^
+# ``guess_lexer_for_filename`` matches a file's name against the filename patterns of every lexer, then runs ``analyse_text`` of each matching lexer over the file's contents. When only one lexer matches, this guess always returns that lexer, so the work is wasted. To avoid it, index the filename patterns of all lexers (not just the ones CodeChat supports, since an unsupported lexer can still win a guess) by extension.
+#
+# The number of characters at the beginning of a file to examine when guessing a lexer for a file with an ambiguous extension, such as ``.h``, ``.m``, or ``.pl``.
+GUESS_LEXER_PREFIX_LENGTH = 16384
+
+# Match a pattern of the form ``*.ext``, capturing ``ext``.
+_SIMPLE_SUFFIX_REGEX = re.compile(r"\*\.([^.*?\[\]]+)")
+
+# The index, built on first use by ``_get_filename_index``: a tuple of (a dict of {extension: set of lexer classes}, a list of (compiled regex, lexer class) for all other patterns).
+_filename_index = None
+
+
+# Build the `filename index` if it doesn't exist, then return it. Building the index requires importing every lexer; ``guess_lexer_for_filename`` does the same.
+def _get_filename_index():
+    global _filename_index
+    if _filename_index is None:
+        suffix_index = {}
+        other_patterns = []
+        for longname, aliases, filename_patterns, mimetypes in get_all_lexers():
+            lexer_class = find_lexer_class(longname)
+            # Like ``guess_lexer_for_filename``, include both the primary and the alias filename patterns.
+            for pattern in [*lexer_class.filenames, *lexer_class.alias_filenames]:
+                mo = _SIMPLE_SUFFIX_REGEX.fullmatch(pattern)
+                if mo:
+                    suffix_index.setdefault(mo.group(1), set()).add(lexer_class)
+                else:
+                    # Pygments matches using a case-sensitive translation of the pattern; do the same.
+                    other_patterns.append((re.compile(translate(pattern)), lexer_class))
+        _filename_index = suffix_index, other_patterns
+    return _filename_index
+
+
+# Return the lexer class for the given filename if exactly one lexer matches it and CodeChat supports that lexer; otherwise, return None.
+def _unambiguous_lexer_class(
+    # The name of the file.
+    filename,
+):
+    suffix_index, other_patterns = _get_filename_index()
+    basename = os.path.basename(filename)
+    head, dot, suffix = basename.rpartition(".")
+    lexer_classes = set(suffix_index.get(suffix, ())) if dot else set()
+    lexer_classes.update(
+        lexer_class for regex, lexer_class in other_patterns if regex.match(basename)
+    )
+    if len(lexer_classes) == 1:
+        (lexer_class,) = lexer_classes
+        if lexer_class.name in COMMENT_DELIMITER_INFO:
+            return lexer_class
+    return None
+
+
 # Provide the ability to print debug info if needed.
 def _debug_print(val):
     # Uncomment for debug prints.
@@ -108,6 +243,275 @@ def _debug_print(val):
     pass
 
 
+# Write the strings produced by the iterable ``pieces`` to the file at ``path``, using ``encoding``. Since producing or encoding these strings may raise an exception after some have been written, write them to a temporary file in the same directory, then replace ``path`` with it; otherwise, an error would leave a truncated file which appears to be up to date.
+def _write_file(path, pieces, encoding):
+    # Only this thread of this process writes to this temporary file.
+    temp_path = "{}.{}-{}.tmp".format(path, os.getpid(), threading.get_ident())
+    try:
+        with open(temp_path, "w", encoding=encoding) as fo:
+            fo.writelines(pieces)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# .. _Profiling:
+#
+# Profiling
+# ^^^^^^^^^
+# To see where a conversion spends its time, set the ``CODECHAT_PROFILE`` environment variable, or convert within `collect_profiles`. Each conversion then produces a report: a dict giving the lexer's name (``lexer``), the number of characters in the code (``chars``), the total wall time in seconds (``seconds``), and a list (``stages``) with a dict for each stage of `source_lexer`, followed by the generator which produced the output. Each stage's dict gives its name (``stage``), the wall time spent in it, excluding the time spent in the stages before it (``seconds``), and the number of items it produced (``items``): tokens for ``_pygments_lexer``, groups for ``_group_lexer_tokens`` (or, with the `fast engine <Engines>`, for ``_fast_lexer``, which replaces these two stages), lines for ``_gather_groups_on_newlines`` and ``_classify_groups``, and strings for the output generator. Within `collect_profiles`, reports are appended to the list it provides; otherwise, each report is written to stderr as a line of JSON.
+#
+# The environment variable which enables profiling.
+PROFILE_ENV_VAR = "CODECHAT_PROFILE"
+
+# The list of reports provided by the innermost `collect_profiles`, or None outside it.
+_profile_reports = ContextVar("_profile_reports", default=None)
+
+
+# .. _collect_profiles:
+#
+# collect_profiles
+# """"""""""""""""
+# Profile all conversions begun within this context manager, providing a list to which the report for each conversion is appended when the conversion finishes.
+@contextmanager
+def collect_profiles():
+    reports = []
+    token = _profile_reports.set(reports)
+    try:
+        yield reports
+    finally:
+        _profile_reports.reset(token)
+
+
+# Record the time spent in each stage of one conversion.
+class _Profile:
+    def __init__(self, lexer, code_str):
+        # Where to deliver the report; see `Profiling`_.
+        self.reports = _profile_reports.get()
+        self.report = {"lexer": lexer.name, "chars": len(code_str)}
+        # The ``_ProfiledStage`` for each stage, in the order the stages consume each other's output.
+        self.stages = []
+
+    # Produce the report, once the last stage finishes.
+    def finish(self):
+        stages = []
+        upstream_seconds = setup_seconds = 0.0
+        for stage in self.stages:
+            # Each stage pulls items from the stage before it, so the time measured while iterating over a stage includes the time spent iterating over all earlier stages, but not the time spent before iterating over them.
+            stages.append(
+                {
+                    "stage": stage.name,
+                    "seconds": stage.seconds - upstream_seconds,
+                    "items": stage.items,
+                }
+            )
+            upstream_seconds = stage.seconds - stage.setup_seconds
+            setup_seconds += stage.setup_seconds
+        self.report["seconds"] = upstream_seconds + setup_seconds
+        self.report["stages"] = stages
+        if self.reports is None:
+            print(json.dumps(self.report), file=sys.stderr, flush=True)
+        else:
+            self.reports.append(self.report)
+
+
+# An iterator which records the time spent producing the items of ``iterable`` and the number of items it produced.
+class _ProfiledStage:
+    def __init__(
+        self,
+        # The ``_Profile`` for this conversion.
+        profile,
+        # The name of this stage.
+        name,
+        # The items produced by this stage.
+        iterable,
+        # Time already spent in this stage before iterating over it.
+        seconds=0.0,
+    ):
+        self.profile = profile
+        self.name = name
+        self.seconds = self.setup_seconds = seconds
+        self.items = 0
+        self._iterator = iter(iterable)
+        self._finished = False
+        profile.stages.append(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            item = next(self._iterator)
+        except StopIteration:
+            self.seconds += time.perf_counter() - start
+            # The last stage consumes all the others, so the conversion is done when it finishes.
+            if not self._finished and self is self.profile.stages[-1]:
+                self._finished = True
+                self.profile.finish()
+            raise
+        self.seconds += time.perf_counter() - start
+        self.items += 1
+        return item
+
+
+# Return a ``_Profile`` for converting ``code_str`` if profiling is enabled; otherwise, return None.
+def _start_profile(lexer, code_str):
+    if _profile_reports.get() is None and PROFILE_ENV_VAR not in os.environ:
+        return None
+    return _Profile(lexer, code_str)
+
+
+# Profile ``iterable`` as the stage ``name`` if ``profile`` isn't None.
+def _profile_stage(profile, name, iterable, seconds=0.0):
+    return (
+        iterable
+        if profile is None
+        else _ProfiledStage(profile, name, iterable, seconds)
+    )
+
+
+# Profile the generator ``output``, which converts ``classified_lines`` (as returned by `source_lexer`) to some format, if the conversion which produced ``classified_lines`` is being profiled.
+def _profile_output(classified_lines, output):
+    if isinstance(classified_lines, _ProfiledStage):
+        return _ProfiledStage(classified_lines.profile, output.__name__, output)
+    return output
+
+
+# .. _Engines:
+#
+# Engines
+# ^^^^^^^
+# By default, `source_lexer` runs a Pygments lexer, then groups its tokens. The ``fast`` engine instead finds these groups directly with a scanner written for a specific language, which is much faster; see `CFamilyScanner.py` and `PythonScanner.py`. It supports C, C++, Go, Java, JavaScript, Python, Rust, and TypeScript; for other languages, or code which the scanner can't classify exactly as Pygments does, it falls back to Pygments, so the classification is the same with either engine. To select an engine, pass ``engine`` to `source_lexer`, convert within `use_engine`, or set the ``CODECHAT_ENGINE`` environment variable; these are consulted in this order.
+#
+# The scanners copy the rules of the Pygments lexers for these languages, as of Pygments version ``FAST_ENGINE_PYGMENTS_VERSION``. Since other versions may lex differently, the ``fast`` engine uses Pygments unless this version is installed.
+#
+# The environment variable which selects an engine.
+ENGINE_ENV_VAR = "CODECHAT_ENGINE"
+
+# The available engines.
+ENGINES = ("pygments", "fast")
+
+# The ``(major, minor)`` version of Pygments whose lexer rules the ``fast`` engine's scanners copy.
+FAST_ENGINE_PYGMENTS_VERSION = (2, 19)
+
+# The engine selected by the innermost `use_engine`, or None outside it.
+_engine = ContextVar("_engine", default=None)
+
+
+# .. _use_engine:
+#
+# use_engine
+# """"""""""
+# Use ``engine`` for all conversions begun within this context manager. If ``engine`` is None, leave the engine unchanged.
+@contextmanager
+def use_engine(engine):
+    if engine is None:
+        yield
+        return
+    _check_engine(engine)
+    token = _engine.set(engine)
+    try:
+        yield
+    finally:
+        _engine.reset(token)
+
+
+# Return the engine to use, given the ``engine`` passed to `source_lexer`.
+def _get_engine(engine):
+    if engine is None:
+        engine = _engine.get() or os.environ.get(ENGINE_ENV_VAR) or "pygments"
+    _check_engine(engine)
+    return engine
+
+
+# Raise a ValueError if ``engine`` isn't one of ``ENGINES``.
+def _check_engine(engine):
+    if engine not in ENGINES:
+        raise ValueError(
+            "Unknown engine {!r}; use one of {}.".format(engine, ", ".join(ENGINES))
+        )
+
+
+# Classify ``code_str`` using the ``fast`` engine. Return ``(token_group, python_docstrings)``, where ``token_group`` is the list of groups produced by steps 1 and 2 of `source_lexer`, or None if this engine doesn't support this lexer or code. Since the Python scanner only classifies code which parses, this code has no syntax errors. ``python_docstrings`` is the result of ``_python_docstrings`` for Python code, which ``_pygments_lexer`` reuses if the scanner gives up, so that this code is parsed only once; it's None for other code.
+def _fast_lexer(
+    # See code_str_.
+    code_str,
+    # See lexer_.
+    lexer,
+    # See docstrings_.
+    docstrings,
+):
+    scanners = _fast_scanners()
+    if not scanners:
+        return None, None
+    text = _pygments_get_tokens_preprocess(lexer, code_str)
+    python_docstrings = _python_docstrings(text) if _is_python(lexer) else None
+    for scanner in scanners:
+        token_group = scanner(text, lexer, docstrings, python_docstrings)
+        if token_group is not None:
+            return token_group, python_docstrings
+    return None, python_docstrings
+
+
+# Return a tuple of the scanners used by the ``fast`` engine. Each is a function taking the preprocessed text, the lexer, `docstrings`_, and the result of ``_python_docstrings`` for Python code (or None), and returning the groups ``_group_lexer_tokens`` would produce, or None if it doesn't support this lexer or text. Return an empty tuple if the installed Pygments isn't ``FAST_ENGINE_PYGMENTS_VERSION``, or if the scanners can't be loaded.
+@lru_cache(maxsize=None)
+def _fast_scanners():
+    if _pygments_version() != FAST_ENGINE_PYGMENTS_VERSION:
+        return ()
+    # Import here, since these modules import from this one. They use Pygments internals when they're loaded, which may fail in any number of ways with an unexpected Pygments; if so, use Pygments.
+    try:
+        from .CFamilyScanner import scan_c_family
+        from .PythonScanner import scan_python
+    except Exception:
+        return ()
+    return (
+        lambda text, lexer, docstrings, python_docstrings: scan_c_family(text, lexer),
+        scan_python,
+    )
+
+
+# Return the ``(major, minor)`` version of the installed Pygments.
+def _pygments_version():
+    return tuple(int(part) for part in pygments.__version__.split(".")[:2])
+
+
+# .. _Token collection:
+#
+# Token collection
+# ^^^^^^^^^^^^^^^^
+# Highlighting the code in a file lexes it again. To avoid this, convert within `collect_tokens`: each conversion which runs the Pygments lexer then appends a ``(tokens, classified_lines)`` pair to the list it provides, where ``tokens`` is a list of the ``(tokentype, string)`` pairs produced by the lexer, and ``classified_lines`` is a list of the ``(type, string)`` pairs produced by `source_lexer`. These lists are filled as the conversion proceeds. The `fast engine <Engines>` doesn't run the Pygments lexer (unless it falls back to Pygments), so it provides no tokens. See ``_doctree_read`` in `CodeToRestSphinx.py`, which uses these tokens to highlight code.
+#
+# The list provided by the innermost `collect_tokens`, or None outside it.
+_token_lists = ContextVar("_token_lists", default=None)
+
+
+# .. _collect_tokens:
+#
+# collect_tokens
+# """"""""""""""
+# Collect the tokens of all conversions begun within this context manager, providing a list to which the tokens of each conversion are appended.
+@contextmanager
+def collect_tokens():
+    token_lists = []
+    token = _token_lists.set(token_lists)
+    try:
+        yield token_lists
+    finally:
+        _token_lists.reset(token)
+
+
+# Yield each item of ``iterable``, also appending it to the list ``items``.
+def _append_each(iterable, items):
+    for item in iterable:
+        items.append(item)
+        yield item
+
+
 # .. _source_lexer:
 #
 # Implementation
@@ -123,10 +527,79 @@ def source_lexer(
     code_str,
     # _`lexer`: The lexer used to analyze the code.
     lexer,
+    # _`docstrings`: True to render Python docstrings as comments; False to leave them as code. When False, the Python code isn't parsed, so syntax errors aren't reported.
+    docstrings=True,
+    # _`engine`: The `engine <Engines>` used to classify the code: ``"pygments"``, ``"fast"``, or None to use the engine selected by `use_engine` or the ``CODECHAT_ENGINE`` environment variable, defaulting to ``"pygments"``.
+    engine=None,
 ):
     _debug_print("Lexer: {}\n".format(lexer.name))
-    # Gather some additional information, based on the lexer, which is needed
-    # to correctly process comments:
+    cdi, comment_is_inline, comment_is_block = _lexer_comment_info(lexer)
+    # Record the time spent in each stage, if `profiling <Profiling>` is enabled.
+    profile = _start_profile(lexer, code_str)
+    start = time.perf_counter()
+    # Collect tokens, if requested by `collect_tokens`.
+    token_lists = _token_lists.get()
+
+    # The fast engine performs steps 1 and 2 at once, if it supports this code.
+    token_group, python_docstrings = (
+        _fast_lexer(code_str, lexer, docstrings)
+        if _get_engine(engine) == "fast"
+        else (None, None)
+    )
+    fast = token_group is not None
+    if fast:
+        ast_syntax_error = ""
+        token_group = _profile_stage(
+            profile, "_fast_lexer", token_group, time.perf_counter() - start
+        )
+    else:
+        # 1.    Invoke a Pygments lexer on the provided source code, obtaining an
+        #       iterable of tokens. Also analyze Python code for docstrings.
+        #
+        token_iter, ast_docstring, ast_syntax_error = _pygments_lexer(
+            code_str, lexer, docstrings, python_docstrings
+        )
+        if token_lists is not None:
+            tokens, classified_lines = [], []
+            token_lists.append((tokens, classified_lines))
+            token_iter = _append_each(token_iter, tokens)
+        token_iter = _profile_stage(
+            profile, "_pygments_lexer", token_iter, time.perf_counter() - start
+        )
+
+        # 2.    Combine tokens from the lexer into three groups: whitespace,
+        #       comment, or other.
+        token_group = _profile_stage(
+            profile,
+            "_group_lexer_tokens",
+            _group_lexer_tokens(
+                token_iter, comment_is_inline, comment_is_block, ast_docstring
+            ),
+        )
+
+    # 3.    Make a per-line list of [group, ws_len, string], so that the last
+    #       string in each list ends with a newline. Change the group of block
+    #       comments that actually span multiple lines.
+    gathered_group = _profile_stage(
+        profile,
+        "_gather_groups_on_newlines",
+        _gather_groups_on_newlines(token_group, cdi),
+    )
+
+    # 4.    Classify each line. For CodeChat-formatted comments, remove the leading whitespace and all comment characters (the // or #, for example).
+    classified_group = _classify_groups(gathered_group, cdi, lexer)
+    if token_lists is not None and not fast:
+        classified_group = _append_each(classified_group, classified_lines)
+    return ast_syntax_error, _profile_stage(
+        profile, "_classify_groups", classified_group
+    )
+
+
+# Gather some additional information, based on the lexer, which is needed to correctly process comments. Return a tuple of (an element of ``COMMENT_DELIMITER_INFO``, `comment_is_inline`_, `comment_is_block`_).
+def _lexer_comment_info(
+    # See lexer_.
+    lexer,
+):
     cdi = COMMENT_DELIMITER_INFO[lexer.name]
     # * If there's no multi-line start info, then classify generic comments as
     #   inline. The exception is HTML, which (currently, as of Pygments v.10.0) classifies as generic comments, but also supports in-line JavaScript comments.
@@ -135,25 +608,7 @@ def source_lexer(
     #   comments. Note that inline comments are a sequence of strings, so look
     #   inside the sequence to the string.
     comment_is_block = True if lexer.name == "HTML" else not cdi[0][0]
-
-    # 1.    Invoke a Pygments lexer on the provided source code, obtaining an
-    #       iterable of tokens. Also analyze Python code for docstrings.
-    #
-    token_iter, ast_docstring, ast_syntax_error = _pygments_lexer(code_str, lexer)
-
-    # 2.    Combine tokens from the lexer into three groups: whitespace, comment,
-    #       or other.
-    token_group = _group_lexer_tokens(
-        token_iter, comment_is_inline, comment_is_block, ast_docstring
-    )
-
-    # 3.    Make a per-line list of [group, ws_len, string], so that the last
-    #       string in each list ends with a newline. Change the group of block
-    #       comments that actually span multiple lines.
-    gathered_group = _gather_groups_on_newlines(token_group, cdi)
-
-    # 4.    Classify each line. For CodeChat-formatted comments, remove the leading whitespace and all comment characters (the // or #, for example).
-    return ast_syntax_error, _classify_groups(gathered_group, cdi, lexer)
+    return cdi, comment_is_inline, comment_is_block
 
 
 # .. _CodeChat style:
@@ -261,6 +716,10 @@ def _pygments_lexer(
     code_str,
     # See lexer_.
     lexer,
+    # See docstrings_.
+    docstrings=True,
+    # The result of ``_python_docstrings`` for this code, if it's already known; otherwise, None.
+    python_docstrings=None,
 ):
     # Pygments does some cleanup on the code given to it before lexing it. If
     # this is Python code, we want to run AST on that cleaned-up version, so
@@ -329,37 +788,14 @@ def _pygments_lexer(
     # So, process this with ast_ if this is Python or Python3 code to find docstrings.
     # If found, store ``{ ending_line_number_of_the_comment: docstring }`` into
     # ``ast_docstring``.
-    ast_docstring = {}
-    # Provide a place to store syntax errors resulting from parsing the Python code.
-    ast_syntax_error = ""
     # Determine if code is Python or Python3. Note that AST processing cannot
     # support Python 2 specific syntax (e.g. the ``<>`` operator).
-    if lexer.name == "Python" or lexer.name == "Python 3":
-        # Syntax errors cause ``ast.parse`` to fail. Catch and report them.
-        try:
-            # If so, walk through the preprocessed code to analyze each token.
-            for _ in ast.walk(ast.parse(preprocessed_code_str)):
-                try:
-                    # Check if current token is a docstring. The docstring will
-                    # be cleaned later.
-                    d = ast.get_docstring(_, False)
-                    if d is not None:
-                        # If so, store current line number and token value. Note
-                        # that ``lineno`` gives the last line of the string,
-                        # per http://bugs.python.org/issue16806, for
-                        # Python <= 3.7. Per the docs, ``end_lineno`` was
-                        # introduced in Python 3.8.
-                        end_lineno = getattr(_.body[0], "end_lineno", _.body[0].lineno)
-                        ast_docstring[end_lineno] = d
-                except (AttributeError, TypeError):
-                    pass
-        except SyntaxError as err:
-            # Take the file name (which shows up as ``<unknown>``) out of the error message returned.
-            ast_syntax_error = (
-                "SyntaxError: {}. Docstrings cannot be processed.\n".format(
-                    err
-                ).replace("<unknown>, ", "")
-            )
+    if docstrings and _is_python(lexer):
+        ast_docstring, ast_syntax_error = python_docstrings or _python_docstrings(
+            preprocessed_code_str
+        )
+    else:
+        ast_docstring, ast_syntax_error = {}, ""
 
     # Now, run the lexer.
     return (
@@ -369,6 +805,66 @@ def _pygments_lexer(
     )
 
 
+# Return True if ``lexer`` lexes Python code, whose docstrings ``_python_docstrings`` can find.
+def _is_python(lexer):
+    return lexer.name == "Python" or lexer.name == "Python 3"
+
+
+# Find docstrings in the given Python code. Return a tuple of (``ast_docstring``, ``ast_syntax_error``) as described above.
+def _python_docstrings(
+    # The (preprocessed) Python code to analyze.
+    code_str,
+):
+    ast_docstring = {}
+    # Provide a place to store syntax errors resulting from parsing the Python code.
+    ast_syntax_error = ""
+    # Syntax errors cause ``ast.parse`` to fail. Catch and report them.
+    try:
+        # Look through the code for docstrings.
+        for node in _docstring_nodes(ast.parse(code_str)):
+            # Check if this node has a docstring. The docstring will be
+            # cleaned later.
+            d = ast.get_docstring(node, False)
+            if d is not None:
+                # If so, store current line number and token value. Note
+                # that ``lineno`` gives the last line of the string,
+                # per http://bugs.python.org/issue16806, for
+                # Python <= 3.7. Per the docs, ``end_lineno`` was
+                # introduced in Python 3.8.
+                end_lineno = getattr(node.body[0], "end_lineno", node.body[0].lineno)
+                ast_docstring[end_lineno] = d
+    except SyntaxError as err:
+        # Take the file name (which shows up as ``<unknown>``) out of the error message returned.
+        ast_syntax_error = "SyntaxError: {}. Docstrings cannot be processed.\n".format(
+            err
+        ).replace("<unknown>, ", "")
+    return ast_docstring, ast_syntax_error
+
+
+# Only modules, classes, and functions have docstrings. These can only be nested inside statements, so yield them by walking just the statements of the AST, rather than every node as ``ast.walk`` does.
+def _docstring_nodes(
+    # The AST to walk.
+    node,
+):
+    if isinstance(node, _DOCSTRING_NODE_TYPES):
+        yield node
+    for field in _STATEMENT_LIST_FIELDS:
+        for child in getattr(node, field, ()):
+            yield from _docstring_nodes(child)
+
+
+# The types of AST nodes which may have a docstring, per ``ast.get_docstring``.
+_DOCSTRING_NODE_TYPES = (
+    ast.Module,
+    ast.ClassDef,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+)
+
+# The fields of AST nodes which contain a list of statements, exception handlers (``except`` clauses), or ``match`` cases.
+_STATEMENT_LIST_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
 # Pygments monkeypatching
 # ^^^^^^^^^^^^^^^^^^^^^^^
 # Provide a way to perform preprocessing on text before lexing it. This code was
@@ -461,11 +957,15 @@ def _group_lexer_tokens(
     comment_is_block,
     # Docstring dict found from AST scanning.
     ast_docstring,
+    # The line number of the first token in ``iter_token``.
+    first_lineno=1,
 ):
-    # Keep track of the current group, string, and line no.
-    current_string = ""
+    # Look up the group for each tokentype in a table, rather than calling group_for_tokentype_ for each token.
+    group_table = _get_group_table(comment_is_inline, comment_is_block)
+    # Keep track of the current group, the strings making up this group, and line no. Collect a group's strings in a list then join them once, rather than repeatedly appending to a string, so that building a group takes time proportional to its length.
+    current_strings = []
     current_group = None
-    token_lineno = 1
+    token_lineno = first_lineno
     # Walk through tokens.
     for tokentype, string in iter_token:
         _debug_print("tokentype = {}, string = {}\n".format(tokentype, [string]))
@@ -482,21 +982,22 @@ def _group_lexer_tokens(
                 # Insert an extra space after the docstring delimiter, making
                 # this look like a reST comment.
                 string = string[0:3] + " " + string[3:]
-        group = _group_for_tokentype(tokentype, comment_is_inline, comment_is_block)
+        group = group_table[tokentype]
 
         # If there's a change in group, yield what we've accumulated so far,
         # then initialize the state to the newly-found group and string.
         if current_group is None:
             current_group = group
         if current_group != group:
-            yield current_group, current_string
+            yield current_group, "".join(current_strings)
             current_group = group
-            current_string = string
+            current_strings = [string]
         # Otherwise, keep accumulating.
         else:
-            current_string += string
+            current_strings.append(string)
 
     # Output final pair, if we have it.
+    current_string = "".join(current_strings)
     if current_string:
         yield current_group, current_string
 
@@ -560,6 +1061,42 @@ def _group_for_tokentype(
     return _GROUP.other
 
 
+# .. _group table:
+#
+# Since group_for_tokentype_ tests the tokentype's place in the hierarchy of Pygments tokens, calling it for every token is slow. Instead, a lexer produces only a few distinct tokentypes, so memoize its result in a table which maps a tokentype to its group. Missing entries are computed on first use.
+class _GroupTable(dict):
+    def __init__(
+        self,
+        # See comment_is_inline_.
+        comment_is_inline,
+        # See comment_is_block_.
+        comment_is_block,
+    ):
+        self.comment_is_inline = comment_is_inline
+        self.comment_is_block = comment_is_block
+
+    def __missing__(self, tokentype):
+        group = self[tokentype] = _group_for_tokentype(
+            tokentype, self.comment_is_inline, self.comment_is_block
+        )
+        return group
+
+
+# The group tables, keyed by ``(comment_is_inline, comment_is_block)``. Languages which share these values share a table.
+_group_tables = {}
+
+
+# Return the `group table`_ for the given values of comment_is_inline_ and comment_is_block_.
+def _get_group_table(comment_is_inline, comment_is_block):
+    key = (comment_is_inline, comment_is_block)
+    group_table = _group_tables.get(key)
+    if group_table is None:
+        group_table = _group_tables.setdefault(
+            key, _GroupTable(comment_is_inline, comment_is_block)
+        )
+    return group_table
+
+
 # Step #3 of source_lexer_
 # ------------------------
 # Given an iterable of groups, break them into lists based on newlines. The list
@@ -15,68 +15,284 @@
 #
 # Standard library
 # ----------------
-import sys
+from concurrent.futures import ProcessPoolExecutor
 import json
+from json.decoder import scanstring
+import os
 from pathlib import Path
+import re
+import sys
 
 # Third-party imports
 # -------------------
 import pygments.util
 
+# Use orjson or msgspec, if installed, to read and write the book; see `Reading and writing the book`_.
+try:
+    from orjson import dumps as _fast_dumps, loads as _fast_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as _fast_loads, encode as _fast_dumps
+    except ImportError:
+        _fast_loads = _fast_dumps = None
+
 # Local application imports
 # -------------------------
-from CodeChat.CommentDelimiterInfo import SUPPORTED_GLOBS
+from CodeChat.CommentDelimiterInfo import GlobMatcher, get_supported_globs
 from CodeChat.CodeToMarkdown import code_to_markdown_string
-from CodeChat.SourceClassifier import get_lexer
+from CodeChat.ConversionCache import DEFAULT_MAX_SIZE, ConversionCache
+from CodeChat.SourceClassifier import _get_filename_index, get_lexer
 
 
 # Code
 # ====
-# This is the heart of the program: given a list of ``sub_items``, walk the list, transforming source code to Markdown.
-def process_sections(sub_items, source_suffixpatterns, lexer_for_glob):
-    for section in sub_items:
-        # If this is a chapter, instead of a section title / separator / etc., process it. (Note that separators aren't a dict, but instead the string "Separator".)
-        chapter = None if isinstance(section, str) else section.get("Chapter")
-        if chapter:
-            source_path = Path(chapter["source_path"])
+# This is the heart of the program: given a list of ``sub_items``, transform each source code chapter in it to Markdown. Converting a chapter doesn't depend on any other chapter, so spread this work over a pool of ``jobs`` processes, then store the results back in the chapters they came from.
+def process_sections(
+    sub_items,
+    source_suffixpatterns,
+    lexer_for_glob,
+    docstrings,
+    # The number of worker processes; if None, use the number of CPUs. With 1 (or only one chapter to convert), convert in this process, which avoids the cost of starting a pool.
+    jobs=1,
+    # A `ConversionCache`, or None to convert every chapter. Chapters found in the cache aren't sent to the pool at all, so rebuilding a book after editing one chapter converts only that chapter.
+    cache=None,
+):
+    chapters = []
+    work = []
+    # The cache key for each chapter in ``chapters``.
+    keys = []
+    hits = 0
+    for chapter in flatten_chapters(sub_items):
+        source_path = Path(chapter["source_path"])
+        # Don't process Markdown files. Try everything else.
+        if source_path.suffix != ".md" and is_supported_language(
+            source_path, source_suffixpatterns
+        ):
+            # See if ``source_file`` matches any of the globs; on a match, use the specified lexer alias.
+            lexer_alias = None
+            for glob, alias in lexer_for_glob.items():
+                if source_path.match(glob):
+                    lexer_alias = alias
+                    break
             content = chapter["content"]
-            # Don't process Markdown files. Try everything else.
-            if source_path.suffix != ".md" and is_supported_language(
-                source_path, source_suffixpatterns
-            ):
-                # See if it's an extension we should process.
+            if cache:
                 try:
-                    # See if ``source_file`` matches any of the globs.
-                    lexer = None
-                    for glob, lexer_alias in lexer_for_glob.items():
-                        if source_path.match(glob):
-                            # On a match, pass the specified lexer alias.
-                            lexer = get_lexer(alias=lexer_alias)
-                            break
-                    # Do this after checking the ``lexer_for_glob`` list, since this will raise an exception on failure.
-                    lexer = lexer or get_lexer(filename=str(source_path), code=content)
-
-                    chapter["content"] = code_to_markdown_string(content, lexer=lexer)
-                    print(
-                        f"Converted {source_path} using the {lexer.name} lexer.",
-                        file=sys.stderr,
-                    )
-
+                    lexer = _get_chapter_lexer(str(source_path), content, lexer_alias)
                 except (KeyError, pygments.util.ClassNotFound):
                     # We don't support this language.
-                    pass
+                    continue
+                key = cache.key("markdown", content, lexer, docstrings)
+                markdown = cache.get(key)
+                if markdown is not None:
+                    chapter["content"] = markdown
+                    hits += 1
+                    continue
+                keys.append(key)
+                # Pass the lexer found here to the worker, rather than having it find (and perhaps guess) the lexer again.
+                lexer_alias = lexer.aliases[0] if lexer.aliases else lexer_alias
+            chapters.append(chapter)
+            work.append((str(source_path), content, lexer_alias, docstrings))
+
+    # ``os.cpu_count`` returns None if the number of CPUs can't be determined.
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(work) <= 1:
+        results = map(_convert_chapter, work)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(jobs, initializer=_get_filename_index)
+        # Send chapters to the workers in chunks, since most chapters convert faster than a round trip to a worker process.
+        results = executor.map(
+            _convert_chapter, work, chunksize=max(1, len(work) // (jobs * 4))
+        )
+    try:
+        # ``map`` returns results in the order of ``work``, so the output doesn't depend on which worker finishes first.
+        for index, (chapter, result) in enumerate(zip(chapters, results)):
+            if result:
+                chapter["content"], lexer_name = result
+                print(
+                    f"Converted {chapter['source_path']} using the {lexer_name} lexer.",
+                    file=sys.stderr,
+                )
+                # Only this process writes to the cache, so the workers don't contend for the database.
+                if cache:
+                    cache.put(keys[index], "markdown", lexer_name, chapter["content"])
+    finally:
+        if executor:
+            executor.shutdown()
+    if cache:
+        print(
+            f"CodeChat cache: {hits} hits, {len(work)} misses.",
+            file=sys.stderr,
+        )
+
+
+# Yield each chapter in ``sub_items``, in the order they appear in the book: a chapter precedes the chapters nested in it. Sections which aren't chapters (such as a part title, or a separator, which is the string "Separator" instead of a dict) are skipped.
+def flatten_chapters(sub_items):
+    # Walk the tree using a stack of iterators instead of recursion, since books may be deeply nested.
+    stack = [iter(sub_items)]
+    while stack:
+        section = next(stack[-1], None)
+        if section is None:
+            stack.pop()
+            continue
+        chapter = None if isinstance(section, str) else section.get("Chapter")
+        if chapter:
+            yield chapter
+            stack.append(iter(chapter["sub_items"]))
+
+
+# Convert one chapter to Markdown, returning ``(markdown, lexer_name)``, or None if CodeChat doesn't support its language. This runs in a worker process, so it takes and returns only values which can be pickled.
+def _convert_chapter(
+    # A tuple of ``(source_path, content, lexer_alias, docstrings)``, where ``lexer_alias`` is None unless the chapter matched a glob in ``lexer_for_glob`` or ``process_sections`` already found its lexer.
+    args,
+):
+    source_path, content, lexer_alias, docstrings = args
+    try:
+        lexer = _get_chapter_lexer(source_path, content, lexer_alias)
+        return (
+            code_to_markdown_string(content, lexer=lexer, docstrings=docstrings),
+            lexer.name,
+        )
+    except (KeyError, pygments.util.ClassNotFound):
+        # We don't support this language.
+        return None
+
 
-            process_sections(
-                chapter["sub_items"], source_suffixpatterns, lexer_for_glob
-            )
+# Return the lexer for a chapter: the lexer named by ``lexer_alias`` if given; otherwise, the lexer for ``source_path``. This raises an exception if there's no such lexer.
+def _get_chapter_lexer(source_path, content, lexer_alias):
+    if lexer_alias:
+        return get_lexer(alias=lexer_alias)
+    return get_lexer(filename=source_path, code=content)
 
 
 # Return True if the provided filename is a source code language CodeChat supports.
 def is_supported_language(filename, source_suffixpatterns):
-    for source_suffixpattern in source_suffixpatterns:
-        if filename.match(source_suffixpattern):
-            return True
-    return False
+    return source_suffixpatterns.match(filename)
+
+
+# Reading and writing the book
+# ----------------------------
+# mdbook sends ``[context, book]`` to the preprocessor as JSON, then reads back the book. For a large book, this JSON is large, and nearly all of it is the content of chapters. If orjson or msgspec is installed, use it, since these parse and produce JSON several times faster than the standard library. Otherwise, `BookScanner`_ avoids keeping and re-encoding content which doesn't change: it discards the content of Markdown chapters, then writes back the JSON it read, replacing only the content of chapters which were converted.
+#
+# .. _BookScanner:
+#
+# BookScanner
+# ^^^^^^^^^^^
+class BookScanner:
+    # Whitespace between JSON values.
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+    # A JSON number, or one of the JSON constants.
+    _SCALAR = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?|true|false|null")
+    _CONSTANTS = {"true": True, "false": False, "null": None}
+    # The ``content`` of a Markdown chapter, which was discarded after it was read.
+    DISCARDED = object()
+    # The maximum number of characters of the input to copy to the output at once.
+    _COPY_SIZE = 2**20
+
+    # Parse ``text``, which contains ``[context, book]`` as JSON, into ``self.context`` and ``self.book``.
+    def __init__(self, text):
+        self.text = text
+        # A list of ``(chapter, start, end, content)`` for each chapter in the book, where ``text[start:end]`` is the JSON for the chapter's content, and ``content`` is its content as read (or ``DISCARDED``).
+        self.chapters = []
+        idx = self._expect(self._skip(0), "[")
+        self.context, idx = self._value(self._skip(idx))
+        self.book_start = self._skip(self._expect(self._skip(idx), ","))
+        self.book, self.book_end = self._value(self.book_start)
+        idx = self._expect(self._skip(self.book_end), "]")
+        if self._skip(idx) != len(text):
+            raise ValueError(f"Extra data at position {idx}.")
+
+    # Write the book as JSON, by calling ``write`` with pieces of it.
+    def dump(self, write):
+        idx = self.book_start
+        for chapter, start, end, content in sorted(
+            self.chapters, key=lambda item: item[1]
+        ):
+            if chapter["content"] is not content:
+                self._copy(write, idx, start)
+                write(json.dumps(chapter["content"]))
+                idx = end
+        self._copy(write, idx, self.book_end)
+
+    # Write ``text[start:end]`` in pieces, rather than making a copy of all of it.
+    def _copy(self, write, start, end):
+        for idx in range(start, end, self._COPY_SIZE):
+            write(self.text[idx : min(idx + self._COPY_SIZE, end)])
+
+    # Return the index of the first non-whitespace character at or after ``idx``.
+    def _skip(self, idx):
+        # mdbook sends compact JSON, so avoid the cost of a regex when there's no whitespace.
+        if not self.text[idx : idx + 1].isspace():
+            return idx
+        return self._WHITESPACE.match(self.text, idx).end()
+
+    # Return the index following the character ``c``, which must be at ``idx``.
+    def _expect(self, idx, c):
+        if self.text[idx : idx + 1] != c:
+            raise ValueError(f"Expected {c!r} at position {idx}.")
+        return idx + 1
+
+    # Return ``(value, end)``, where ``value`` is the JSON value starting at ``idx`` and ``end`` is the index following it.
+    def _value(self, idx):
+        c = self.text[idx : idx + 1]
+        if c == '"':
+            return scanstring(self.text, idx + 1)
+        if c == "{":
+            return self._object(idx)
+        if c == "[":
+            return self._array(idx)
+        m = self._SCALAR.match(self.text, idx)
+        if not m:
+            raise ValueError(f"Expected a value at position {idx}.")
+        s = m.group()
+        if s in self._CONSTANTS:
+            return self._CONSTANTS[s], m.end()
+        return (float(s) if m.group(2) or m.group(3) else int(s)), m.end()
+
+    def _object(self, idx):
+        text = self.text
+        obj = {}
+        # The start and end of the ``content`` string, if this object has one.
+        content_span = None
+        idx = self._skip(idx + 1)
+        if text[idx : idx + 1] == "}":
+            return obj, idx + 1
+        while True:
+            if text[idx : idx + 1] != '"':
+                raise ValueError(f"Expected a key at position {idx}.")
+            key, idx = scanstring(text, idx + 1)
+            idx = self._skip(self._expect(self._skip(idx), ":"))
+            start = idx
+            obj[key], idx = self._value(idx)
+            if key == "content" and isinstance(obj[key], str):
+                content_span = (start, idx)
+            idx = self._skip(idx)
+            if text[idx : idx + 1] == "}":
+                break
+            idx = self._skip(self._expect(idx, ","))
+
+        # Only chapters have a ``source_path``.
+        if content_span and "source_path" in obj:
+            source_path = obj["source_path"]
+            # Discard the content of Markdown chapters, since ``process_sections`` doesn't change them.
+            if isinstance(source_path, str) and Path(source_path).suffix == ".md":
+                obj["content"] = self.DISCARDED
+            self.chapters.append((obj, *content_span, obj["content"]))
+        return obj, idx + 1
+
+    def _array(self, idx):
+        text = self.text
+        array = []
+        idx = self._skip(idx + 1)
+        if text[idx : idx + 1] == "]":
+            return array, idx + 1
+        while True:
+            value, idx = self._value(idx)
+            array.append(value)
+            idx = self._skip(idx)
+            if text[idx : idx + 1] == "]":
+                return array, idx + 1
+            idx = self._skip(self._expect(idx, ","))
 
 
 # main
@@ -89,14 +305,46 @@ def main():
 
     # Delay imports until this point, so the first phase of the build (detecting support, which is handled above) can run without these.
     # Load both the context and the book representations from stdin.
-    context, book = json.load(sys.stdin)
+    input_ = sys.stdin.buffer.read()
+    if _fast_loads:
+        context, book = _fast_loads(input_)
+    else:
+        scanner = BookScanner(input_.decode("utf-8"))
+        context, book = scanner.context, scanner.book
+    del input_
     # Get the lexer_for_glob dict.
-    lexer_for_glob = context["config"]["preprocessor"]["CodeChat"]["lexer_for_glob"]
-    source_suffixpatterns = SUPPORTED_GLOBS | set(lexer_for_glob.keys())
+    codechat_config = context["config"]["preprocessor"]["CodeChat"]
+    lexer_for_glob = codechat_config["lexer_for_glob"]
+    # Optionally, ``docstrings = false`` leaves Python docstrings as code. See `docstrings <docstrings>`.
+    docstrings = codechat_config.get("docstrings", True)
+    # Optionally, ``jobs = N`` sets the number of worker processes used to convert chapters; it defaults to the number of CPUs.
+    jobs = codechat_config.get("jobs")
+    # Optionally, ``cache_dir = "path"`` stores converted chapters in a `ConversionCache`, so that rebuilding the book reconverts only the chapters which changed. A relative path is relative to the book's root directory. ``cache_max_size`` gives the maximum size of the cache, in bytes; when the cache grows larger, it evicts the least-recently used chapters.
+    cache_dir = codechat_config.get("cache_dir")
+    cache = (
+        None
+        if cache_dir is None
+        else ConversionCache(
+            Path(context["root"]) / cache_dir,
+            codechat_config.get("cache_max_size", DEFAULT_MAX_SIZE),
+        )
+    )
+    # Optionally, ``use_snapshot = true`` finds source files using the snapshot of the `supported globs <get_supported_globs>`, which is faster but omits globs for lexers provided by plugins.
+    use_snapshot = codechat_config.get("use_snapshot", False)
+    source_suffixpatterns = GlobMatcher(
+        get_supported_globs(use_snapshot) | set(lexer_for_glob.keys())
+    )
     # Walk through each file, rendering it if possible.
-    process_sections(book["sections"], source_suffixpatterns, lexer_for_glob)
+    process_sections(
+        book["sections"], source_suffixpatterns, lexer_for_glob, docstrings, jobs, cache
+    )
+    if cache:
+        cache.close()
     # Dump the updated book back to mdbook via stdout.
-    print(json.dumps(book))
+    if _fast_dumps:
+        sys.stdout.buffer.write(_fast_dumps(book))
+    else:
+        scanner.dump(lambda s: sys.stdout.buffer.write(s.encode("utf-8")))
 
 
 if __name__ == "__main__":
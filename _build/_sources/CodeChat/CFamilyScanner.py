@@ -0,0 +1,866 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***************************************************
+# |docname| - A fast scanner for C-family languages
+# ***************************************************
+# To classify code, `source_lexer` needs to know only which parts of the code are whitespace, inline comments, block comments, or anything else. A Pygments lexer finds much more: it classifies every keyword, name, number, and operator, trying each of its rules in turn at every token. For C, C++, Go, Java, JavaScript, Rust, and TypeScript, `scan_c_family` instead finds the same groups with one compiled regular expression per lexer state, which recognizes only whitespace, strings, character literals, and comments; everything else is lumped together as code. `source_lexer` uses this scanner when the `fast engine <Engines>` is selected.
+#
+# The result must be identical to the groups ``_group_lexer_tokens`` produces from the Pygments lexer's tokens, quirks included. So, each scanner below follows the rules of the corresponding Pygments lexer (as of Pygments 2.19; the ``fast`` engine uses these scanners only with this version, given by ``FAST_ENGINE_PYGMENTS_VERSION``), copying its regular expressions for comments, strings, and character literals and tracking the lexer states which change how these are recognized: for example, C preprocessor directives and ``#if 0`` blocks, regular expression literals and template strings in JavaScript, or nested comments, lifetimes, and raw strings in Rust. ``test/CFamilyScanner_test.py`` checks this against Pygments. Where following Pygments exactly would require running its full lexer, the scanner gives up, and `source_lexer` falls back to Pygments; see `_Unsupported <Unsupported>`.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from itertools import groupby
+from operator import itemgetter
+import re
+
+# Third-party imports
+# -------------------
+from pygments.lexers import (
+    CLexer,
+    CppLexer,
+    GoLexer,
+    JavaLexer,
+    JavascriptLexer,
+    RustLexer,
+    TypeScriptLexer,
+)
+from pygments.lexers.javascript import JS_IDENT
+
+# Local application imports
+# -------------------------
+from .SourceClassifier import _GROUP
+
+# Scanning
+# ========
+# The groups produced by each scanner.
+_WS = _GROUP.whitespace
+_INLINE = _GROUP.inline_comment
+_BLOCK = _GROUP.block_comment
+_OTHER = _GROUP.other
+
+
+# .. _scan_c_family:
+#
+# scan_c_family
+# -------------
+# Return a list of ``(group, string)`` pairs for ``text``, the same as ``_group_lexer_tokens`` produces from the tokens of ``lexer``. Return None if this module doesn't support the lexer, or if it can't classify this text exactly.
+def scan_c_family(
+    # The code to classify, already preprocessed by ``_pygments_get_tokens_preprocess``.
+    text,
+    # The Pygments lexer whose groups should be reproduced.
+    lexer,
+):
+    scanner = _SCANNERS.get(type(lexer))
+    # A lexer's filters may change its tokens, which this module can't reproduce.
+    if scanner is None or lexer.filters:
+        return None
+    try:
+        tokens = scanner(text)
+    except _Unsupported:
+        return None
+    # Merge adjacent tokens in the same group, as ``_group_lexer_tokens`` does.
+    return [
+        (group, "".join(map(itemgetter(1), pairs)))
+        for group, pairs in groupby(tokens, itemgetter(0))
+    ]
+
+
+# .. _Unsupported:
+#
+# _Unsupported
+# ------------
+# Raised by a scanner when it can't reproduce the Pygments lexer exactly. For example, the C lexer recognizes function definitions using a single regular expression, which can span several lines and treats a ``//`` comment containing a ``)`` inside the parameter list as code. Rather than reproduce this, the scanner gives up when it finds a comment which could be affected.
+class _Unsupported(Exception):
+    pass
+
+
+# Append ``string`` to ``tokens``, placing its whitespace in the whitespace group and everything else in the other group. This matches the groups produced by Pygments rules whose match contains only names, punctuation, and whitespace.
+def _append_code(tokens, string):
+    for m in _WS_OR_NOT.finditer(string):
+        tokens.append((_OTHER if m.lastgroup == "other" else _WS, m.group()))
+
+
+_WS_OR_NOT = re.compile(r"(?P<ws>\s+)|(?P<other>\S+)")
+_SPACE = re.compile(r"\s+")
+
+
+# C and C++
+# =========
+# See ``pygments.lexers.c_cpp.CFamilyLexer``. The preprocessor rules match only at the beginning of a line.
+_C_WS1 = r"\s*(?:/[*].*?[*]/\s*)?"
+_C_LINE_IF0 = re.compile(r"(" + _C_WS1 + r")#if\s+0", re.M)
+_C_LINE_HASH = re.compile(r"(" + _C_WS1 + r")#", re.M)
+
+# A C++ raw string may begin immediately after a number, such as ``1uR"(...)"``, so numbers and identifiers must end where Pygments ends them.
+_C_NUMBER = (
+    r"0[xX](?:{h}\.{h}|\.{h}|{h})[pP][+-]?{h}[lL]?"
+    r"|(?:{d}\.{d}|\.{d}|{d})[eE][+-]?{d}[fFlL]?"
+    r"|(?:{d}\.(?:{d})?|\.{d})[fFlL]?|{d}[fFlL]"
+    r"|0[xX]{h}{i}|0[bB][01](?:'?[01])*{i}|0(?:'?[0-7])+{i}|{d}{i}"
+).format(h=CLexer._hexpart, d=CLexer._decpart, i=CLexer._intsuffix)
+_C_IDENT = r"(?!\d)(?:[\w$]|\\u[0-9a-fA-F]{4}|\\U[0-9a-fA-F]{8})+"
+_C_TOKEN = re.compile(
+    r"(?P<ws>\n|[^\S\n]+|\\\n)"
+    r"|(?P<inline>//(?:.|(?<=\\)\n)*\n)"
+    r"|(?P<block>/(?:\\\n)?[*](?:[^*]|[*](?!(?:\\\n)?/))*[*](?:\\\n)?/"
+    # An unterminated block comment extends to the end of the file.
+    r"|/(?:\\\n)?[*][\w\W]*)"
+    # A string which isn't terminated ends before the newline.
+    r'|(?P<string>"(?:[^\\"\n]|\\[\s\S]?)*(?P<close>")?)'
+    r"|(?P<char>'(?:\\.|\\[0-7]{1,3}|\\x[a-fA-F0-9]{1,2}|[^\\'\n])')"
+    r"|(?P<number>" + _C_NUMBER + r")"
+    r"|(?P<word>" + _C_IDENT + r")"
+    r"|(?P<code>[^\s\w$/\"'\\.]+|[\s\S])",
+    re.M,
+)
+
+_C_WORD = re.compile(_C_IDENT)
+# Keywords which change the state of the Pygments lexer. Like Pygments, match these at the beginning of a name, such as ``case$x``.
+_C_CASE = re.compile(r"case\b")
+_CPP_NAMESPACE = re.compile(r"namespace\b")
+# A label, recognized only at the beginning of a line. Its name, such as ``case`` in ``case:``, isn't a keyword.
+_C_LABEL = re.compile(
+    r"[ \t]*(?!(?:public|private|protected|default)\b)" + _C_IDENT + r"\s*:(?!:)"
+)
+# A ``:`` which ends a ``case`` label.
+_C_CASE_END = re.compile(r"(?<!:):(?!:)")
+# These keywords, when followed by whitespace, are lexed together with all this whitespace, which may include the newline and indentation of the following line. The name which follows them isn't a keyword.
+_C_SPACE_KEYWORDS = {"struct", "union"}
+_CPP_SPACE_KEYWORDS = _C_SPACE_KEYWORDS | {"class", "concept", "typename", "enum"}
+
+# The prefixes of a C++ raw string, such as ``R"delim(...)delim"``.
+_CPP_RAW_PREFIXES = {"R", "LR", "uR", "UR", "u8R"}
+_CPP_RAW = re.compile(r'(?:[LuU]|u8)?R"([^\\()\s]{,16})\((?:.|\n)*?\)\1"', re.M)
+
+# In a preprocessor directive, each of these rules is tried before the rules in ``_C_MACRO``.
+_C_INCLUDES = [
+    re.compile(
+        r"(" + _C_WS1 + r")(include)(" + _C_WS1 + r")(" + file + r")([^\n]*)", re.M
+    )
+    for file in (r'"[^"]+"', r"<[^>]+>")
+]
+_C_MACRO = re.compile(
+    r"(?P<code>[^/\n]+)"
+    r"|(?P<block>/[*][\s\S]*?[*]/)"
+    r"|(?P<inline>//.*?\n)"
+    r"|(?P<slash>/)"
+    r"|(?P<continuation>(?<=\\)\n)"
+    r"|(?P<end>\n)",
+    re.M,
+)
+
+# The lines in an ``#if 0`` block.
+_C_IF0 = re.compile(
+    r"(?P<push>^\s*#if.*?(?<!\\)\n)"
+    r"|(?P<pop>^\s*#el(?:se|if).*\n|^\s*#endif.*?(?<!\\)\n)"
+    r"|(?P<comment>.*?\n)",
+    re.M,
+)
+
+
+def _scan_c(
+    # The code to scan.
+    text,
+    # True for C++, which adds raw strings.
+    cpp=False,
+):
+    tokens = []
+    append = tokens.append
+    pos = 0
+    length = len(text)
+    # The nesting depth of parentheses, and whether a ``)`` was found after the last ``;`` or ``{``. Together, these determine if the C lexer's rule for function definitions might apply; see `_Unsupported <Unsupported>`. This rule lexes the text between a function's name and the following ``;`` or ``{`` separately, so a preprocessor directive there may be lexed differently.
+    depth = 0
+    after_paren = False
+    space_keywords = _CPP_SPACE_KEYWORDS if cpp else _C_SPACE_KEYWORDS
+    # The state of the Pygments lexer after a keyword, if it affects the following names: ``classname`` or ``enumname`` after a keyword in ``space_keywords``, ``case`` until the ``:`` ending a case label, or ``namespace`` until the ``;`` or ``{`` after a C++ namespace. In each of these states, names aren't keywords.
+    state = None
+    while pos < length:
+        if state == "classname":
+            state = None
+            m = _C_WORD.match(text, pos)
+            if m:
+                append((_OTHER, m.group()))
+                pos = m.end()
+                continue
+            if text.startswith(">", pos):
+                # Pygments produces an empty whitespace token before a template's closing ``>``.
+                append((_WS, ""))
+
+        # Look for preprocessor directives at the beginning of each line.
+        if pos == 0 or text[pos - 1] == "\n":
+            m = _C_LINE_IF0.match(text, pos) or _C_LINE_HASH.match(text, pos)
+            if m and (depth or after_paren):
+                raise _Unsupported
+            m = _C_LINE_IF0.match(text, pos)
+            if m:
+                # Pygments lexes any whitespace and comment before the directive with a new lexer.
+                tokens += _scan_c(m.group(1), cpp)
+                append((_OTHER, text[m.end(1) : m.end()]))
+                pos = _scan_c_if0(text, m.end(), tokens)
+                continue
+            m = _C_LINE_HASH.match(text, pos)
+            if m:
+                tokens += _scan_c(m.group(1), cpp)
+                append((_OTHER, "#"))
+                pos = _scan_c_macro(text, m.end(), tokens, cpp)
+                continue
+            # In the ``case`` and ``namespace`` states, Pygments looks for names before labels.
+            if state in (None, "enumname"):
+                m = _C_LABEL.match(text, pos)
+                if m:
+                    _append_code(tokens, m.group())
+                    pos = m.end()
+                    continue
+
+        m = _C_TOKEN.match(text, pos)
+        kind = m.lastgroup
+        string = m.group()
+        if kind == "ws":
+            append((_WS, string))
+        elif kind == "inline" or kind == "block":
+            if depth and ")" in string:
+                raise _Unsupported
+            append((_INLINE if kind == "inline" else _BLOCK, string))
+        else:
+            # A name in any of these states isn't a keyword.
+            is_name = state is not None
+            if state == "enumname":
+                if kind != "word":
+                    state = None
+                    if string.startswith(">"):
+                        append((_WS, ""))
+                elif string not in ("class", "struct"):
+                    state = None
+            if kind == "word":
+                if is_name:
+                    pass
+                elif string in space_keywords:
+                    space = _SPACE.match(text, m.end())
+                    if space:
+                        append((_OTHER, string))
+                        append((_WS, space.group()))
+                        pos = space.end()
+                        state = "enumname" if string == "enum" else "classname"
+                        continue
+                elif _C_CASE.match(string):
+                    state = "case"
+                elif cpp and _CPP_NAMESPACE.match(string):
+                    state = "namespace"
+                elif (
+                    cpp
+                    and string in _CPP_RAW_PREFIXES
+                    and text.startswith('"', m.end())
+                ):
+                    raw = _CPP_RAW.match(text, pos)
+                    if raw:
+                        string = raw.group()
+            elif kind == "code":
+                if "#" in string and (after_paren or ")" in string):
+                    raise _Unsupported
+                depth, after_paren = _c_parens(string, depth, after_paren)
+                if (state == "case" and _C_CASE_END.search(string)) or (
+                    state == "namespace" and ("{" in string or ";" in string)
+                ):
+                    state = None
+            elif kind != "number":
+                # A string or character literal can't be part of a function definition.
+                after_paren = False
+                # At the newline following a string which isn't terminated, Pygments returns to its initial state.
+                if kind == "string" and not m.group("close"):
+                    state = None
+            append((_OTHER, string))
+        pos += len(string)
+    return tokens
+
+
+# Update the parenthesis tracking in ``_scan_c`` for the code ``string``.
+def _c_parens(string, depth, after_paren):
+    if "(" in string or ")" in string:
+        depth = max(0, depth + string.count("(") - string.count(")"))
+    close = string.rfind(")")
+    statement = max(string.rfind(";"), string.rfind("{"))
+    if close > statement:
+        after_paren = True
+    elif statement >= 0:
+        after_paren = False
+    return depth, after_paren
+
+
+# Scan a preprocessor directive, starting just after its ``#``. Return the position following it.
+def _scan_c_macro(text, pos, tokens, cpp):
+    append = tokens.append
+    length = len(text)
+    while pos < length:
+        for include in _C_INCLUDES:
+            m = include.match(text, pos)
+            if m:
+                tokens += _scan_c(m.group(1), cpp)
+                append((_OTHER, m.group(2)))
+                tokens += _scan_c(m.group(3), cpp)
+                append((_OTHER, m.group(4)))
+                if m.group(5):
+                    append((_INLINE, m.group(5)))
+                pos = m.end()
+                break
+        else:
+            m = _C_MACRO.match(text, pos)
+            kind = m.lastgroup
+            string = m.group()
+            pos = m.end()
+            if kind == "block":
+                append((_BLOCK, string))
+            elif kind == "inline":
+                append((_INLINE, string))
+                break
+            else:
+                append((_OTHER, string))
+                if kind == "end":
+                    break
+    return pos
+
+
+# Scan an ``#if 0`` block, starting just after the ``#if 0``. Return the position following it.
+def _scan_c_if0(text, pos, tokens):
+    append = tokens.append
+    length = len(text)
+    depth = 1
+    while pos < length:
+        m = _C_IF0.match(text, pos)
+        if not m:
+            # Without a newline, nothing matches; Pygments produces an error token for each remaining character.
+            append((_OTHER, text[pos:]))
+            return length
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "comment":
+            # This is a ``Token.Comment``, which the C lexer places in the inline comment group.
+            append((_INLINE, m.group()))
+            continue
+        append((_OTHER, m.group()))
+        depth += 1 if kind == "push" else -1
+        if not depth:
+            break
+    return pos
+
+
+# Java
+# ====
+# See ``pygments.lexers.jvm.JavaLexer``.
+_JAVA_IDENT = r"(?:[^\W\d]|\$)[\w$]*"
+_JAVA_TOKEN = re.compile(
+    r"(?P<ws>[^\S\n]+|\n)"
+    r"|(?P<inline>//.*?)(?P<newline>\n)"
+    r"|(?P<block>/\*.*?\*/)"
+    r"|(?P<word>" + _JAVA_IDENT + r")"
+    r"|(?P<decorator>@[^\W\d][\w.]*)"
+    r'|(?P<text_block>"""\n(?:[^\\"]|\\[\s\S]?|"(?!""))*(?:"""|\Z))'
+    r'|(?P<string>"(?:[^\\"]|\\[\s\S]?)*"?)'
+    r"|(?P<char>'\\.'|'[^\\]'|'\\u[0-9a-fA-F]{4}')"
+    r"|(?P<attribute>\." + _JAVA_IDENT + r")"
+    # A number ends where Pygments ends it, since a keyword such as ``class`` may follow it.
+    r"|(?P<number>(?:[0-9][0-9_]*\.(?:[0-9][0-9_]*)?|\.[0-9][0-9_]*)"
+    r"(?:[eE][+\-]?[0-9][0-9_]*)?[fFdD]?"
+    r"|[0-9][eE][+\-]?[0-9][0-9_]*[fFdD]?"
+    r"|[0-9](?:[eE][+\-]?[0-9][0-9_]*)?[fFdD]"
+    r"|0[xX](?:[0-9a-fA-F][0-9a-fA-F_]*\.?"
+    r"|(?:[0-9a-fA-F][0-9a-fA-F_]*)?\.[0-9a-fA-F][0-9a-fA-F_]*)"
+    r"[pP][+\-]?[0-9][0-9_]*[fFdD]?"
+    r"|0[xX][0-9a-fA-F][0-9a-fA-F_]*[lL]?|0[bB][01][01_]*[lL]?|0[0-7_]+[lL]?"
+    r"|0|[1-9][0-9_]*[lL]?)"
+    r"|(?P<code>[^\s\w$/\"'.@]+|[\s\S])",
+    re.M | re.S,
+)
+# Keywords tried before the rule for method names.
+_JAVA_KEYWORDS = set(
+    "assert break case catch continue default do else finally for if goto "
+    "instanceof new return switch this throw try while".split()
+)
+# A method declaration, such as ``public static void main(``.
+_JAVA_METHOD = re.compile(
+    r"((?:(?:[^\W\d]|\$)[\w.\[\]$<>?]*\s+)+?)((?:[^\W\d]|\$)[\w$]*)(\s*)(\()",
+    re.M | re.S,
+)
+# A ``record`` declaration, recognized only at the beginning of a line.
+_JAVA_RECORD = re.compile(
+    r"(^\s*)((?:(?:public|private|protected|static|strictfp)(?:\s+))*)(record)\b",
+    re.M | re.S,
+)
+# A label, which Pygments recognizes before other names only at the beginning of a line; this matters only when it begins with a newline.
+_JAVA_LABEL = re.compile(r"\s*" + _JAVA_IDENT + ":", re.M | re.S)
+# For the keywords which enter a new state, the regex which ends that state.
+_JAVA_STATES = {
+    "class": re.compile(_JAVA_IDENT),
+    "interface": re.compile(_JAVA_IDENT),
+    "var": re.compile(_JAVA_IDENT),
+    "package": re.compile(r"[\w.]+\*?"),
+    "import": re.compile(r"[\w.]+\*?"),
+}
+# The whitespace which must follow these keywords for them to enter a new state.
+_JAVA_STATE_KEYWORD = {
+    "var": re.compile(r"var(\s+)", re.M | re.S),
+    "package": re.compile(r"package(\s+)", re.M | re.S),
+    "import": re.compile(r"(import(?:\s+static)?)(\s+)", re.M | re.S),
+}
+
+
+def _scan_java(text):
+    tokens = []
+    append = tokens.append
+    pos = 0
+    length = len(text)
+    while pos < length:
+        if pos == 0 or text[pos - 1] == "\n":
+            m = _JAVA_RECORD.match(text, pos)
+            if m:
+                # Pygments lexes the modifiers with a new lexer.
+                _append_code(tokens, m.group(1))
+                tokens += _scan_java(m.group(2))
+                append((_OTHER, m.group(3)))
+                pos = _scan_java_state(text, m.end(), tokens, "class")
+                continue
+            if text[pos] == "\n":
+                m = _JAVA_LABEL.match(text, pos)
+                if m:
+                    _append_code(tokens, m.group())
+                    pos = m.end()
+                    continue
+
+        m = _JAVA_TOKEN.match(text, pos)
+        kind = m.lastgroup
+        if kind == "newline":
+            append((_INLINE, m.group("inline")))
+            append((_WS, "\n"))
+        elif kind == "ws":
+            append((_WS, m.group()))
+        elif kind == "block":
+            append((_BLOCK, m.group()))
+        elif kind == "word" and m.group() in _JAVA_STATES:
+            word = m.group()
+            method = _JAVA_METHOD.match(text, pos)
+            if method:
+                pos = _append_java_method(tokens, method)
+                continue
+            if word in _JAVA_STATE_KEYWORD:
+                keyword = _JAVA_STATE_KEYWORD[word].match(text, pos)
+                if not keyword:
+                    append((_OTHER, word))
+                    pos = m.end()
+                    continue
+                append((_OTHER, keyword.group(1) if word == "import" else word))
+                append((_WS, keyword.groups()[-1]))
+                pos = _scan_java_state(text, keyword.end(), tokens, word)
+                continue
+            append((_OTHER, word))
+            pos = _scan_java_state(text, m.end(), tokens, word)
+            continue
+        elif kind == "word" and m.group() not in _JAVA_KEYWORDS:
+            method = _JAVA_METHOD.match(text, pos)
+            if method:
+                pos = _append_java_method(tokens, method)
+                continue
+            append((_OTHER, m.group()))
+        else:
+            append((_OTHER, m.group()))
+        pos = m.end()
+    return tokens
+
+
+# Append the tokens of a method declaration matched by ``_JAVA_METHOD``, returning the position following it. Pygments lexes the return type and modifiers with a new lexer.
+def _append_java_method(tokens, method):
+    tokens += _scan_java(method.group(1))
+    _append_code(tokens, method.string[method.start(2) : method.end()])
+    return method.end()
+
+
+# Scan the state entered after ``keyword``, which ends with a name. Return the position following it.
+def _scan_java_state(text, pos, tokens, keyword):
+    append = tokens.append
+    length = len(text)
+    end = _JAVA_STATES[keyword if keyword != "record" else "class"]
+    is_class = keyword in ("class", "interface", "record")
+    while pos < length:
+        m = end.match(text, pos)
+        if m:
+            append((_OTHER, m.group()))
+            return m.end()
+        if is_class:
+            m = _SPACE.match(text, pos)
+            if m:
+                append((_WS, m.group()))
+                pos = m.end()
+                continue
+        elif text[pos] == "\n":
+            # On a newline which no rule matches, Pygments returns to the root state.
+            append((_WS, "\n"))
+            return pos + 1
+        # Pygments produces an error token for any other character.
+        append((_OTHER, text[pos]))
+        pos += 1
+    return pos
+
+
+# JavaScript and TypeScript
+# =========================
+# See ``pygments.lexers.javascript.JavascriptLexer`` and ``TypeScriptLexer``. After an operator, punctuation, or keyword which may precede an expression, the JavaScript lexer enters a state in which a ``/`` begins a regular expression literal; it also enters this state at the beginning of a line which starts with whitespace or a ``/``.
+_JS_COMMENTS = r"(?P<ws>\s+)" r"|(?P<inline><!--|//.*?$)" r"|(?P<block>/\*.*?\*/)"
+_JS_REGEX_STATE = re.compile(
+    _JS_COMMENTS + r"|(?P<regex>/(?:\\.|[^[/\\\n]|\[(?:\\.|[^\]\\\n])*])+/"
+    r"(?:[gimuysd]+\b|\B))"
+    r"|(?P<bad_regex>(?=/))",
+    re.M | re.S,
+)
+_JS_ROOT = (
+    _JS_COMMENTS + r"|(?P<code>0[bB][01]+n?|0[oO]?[0-7]+n?|0[xX][0-9a-fA-F]+n?|[0-9]+n"
+    r"|(?:\.[0-9]+|[0-9]+\.[0-9]*|[0-9]+)(?:[eE][-+]?[0-9]+)?"
+    r"|\.\.\.|=>)"
+    r"|(?P<expression>\+\+|--|~|\?\?=?|\?|:|\\(?=\n)"
+    r"|(?:<<|>>>?|==?|!=?|(?:\*\*|\|\||&&|[-<>+*%&|^/]))=?"
+    r"|[{(\[;,]"
+    r"|(?:typeof|instanceof|in|void|delete|new)\b)"
+    r"|(?P<punctuation>[})\].])"
+    r"|(?P<reserved>\b(?:constructor|from|as)\b)"
+    r"|(?P<keyword>(?:for|in|while|do|break|return|continue|switch|case|default|"
+    r"if|else|throw|try|catch|finally|yield|await|async|this|of|static|export|"
+    r"import|debugger|extends|super)\b|(?:var|let|const|with|function|class)\b)"
+    r"|(?P<name>" + JS_IDENT + r"|#[a-zA-Z_]\w*"
+    r'|"(?:\\\\|\\[^\\]|[^"\\])*"'
+    r"|'(?:\\\\|\\[^\\]|[^'\\])*')"
+    r"|(?P<template>`)"
+    r"|(?P<error>[\s\S])"
+)
+_JS_TOKEN = re.compile(_JS_ROOT, re.M | re.S)
+# TypeScript tries these rules before the JavaScript rules.
+_TS_TOKEN = re.compile(
+    r"(?P<ts_keyword>(?:abstract|implements|private|protected|public|readonly)\b"
+    r"|(?:enum|interface|override)\b)"
+    r"|(?P<ts_type>\b(?:declare|type)\b|\b(?:string|boolean|number)\b)"
+    r"|(?P<ts_module>\b(?:module)\s*[\w?.$]+\s*)"
+    r"|(?P<ts_annotation>[\w?.$]+\s*:\s*[\w?.$]+)"
+    r"|(?P<ts_decorator>@" + JS_IDENT + r")"
+    r"|" + _JS_ROOT,
+    re.M | re.S,
+)
+# For each kind of token, its group and True if a ``/`` following it begins a regular expression.
+_JS_ACTIONS = {
+    "ws": (_WS, None),
+    "inline": (_INLINE, None),
+    "block": (_BLOCK, None),
+    "code": (_OTHER, False),
+    "expression": (_OTHER, True),
+    "punctuation": (_OTHER, False),
+    "reserved": (_OTHER, False),
+    "keyword": (_OTHER, True),
+    "name": (_OTHER, False),
+    "error": (_OTHER, False),
+    "ts_keyword": (_OTHER, True),
+    "ts_type": (_OTHER, False),
+    "ts_decorator": (_OTHER, False),
+}
+_JS_LINE_START = re.compile(r"(?=\s|/|<!--)")
+_JS_HASHBANG = re.compile(r"#! ?/.*?$", re.M)
+# The text of a template string, up to its end or an interpolation.
+_JS_TEMPLATE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*", re.S)
+
+# The states of the JavaScript lexer which this scanner tracks.
+_JS_TEMPLATE_STATE = 1
+_JS_INTERPOLATION_STATE = 2
+
+
+def _scan_js(
+    # The code to scan.
+    text,
+    # True for TypeScript.
+    ts=False,
+):
+    tokens = []
+    append = tokens.append
+    token_re = _TS_TOKEN if ts else _JS_TOKEN
+    pos = 0
+    length = len(text)
+    # The stack of template strings and interpolations.
+    stack = []
+    # True if a ``/`` begins a regular expression.
+    expression = False
+    m = _JS_HASHBANG.match(text)
+    if m:
+        append((_OTHER, m.group()))
+        pos = m.end()
+    while pos < length:
+        if expression:
+            m = _JS_REGEX_STATE.match(text, pos)
+            kind = m and m.lastgroup
+            if kind in ("ws", "inline", "block"):
+                append((_JS_ACTIONS[kind][0], m.group()))
+                pos = m.end()
+                continue
+            expression = False
+            if kind == "regex":
+                append((_OTHER, m.group()))
+                pos = m.end()
+                continue
+            if kind == "bad_regex":
+                # Pygments produces an empty whitespace token, then an error token for everything up to the newline.
+                append((_WS, ""))
+                end = text.find("\n", pos)
+                if end < 0:
+                    append((_OTHER, text[pos:]))
+                    break
+                append((_OTHER, text[pos:end]))
+                append((_WS, "\n"))
+                pos = end + 1
+                continue
+
+        state = stack[-1] if stack else None
+        if state == _JS_TEMPLATE_STATE:
+            end = _JS_TEMPLATE.match(text, pos).end()
+            if end < length:
+                if text[end] == "`":
+                    end += 1
+                    stack.pop()
+                elif text.startswith("${", end):
+                    end += 2
+                    stack.append(_JS_INTERPOLATION_STATE)
+                else:
+                    end += 1
+            append((_OTHER, text[pos:end]))
+            pos = end
+            continue
+        if state == _JS_INTERPOLATION_STATE and text[pos] == "}":
+            append((_OTHER, "}"))
+            stack.pop()
+            pos += 1
+            continue
+        if (pos == 0 or text[pos - 1] == "\n") and _JS_LINE_START.match(text, pos):
+            # This rule produces an empty whitespace token.
+            append((_WS, ""))
+            expression = True
+            continue
+
+        m = token_re.match(text, pos)
+        kind = m.lastgroup
+        pos = m.end()
+        if kind == "template":
+            append((_OTHER, "`"))
+            stack.append(_JS_TEMPLATE_STATE)
+        elif kind == "ts_module":
+            _append_code(tokens, m.group())
+            expression = True
+        elif kind == "ts_annotation":
+            _append_code(tokens, m.group())
+        else:
+            group, expression_ = _JS_ACTIONS[kind]
+            append((group, m.group()))
+            if expression_:
+                expression = True
+    return tokens
+
+
+# Go
+# ==
+# See ``pygments.lexers.go.GoLexer``.
+_GO_TOKEN = re.compile(
+    r"(?P<ws>\s+|\\\n)"
+    r"|(?P<inline>//.*?$)"
+    r"|(?P<block>/(?:\\\n)?[*](?:.|\n)*?[*](?:\\\n)?/)"
+    r"|(?P<code>'(?:\\['\"\\abfnrtv]|\\x[0-9a-fA-F]{2}|\\[0-7]{1,3}"
+    r"|\\u[0-9a-fA-F]{4}|\\U[0-9a-fA-F]{8}|[^\\])'"
+    r"|`[^`]*`"
+    r'|"(?:\\\\|\\[^\\]|[^"\\])*"'
+    r"|[^\s\\/'`\"]+|[\s\S])",
+    re.M,
+)
+_GO_GROUPS = {"ws": _WS, "inline": _INLINE, "block": _BLOCK, "code": _OTHER}
+
+
+def _scan_go(text):
+    tokens = []
+    append = tokens.append
+    pos = 0
+    length = len(text)
+    while pos < length:
+        m = _GO_TOKEN.match(text, pos)
+        append((_GO_GROUPS[m.lastgroup], m.group()))
+        pos = m.end()
+    return tokens
+
+
+# Rust
+# ====
+# See ``pygments.lexers.rust.RustLexer``. Doc comments (``///``, ``//!``, ``/**``, and ``/*!``) are ``String.Doc`` tokens, which are code. Block comments nest.
+_RUST_TOKEN = re.compile(
+    r"(?P<ws>\s+)"
+    r"|(?P<doc>//!.*?\n|///(?:\n|[^/].*?\n))"
+    r"|(?P<inline>//.*?\n)"
+    r"|(?P<doc_block>/\*\*(?:\n|[^/*])|/\*!)"
+    r"|(?P<block>/\*)"
+    # A macro parameter, such as ``$x``.
+    r"|(?P<macro_parameter>\$(?:[a-zA-Z_]\w*|\(,?|\),?|,?))"
+    r"|(?P<type_path>::\b)"
+    r"|(?P<type>:|->)"
+    r"|(?P<label>(?:break|continue)\b\s*(?:'[A-Za-z_]\w*)?)"
+    # The name following these keywords is never a type keyword.
+    r"|(?P<name_keyword>(?:mod|fn)\b\s*(?:[a-zA-Z_]\w*)?)"
+    r"|(?P<default>default\s+(?:type|fn)\b)"
+    r"|(?P<type_keyword>(?:struct|enum|type|union)\b)"
+    r"|(?P<char>'(?:\\['\"\\nrt]|\\x[0-7][0-9a-fA-F]|\\0"
+    r"|\\u\{[0-9a-fA-F]{1,6}\}|.)'"
+    r"|b'(?:\\['\"\\nrt]|\\x[0-9a-fA-F]{2}|\\0"
+    r"|\\u\{[0-9a-fA-F]{1,6}\}|.)')"
+    # A number ends where Pygments ends it, since a keyword such as ``struct`` may follow it.
+    r"|(?P<number>(?:0b[01_]+|0o[0-7_]+|0[xX][0-9a-fA-F_]+"
+    r"|[0-9][0-9_]*(?:\.[0-9_]+[eE][+\-]?[0-9_]+|\.[0-9_]*(?!\.)|[eE][+\-]?[0-9_]+)"
+    r"|[0-9][0-9_]*)(?:[ui](?:8|16|32|64|size)|f(?:32|64))?)"
+    r'|(?P<string>b?"(?:[^\\"]|\\[\s\S]?)*"?'
+    r'|(?s:b?r(?P<hashes>#*)".*?"(?P=hashes)))'
+    r"|(?P<lifetime>')"
+    r"|(?P<word>[a-zA-Z_]\w*)"
+    r"|(?P<attribute>#!?\[)"
+    r"|(?P<code>[^\s\w/'\"#:\-$]+|[\s\S])",
+    re.M,
+)
+_RUST_SHEBANG = re.compile(r"#![^[\r\n].*$", re.M)
+_RUST_COMMENT = re.compile(r"/\*|\*/")
+_RUST_STRING = re.compile(r'"(?:[^\\"]|\\[\s\S]?)*"?')
+_RUST_ATTRIBUTE = re.compile(r'[^"\]\[]+')
+# A lifetime's name.
+_RUST_LIFETIME = re.compile(r"(?:static|_|[a-zA-Z_]+\w*)*")
+# The rules of the state entered after a ``:`` or ``->``, or after a keyword such as ``struct``, in which a ``'`` begins a lifetime.
+_RUST_TYPENAME = re.compile(
+    r"(?P<ws>\s+)"
+    r"|(?P<code>&|"
+    + RustLexer.builtin_funcs_types[0].get()
+    + "|"
+    + RustLexer.keyword_types[0].get()
+    + r")"
+    r"|(?P<lifetime>')"
+    r"|(?P<name>[a-zA-Z_]\w*)",
+    re.M,
+)
+
+
+def _scan_rust(text):
+    tokens = []
+    append = tokens.append
+    pos = 0
+    length = len(text)
+    m = _RUST_SHEBANG.match(text)
+    if m:
+        append((_OTHER, m.group()))
+        pos = m.end()
+    while pos < length:
+        m = _RUST_TOKEN.match(text, pos)
+        kind = m.lastgroup
+        string = m.group()
+        pos = m.end()
+        if kind == "ws":
+            append((_WS, string))
+        elif kind == "inline":
+            append((_INLINE, string))
+        elif kind == "block" or kind == "doc_block":
+            end = _rust_comment_end(text, pos)
+            append((_BLOCK if kind == "block" else _OTHER, text[m.start() : end]))
+            pos = end
+        elif kind == "label" or kind == "name_keyword":
+            _append_code(tokens, string)
+        elif kind == "default":
+            _append_code(tokens, string)
+        elif kind == "type" or kind == "type_keyword":
+            append((_OTHER, string))
+            pos = _scan_rust_typename(text, pos, tokens)
+        elif kind == "lifetime":
+            end = _RUST_LIFETIME.match(text, pos).end()
+            append((_OTHER, text[m.start() : end]))
+            pos = end
+        elif kind == "attribute":
+            pos = _scan_rust_attribute(text, pos, tokens, string)
+        else:
+            append((_OTHER, string))
+    return tokens
+
+
+# Return the position following the end of a (possibly nested) block comment, given the position following its opening delimiter.
+def _rust_comment_end(text, pos):
+    depth = 1
+    for m in _RUST_COMMENT.finditer(text, pos):
+        depth += 1 if m.group() == "/*" else -1
+        if not depth:
+            return m.end()
+    return len(text)
+
+
+# Scan the state after a ``:``, ``->``, or type keyword. Return the position following it.
+def _scan_rust_typename(text, pos, tokens):
+    append = tokens.append
+    length = len(text)
+    while pos < length:
+        m = _RUST_TYPENAME.match(text, pos)
+        if not m:
+            break
+        kind = m.lastgroup
+        if kind == "lifetime":
+            end = _RUST_LIFETIME.match(text, m.end()).end()
+            append((_OTHER, text[pos:end]))
+            pos = end
+            continue
+        append((_WS if kind == "ws" else _OTHER, m.group()))
+        pos = m.end()
+        if kind == "name":
+            break
+    return pos
+
+
+# Scan an attribute, such as ``#[derive(Debug)]``, which may contain strings and nested brackets. Return the position following it.
+def _scan_rust_attribute(text, pos, tokens, string):
+    length = len(text)
+    start = pos - len(string)
+    depth = 1
+    while pos < length:
+        c = text[pos]
+        if c == '"':
+            pos = _RUST_STRING.match(text, pos).end()
+        elif c == "[":
+            depth += 1
+            pos += 1
+        elif c == "]":
+            depth -= 1
+            pos += 1
+            if not depth:
+                break
+        else:
+            pos = _RUST_ATTRIBUTE.match(text, pos).end()
+    tokens.append((_OTHER, text[start:pos]))
+    return pos
+
+
+# The scanner for each supported lexer.
+_SCANNERS = {
+    CLexer: _scan_c,
+    CppLexer: lambda text: _scan_c(text, True),
+    GoLexer: _scan_go,
+    JavaLexer: _scan_java,
+    JavascriptLexer: _scan_js,
+    RustLexer: _scan_rust,
+    TypeScriptLexer: lambda text: _scan_js(text, True),
+}
@@ -0,0 +1,238 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ********************************************************
+# |docname| - a module to translate source code to PreTeXt
+# ********************************************************
+# The API_ lists two functions which convert source code into `PreTeXt <https://pretextbook.org/>`_. It relies on `source_lexer` to classify the source as code or comment, then `_generate_pretext`_ to convert this to PreTeXt.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import html
+import re
+
+# Third-party imports
+# -------------------
+# None.
+
+# Local application imports
+# -------------------------
+from .SourceClassifier import (
+    source_lexer,
+    get_lexer,
+    _debug_print,
+    _profile_output,
+    _write_file,
+)
+
+
+# API
+# ===
+# The following routines provide easy access to the core functionality of this
+# module.
+#
+# .. _code_to_pretext_string:
+#
+# code_to_pretext_string
+# -----------------------
+# This function converts a string containing source code to PreTeXt, preserving all indentations of both source code and comments. To do so, the comment characters are stripped from CodeChat-formatted comments and all code is placed inside fenced code blocks.
+def code_to_pretext_string(
+    # _`code_str`: the code to translate to PreTeXt.
+    code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See `cache <cache>`.
+    cache=None,
+    # See `options <options>`.
+    **options,
+):
+    lexer = get_lexer(code=code_str, **options)
+    if cache is None:
+        return _code_to_pretext(code_str, lexer, docstrings)
+    return cache.convert("pretext", code_str, lexer, docstrings, _code_to_pretext)
+
+
+# Convert code to PreTeXt using the given lexer; see `code_to_pretext_string`_.
+def _code_to_pretext(code_str, lexer, docstrings):
+    return "".join(_iter_pretext(code_str, lexer, docstrings))
+
+
+# .. _iter_pretext:
+#
+# iter_pretext
+# ------------
+# Like `code_to_pretext_string`_, but yield the PreTeXt in pieces as it's produced, instead of returning it as one string. This avoids holding the entire PreTeXt in memory.
+def iter_pretext(
+    # See code_str_.
+    code_str,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+    # See `cache <cache>`. Since the cache stores complete outputs, this yields the PreTeXt as one piece when a cache is used.
+    cache=None,
+    # See `options <options>`.
+    **options,
+):
+    if cache is None:
+        return _iter_pretext(code_str, get_lexer(code=code_str, **options), docstrings)
+    return iter([code_to_pretext_string(code_str, docstrings, cache, **options)])
+
+
+# Yield the PreTeXt produced from code using the given lexer; see `iter_pretext`_.
+def _iter_pretext(code_str, lexer, docstrings):
+    ast_syntax_error, classified_lines = source_lexer(code_str, lexer, docstrings)
+    # Remove the newline from a syntax error, so that source line numbers match exactly with the lines output by this function.
+    if ast_syntax_error:
+        yield f"<warning>CodeChat parse error: {html.escape(ast_syntax_error, False)[:-1]}</warning>"
+    yield "<program><input>"
+    yield from _profile_output(classified_lines, _generate_pretext(classified_lines))
+    yield "</input></program>"
+
+
+# .. _code_to_pretext_file:
+#
+# code_to_pretext_file
+# ---------------------
+# Convert a source file to a PreTeXt file.
+def code_to_pretext_file(
+    # .. _source_path:
+    #
+    # Path to a source code file to process.
+    source_path,
+    # Path to a destination PreTeXt file to create. It will be overwritten if it
+    # already exists. If not specified, it is ``source_path.ptx``.
+    pt_path=None,
+    # .. _input_encoding:
+    #
+    # Encoding to use for the input file. The default of None detects the
+    # encoding of the input file.
+    input_encoding="utf-8",
+    # .. _output_encoding:
+    #
+    # Encoding to use for the output file.
+    output_encoding="utf-8",
+    # See `options <options>`.
+    **options,
+):
+    # Provide a default ``rst_path``.
+    if not pt_path:
+        pt_path = source_path + ".ptx"
+    with open(source_path, encoding=input_encoding) as fi:
+        code_str = fi.read()
+    # If not already present, provide the filename of the source to help in identifying a lexer.
+    options.setdefault("filename", source_path)
+    # Write the PreTeXt as it's produced, rather than first gathering all of it into a string.
+    _write_file(pt_path, iter_pretext(code_str, **options), output_encoding)
+
+
+# Converting classified code to PreTeXt
+# =====================================
+# A regex to match part of an opening XML tag in a comment context, allowing for leading whitespace. At this time, a comment must always begin with a ``<p>`` tag and end with a closing ``</p>`` tag.
+xml_partial_opening_tag_regex = re.compile(r"^\s*<p\s*>")
+xml_closing_tag_regex = re.compile(r"</p\s*>\s*$")
+# These regexes are checked on each change of state, so look up their search methods once.
+_xml_partial_opening_tag_search = xml_partial_opening_tag_regex.search
+_xml_closing_tag_search = xml_closing_tag_regex.search
+
+
+# _generate_pretext
+# -----------------
+# Generate PreTeXt from the classified code, yielding it in pieces. To do this, create a state machine, where current_type defines the state. When the state changes, exit the previous state, then enter the new state.
+#
+# Exiting a comment may add a closing ``</p>`` to the end of its last line, so the output for each line is held until the following line (or the end of the code) shows whether it's the last line of a comment. This one line of lookahead keeps the output forward-only, so it can be written to any text sink.
+def _generate_pretext(
+    # An iterable of (type, string) pairs, one per line.
+    classified_lines,
+):
+    # Keep track of the current type. Begin with neither comment nor code.
+    current_type = -2
+
+    # Keep track of the current line number.
+    line = 1
+
+    # The previous line from the program, and the output produced for it, which hasn't been yielded yet.
+    last_string = ""
+    last_output = ""
+
+    for type_, string in classified_lines:
+        _debug_print(
+            "type_ = {}, line = {}, string = {}\n".format(type_, line, [string])
+        )
+
+        # See if there's a change in state.
+        if current_type != type_:
+            # Exit the current state.
+            last_output = _exit_state(current_type, last_string, last_output)
+
+            # Enter the new state.
+            #
+            # Code state:
+            if type_ == -1:
+                # Nothing is needed.
+                pass
+            # Comment state:
+            else:
+                # Add an opening ``<p>`` if there's no XML tag at the beginning of this string.
+                if not _xml_partial_opening_tag_search(string):
+                    string = "<p>" + string
+
+        yield last_output
+        last_string = string
+        # Escape characters in code; pass comments through with appropriate leading whitespace.
+        last_output = (
+            html.escape(string, False) if type_ == -1 else " " * type_ + string
+        )
+
+        # Update the state.
+        current_type = type_
+        line += 1
+
+    # When done, exit the last state.
+    yield _exit_state(current_type, last_string, last_output)
+
+
+# _exit_state
+# -----------
+# Return the output for the last line of a state, adding any text produced when exiting this state. Supports `_generate_pretext`_.
+def _exit_state(
+    # The type (classification) of the last line.
+    type_,
+    # The last line of the state, from the program being translated.
+    string,
+    # The output produced for this line.
+    output,
+):
+    # Code state: do nothing.
+    if type_ == -1:
+        return output
+    # Comment state: emit a closing ``</p>`` tag if it wasn't provided.
+    elif type_ >= 0:
+        if not _xml_closing_tag_search(string):
+            # Place it before the newline at the end of the line.
+            if output.endswith("\n"):
+                output = output[:-1]
+            return output + "</p>\n"
+        return output
+    # Initial state. Nothing needed.
+    else:
+        return output
@@ -0,0 +1,810 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ***************************************************************
+# |docname| - a Sphinx extension to translate source code to reST
+# ***************************************************************
+# This modules enables Sphinx to read in source files by converting the source
+# code to reST before passing the file on to Sphinx. The overall design:
+#
+# 1. Monkeypatch_ Sphinx to include source files in the build, keeping the
+#    source file's extension intact. (Sphinx strips the extension of reST
+#    files).
+# 2. When Sphinx `reads a source file <source-read event>`_, check to see if the
+#    file's extension is intact. If so, it's a source file; translate it to reST
+#    then pass it on to Sphinx.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import contextlib
+from itertools import groupby
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+# Third-party imports
+# -------------------
+from docutils import nodes
+import pygments
+from pygments.token import Token
+import sphinx
+from sphinx.application import Sphinx
+import sphinx.builders
+from sphinx.config import Config
+import sphinx.highlighting
+import sphinx.io
+import sphinx.project
+import sphinx.util
+from sphinx.util import texescape
+
+# This was deprecated_ in Sphinx v5.1.0.
+if sphinx.version_info[:3] >= (5, 1, 0):
+    from sphinx.util.osutil import path_stabilize
+else:
+    from sphinx.util import path_stabilize
+
+# The exception ``FiletypeNotFoundError`` was `deprecated <https://www.sphinx-doc.org/en/master/extdev/deprecated.html>`_  in Sphinx v2.4.0 by moving it from ``sphinx.io`` to ``sphinx.errors``.
+if sphinx.version_info[:3] >= (2, 4, 0):
+    from sphinx.errors import FiletypeNotFoundError
+else:
+    from sphinx.io import FiletypeNotFoundError
+import pygments.util
+
+# Local application imports
+# -------------------------
+from .CodeToRest import code_to_rest_string, add_highlight_language
+from .CodeToMarkdown import code_to_markdown_string
+from .ConversionCache import ConversionCache, DEFAULT_MAX_SIZE
+from .CommentDelimiterInfo import GlobMatcher, get_supported_globs
+from .SourceClassifier import (
+    PROFILE_ENV_VAR,
+    collect_profiles,
+    collect_tokens,
+    get_lexer,
+    use_engine,
+)
+from . import __version__
+
+
+# Utility
+# =======
+#
+# .. _exclude_small_files:
+#
+# exclude_small_files
+# -------------------
+# Python requires ``__init__.py`` files; these are often small or even empty. Provide a function to exclude these from the docs in order to reduce noise. Invoke this from a ``setup`` function in a Sphinx extension.
+#
+# Therefore, this function excludes small files matching the given glob from a Sphinx build.
+def exclude_small_files(
+    # The Sphinx application object.
+    app_: Sphinx,
+    # A `glob pattern <https://docs.python.org/3/library/pathlib.html#pathlib.Path.glob>`_ specifying which files should be excluded if they are empty.
+    pattern: str,
+    # Optional; the maximum size of an ignorable file, in bytes. Defaults to 0.
+    max_size: int = 0,
+):
+    # This returns a function which will be called by the `config-inited`_ event.
+    def excluder(app: Sphinx, config: Config):
+        # The path must start in the `srcdir <https://www.sphinx-doc.org/en/master/extdev/appapi.html#sphinx.application.Sphinx.srcdir>`_.
+        root_path = Path(app.srcdir)
+        # This is slightly inefficient, since it doesn't use the existing excludes to avoid searching already-excluded values.
+        app.config.exclude_patterns += [  # type: ignore
+            # Paths must be relative to the srcdir.
+            x.relative_to(root_path).as_posix()
+            for x in root_path.glob(pattern)
+            if x.stat().st_size <= max_size
+        ]
+
+    # Connect this to the `config-inited <https://www.sphinx-doc.org/en/master/extdev/appapi.html#event-config-inited>`_ Sphinx event.
+    app_.connect("config-inited", excluder)
+
+
+# source-read event
+# =================
+# Create a logger for issuing warnings during the build process.
+logger = sphinx.util.logging.getLogger(__name__)
+
+
+# The source-read_ event occurs when a source file is read. If it's code, this
+# routine changes it into reST or Markdown.
+def _source_read(
+    # _`app`: The `Sphinx application object <http://sphinx-doc.org/extdev/appapi.html#sphinx.application.Sphinx>`_.
+    app,
+    # _`docname`: The name of the document that was read. It contains a path
+    # relative to the project directory and (typically) no extension.
+    docname,
+    # A list whose single element is the contents of the source file.
+    source,
+):
+    if is_source_code(app.env, docname):
+        # See if it's an extension we should process.
+        try:
+            # See if ``source_file`` matches any of the globs.
+            lexer = None
+            lfg = app.config.CodeChat_lexer_for_glob
+            path_docname = Path(docname)
+            for glob, lexer_alias in lfg.items():
+                if path_docname.match(glob):
+                    # On a match, pass the specified lexer alias.
+                    lexer = get_lexer(alias=lexer_alias)
+                    break
+            # Do this after checking the ``CodeChat_lexer_for_glob`` list, since
+            # this will raise an exception on failure.
+            lexer = lexer or get_lexer(filename=docname, code=source[0])
+
+            # Translate code to reST or Markdown using the `engine <Engines>` selected by `CodeChat_engine <CodeChat_engine>`, collecting a `profile <Profiling>` of the conversion if requested.
+            profiler = (
+                collect_profiles()
+                if _is_profiling(app.config)
+                else contextlib.nullcontext([])
+            )
+            with profiler as reports, use_engine(
+                app.config.CodeChat_engine
+            ), collect_tokens() as token_lists:
+                if is_markdown_docname(app.config, docname):
+                    source[0] = code_to_markdown_string(
+                        source[0],
+                        lexer=lexer,
+                        docstrings=app.config.CodeChat_docstrings,
+                        cache=_conversion_cache,
+                    )
+                    markup = "Markdown"
+                else:
+                    source[0] = code_to_rest_string(
+                        source[0],
+                        lexer=lexer,
+                        docstrings=app.config.CodeChat_docstrings,
+                        cache=_conversion_cache,
+                    )
+                    source[0] = add_highlight_language(source[0], lexer)
+                    markup = "reST"
+                    # Save the lexer's tokens for `_doctree_read <_doctree_read>`.
+                    if token_lists and _is_highlight_block_patched():
+                        app.env.temp_data["CodeChat_tokens"] = (
+                            lexer,
+                            *token_lists[0],
+                        )
+            # A conversion read from the cache produces no report.
+            for report in reports:
+                report["docname"] = docname
+                _profiles(app.env)[docname] = report
+            logger.info(
+                "Converted as {} using the {} lexer.".format(markup, lexer.name)
+            )
+
+        except (KeyError, pygments.util.ClassNotFound) as e:
+            # We don't support this language.
+            logger.warning(
+                "Unsupported source code language: " + str(e), location=docname
+            )
+
+
+# The `ConversionCache` used by ``_source_read``, or None if `CodeChat_cache_dir <CodeChat_cache_dir>` is None.
+_conversion_cache = None
+
+
+# When the builder is initialized (after ``conf.py`` has been loaded), open the conversion cache specified in ``conf.py``.
+def _builder_inited(
+    # See app_.
+    app,
+):
+    global _conversion_cache
+    _saved_block_tokens.clear()
+    cache_dir = app.config.CodeChat_cache_dir
+    # A relative path is relative to the directory containing ``conf.py``.
+    _conversion_cache = (
+        None
+        if cache_dir is None
+        else ConversionCache(
+            Path(app.confdir) / cache_dir, app.config.CodeChat_cache_max_size
+        )
+    )
+
+
+# .. _Highlighting:
+#
+# Highlighting
+# ============
+# Sphinx highlights each literal block by running Pygments over its text, so the code in a source file would be lexed twice: once when converting it to reST, then again when highlighting it. Instead, ``_source_read`` `collects the tokens <Token collection>` produced by the lexer, `_doctree_read <_doctree_read>` saves the tokens of each fenced code block in ``_saved_block_tokens``, and the `highlight_block patch`_ formats these tokens. Sphinx lexes a fenced code block as before if it has no saved tokens: for example, if the `fast engine <Engines>` converted the file, the conversion was read from the `cache <CodeChat_cache_dir>`, the document was read in another process of a parallel build or by an earlier build, or the installed Sphinx isn't ``HIGHLIGHT_BLOCK_SPHINX_VERSION``.
+#
+# The tokens for each fenced code block, saved for the current build. Each key is the ``(source, line, rawsource)`` of the block's ``literal_block`` node, which (unlike the node itself) survives pickling the doctree between reading and writing it; each value is ``(lexer alias, tokens)``, where ``tokens`` is a list of ``(tokentype, length)`` pairs. Keeping these out of the node keeps them out of the pickled doctrees.
+_saved_block_tokens = {}
+
+
+# .. _`_doctree_read`:
+#
+# After Sphinx parses a document (the `doctree-read <https://www.sphinx-doc.org/en/master/extdev/appapi.html#event-doctree-read>`_ event), save the tokens of each fenced code block in the document.
+def _doctree_read(
+    # See app_.
+    app,
+    # The document's doctree.
+    doctree,
+):
+    saved = app.env.temp_data.pop("CodeChat_tokens", None)
+    if saved is None or not _is_highlight_block_patched():
+        return
+    lexer, tokens, classified_lines = saved
+    block_tokens = _fenced_code_tokens(
+        lexer, tokens, classified_lines, doctree.settings.tab_width
+    )
+    # ``findall`` replaced ``traverse`` in docutils v0.18.
+    findall = getattr(doctree, "findall", doctree.traverse)
+    for node in findall(nodes.literal_block):
+        if "fenced-code" in node["classes"] and node.rawsource in block_tokens:
+            # ``_source_read`` uses ``add_highlight_language`` to tell Sphinx to highlight this code using this lexer.
+            _saved_block_tokens[(node.source, node.line, node.rawsource)] = (
+                lexer.aliases[0],
+                block_tokens[node.rawsource],
+            )
+
+
+# Return a dict of ``{content: tokens}`` for each fenced code block ``_generate_rest`` produces from ``classified_lines``, where ``content`` is the text of the block's ``literal_block`` node, and ``tokens`` is a list of ``(tokentype, length)`` pairs for ``content`` followed by a newline.
+def _fenced_code_tokens(
+    # The lexer which produced these tokens.
+    lexer,
+    # The tokens produced by the lexer.
+    tokens,
+    # The ``(type, string)`` pairs produced by `source_lexer` from these tokens.
+    classified_lines,
+    # The number of columns between tab stops, used by the reST parser to expand tabs.
+    tab_width,
+):
+    # Split the tokens into lines: for each line, a list of its tokens, excluding the newline, and the token type of the newline.
+    token_lines = []
+    line = []
+    for tokentype, value in tokens:
+        *values, rest = value.split("\n")
+        for value in values:
+            if value:
+                line.append((tokentype, value))
+            token_lines.append((line, tokentype))
+            line = []
+        if rest:
+            line.append((tokentype, rest))
+    if line:
+        token_lines.append((line, Token.Text))
+    if len(token_lines) != len(classified_lines):
+        return {}
+
+    block_tokens = {}
+    for is_code, lines in groupby(
+        zip(classified_lines, token_lines), lambda line: line[0][0] == -1
+    ):
+        if is_code:
+            block = _fenced_code_block(lexer, lines, tab_width)
+            if block:
+                block_tokens[block[0]] = block[1]
+    return block_tokens
+
+
+# Given the ``((type, string), (tokens, newline tokentype))`` of each line in a fenced code block, return its ``(content, tokens)`` (see ``_fenced_code_tokens``), or None if the tokens don't match the content.
+def _fenced_code_block(lexer, lines, tab_width):
+    content = []
+    content_tokens = []
+    for (type_, string), (line_tokens, newline_tokentype) in lines:
+        # The reST parser converts vertical tabs and form feeds to spaces, expands tabs, then removes trailing whitespace. ``_generate_rest`` indents each line by one space, which the directive removes.
+        rest_lines = _RST_WHITESPACE.sub(" ", " " + string.rstrip("\n")).splitlines()
+        if len(rest_lines) != 1:
+            return None
+        text = rest_lines[0].expandtabs(tab_width).rstrip()[1:]
+
+        # Transform the tokens in the same way, beginning at column 1.
+        column = 1
+        transformed = []
+        for tokentype, value in line_tokens:
+            value = _RST_WHITESPACE.sub(" ", value)
+            if "\t" in value:
+                pad = column % tab_width
+                value = (" " * pad + value).expandtabs(tab_width)[pad:]
+            column += len(value)
+            transformed.append((tokentype, value))
+        while transformed and not transformed[-1][1].rstrip():
+            transformed.pop()
+        if transformed:
+            tokentype, value = transformed[-1]
+            transformed[-1] = (tokentype, value.rstrip())
+        if "".join(value for tokentype, value in transformed) != text:
+            return None
+        content.append(text)
+        content_tokens.append((transformed, newline_tokentype))
+
+    # `_FencedCodeBlock` replaces empty lines at the beginning and end of the block with a space.
+    for indexes in (range(len(content)), range(len(content) - 1, -1, -1)):
+        for index in indexes:
+            if content[index]:
+                break
+            content[index] = " "
+    for index, tokentype in _padding_tokentypes(lexer, content).items():
+        content_tokens[index] = ([(tokentype, " ")], content_tokens[index][1])
+    # Pygments removes a byte order mark from the beginning of the code.
+    if content[0].startswith("\ufeff"):
+        return None
+
+    # Store each token's string by its length.
+    return "\n".join(content), [
+        (tokentype, len(value))
+        for transformed, newline_tokentype in content_tokens
+        for tokentype, value in transformed + [(newline_tokentype, "\n")]
+    ]
+
+
+# Return a dict of ``{index: tokentype}`` giving the token type of each space `_FencedCodeBlock` added to ``content``, a list of the lines in a fenced code block. The lexer's tokens for these spaces may depend on the code around them: lex the spaces at the beginning of the block with the line of code which follows them, and the spaces at its end after a newline.
+def _padding_tokentypes(lexer, content):
+    # Since the reST parser removes trailing whitespace, only the lines `_FencedCodeBlock` added consist of a space.
+    code_indexes = [index for index, text in enumerate(content) if text != " "]
+    regions = (
+        [
+            ("", range(code_indexes[0] + 1)),
+            ("\n", range(code_indexes[-1] + 1, len(content))),
+        ]
+        if code_indexes
+        else [("", range(len(content)))]
+    )
+    tokentypes = {}
+    for prefix, region in regions:
+        # Find the offset of each space in this region's text.
+        padding_offsets = {}
+        offset = len(prefix)
+        for index in region:
+            if content[index] == " ":
+                padding_offsets[offset] = index
+            offset += len(content[index]) + 1
+        if not padding_offsets:
+            continue
+        text = prefix + "\n".join(content[index] for index in region) + "\n"
+        for start, tokentype, value in lexer.get_tokens_unprocessed(text):
+            for offset, index in padding_offsets.items():
+                if start <= offset < start + len(value):
+                    tokentypes[index] = tokentype
+    return tokentypes
+
+
+# The characters the reST parser converts to spaces.
+_RST_WHITESPACE = re.compile("[\v\f]")
+
+
+# Profiling
+# =========
+# Return True if conversions should be `profiled <Profiling>`, as requested by `CodeChat_profile <CodeChat_profile>` or by the ``CODECHAT_PROFILE`` environment variable.
+def _is_profiling(config):
+    return config.CodeChat_profile or PROFILE_ENV_VAR in os.environ
+
+
+# Return the dict of ``{docname: report}`` stored in the build environment, creating it if necessary. Storing reports in the environment lets Sphinx merge the reports made by each process of a parallel build.
+def _profiles(env):
+    if not hasattr(env, "CodeChat_profiles"):
+        env.CodeChat_profiles = {}
+    return env.CodeChat_profiles
+
+
+# When a document is removed or about to be re-read, remove its report (`env-purge-doc <https://www.sphinx-doc.org/en/master/extdev/appapi.html#event-env-purge-doc>`_).
+def _env_purge_doc(app, env, docname):
+    _profiles(env).pop(docname, None)
+
+
+# Merge the reports made by a parallel read process (`env-merge-info <https://www.sphinx-doc.org/en/master/extdev/appapi.html#event-env-merge-info>`_).
+def _env_merge_info(app, env, docnames, other):
+    other_profiles = _profiles(other)
+    _profiles(env).update(
+        (docname, other_profiles[docname])
+        for docname in docnames
+        if docname in other_profiles
+    )
+
+
+# The number of files and languages listed in the build summary.
+PROFILE_SUMMARY_LENGTH = 10
+
+
+# At the end of the build (`build-finished <https://www.sphinx-doc.org/en/master/extdev/appapi.html#event-build-finished>`_), write all reports to ``CodeChat-profile.json`` in the doctree directory, then log a summary listing the slowest files, the slowest languages, and the time spent in each stage.
+def _build_finished(app, exception):
+    profiles = _profiles(app.env)
+    if exception or not _is_profiling(app.config) or not profiles:
+        return
+    reports = sorted(profiles.values(), key=lambda report: -report["seconds"])
+    profile_path = Path(app.doctreedir) / "CodeChat-profile.json"
+    profile_path.write_text(json.dumps(reports, indent=2), encoding="utf-8")
+
+    languages = {}
+    stages = {}
+    for report in reports:
+        files, seconds = languages.get(report["lexer"], (0, 0.0))
+        languages[report["lexer"]] = (files + 1, seconds + report["seconds"])
+        for stage in report["stages"]:
+            stages[stage["stage"]] = stages.get(stage["stage"], 0.0) + stage["seconds"]
+
+    lines = [
+        "CodeChat profile: {} files converted in {:.3f} s; see {}.".format(
+            len(reports), sum(report["seconds"] for report in reports), profile_path
+        ),
+        "Slowest files:",
+    ]
+    lines.extend(
+        "  {:8.3f} s  {} ({}, {} lines)".format(
+            report["seconds"],
+            report["docname"],
+            report["lexer"],
+            # Each line of code is one item produced by ``_classify_groups``.
+            {stage["stage"]: stage["items"] for stage in report["stages"]}[
+                "_classify_groups"
+            ],
+        )
+        for report in reports[:PROFILE_SUMMARY_LENGTH]
+    )
+    lines.append("Slowest languages:")
+    lines.extend(
+        "  {:8.3f} s  {} ({} files)".format(seconds, lexer_name, files)
+        for lexer_name, (files, seconds) in sorted(
+            languages.items(), key=lambda item: -item[1][1]
+        )[:PROFILE_SUMMARY_LENGTH]
+    )
+    lines.append("Time in each stage:")
+    lines.extend(
+        "  {:8.3f} s  {}".format(seconds, stage) for stage, seconds in stages.items()
+    )
+    logger.info("\n".join(lines))
+
+
+# Return True if the supplied ``docname`` is source code.
+def is_source_code(
+    # The `Sphinx build environment <http://www.sphinx-doc.org/en/1.5.1/extdev/envapi.html>`_.
+    env,
+    # See docname_.
+    docname,
+):
+    # If the docname's extension doesn't change when asking for its full path,
+    # then it's source code. Normally, the docname of ``foo.rst`` is ``foo``;
+    # only for source code is the docname of ``foo.c`` also ``foo.c``. Look up
+    # the name and extension using `doc2path
+    # <http://sphinx-doc.org/extdev/envapi.html#sphinx.environment.BuildEnvironment.doc2path>`_.
+    docname_ext = env.doc2path(docname, None)
+    return Path(docname_ext) == Path(docname)
+
+
+# Return True if the supplied ``docname`` is Markdown; False means reST.
+def is_markdown_docname(
+    # The Sphinx config object.
+    config,
+    # See docname_.
+    docname,
+):
+    # Get the second extension: given a file named ``a.foo.bar``, produce ``[".foo"]``; given ``a.bar``, produce ``[]``.
+    docname_suffixes = Path(docname).suffixes
+    # See if this is a recognized Markdown extension.
+    return (
+        len(docname_suffixes) > 1
+        and config.source_suffix.get(docname_suffixes[-2]) == "markdown"
+    )
+
+
+# Monkeypatch
+# ===========
+# Sphinx doesn't naturally look for source files. Simply adding all supported
+# source file extensions to ``conf.py``'s `source_suffix <http://sphinx-doc.org/config.html#confval-source_suffix>`_
+# doesn't work, since ``foo.c`` and ``foo.h`` will now both been seen as the
+# docname ``foo``, making then indistinguishable. See also my `post on
+# sphinx-users <https://groups.google.com/d/msg/sphinx-users/CH8FW-tK1T0/_IHuAUW5GQAJ>`_.
+#
+# path2doc patch
+# --------------
+# For source files, make their docname the same as the file name; for reST
+# files, allow Sphinx to strip off the extension as before. This patch
+# accomplishes this. It comes from ``sphinx.project.Project``, line 79 and
+# following in Sphinx 7.2.6.
+def _path2doc(self, filename: str | os.PathLike[str]) -> str | None:
+    """Return the docname for the filename if the file is a document.
+
+    *filename* should be absolute or relative to the source directory.
+    """
+    try:
+        return self._path_to_docname[filename]  # type: ignore[index]
+    except KeyError:
+        if os.path.isabs(filename):
+            with contextlib.suppress(ValueError):
+                filename = os.path.relpath(filename, self.srcdir)
+
+        for suffix in self.source_suffix:
+            if os.path.basename(filename).endswith(suffix):
+                return path_stabilize(filename).removesuffix(suffix)
+
+        # The following code was added.
+        if is_supported_language(filename):
+            return filename
+
+        # the file does not have a docname
+        return None
+
+
+sphinx.project.Project.path2doc = _path2doc
+
+# A `GlobMatcher` for the supported source file globs. Avoid recomputing the value of this variable by defining it globally.
+source_suffixpatterns = None
+
+
+# Return True if the provided filename is a source code language CodeChat supports.
+def is_supported_language(filename):
+    # type: (str) -> bool
+    # Initialize this if necessary.
+    global source_suffixpatterns
+    if not source_suffixpatterns:
+        source_suffixpatterns = GlobMatcher(
+            get_supported_globs(_config.CodeChat_use_snapshot)
+            | set(_config.CodeChat_lexer_for_glob.keys())
+        )
+    return source_suffixpatterns.match(filename)
+
+
+# doc2path patch
+# --------------
+# Next, the way docnames get transformed back to a full path needs to be fixed
+# for source files. Specifically, a docname might be the source file, without
+# adding an extension. This code comes from ``sphinx.project.Project`` of Sphinx
+# 7.2.6.
+def _doc2path(self, docname: str, absolute: bool) -> str:
+    """Return the filename for the document name.
+
+    If *absolute* is True, return as an absolute path.
+    Else, return as a relative path to the source directory.
+    """
+    try:
+        filename = self._docname_to_path[docname]
+    except KeyError:
+        # Three lines of code added here -- check for the no-extension case.
+        if os.path.isfile(os.path.join(self.srcdir, docname)):
+            filename = docname
+        else:
+            # Backwards compatibility: the document does not exist
+            filename = docname + self._first_source_suffix
+
+    if absolute:
+        return os.path.join(self.srcdir, filename)
+    return filename
+
+
+sphinx.project.Project.doc2path = _doc2path
+
+
+# get_filetype patch
+# ------------------
+# The ``get_filetype`` function raises an exception if it can't determine the type of a file. Patch it to also recognize source code as reST. This was taken from ``sphinx.util``, version 7.2.6.
+def _get_filetype(source_suffix: Dict[str, str], filename: str) -> str:
+    for suffix, filetype in source_suffix.items():
+        if filename.endswith(suffix):
+            # If default filetype (None), considered as restructuredtext.
+            return filetype or "restructuredtext"
+    else:
+        # The following code was added.
+        if is_supported_language(filename):
+            return (
+                "markdown"
+                if is_markdown_docname(_config, filename)
+                else "restructuredtext"
+            )
+        # This was the existing code.
+        raise FiletypeNotFoundError
+
+
+# Per the `where to patch <https://docs.python.org/3/library/unittest.mock.html#where-to-patch>`_ docs, patch this where the ``get_filetype`` function is used, not where it's defined:
+SPHINX_VERSION = sphinx.version_info[:3]
+if SPHINX_VERSION >= (2, 4, 0) and SPHINX_VERSION < (4, 0, 0):
+    # The function ``sphinx.io.get_filetype`` was deprecated_ in Sphinx v2.4.0; it was renamed to ``sphinx.util.get_filetype`` instead. Sphinx uses ``sphinx.deprecation._ModuleWrapper`` to perform deprecation. Since ``get_filetype`` is used in ``sphinx.io``, we need to monkeypatch inside it, hence the ``_module`` (a member of the ``_ModuleWrapper``).
+    sphinx.io._module.get_filetype = _get_filetype
+elif SPHINX_VERSION >= (4, 0, 0) and SPHINX_VERSION < (5, 0, 0):
+    # In these versions, ``get_filetype`` is used in ``sphinx.io``. It's no longer deprecated, but removed; therefore, a direct monkeypatch works.
+    sphinx.io.get_filetype = _get_filetype
+else:
+    # In current Sphinx, ``get_filetype`` is used in several places:
+    sphinx.builders.get_filetype = _get_filetype
+    # Current Sphinx (7.2.6) doesn't need this.
+    sphinx.io.get_filetype = _get_filetype
+    sphinx.transforms.i18n.get_filetype = _get_filetype
+
+
+# .. _highlight_block patch:
+#
+# highlight_block patch
+# ---------------------
+# Format the tokens saved by `_doctree_read <_doctree_read>` for a literal block, instead of lexing its code again; see `Highlighting`_. This code comes from ``sphinx.highlighting.PygmentsBridge.highlight_block`` of Sphinx 7.2.6; since other versions of Sphinx may highlight differently, CodeChat patches ``highlight_block`` only if the installed Sphinx is ``HIGHLIGHT_BLOCK_SPHINX_VERSION``.
+HIGHLIGHT_BLOCK_SPHINX_VERSION = (7, 2)
+
+
+def _highlight_block(
+    self,
+    source: str,
+    lang: str,
+    opts: dict | None = None,
+    force: bool = False,
+    location: Any = None,
+    **kwargs: Any,
+) -> str:
+    # The following code was added.
+    tokens = _saved_tokens(source, lang, opts, force, location)
+    if tokens is None:
+        return _sphinx_highlight_block(
+            self, source, lang, opts, force, location, **kwargs
+        )
+
+    # This was the existing code, with ``highlight`` replaced by ``pygments.format``.
+    formatter = self.get_formatter(**kwargs)
+    hlsource = pygments.format(tokens, formatter)
+    if self.dest == "html":
+        return hlsource
+    else:
+        # MEMO: this is done to escape Unicode chars with non-Unicode engines
+        return texescape.hlescape(hlsource, self.latex_engine)
+
+
+# Return the tokens saved for ``location``, a ``literal_block`` node, if Sphinx would lex its ``source`` using the same lexer that produced these tokens; otherwise, return None.
+def _saved_tokens(source, lang, opts, force, location):
+    if not isinstance(location, nodes.literal_block):
+        return None
+    alias, saved = _saved_block_tokens.get(
+        (location.source, location.line, location.rawsource), (None, None)
+    )
+    if (
+        alias != lang
+        # Lexer options may change the tokens.
+        or opts
+        # Sphinx lexes interactive Python sessions and custom lexers differently.
+        or source.startswith(">>>")
+        or lang in sphinx.highlighting.lexers
+        # ``app.add_lexer`` stores a custom lexer class in ``lexer_classes``.
+        or sphinx.highlighting.lexer_classes.get(lang)
+        is not _sphinx_lexer_classes.get(lang)
+    ):
+        return None
+    source += "\n"
+    tokens = []
+    start = 0
+    for tokentype, length in saved:
+        tokens.append((tokentype, source[start : start + length]))
+        start += length
+    if start != len(source) or (
+        # Unless forced, Sphinx retries code containing errors in relaxed mode, after issuing a warning.
+        not force
+        and any(tokentype is Token.Error for tokentype, value in tokens)
+    ):
+        return None
+    return tokens
+
+
+# Sphinx's default lexer classes, before any extension adds its own.
+_sphinx_lexer_classes = dict(sphinx.highlighting.lexer_classes)
+
+_sphinx_highlight_block = sphinx.highlighting.PygmentsBridge.highlight_block
+if sphinx.version_info[:2] == HIGHLIGHT_BLOCK_SPHINX_VERSION:
+    sphinx.highlighting.PygmentsBridge.highlight_block = _highlight_block
+
+
+# Return True if Sphinx uses the `highlight_block patch`_; otherwise, there's no need to save tokens.
+def _is_highlight_block_patched():
+    return sphinx.highlighting.PygmentsBridge.highlight_block is _highlight_block
+
+
+# Correct naming for the "show source" option
+# ===========================================
+# The following function corrects the extension of source files in the
+# "source" link. By default, Sphinx (in ``sphinx.builders.html.StandaloneHTMLBuilder.get_doc_context``)
+# creates a sourcename by appending a file's extension to the value returned by
+# ``doc2path``. For non-source files, ``doc2path``'s return value contains no
+# extension, so this works fine. However, for source files, ``doc2path``'s
+# return value contains an extension, so that appending the extension to source
+# files produces a doubled extension -- ``.py.py``, for example.
+def _html_page_context(
+    # See app_.
+    app,
+    # The canonical name of the page being rendered, that is, without the
+    # ``.html`` suffix and using slashes as path separators.
+    pagename,
+    # The name of the template to render; this will be 'page.html' for all pages
+    # from reST documents.
+    templatename,
+    # A dictionary of values that are given to the template engine to render the
+    # page and can be modified to include custom values. Keys must be strings.
+    context,
+    # A doctree when the page is created from a reST documents; None when the
+    # page is created from an HTML template alone.
+    doctree,
+):
+    sourcename = context.get("sourcename")
+    ext = Path(pagename).suffix
+    # The extension Sphinx uses optionally includes the `html_sourcelink_suffix <http://www.sphinx-doc.org/en/stable/config.html#confval-html_sourcelink_suffix>`_.
+    sphinx_ext = ext + (
+        ""
+        if ext == app.config.html_sourcelink_suffix
+        else app.config.html_sourcelink_suffix
+    )
+    double_ext = ext + sphinx_ext
+    # Only provide the rename if necessary.
+    if sourcename and ext and sourcename.endswith(double_ext):
+        # Take off the second of the double extensions.
+        context["sourcename"] = sourcename[: -len(double_ext)] + sphinx_ext
+
+
+# Extension setup
+# ===============
+# This routine defines the `entry point
+# <http://sphinx-doc.org/extdev/appapi.html>`_ called by Sphinx to initialize
+# this extension.
+def setup(
+    # See app_.
+    app,
+):
+    # Ensure we're using a new enough Sphinx using `require_sphinx
+    # <http://sphinx-doc.org/extdev/appapi.html#sphinx.application.Sphinx.require_sphinx>`_.
+    app.require_sphinx("2.0")
+
+    # Use the `source-read <http://sphinx-doc.org/extdev/appapi.html#event-source-read>`_
+    # event hook to transform source code to reST before Sphinx processes it.
+    app.connect("source-read", _source_read)
+    # Save the tokens of fenced code; see `Highlighting`_.
+    app.connect("doctree-read", _doctree_read)
+
+    # Add the CodeChat.css style sheet using `add_css_file
+    # <http://www.sphinx-doc.org/en/master/extdev/appapi.html#sphinx.application.Sphinx.add_css_file>`_.
+    app.add_css_file("CodeChat.css")
+
+    # Add the `CodeChat_lexer_for_glob <CodeChat_lexer_for_glob>` config value. See `add_config_value
+    # <http://sphinx-doc.org/extdev/appapi.html#sphinx.application.Sphinx.add_config_value>`_.
+    app.add_config_value("CodeChat_lexer_for_glob", {}, "html")
+
+    # Add the `CodeChat_use_snapshot <CodeChat_use_snapshot>` config value. It may change which files are source code, so re-read all files when it changes.
+    app.add_config_value("CodeChat_use_snapshot", False, "env")
+
+    # Add the `CodeChat_docstrings <CodeChat_docstrings>` config value.
+    app.add_config_value("CodeChat_docstrings", True, "env")
+
+    # Add the `CodeChat_cache_dir <CodeChat_cache_dir>` and `CodeChat_cache_max_size <CodeChat_cache_max_size>` config values. Changing these doesn't change the output, so nothing needs to be rebuilt.
+    app.add_config_value("CodeChat_cache_dir", None, "")
+    app.add_config_value("CodeChat_cache_max_size", DEFAULT_MAX_SIZE, "")
+
+    # Add the `CodeChat_engine <CodeChat_engine>` config value. Every engine produces the same output, so nothing needs to be rebuilt when it changes.
+    app.add_config_value("CodeChat_engine", None, "")
+
+    # Add the `CodeChat_profile <CodeChat_profile>` config value, then connect the events which gather and report profiles.
+    app.add_config_value("CodeChat_profile", False, "")
+    app.connect("env-purge-doc", _env_purge_doc)
+    app.connect("env-merge-info", _env_merge_info)
+    app.connect("build-finished", _build_finished)
+    # Open the cache once these values are available.
+    app.connect("builder-inited", _builder_inited)
+
+    # Use the `html-page-context <http://www.sphinx-doc.org/en/stable/extdev/appapi.html#event-html-page-context>`_
+    # event to correct the extension of source files.
+    app.connect("html-page-context", _html_page_context)
+
+    # .. _global_config:
+    #
+    # An ugly hack: we need to get to the `Config <http://sphinx-doc.org/extdev/appapi.html#sphinx.config.Config>`_
+    # object after ``conf.py``'s values have been loaded. They aren't loaded
+    # yet, so we store the ``config`` object to access it later when it is
+    # loaded.
+    global _config
+    _config = app.config
+
+    # Return `extension metadata <http://sphinx-doc.org/extdev/index.html>`_.
+    return {"version": __version__, "parallel_read_safe": True}
@@ -0,0 +1,339 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# *********************************************************
+# |docname| - Info on comment delimiters for many languages
+# *********************************************************
+# `CodeChat <__init__.py>` relies on knowledge of the comment
+# delimiters for each supported language. This file consists of a large table
+# which provides this information.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import fnmatch
+from functools import lru_cache
+import json
+import os
+from pathlib import Path, PurePath
+import re
+
+# Third-party imports
+# -------------------
+import pygments
+from pygments.lexers import get_all_lexers
+
+# Local application imports
+# -------------------------
+# None.
+
+
+# Supported languages
+# ===================
+# Based on the unique name for each lexer, provide some additional information
+# on comment delimiters that Pygments doesn't explicitly define. This data was
+# mostly taken from the `Wikipedia page
+# <http://en.wikipedia.org/wiki/Comparison_of_programming_languages_(syntax)#Comments>`_.
+#
+# `Disable Black <https://github.com/psf/black#the-black-code-style>`_ for this block.
+# fmt: off
+COMMENT_DELIMITER_INFO = {
+#
+# These languages have unit tests which pass
+# ------------------------------------------
+# See :doc:`../test/CodeToRest_test.py` for the tests.
+    ## Language name: inline, block opening, block closing
+    "C":              ( ( "//", ),     "/*",            "*/"),
+    "C++":            ( ( "//", ),     "/*",            "*/"),
+    "Java":           ( ( "//", ),     "/*",            "*/"),
+    "ActionScript":   ( ( "//", ),     "/*",            "*/"),
+    "ActionScript 3": ( ( "//", ),     "/*",            "*/"),
+    "C#":             ( ( "//", ),     "/*",            "*/"),
+    # Note: also has   ``/+``  ~  ``+/`` for nested block comments.
+    # (reST to code will use characters in tuple)
+    "D":              ( ( "//", ),     "/*",            "*/"),
+    "Go":             ( ( "//", ),     "/*",            "*/"),
+    "JavaScript":     ( ( "//", ),     "/*",            "*/"),
+    "Objective-C":    ( ( "//", ),     "/*",            "*/"),
+    #  Support Rust comments (``//``) as well as `Rustdoc <https://doc.rust-lang.org/rustdoc/what-is-rustdoc.html#outer-and-inner-documentation>`_.
+    "Rust":           ( ( "//", "///", "//!"), "/*",    "*/"),
+    "Scala":          ( ( "//", ),     "/*",            "*/"),
+    "Swift":          ( ( "//", ),     "/*",            "*/"),
+    "verilog":        ( ( "//", ),     "/*",            "*/"),
+    "systemverilog":  ( ( "//", ),     "/*",            "*/"),
+    "Dart":           ( ( "//", ),     "/*",            "*/"),
+    "Juttle":         ( ( "//", ),     "/*",            "*/"),
+    "Objective-J":    ( ( "//", ),     "/*",            "*/"),
+    "TypeScript":     ( ( "//", ),     "/*",            "*/"),
+    "Arduino":        ( ( "//", ),     "/*",            "*/"),
+    "Clay":           ( ( "//", ),     "/*",            "*/"),
+    "CUDA":           ( ( "//", ),     "/*",            "*/"),
+    "eC":             ( ( "//", ),     "/*",            "*/"),
+    "MQL":            ( ( "//", ),     "/*",            "*/"),
+    "nesC":           ( ( "//", ),     "/*",            "*/"),
+    "Pike":           ( ( "//", ),     "/*",            "*/"),
+    "SWIG":           ( ( "//", ),     "/*",            "*/"),
+    "Vala":           ( ( "//", ),     "/*",            "*/"),
+    "Zephir":         ( ( "//", ),     "/*",            "*/"),
+    "Haxe":           ( ( "//", ),     "/*",            "*/"),
+    "Thrift":         ( ( "//", ),     "/*",            "*/"),
+    "Kotlin":         ( ( "//", ),     "/*",            "*/"),
+
+    "PHP":            ( ( "#", "//"),  "/*",            "*/"),
+    # Block comments not tested.
+    "NASM":           ( ( ";", ), "%comment\n", "%endcomment"),
+    "PIC24":          ( ( ";", ),      "/*",           "*/"),
+    # In Python, docstrings are treated as multi-line comments.
+    "Python 2.x":     ( ( "#", ),     '"""',          '"""'),
+    "Python":         ( ( "#", ),     '"""',          '"""'),
+    "CSS":            ( ( "", ),       "/*",           "*/"),
+    # This covers csh and sh as well. Wikipedia claims that ``<#`` ~ ``#>`` are
+    # block comments, but I don"t see this anywhere in man bash. These aren't
+    # supported.
+    "Bash":           ( ( "#", ),        "",              ""),
+    "Tcsh":           ( ( "#", ),        "",              ""),
+    # The only valid comment type is ``rem``. Neither ``:`` or ``::`` are
+    # classified as a comment. Not that this must be a lower-case string, since it
+    # will be compared to a lowercased comment.
+    "Batchfile":      ( ( "rem", ),      "",              ""),
+    "Matlab":         ( ("%", "..."),  "%{",            "%}"),
+    "SQL":            ( ( "--", ),     "/*",            "*/"),
+    "PL/pgSQL":       ( ( "--", ),     "/*",            "*/"),
+    "PowerShell":     ( ( "#", ),      "<#",            "#>"),
+    # ``/*`` ~ ``*/`` not supported (Pygments doesn't lex these).
+    "GAS":            ( ( "#", ";" ),  "/*",            "*/"),
+    "ARM":            ( ( "#", ";", "@"), "/*",         "*/"),
+    "autohotkey":     ( ( ";", ),      "/*",            "*/"),
+    "Prolog":         ( ( "%", ),      "/*",            "*/"),
+    "AutoIt":         ( ( ";", ),     "#cs",           "#ce"),
+
+    # `PODs <https://docs.perl6.org/language/pod>`_ not supported. Only single line comments
+    "Perl":           ( ( "#", ),        "",              ""),
+    # PODs not supported in Perl6, since they conflict with the new block-style
+    # comments: ``#`[`` ~ ``]``, or any other pair.
+    "Perl6":          ( ( "#", ),     "#'(",             ")"),
+
+    "Ruby":           ( ( "#", ),  "=begin",          "=end"),
+    "S":              ( ( "#", ),        "",              ""),
+    # `Bird style <https://wiki.haskell.org/Literate_programming#Bird_Style>`_
+    # is not supported.
+    "Haskell":        ( ( "--", ),     "{-",            "-}"),
+    # ``(*`` ~ ``*)`` not supported.
+    "Delphi":         ( ( "//", ),      "{",             "}"),
+    "AppleScript":    ( ("--", "#"),   "(*",            "*)"),
+    "Common Lisp":    ( ( ";", ),      "#|",            "|#"),
+    # ``--[=[`` ~ ``]=]`` not supported.
+    "Lua":            ( ( "--", ),   "--[[",            "]]"),
+    "Clojure":        ( ( ";", ),        "",              ""),
+    "Scheme":         ( ( ";", ),        "",              ""),
+    # Include JavaScript single-line comments, since the HTML parser recognizes embedded JS. However, this change requires a `fix to Pygments <https://github.com/pygments/pygments/issues/1896>`_. TODO: allow multiple block comment symbols so we can also support JS with ``/*`` and ``*/`` block comments.
+    "HTML":           ( ( "//", ),   "<!--",           "-->"),
+    # The XML and XSLT lexers also need a `fix to Pygments`_.
+    "XML":            ( ( "", ),     "<!--",           "-->"),
+    "XSLT":           ( ( "", ),     "<!--",           "-->"),
+    "MXML":           ( (  "", ),   "<!---",           "-->"),
+    "Fortran":        ( ( "!", ),        "",              ""),
+    "APL":            ( ( "⍝", ),        "",              ""),
+    "Makefile":       ( ( "#", ),        "",              ""),
+    "RPMSpec":        ( ( "#", ),        "",              ""),
+    "Nimrod":         ( ( "#", ),        "",              ""),
+    # Comments continued on the next line with a ``\`` aren't supported.
+    "NSIS":           ( ("#", ";"),      "",              ""),
+    "TeX":            ( ( "%", ),        "",              ""),
+    "Erlang":         ( ( "%", ),        "",              ""),
+    "QBasic":         ( ( "'", ),        "",              ""),
+    "VB.net":         ( ( "'", ),        "",              ""),
+    "REBOL":          ( ( ";", ),        "",              ""),
+    "LLVM":           ( ( ";", ),        "",              ""),
+    "INI":            ( ( ";", "#"),     "",              ""),
+    "Ada":            ( ( "--", ),       "",              ""),
+    "Eiffel":         ( ( "--", ),       "",              ""),
+    "vhdl":           ( ( "--", ),       "",              ""),
+    # An inline comment is six ignored characters followed by ``*`` or ``/`` -- there's a `special case <COBOL special case>` in the code to handle this. ``*>`` as an inline comment is not supported.
+    "COBOL":          ( ( "      *", ),  "",              ""),
+    "YAML":           ( ( "#", ),        "",              ""),
+    "TOML":           ( ( "#", ),        "",              ""),
+    "Mako":           ( ( "##", ), "<%doc>",       "</%doc>"),
+    "HTML+Mako":      ( ( "##", ), "<%doc>",       "</%doc>"),
+    "XML+Mako":       ( ( "##", ), "<%doc>",       "</%doc>"),
+    "JavaScript+Mako": ( ( "##", ), "<%doc>",      "</%doc>"),
+    "CSS+Mako":       ( ( "##", ), "<%doc>",       "</%doc>"),
+
+# These languages lack unit tests
+# -------------------------------
+    # TODO: What single-line comment character does Django/Jinja support?
+    "HTML+Django/Jinja": ( ( "", ),  "<!--",           "-->"),
+
+# These languages have failing unit tests
+# ---------------------------------------
+# None at this time.
+}
+# fmt: on
+
+# Supported extensions
+# ====================
+# Compute a set of supported filename globs: supported by the lexer and by CodeChat (inline / block comment info in ``COMMENT_DELIMITER_INFO``). This requires examining every Pygments lexer, including lexers provided by plugins; loading these plugins can be slow (for example, the IPython plugin imports IPython). So, compute this set only when it's first needed, rather than when this module is imported.
+#
+# Callers which don't need globs from plugins may avoid this cost by asking for the snapshot of this set stored in ``SupportedGlobs.json``, which is used as long as it was computed using the installed version of Pygments and the current ``COMMENT_DELIMITER_INFO``. The snapshot doesn't include globs for lexers provided by plugins, so it's never used by default. To update it, run ``python -m CodeChat.CommentDelimiterInfo``.
+_SNAPSHOT_PATH = Path(__file__).parent / "SupportedGlobs.json"
+
+# The supported globs, keyed by the ``use_snapshot`` argument to `get_supported_globs`_.
+_supported_globs = {}
+
+
+# .. _get_supported_globs:
+#
+# get_supported_globs
+# -------------------
+# Return a frozenset of supported filename globs.
+def get_supported_globs(
+    # True to use the snapshot when it's valid, instead of examining every lexer. The snapshot omits globs for lexers provided by plugins.
+    use_snapshot=False,
+):
+    if use_snapshot not in _supported_globs:
+        globs_for_language = (
+            use_snapshot and _read_snapshot()
+        ) or _globs_for_language()
+        _supported_globs[use_snapshot] = frozenset(
+            glob for globs in globs_for_language.values() for glob in globs
+        )
+    return _supported_globs[use_snapshot]
+
+
+# For compatibility, provide ``SUPPORTED_GLOBS`` as a (lazily computed) module attribute. Since ``from CodeChat.CommentDelimiterInfo import SUPPORTED_GLOBS`` computes it immediately, call `get_supported_globs`_ instead.
+def __getattr__(name):
+    if name == "SUPPORTED_GLOBS":
+        return get_supported_globs()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+# .. _GlobMatcher:
+#
+# GlobMatcher
+# -----------
+# Determine if a filename matches any of a set of glob patterns, producing the same result as checking ``Path(filename).match(pattern)`` for each pattern. Sphinx checks every file in a project against the hundreds of `supported globs <get_supported_globs>`, so avoid checking each pattern in turn:
+#
+# - Most patterns have the form ``*.suffix``. Look up each suffix of a file's name (``.gz`` and ``.tar.gz`` for ``foo.tar.gz``) in a set of these suffixes.
+# - Look up the entire name of a file in a set of patterns without wildcards, such as ``Makefile``.
+# - Match the few remaining patterns which apply only to a file's name, such as ``Makefile.*``, using a single combined regular expression.
+# - Check patterns which contain a directory, such as ``docs/*.js``, using ``Path.match``.
+#
+# Finally, remember the result for each filename.
+class GlobMatcher:
+    def __init__(
+        self,
+        # An iterable of glob patterns.
+        patterns,
+    ):
+        self._suffixes = set()
+        self._names = set()
+        name_regexes = []
+        self._path_patterns = []
+        for pattern in patterns:
+            if "/" in pattern or os.sep in pattern:
+                self._path_patterns.append(pattern)
+                continue
+            # Like ``Path.match``, ignore case on case-insensitive platforms.
+            pattern = os.path.normcase(pattern)
+            if pattern.startswith("*.") and not _has_wildcard(pattern[1:]):
+                self._suffixes.add(pattern[1:])
+            elif not _has_wildcard(pattern):
+                self._names.add(pattern)
+            else:
+                name_regexes.append(fnmatch.translate(pattern))
+        self._name_regex = re.compile("|".join(name_regexes)) if name_regexes else None
+        # Remember the result for each filename.
+        self.match = lru_cache(maxsize=4096)(self._match)
+
+    # .. _GlobMatcher.match:
+    #
+    # Return True if ``filename`` (a string or a path) matches any of this matcher's patterns. This is replaced by a memoized version of itself in ``__init__``.
+    def _match(self, filename):
+        name = os.path.normcase(PurePath(filename).name)
+        if name in self._names:
+            return True
+        # Look up every suffix of the name, starting at each period.
+        index = name.find(".")
+        while index != -1:
+            if name[index:] in self._suffixes:
+                return True
+            index = name.find(".", index + 1)
+        if self._name_regex and self._name_regex.match(name):
+            return True
+        if self._path_patterns:
+            path = PurePath(filename)
+            return any(path.match(pattern) for pattern in self._path_patterns)
+        return False
+
+
+# Return True if the glob ``pattern`` contains wildcards.
+def _has_wildcard(pattern):
+    return any(c in pattern for c in "*?[")
+
+
+# Return a dict of ``{language: [glob, ...]}`` for every language in ``COMMENT_DELIMITER_INFO``; languages with no Pygments lexer have no globs.
+def _globs_for_language(
+    # True to include lexers provided by plugins.
+    plugins=True,
+):
+    globs_for_language = {language: [] for language in COMMENT_DELIMITER_INFO}
+    # Per `get_all_lexers
+    # <http://pygments.org/docs/api/#pygments.lexers.get_all_lexers>`_, we get a
+    # tuple. Pick out only the filename and examine it.
+    for longname, aliases, filename_patterns, mimetypes in get_all_lexers(plugins):
+        # Pick only filenames we have comment info for.
+        if longname in COMMENT_DELIMITER_INFO:
+            globs_for_language[longname].extend(filename_patterns)
+    return globs_for_language
+
+
+# Return the snapshot's dict of ``{language: [glob, ...]}``, or None if the snapshot is missing or out of date.
+def _read_snapshot():
+    try:
+        with open(_SNAPSHOT_PATH, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    globs_for_language = snapshot.get("globs_for_language", {})
+    if snapshot.get("pygments_version") != pygments.__version__ or set(
+        globs_for_language
+    ) != set(COMMENT_DELIMITER_INFO):
+        return None
+    return globs_for_language
+
+
+# Write a snapshot computed from the installed lexers, excluding plugins.
+def _write_snapshot():
+    with open(_SNAPSHOT_PATH, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "pygments_version": pygments.__version__,
+                "globs_for_language": _globs_for_language(plugins=False),
+            },
+            f,
+            indent=4,
+            sort_keys=True,
+        )
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    _write_snapshot()
@@ -0,0 +1,374 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# **************************************************
+# |docname| - A compact, offset-based classification
+# **************************************************
+# `source_lexer` produces a ``(type, string)`` tuple for each line of source code, creating a new string for every line, along with the strings and lists used to build it. For a very large source file, a program which keeps this classification (rather than immediately converting it to markup) holds several times more memory in these objects than the source code itself requires. `compact_source_lexer` instead produces a `ClassifiedLines`_ object, which stores each classified line as a few integers in arrays: its type, plus the start and end offsets of its text in the preprocessed source code. The string for a line is created only when it's requested. The classification this produces is identical to the classification produced by `source_lexer`.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from array import array
+import re
+
+# Third-party imports
+# -------------------
+# None.
+
+# Local application imports
+# -------------------------
+from .SourceClassifier import (
+    _block_comment_indent,
+    _group_lexer_tokens,
+    _GROUP,
+    _is_block_body_or_end,
+    _lexer_comment_info,
+    _pygments_get_tokens_postprocess,
+    _pygments_get_tokens_preprocess,
+    _python_docstrings,
+)
+
+
+# .. _ClassifiedLines:
+#
+# ClassifiedLines
+# ===============
+# A sequence of classified lines, where each element is the ``(type, string)`` tuple which `source_lexer` produces for that line.
+#
+# Most lines are a single slice of ``text``. A comment may instead be two slices: for example, the string for the line ``/* comment */\n`` is ``comment`` followed by the newline, skipping the closing comment delimiter. So, each line stores a slice of ``text`` and an optional second slice (its tail). A line which can't be represented this way (such as ``/* one */ /* two */\n``) stores its string instead.
+class ClassifiedLines:
+    def __init__(
+        self,
+        # The text which each line's offsets refer to.
+        text,
+    ):
+        self.text = text
+        # Use 32-bit offsets unless the text is too large for them.
+        typecode = "i" if len(text) < 2**31 else "q"
+        # The type of each line, as described in `source_lexer`.
+        self.types = array("i")
+        # The offsets of each line's text. A start offset of -1 indicates that the line's string is stored in ``_strings``.
+        self._starts = array(typecode)
+        self._ends = array(typecode)
+        # The offsets of each line's tail; when the line has no tail, both are 0.
+        self._tail_starts = array(typecode)
+        self._tail_ends = array(typecode)
+        # A dict of ``{index: string}`` for lines which can't be represented by offsets.
+        self._strings = {}
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        # Look up the type first, which raises an ``IndexError`` for an invalid index.
+        type_ = self.types[index]
+        if index < 0:
+            index += len(self.types)
+        return type_, self._string(
+            index,
+            self._starts[index],
+            self._ends[index],
+            self._tail_starts[index],
+            self._tail_ends[index],
+        )
+
+    def __iter__(self):
+        text = self.text
+        for index, (type_, start, end, tail_start, tail_end) in enumerate(
+            zip(
+                self.types, self._starts, self._ends, self._tail_starts, self._tail_ends
+            )
+        ):
+            # Handle the common case (a single slice) here, avoiding a function call.
+            if tail_start == tail_end and start >= 0:
+                yield type_, text[start:end]
+            else:
+                yield type_, self._string(index, start, end, tail_start, tail_end)
+
+    # Return the string for the line at ``index``, given its offsets.
+    def _string(self, index, start, end, tail_start, tail_end):
+        if start < 0:
+            return self._strings[index]
+        return self.text[start:end] + self.text[tail_start:tail_end]
+
+    # Add a line, given its type and a list of ``(start, end)`` offsets of the slices of ``text`` which form its string.
+    def _append(self, type_, spans):
+        # Merge adjacent slices and drop empty ones.
+        merged = []
+        for start, end in spans:
+            if start == end:
+                continue
+            if merged and merged[-1][1] == start:
+                merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        if len(merged) > 2:
+            self._strings[len(self.types)] = "".join(
+                [self.text[start:end] for start, end in merged]
+            )
+            merged = [(-1, -1)]
+        # Pad with empty slices.
+        merged += [(0, 0)] * (2 - len(merged))
+        self.types.append(type_)
+        self._starts.append(merged[0][0])
+        self._ends.append(merged[0][1])
+        self._tail_starts.append(merged[1][0])
+        self._tail_ends.append(merged[1][1])
+
+
+# .. _compact_source_lexer:
+#
+# compact_source_lexer
+# ====================
+# Classify source code, returning a tuple of (``ast_syntax_error``, a `ClassifiedLines`_ object); these are the same as the values returned by `source_lexer`.
+#
+# The offsets in the `ClassifiedLines`_ object refer to the source code as preprocessed by Pygments (for example, with tabs expanded), which it shares with the lexer, rather than to a copy. There are two exceptions: Python docstrings rendered as comments are rewritten (see `docstrings <docstrings>`), and a lexer's filters may change the text of its tokens. In these cases, the offsets instead refer to a copy of the source code containing these changes.
+def compact_source_lexer(
+    # See `code_str <code_str>`.
+    code_str,
+    # See `lexer <lexer>`.
+    lexer,
+    # See `docstrings <docstrings>`.
+    docstrings=True,
+):
+    cdi, comment_is_inline, comment_is_block = _lexer_comment_info(lexer)
+    # These steps are the same as the first two steps of `source_lexer`.
+    text = _pygments_get_tokens_preprocess(lexer, code_str)
+    if docstrings and lexer.name in ("Python", "Python 3"):
+        ast_docstring, ast_syntax_error = _python_docstrings(text)
+    else:
+        ast_docstring, ast_syntax_error = {}, ""
+    token_group = _group_lexer_tokens(
+        _pygments_get_tokens_postprocess(lexer, text),
+        comment_is_inline,
+        comment_is_block,
+        ast_docstring,
+    )
+    # When the groups may not match the preprocessed source code, build the text from the groups instead.
+    if ast_docstring or lexer.filters:
+        token_group = list(token_group)
+        text = "".join([string for group, string in token_group])
+
+    classified_lines = ClassifiedLines(text)
+    for type_, spans in _classify_offsets(
+        text, _gather_offsets_on_newlines(text, token_group, cdi), cdi, lexer
+    ):
+        classified_lines._append(type_, spans)
+    return ast_syntax_error, classified_lines
+
+
+# Gathering and classifying
+# =========================
+# These functions follow ``_gather_groups_on_newlines`` and ``_classify_groups``, but represent each string as a pair of offsets into ``text``.
+#
+# ``str.splitlines`` splits a string at each of these line boundaries.
+_LINE_BOUNDARY = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+# Matches a character for which ``str.isspace`` is False.
+_NON_SPACE = re.compile(r"\S")
+
+
+# Given an iterable of groups, break them into lists based on newlines. Each list consists of (group, comment_leading_whitespace_length, start, end) tuples.
+def _gather_offsets_on_newlines(
+    # The text containing the groups.
+    text,
+    # An iterable of (group, string) pairs provided by ``_group_lexer_tokens``. Together, these strings must form ``text``.
+    iter_grouped,
+    # See ``comment_delim_info`` in ``_gather_groups_on_newlines``.
+    comment_delim_info,
+):
+    _list = []
+    len_opening_block_comment = len(comment_delim_info[1])
+    end = 0
+    for group, string in iter_grouped:
+        start = end
+        end = start + len(string)
+        # Find the end of each line in this group, as ``string.splitlines(True)`` would.
+        line_ends = [match.end() for match in _LINE_BOUNDARY.finditer(text, start, end)]
+        if end > start and (not line_ends or line_ends[-1] != end):
+            line_ends.append(end)
+
+        ws_len = 0
+        if len(line_ends) > 1 and group == _GROUP.block_comment:
+            group = _GROUP.block_comment_start
+            ws_len = _block_comment_indent(
+                string,
+                string.splitlines(True),
+                len_opening_block_comment
+                + 1
+                + sum([end_ - start_ for group_, ws_len_, start_, end_ in _list]),
+                comment_delim_info,
+            )
+
+        line_start = start
+        for index, line_end in enumerate(line_ends):
+            _list.append((group, ws_len, line_start, line_end))
+            if group == _GROUP.block_comment_start:
+                group = _GROUP.block_comment_body
+            if index == len(line_ends) - 2 and group == _GROUP.block_comment_body:
+                group = _GROUP.block_comment_end
+            if text[line_end - 1] == "\n":
+                yield _list
+                _list = []
+            line_start = line_end
+
+    if _list:
+        yield _list
+
+
+# Classify the output of ``_gather_offsets_on_newlines``, yielding a tuple of (type, a list of ``(start, end)`` offsets of the slices of ``text`` forming the line's string).
+def _classify_offsets(
+    # The text containing the groups.
+    text,
+    # An iterable of lists produced by ``_gather_offsets_on_newlines``.
+    iter_gathered_groups,
+    # See ``comment_delim_info`` in ``_gather_groups_on_newlines``.
+    comment_delim_info,
+    # See `lexer <lexer>`.
+    lexer,
+):
+    is_block_rest_comment = False
+    for _list in iter_gathered_groups:
+        if _is_rest_comment_offsets(
+            text, _list, is_block_rest_comment, comment_delim_info, lexer
+        ):
+            first_group, first_ws_len, first_start, first_end = _list[0]
+            if first_group == _GROUP.whitespace:
+                type_ = first_end - first_start
+                _list.pop(0)
+                first_group, first_ws_len, first_start, first_end = _list[0]
+            elif not _is_block_body_or_end(first_group):
+                type_ = 0
+
+            if first_group == _GROUP.block_comment_start:
+                is_block_rest_comment = True
+
+            spans = [
+                _comment_delim_offsets(
+                    text, group, start, end, comment_delim_info, lexer
+                )
+                for group, ws_len, start, end in _list
+            ]
+            if _is_block_body_or_end(first_group):
+                if not _isspace_offsets(text, spans) and first_ws_len > 0:
+                    spans = _strip_offsets(spans, first_ws_len - 1)
+                    if _first_char_offsets(text, spans) == " ":
+                        spans = _strip_offsets(spans, 1)
+            elif _first_char_offsets(text, spans) == " ":
+                spans = _strip_offsets(spans, 1)
+
+        else:
+            type_ = -1
+            spans = [(_list[0][2], _list[-1][3])]
+            is_block_rest_comment = False
+
+        yield type_, spans
+
+
+# Supporting routines
+# -------------------
+# Return the offsets of a string in ``text`` with its comment delimiter removed, following ``_remove_comment_delim``.
+def _comment_delim_offsets(text, group, start, end, comment_delim_info, lexer):
+    length = end - start
+    len_opening_block_comment_delim = len(comment_delim_info[1])
+    len_closing_block_comment_delim = len(comment_delim_info[2])
+
+    if group == _GROUP.inline_comment:
+        # See the `COBOL special case <COBOL special case>`.
+        if lexer.name == "COBOL":
+            return (
+                (start + 7, end) if text[start:end][6] in ("*", "/") else (start, end)
+            )
+        for inline_comment_delim in comment_delim_info[0]:
+            len_delim = len(inline_comment_delim)
+            if (
+                length >= len_delim
+                and text[start : start + len_delim].lower() == inline_comment_delim
+            ):
+                return start + len_delim, end
+        return start, end
+    # Python's slicing produces an empty string if the end of a slice precedes its start; likewise, ``string[:-0]`` is empty.
+    if group == _GROUP.block_comment:
+        new_start = start + min(len_opening_block_comment_delim, length)
+        new_end = (
+            end - len_closing_block_comment_delim
+            if len_closing_block_comment_delim
+            else start
+        )
+        return new_start, max(new_start, new_end)
+    if group == _GROUP.block_comment_start:
+        return start + min(len_opening_block_comment_delim, length), end
+    if group == _GROUP.block_comment_end:
+        new_end = (
+            end - len_closing_block_comment_delim
+            if len_closing_block_comment_delim
+            else start
+        )
+        return start, max(start, new_end)
+    return start, end
+
+
+# Determine if the given line is a comment to be interpreted by reST, following ``_is_rest_comment``.
+def _is_rest_comment_offsets(
+    text, line_list, is_block_rest_comment, comment_delim_info, lexer
+):
+    group_list = [group for group, ws_len, start, end in line_list]
+    if _GROUP.other in group_list:
+        return False
+    if group_list == [_GROUP.whitespace]:
+        return False
+
+    first_comment_index = 1 if group_list[0] == _GROUP.whitespace else 0
+    first_group, first_ws_len, first_start, first_end = line_list[first_comment_index]
+    if is_block_rest_comment and _is_block_body_or_end(first_group):
+        return True
+    start, end = _comment_delim_offsets(
+        text, first_group, first_start, first_end, comment_delim_info, lexer
+    )
+    first_char_is_rest = start == end or text[start] in (" ", "\n")
+    return first_char_is_rest and not _is_block_body_or_end(first_group)
+
+
+# Return True if the string formed by ``spans`` is non-empty and contains only whitespace, like ``str.isspace``.
+def _isspace_offsets(text, spans):
+    return any([start < end for start, end in spans]) and not any(
+        [_NON_SPACE.search(text, start, end) for start, end in spans]
+    )
+
+
+# Return the first character of the string formed by ``spans``, or an empty string if it's empty.
+def _first_char_offsets(text, spans):
+    for start, end in spans:
+        if start < end:
+            return text[start]
+    return ""
+
+
+# Return ``spans`` with the first ``count`` characters of the string they form removed.
+def _strip_offsets(spans, count):
+    stripped = []
+    for start, end in spans:
+        removed = min(count, end - start)
+        count -= removed
+        stripped.append((start + removed, end))
+    return stripped
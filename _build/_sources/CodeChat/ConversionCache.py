@@ -0,0 +1,319 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ****************************************************************
+# |docname| - An on-disk cache of source code converted to markup
+# ****************************************************************
+# Converting a large source file to reST, Markdown, or PreTeXt takes time, yet most files don't change between builds. The `ConversionCache`_ in this module stores the output of a conversion on disk, so that converting an unchanged file again simply reads its output from the cache. To use it, pass a `ConversionCache`_ as the ``cache`` argument to `code_to_rest_string`, `code_to_markdown_string`, or `code_to_pretext_string`; Sphinx users can instead set `CodeChat_cache_dir <CodeChat_cache_dir>` in ``conf.py``.
+#
+# The cache stores each output with a key produced by hashing everything which determines this output: the source code, the lexer's name and options, the ``docstrings`` option, the output format, and the versions of CodeChat and Pygments. So, changing any of these produces a cache miss, rather than a stale result. When the cache grows beyond its maximum size, it evicts the least-recently used outputs. To avoid examining the entire cache for each new output, the cache keeps a running total of its size; to avoid a write for each output it returns, it records that an output was used at most once per ``last_used_interval`` seconds.
+#
+# The cache is a `SQLite <https://docs.python.org/3/library/sqlite3.html>`_ database, which allows several processes (such as a parallel Sphinx build) to share it safely. To inspect or prune the cache from the command line, use ``CodeChat-cache``; run ``CodeChat-cache --help`` for details.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from collections import namedtuple
+import hashlib
+import os
+from pathlib import Path
+import sqlite3
+import time
+
+# Third-party imports
+# -------------------
+import pygments
+
+# Local application imports
+# -------------------------
+from . import __version__
+
+# Cache
+# =====
+# The default maximum size of the cache, in bytes.
+DEFAULT_MAX_SIZE = 100 * 2**20
+
+# The default for ``last_used_interval``: by default, record that an output was used at most once a minute.
+DEFAULT_LAST_USED_INTERVAL = 60
+
+# When `put <ConversionCache.put>` finds the cache too large, it evicts outputs until the cache is no larger than this fraction of its maximum size. This leaves room for the following outputs, so that a build which fills the cache doesn't evict after every ``put``.
+_EVICT_FRACTION = 0.9
+
+# The name of the database file stored in the cache directory.
+_DATABASE_NAME = "CodeChat-cache.sqlite3"
+
+# Statistics about a cache, as returned by `info <ConversionCache.info>`.
+ConversionCacheInfo = namedtuple("ConversionCacheInfo", ["entries", "size", "counts"])
+
+
+# .. _ConversionCache:
+#
+# ConversionCache
+# ---------------
+class ConversionCache:
+    def __init__(
+        self,
+        # The directory containing the cache. It will be created if it doesn't exist.
+        cache_dir,
+        # The maximum size of the cached outputs, in bytes.
+        max_size=DEFAULT_MAX_SIZE,
+        # Record that an output was used only if its last use was at least this many seconds ago. Each record is a write to the database, so this saves a write for each output used repeatedly, at the cost of evicting less precisely.
+        last_used_interval=DEFAULT_LAST_USED_INTERVAL,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.last_used_interval = last_used_interval
+        # The size of the cached outputs, in bytes. This is computed when the database is opened, then updated by `put <ConversionCache.put>`; so, it doesn't include outputs which other processes store. ``_evict`` computes the size again before evicting.
+        self._size = 0
+        # The connection to the database, and the ID of the process which opened it; see `_connection <connection>`.
+        self._connection_ = None
+        self._connection_pid = None
+
+    # .. _ConversionCache.convert:
+    #
+    # Return the output of ``convert(code_str, lexer, docstrings)`` from the cache. On a cache miss, call ``convert`` and store its output in the cache.
+    def convert(
+        self,
+        # The name of the output format, such as ``"rest"``.
+        output_format,
+        # See `code_str <code_str>`.
+        code_str,
+        # See `lexer <lexer>`.
+        lexer,
+        # See `docstrings <docstrings>`.
+        docstrings,
+        # A function which converts the source code to the output format.
+        convert,
+    ):
+        key = self.key(output_format, code_str, lexer, docstrings)
+        output = self.get(key)
+        if output is None:
+            output = convert(code_str, lexer, docstrings)
+            self.put(key, output_format, lexer.name, output)
+        return output
+
+    # Return the key used to store the output of a conversion.
+    def key(self, output_format, code_str, lexer, docstrings):
+        h = hashlib.sha256()
+        h.update(
+            repr(
+                (
+                    __version__,
+                    pygments.__version__,
+                    output_format,
+                    lexer.name,
+                    sorted(lexer.options.items()),
+                    docstrings,
+                )
+            ).encode("utf-8")
+        )
+        # Encode using ``surrogatepass``, since code read from an improperly-encoded file may contain unpaired surrogates.
+        h.update(code_str.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    # Return the output stored with ``key``, or None if it's not in the cache.
+    def get(self, key):
+        with self._connection as connection:
+            row = connection.execute(
+                "SELECT output, last_used FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            output, last_used = row
+            now = time.time()
+            if now - last_used >= self.last_used_interval:
+                connection.execute(
+                    "UPDATE conversions SET last_used = ? WHERE key = ?", (now, key)
+                )
+        return output
+
+    # .. _ConversionCache.put:
+    #
+    # Store ``output`` in the cache, then evict old outputs if the cache is too large.
+    def put(self, key, output_format, lexer_name, output):
+        size = len(output.encode("utf-8", "surrogatepass"))
+        with self._connection as connection:
+            # Another process may have stored this output since ``get`` missed; replacing it frees its size.
+            row = connection.execute(
+                "SELECT size FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    output_format,
+                    lexer_name,
+                    __version__,
+                    size,
+                    time.time(),
+                    output,
+                ),
+            )
+            self._size += size - (0 if row is None else row[0])
+            if self._size > self.max_size:
+                self._evict(connection, self.max_size * _EVICT_FRACTION)
+
+    # .. _ConversionCache.info:
+    #
+    # Return a ``ConversionCacheInfo`` giving the number of entries in the cache, their size in bytes, and a dict of ``{(output_format, version): entries}``.
+    def info(self):
+        with self._connection as connection:
+            entries, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM conversions"
+            ).fetchone()
+            counts = {
+                (output_format, version): count
+                for output_format, version, count in connection.execute(
+                    "SELECT output_format, version, COUNT(*) FROM conversions "
+                    "GROUP BY output_format, version ORDER BY output_format, version"
+                )
+            }
+        return ConversionCacheInfo(entries, size, counts)
+
+    # .. _ConversionCache.prune:
+    #
+    # Remove outputs produced by other versions of CodeChat, which this version will never use, then evict the least-recently used outputs until the cache is no larger than ``max_size`` bytes. Return the number of entries removed.
+    def prune(
+        self,
+        # The maximum size of the cache after pruning; if None, use the cache's maximum size.
+        max_size=None,
+    ):
+        with self._connection as connection:
+            removed = connection.execute(
+                "DELETE FROM conversions WHERE version != ?", (__version__,)
+            ).rowcount
+            removed += self._evict(
+                connection, self.max_size if max_size is None else max_size
+            )
+        return removed
+
+    # Remove all entries from the cache.
+    def clear(self):
+        return self.prune(0)
+
+    # Close the connection to the database.
+    def close(self):
+        if self._connection_ is not None:
+            self._connection_.close()
+            self._connection_ = None
+
+    # Supporting routines
+    # -------------------
+    # Delete the least-recently used entries until the cache is no larger than ``max_size``, returning the number of entries deleted.
+    def _evict(self, connection, max_size):
+        (size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM conversions"
+        ).fetchone()
+        self._size = size
+        if size <= max_size:
+            return 0
+        keys = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM conversions ORDER BY last_used"
+        ):
+            if size <= max_size:
+                break
+            keys.append((key,))
+            size -= entry_size
+        connection.executemany("DELETE FROM conversions WHERE key = ?", keys)
+        self._size = size
+        return len(keys)
+
+    # .. _connection:
+    #
+    # Return a connection to the database, creating it if necessary. A SQLite connection `can't be used <https://www.sqlite.org/howtocorrupt.html#_carrying_an_open_database_connection_across_a_fork_>`_ in a process forked after it was opened (as a parallel Sphinx build does), so open a new connection in this case.
+    @property
+    def _connection(self):
+        if self._connection_ is None or self._connection_pid != os.getpid():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Wait for other processes using the cache, instead of immediately raising an exception.
+            connection = sqlite3.connect(
+                str(self.cache_dir / _DATABASE_NAME), timeout=60
+            )
+            # Write-ahead logging allows reads while another process writes. Since the cache can always be rebuilt, trade durability for speed by not syncing after each write.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS conversions ("
+                    "key TEXT PRIMARY KEY, output_format TEXT, lexer_name TEXT, "
+                    "version TEXT, size INTEGER, last_used REAL, output TEXT)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS conversions_last_used "
+                    "ON conversions (last_used)"
+                )
+                (self._size,) = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM conversions"
+                ).fetchone()
+            self._connection_ = connection
+            self._connection_pid = os.getpid()
+        return self._connection_
+
+
+# Command-line interface
+# ======================
+# Inspect or prune a cache from the command line.
+def main(
+    # The command-line arguments; if None, use ``sys.argv``.
+    args=None,
+):
+    parser = argparse.ArgumentParser(
+        prog="CodeChat-cache",
+        description="Inspect or prune the CodeChat conversion cache.",
+    )
+    parser.add_argument("cache_dir", help="The directory containing the cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("info", help="Show the size and contents of the cache.")
+    prune_parser = subparsers.add_parser(
+        "prune",
+        help="Remove entries made by other versions of CodeChat, then remove the least-recently used entries until the cache fits in MAX_SIZE bytes.",
+    )
+    prune_parser.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help="The maximum size of the cache, in bytes (default: %(default)s).",
+    )
+    subparsers.add_parser("clear", help="Remove all entries from the cache.")
+    args = parser.parse_args(args)
+
+    if not (Path(args.cache_dir) / _DATABASE_NAME).is_file():
+        parser.exit(1, "No cache found in {}.\n".format(args.cache_dir))
+    cache = ConversionCache(args.cache_dir)
+    if args.command == "info":
+        info = cache.info()
+        print("Entries: {}".format(info.entries))
+        print("Size: {} bytes".format(info.size))
+        for (output_format, version), count in info.counts.items():
+            print("  {} (CodeChat {}): {}".format(output_format, version, count))
+    elif args.command == "prune":
+        print("Removed {} entries.".format(cache.prune(args.max_size)))
+    else:
+        print("Removed {} entries.".format(cache.clear()))
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
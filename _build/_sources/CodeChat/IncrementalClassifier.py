@@ -0,0 +1,401 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ********************************************************************
+# |docname| - Incrementally classify source code as it's being edited
+# ********************************************************************
+# An editor which shows a live preview of a CodeChat document needs to reclassify the source after every edit. Running `source_lexer` over the whole buffer makes the cost of each keystroke proportional to the size of the file. The `IncrementalClassifier`_ in this module instead re-lexes only from the nearest resynchronization point before an edit, stopping as soon as the results match the classification before the edit.
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# Third-party imports
+# -------------------
+from pygments.lexer import ExtendedRegexLexer, RegexLexer
+from pygments.token import Error, Token, Whitespace, _TokenType
+
+# Local application imports
+# -------------------------
+from .SourceClassifier import (
+    _classify_groups,
+    _gather_groups_on_newlines,
+    _get_group_table,
+    _group_lexer_tokens,
+    _GROUP,
+    _lexer_comment_info,
+    _pygments_get_tokens_postprocess,
+    _python_docstrings,
+)
+
+# Segments
+# ========
+# The classifier divides the source into segments. Each segment begins on a *safe line*: a line where the lexer can begin lexing without knowing anything about the lines which precede it. A line is safe when:
+#
+# - a token begins at the start of the line, and the lexer is in its default state when it matches this token (see `Lexing with states`_),
+# - the newline which ends the previous line is whitespace or part of an inline comment. So, the previous line didn't end inside a string, block comment, or other multi-line construct. This also means that the line isn't the body or end of a block comment, which ``_classify_groups`` treats differently based on earlier lines.
+#
+# Since each segment begins in the lexer's default state, classifying the source one segment at a time produces the same result as classifying it all at once. Each segment records:
+#
+# - the number of lines of source code it contains,
+# - the number of classified lines it produced, which may differ from the number of lines of source code (for example, cleaning a Python docstring may remove blank lines), and
+# - whether it may contain the unterminated beginning of a multi-line construct, such as a block comment missing its closing delimiter. A lexer which can't match such a construct either emits an error token or lexes its opening delimiter as code, then continues. An edit to any later line might complete the construct, so the classifier re-lexes from the first such segment preceding an edit.
+_SOURCE_LINES, _CLASSIFIED_LINES, _MAY_BE_UNTERMINATED = range(3)
+
+
+# .. _IncrementalClassifier:
+#
+# IncrementalClassifier
+# =====================
+# Classify source code, then update this classification after each edit.
+#
+# Unlike `source_lexer`, this classifier never strips leading or trailing blank lines from the source (the lexer's ``stripnl`` and ``stripall`` options are ignored), so that each line of source code has a matching classified line; an editor needs this to keep its lines aligned with the preview. Otherwise, the classification matches the one produced by `source_lexer`.
+#
+# This assumes that a lexer can start lexing from any safe line, and that an edit can only change the way lines before it are lexed by completing a block comment or a construct the lexer marked as an error. A few lexers don't meet this assumption; for example, Bash lexes an unterminated here document as code, so adding its terminator later changes the meaning of the earlier lines. In these cases, call `reclassify`_ to start over from the beginning of the source.
+#
+# When finding Python docstrings, each edit still parses the entire source using Python's ``ast`` module, since an edit anywhere in the source may introduce a syntax error or change which strings are docstrings. This parse is much faster than lexing the source, but its cost still grows with the size of the source.
+class IncrementalClassifier:
+    def __init__(
+        self,
+        # See `code_str <code_str>`.
+        code_str,
+        # See `lexer <lexer>`.
+        lexer,
+        # See `docstrings <docstrings>`.
+        docstrings=True,
+    ):
+        self.lexer = lexer
+        self.docstrings = docstrings and lexer.name in ("Python", "Python 3")
+        (
+            self._comment_delim_info,
+            self._comment_is_inline,
+            self._comment_is_block,
+        ) = _lexer_comment_info(lexer)
+        # Like Pygments, remove a byte order mark.
+        if code_str.startswith("\ufeff"):
+            code_str = code_str[len("\ufeff") :]
+        # The source code, as a list of lines. Each line ends with a newline.
+        self.lines = self._split_lines(code_str)
+        self.classified_lines = []
+        self.reclassify()
+
+    # .. _reclassify:
+    #
+    # Classify the entire source. Return the classified lines which changed, as described in `edit`_.
+    def reclassify(self):
+        old_len = len(self.classified_lines)
+        # The output of `source_lexer`: the syntax error produced when searching for Python docstrings...
+        self.ast_syntax_error = ""
+        self._ast_docstring = {}
+        self._find_docstrings()
+        # ...and a list of ``(type, string)`` classified lines.
+        self.classified_lines = []
+        # A list of segments, in the format given by `Segments`_.
+        self._segments = []
+        for segment, classified_lines in self._lex_segments(0):
+            self._segments.append(segment)
+            self.classified_lines.extend(classified_lines)
+        return 0, old_len, len(self.classified_lines)
+
+    # .. _edit:
+    #
+    # Replace lines ``start_line`` up to but not including ``end_line`` of the source with ``replacement`` (lines are numbered from 0), then update the classification. Return a tuple of ``(start, old_end, new_end)``: ``classified_lines[start:new_end]`` replaced what was ``classified_lines[start:old_end]`` before this edit.
+    def edit(
+        self,
+        # The first line to replace.
+        start_line,
+        # One past the last line to replace. If this equals ``start_line``, then ``replacement`` is inserted before ``start_line``.
+        end_line,
+        # The text to replace these lines with. An empty string deletes them; a newline is added to the end if it's missing.
+        replacement,
+    ):
+        if not (0 <= start_line <= end_line <= len(self.lines)):
+            raise ValueError(
+                "Invalid line range {}-{} for source with {} lines.".format(
+                    start_line, end_line, len(self.lines)
+                )
+            )
+        new_lines = self._split_lines(replacement)
+        line_delta = len(new_lines) - (end_line - start_line)
+        self.lines[start_line:end_line] = new_lines
+        # The first line following the replacement.
+        new_end_line = start_line + len(new_lines)
+
+        old_ast_docstring = self._ast_docstring
+        self._find_docstrings()
+
+        # Find the line on which each segment starts and the index of its first classified line; the final element of each list marks the end of the last segment.
+        source_starts = [0, *accumulate(s[_SOURCE_LINES] for s in self._segments)]
+        classified_starts = [
+            0,
+            *accumulate(s[_CLASSIFIED_LINES] for s in self._segments),
+        ]
+        # Start re-lexing at the segment before the one containing the edit, since an edit may change how the lexer matches the end of the previous line. Go back further to any segment which may be unterminated.
+        first_segment = max(
+            min(bisect_right(source_starts, start_line), len(self._segments)) - 2, 0
+        )
+        first_segment = next(
+            (
+                index
+                for index, segment in enumerate(self._segments[:first_segment])
+                if segment[_MAY_BE_UNTERMINATED]
+            ),
+            first_segment,
+        )
+        relex_start = source_starts[first_segment]
+
+        # Re-lex until the segments line up with the segments before the edit.
+        new_segments = []
+        new_classified_lines = []
+        next_start = relex_start
+        end_segment = len(self._segments)
+        for segment, classified_lines in self._lex_segments(relex_start):
+            new_segments.append(segment)
+            new_classified_lines.extend(classified_lines)
+            next_start += segment[_SOURCE_LINES]
+            # If this segment ends after the edit at a line which also began an old segment, then the remaining old segments are still valid.
+            if next_start >= new_end_line:
+                old_next_start = next_start - line_delta
+                index = bisect_left(source_starts, old_next_start)
+                if index < end_segment and source_starts[index] == old_next_start:
+                    end_segment = index
+                    break
+
+        # The classification of the segments which weren't re-lexed depends on the docstrings they contain. If these changed (for example, because the edit introduced a syntax error), start over.
+        if self.docstrings and _docstrings_outside(
+            self._ast_docstring, relex_start, next_start, 0
+        ) != _docstrings_outside(
+            old_ast_docstring, relex_start, next_start, line_delta
+        ):
+            return self.reclassify()
+
+        start = classified_starts[first_segment]
+        old_end = classified_starts[end_segment]
+        self._segments[first_segment:end_segment] = new_segments
+        self.classified_lines[start:old_end] = new_classified_lines
+        return start, old_end, start + len(new_classified_lines)
+
+    # Supporting routines
+    # -------------------
+    # Split code into a list of lines, each ending in a newline. Perform the same preprocessing as Pygments: normalize newlines and expand tabs.
+    def _split_lines(self, code_str):
+        code_str = code_str.replace("\r\n", "\n").replace("\r", "\n")
+        if self.lexer.tabsize > 0:
+            code_str = code_str.expandtabs(self.lexer.tabsize)
+        lines = code_str.split("\n")
+        # ``split`` produces the (possibly empty) text following the last newline as the last element.
+        last_line = lines.pop()
+        lines = [line + "\n" for line in lines]
+        if last_line:
+            lines.append(last_line + "\n")
+        return lines
+
+    # Update ``ast_syntax_error`` and the docstrings found in the source.
+    def _find_docstrings(self):
+        if self.docstrings:
+            self._ast_docstring, self.ast_syntax_error = _python_docstrings(
+                "".join(self.lines)
+            )
+
+    # Lex the source starting at the safe line ``start_line``, yielding a tuple of (segment, classified lines) for each segment. The source is lexed only as far as the caller consumes segments.
+    def _lex_segments(self, start_line):
+        # The tokens in the current segment.
+        tokens = []
+        # The line the current segment starts on, and the line the next token starts on.
+        segment_start = line = start_line
+        # True if the last token ended with a newline which makes the next line safe.
+        is_safe = False
+        group_table = _get_group_table(self._comment_is_inline, self._comment_is_block)
+        for tokentype, string, is_default_state in _lex_with_states(
+            self.lexer, "".join(self.lines[start_line:])
+        ):
+            if not string:
+                continue
+            if is_safe and is_default_state and line > segment_start:
+                yield self._classify_segment(tokens, segment_start, line)
+                tokens = []
+                segment_start = line
+            tokens.append((tokentype, string))
+            line += string.count("\n")
+            is_safe = string.endswith("\n") and group_table[tokentype] in (
+                _GROUP.whitespace,
+                _GROUP.inline_comment,
+            )
+        if tokens:
+            yield self._classify_segment(tokens, segment_start, line)
+
+    # Classify the tokens in one segment, returning a tuple of (segment, classified lines).
+    def _classify_segment(self, tokens, segment_start, segment_end):
+        cdi = self._comment_delim_info
+        # Look for error tokens, or an opening block comment delimiter outside of comments and strings (it may be split across several tokens).
+        may_be_unterminated = any(
+            tokentype in Token.Error for tokentype, _ in tokens
+        ) or (
+            bool(cdi[1])
+            and cdi[1]
+            in "".join(
+                string
+                for tokentype, string in tokens
+                if tokentype not in Token.Comment and tokentype not in Token.String
+            )
+        )
+        classified_lines = list(
+            _classify_groups(
+                _gather_groups_on_newlines(
+                    _group_lexer_tokens(
+                        tokens,
+                        self._comment_is_inline,
+                        self._comment_is_block,
+                        self._ast_docstring,
+                        segment_start + 1,
+                    ),
+                    cdi,
+                ),
+                cdi,
+                self.lexer,
+            )
+        )
+        return (
+            (segment_end - segment_start, len(classified_lines), may_be_unterminated),
+            classified_lines,
+        )
+
+
+# Return the docstrings in ``ast_docstring`` which end before ``relex_start`` or at or after ``next_start`` (these are line indices after the edit), keyed by their line number after the edit.
+def _docstrings_outside(
+    # The docstrings to examine; see ``_python_docstrings``. Its keys are line numbers, which begin at 1.
+    ast_docstring,
+    # The first line re-lexed.
+    relex_start,
+    # The first line following the re-lexed lines.
+    next_start,
+    # The number of lines to add to the line number of docstrings following the edit.
+    line_delta,
+):
+    return {
+        (lineno if lineno <= relex_start else lineno + line_delta): docstring
+        for lineno, docstring in ast_docstring.items()
+        if lineno <= relex_start or lineno + line_delta > next_start
+    }
+
+
+# Lexing with states
+# ==================
+# Lex ``text``, yielding a tuple of ``(tokentype, string, is_default_state)`` for each token. ``is_default_state`` is True if the lexer was in its default state (a state stack containing only ``root``) when it began matching this token. A lexer remembers what it's inside of (for example, the braces of a CSS rule or a string) in its state stack, so lines which don't begin in the default state can't begin a segment.
+#
+# Pygments doesn't make its state stack visible, so this relies on a copy of the ``RegexLexer`` lexing loop below. Lexers which provide their own lexing loop (all lexers which aren't a ``RegexLexer``, including an ``ExtendedRegexLexer``) and lexers with filters (which may merge or split tokens) report no default states; for these lexers, the entire source forms a single segment, so that each edit re-lexes the entire source.
+def _lex_with_states(
+    # The lexer to use.
+    lexer,
+    # The preprocessed text to lex.
+    text,
+):
+    if (
+        not isinstance(lexer, RegexLexer)
+        or isinstance(lexer, ExtendedRegexLexer)
+        or lexer.filters
+        # The PHP lexer's ``startinline`` option starts lexing in a state other than the default state.
+        or getattr(lexer, "startinline", False)
+    ):
+        for tokentype, string in _pygments_get_tokens_postprocess(lexer, text):
+            yield tokentype, string, False
+        return
+
+    states = _regex_lexer_get_tokens_unprocessed(lexer, text)
+    if type(lexer).get_tokens_unprocessed is RegexLexer.get_tokens_unprocessed:
+        for _, tokentype, string, is_default_state in states:
+            yield tokentype, string, is_default_state
+        return
+
+    # This lexer wraps the ``RegexLexer`` lexing loop, typically to change the type of some tokens (for example, the C lexer marks standard types as keywords). Take tokens from this lexer, and states from the copied loop, matched by the position of each token.
+    state_index = -1
+    for index, tokentype, string in lexer.get_tokens_unprocessed(text):
+        while state_index < index:
+            state_index, _, _, is_default_state = next(
+                states, (len(text), None, None, False)
+            )
+        yield tokentype, string, state_index == index and is_default_state
+
+
+# This code was copied from ``pygments.lexer.RegexLexer.get_tokens_unprocessed``, v. 2.19.2, then edited to yield ``(index, tokentype, string, is_default_state)``.
+def _regex_lexer_get_tokens_unprocessed(self, text, stack=("root",)):
+    pos = 0
+    tokendefs = self._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    while 1:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                # EDIT: Only the first token produced by a match begins in this state.
+                is_default_state = len(statestack) == 1
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group(), is_default_state
+                    else:
+                        for index, tokentype, string in action(self, m):
+                            yield index, tokentype, string, is_default_state
+                            is_default_state = False
+                pos = m.end()
+                if new_state is not None:
+                    # state transition
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == "#pop":
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == "#push":
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        # pop, but keep at least one state on the stack
+                        # (random code leading to unexpected pops should
+                        # not allow exceptions)
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == "#push":
+                        statestack.append(statestack[-1])
+                    else:
+                        assert False, f"wrong state def: {new_state!r}"
+                    statetokens = tokendefs[statestack[-1]]
+                break
+        else:
+            # We are here only if all state tokens have been considered
+            # and there was not a match on any of them.
+            try:
+                if text[pos] == "\n":
+                    # at EOL, reset state to "root"
+                    statestack = ["root"]
+                    statetokens = tokendefs["root"]
+                    yield pos, Whitespace, "\n", False
+                    pos += 1
+                    continue
+                yield pos, Error, text[pos], len(statestack) == 1
+                pos += 1
+            except IndexError:
+                break
@@ -0,0 +1,294 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ******************************************
+# |docname| - A persistent conversion server
+# ******************************************
+# Starting Python and importing Pygments, docutils, and lxml takes far longer than converting a typical source file. The ``CodeChat-server`` command starts a long-running process which pays this cost once, then converts source code on request, keeping the lexers and docutils settings it creates for later requests. Editors showing a live preview and build tools which convert many files can send each conversion to this server, rather than starting a new process for each one.
+#
+# Protocol
+# ========
+# The server speaks `JSON-RPC 2.0 <https://www.jsonrpc.org/specification>`_, with one message (a request, a batch of requests, or a response) per line. By default, it reads requests from stdin and writes responses to stdout; ``CodeChat-server --socket PATH`` instead listens on a Unix domain socket, accepting any number of connections. Requests are converted concurrently, so a response may arrive before the response to an earlier request; use each response's ``id`` to match it with its request.
+#
+# The server provides these methods:
+#
+# =============== ===============================================
+# Method          Converts source code using
+# =============== ===============================================
+# ``to_rest``     `code_to_rest_string`
+# ``to_markdown`` `code_to_markdown_string`
+# ``to_pretext``  `code_to_pretext_string`
+# ``to_html``     `code_to_html_string`
+# =============== ===============================================
+#
+# Each takes named parameters: ``code``, the source code to convert, is required. To select a lexer, provide ``alias``, ``filename``, or ``mimetype`` (see `get_lexer`); with none of these, the lexer is guessed from the code. ``docstrings`` is optional; see `docstrings <docstrings>`. The result is the converted code, as a string. For example:
+#
+# .. code-block:: text
+#
+#   --> {"jsonrpc": "2.0", "id": 1, "method": "to_markdown", "params": {"code": "# A comment.\nx = 1\n", "alias": "python"}}
+#   <-- {"jsonrpc": "2.0", "id": 1, "result": "..."}
+#
+# .. contents::
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Standard library
+# ----------------
+import argparse
+from concurrent.futures import ThreadPoolExecutor, wait
+import io
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+
+# Third-party imports
+# -------------------
+# None.
+
+# Local application imports
+# -------------------------
+from .CodeToMarkdown import code_to_markdown_string
+from .CodeToPretext import code_to_pretext_string
+from .CodeToRest import code_to_html_string, code_to_rest_string
+from .SourceClassifier import _get_filename_index
+
+# Handling requests
+# =================
+# `Error codes <https://www.jsonrpc.org/specification#error_object>`_ defined by JSON-RPC.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+# A server-defined error code, returned when a conversion raises an exception.
+CONVERSION_ERROR = -32000
+
+
+# Convert code to HTML. Docutils reports errors in the HTML it produces, so discard the copy of these errors it also writes to its warning stream, which would otherwise go to stderr.
+def _code_to_html(code_str, **options):
+    return code_to_html_string(code_str, warning_stream=io.StringIO(), **options)
+
+
+# For each method, give the function which performs this conversion.
+_METHODS = {
+    "to_rest": code_to_rest_string,
+    "to_markdown": code_to_markdown_string,
+    "to_pretext": code_to_pretext_string,
+    "to_html": _code_to_html,
+}
+
+# The parameters a request may provide, in addition to ``code``.
+_OPTIONAL_PARAMS = {"alias", "filename", "mimetype", "docstrings"}
+
+
+# Return the response to one JSON-RPC request, already decoded from JSON, or None if the request is a notification (which has no response).
+def handle_request(request):
+    if (
+        not isinstance(request, dict)
+        or request.get("jsonrpc") != "2.0"
+        or not isinstance(request.get("method"), str)
+    ):
+        return _error_response(None, INVALID_REQUEST, "Invalid request.")
+    id_ = request.get("id")
+    method = _METHODS.get(request["method"])
+    params = request.get("params", {})
+    if method is None:
+        response = _error_response(
+            id_, METHOD_NOT_FOUND, "Unknown method {}.".format(request["method"])
+        )
+    elif (
+        not isinstance(params, dict)
+        or not isinstance(params.get("code"), str)
+        or not params.keys() - {"code"} <= _OPTIONAL_PARAMS
+    ):
+        response = _error_response(
+            id_,
+            INVALID_PARAMS,
+            "The parameters must be an object containing code and, optionally, {}.".format(
+                ", ".join(sorted(_OPTIONAL_PARAMS))
+            ),
+        )
+    else:
+        options = dict(params)
+        code_str = options.pop("code")
+        try:
+            response = {
+                "jsonrpc": "2.0",
+                "id": id_,
+                "result": method(code_str, **options),
+            }
+        except Exception as e:
+            response = _error_response(
+                id_, CONVERSION_ERROR, "{}: {}".format(type(e).__name__, e)
+            )
+    return None if "id" not in request else response
+
+
+# Return a JSON-RPC error response.
+def _error_response(id_, code, message):
+    return {"jsonrpc": "2.0", "id": id_, "error": {"code": code, "message": message}}
+
+
+# Return the response to one line of JSON received from a client, encoded as JSON, or None if there's no response. The line may contain a single request or a batch (a list) of requests.
+def handle_line(line):
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return json.dumps(_error_response(None, PARSE_ERROR, str(e)))
+    if isinstance(request, list):
+        if not request:
+            return json.dumps(_error_response(None, INVALID_REQUEST, "Empty batch."))
+        responses = [
+            response
+            for response in map(handle_request, request)
+            if response is not None
+        ]
+        return json.dumps(responses) if responses else None
+    response = handle_request(request)
+    return None if response is None else json.dumps(response)
+
+
+# Serving clients
+# ===============
+# Read requests, one per line, from ``reader`` until it's closed. Convert each in ``executor``, writing its response as a line to ``writer`` as soon as it's ready. Return after writing all responses.
+def serve_stream(
+    # A text file opened for reading.
+    reader,
+    # A text file opened for writing.
+    writer,
+    # A ``concurrent.futures.Executor`` used to convert each request.
+    executor,
+):
+    # Serialize writes, since responses are written from the executor's threads.
+    write_lock = threading.Lock()
+    # The futures whose responses haven't been written yet.
+    pending = set()
+
+    def write_response(future):
+        response = future.result()
+        with write_lock:
+            pending.discard(future)
+            if response is not None:
+                writer.write(response + "\n")
+                writer.flush()
+
+    for line in reader:
+        if line.strip():
+            future = executor.submit(handle_line, line)
+            with write_lock:
+                pending.add(future)
+            future.add_done_callback(write_response)
+
+    with write_lock:
+        remaining = list(pending)
+    wait(remaining)
+
+
+# Accept connections on a Unix domain socket, serving each from its own thread.
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(
+            self,
+            # The path of the socket.
+            socket_path,
+            # See ``executor`` in ``serve_stream``.
+            executor,
+        ):
+            self.executor = executor
+            super().__init__(socket_path, _ConnectionHandler)
+
+    class _ConnectionHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            serve_stream(
+                io.TextIOWrapper(self.rfile, encoding="utf-8"),
+                io.TextIOWrapper(self.wfile, encoding="utf-8"),
+                self.server.executor,
+            )
+
+
+# Create a server listening on the Unix domain socket at ``socket_path``, replacing a socket left there by a server which exited without removing it. Call its ``serve_forever`` method to serve clients.
+def make_socket_server(socket_path, executor):
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise OSError("Unix domain sockets aren't supported on this platform.")
+    try:
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    return _UnixServer(socket_path, executor)
+
+
+# Create the state which the first conversion would otherwise create: the index of lexers by filename, the docutils settings, and compiled regular expressions for the Python lexer.
+def _warm_up():
+    _get_filename_index()
+    for method in _METHODS.values():
+        method("# A comment.\nx = 1\n", alias="python")
+
+
+# Command-line interface
+# ======================
+def main(
+    # The command-line arguments; if None, use ``sys.argv``.
+    args=None,
+):
+    parser = argparse.ArgumentParser(
+        prog="CodeChat-server",
+        description="Convert source code on request, using JSON-RPC over stdin/stdout or a Unix domain socket.",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Listen on a Unix domain socket at this path, instead of using stdin and stdout.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=4,
+        help="The number of requests to convert concurrently (default: %(default)s).",
+    )
+    args = parser.parse_args(args)
+
+    _warm_up()
+    with ThreadPoolExecutor(args.jobs) as executor:
+        if args.socket is None:
+            serve_stream(
+                io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8"),
+                io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8"),
+                executor,
+            )
+            return
+        server = make_socket_server(args.socket, executor)
+        print("Listening on {}.".format(args.socket), file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
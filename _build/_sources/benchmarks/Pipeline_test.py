@@ -0,0 +1,166 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# **************************************************
+# |docname| - Benchmarks for the conversion pipeline
+# **************************************************
+# These benchmarks time each stage of converting source code to HTML, using `pytest-benchmark <https://pytest-benchmark.readthedocs.io/>`_. Each stage is given the output of the previous stage, computed before timing begins, so that its time doesn't include the time of the stages before it. To run them, install pytest-benchmark (``pip install -e .[benchmark]``), then execute ``pytest benchmarks`` from the root directory of the project.
+#
+# To catch regressions, save the results of each run, which pytest-benchmark names with the current commit, then compare later runs with the last saved run:
+#
+# .. code-block:: console
+#
+#   $ pytest benchmarks --benchmark-autosave
+#   $ pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+#
+# The second command fails if any benchmark's mean time grew by more than 10%. Run ``pytest-benchmark compare`` to view saved runs side by side.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+import copy
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Skip these benchmarks, instead of failing, if pytest-benchmark isn't installed.
+pytest.importorskip("pytest_benchmark")
+from docutils import core  # noqa: E402
+
+# Local application imports
+# -------------------------
+from CodeChat.CodeToRest import _generate_rest, _html_settings  # noqa: E402
+from CodeChat.SourceClassifier import (  # noqa: E402
+    _classify_groups,
+    _fast_lexer,
+    _gather_groups_on_newlines,
+    _group_lexer_tokens,
+    _lexer_comment_info,
+    _pygments_lexer,
+    clear_lexer_cache,
+    get_lexer,
+)
+
+
+# Stages
+# ======
+# Run each stage on ``corpus``, returning a dict of the output of each stage, keyed by the stage's name.
+def _run_stages(corpus):
+    filename, code = corpus
+    lexer = get_lexer(filename=filename, code=code)
+    cdi, comment_is_inline, comment_is_block = _lexer_comment_info(lexer)
+    token_iter, ast_docstring, ast_syntax_error = _pygments_lexer(code, lexer)
+    stages = {"lexer": lexer, "cdi": cdi}
+    stages["tokens"] = list(token_iter)
+    stages["grouped"] = list(
+        _group_lexer_tokens(
+            stages["tokens"], comment_is_inline, comment_is_block, ast_docstring
+        )
+    )
+    stages["gathered"] = list(_gather_groups_on_newlines(stages["grouped"], cdi))
+    stages["classified"] = list(
+        _classify_groups(copy.deepcopy(stages["gathered"]), cdi, lexer)
+    )
+    stages["rest"] = "".join(_generate_rest(stages["classified"]))
+    return stages
+
+
+@pytest.fixture(scope="session")
+def stages(corpus):
+    return _run_stages(corpus)
+
+
+# Find a lexer from the filename and code, when the `lexer cache` is empty.
+def test_get_lexer(benchmark, corpus):
+    filename, code = corpus
+    benchmark.pedantic(
+        get_lexer,
+        kwargs=dict(filename=filename, code=code),
+        setup=clear_lexer_cache,
+        rounds=50,
+    )
+
+
+# Lex the code with Pygments, including finding Python docstrings.
+def test_pygments_lexer(benchmark, corpus, stages):
+    def pygments_lexer():
+        return list(_pygments_lexer(corpus[1], stages["lexer"])[0])
+
+    benchmark(pygments_lexer)
+
+
+def test_group_lexer_tokens(benchmark, corpus, stages):
+    _, comment_is_inline, comment_is_block = _lexer_comment_info(stages["lexer"])
+    # The docstrings found in the code are an output of ``_pygments_lexer``, not its tokens, so find them before timing.
+    ast_docstring = _pygments_lexer(corpus[1], stages["lexer"])[1]
+
+    def group_lexer_tokens():
+        return list(
+            _group_lexer_tokens(
+                stages["tokens"], comment_is_inline, comment_is_block, ast_docstring
+            )
+        )
+
+    benchmark(group_lexer_tokens)
+
+
+# Produce the same groups as the two stages above using the ``fast`` `engine <Engines>`, for the corpora it supports.
+def test_fast_lexer(benchmark, corpus, stages):
+    if _fast_lexer(corpus[1], stages["lexer"], True) is None:
+        pytest.skip("The fast engine doesn't support this corpus.")
+    benchmark(lambda: _fast_lexer(corpus[1], stages["lexer"], True))
+
+
+def test_gather_groups_on_newlines(benchmark, stages):
+    benchmark(
+        lambda: list(_gather_groups_on_newlines(stages["grouped"], stages["cdi"]))
+    )
+
+
+# ``_classify_groups`` modifies the lists it's given, so give each round its own copy.
+def test_classify_groups(benchmark, stages):
+    def setup():
+        return (copy.deepcopy(stages["gathered"]),), {}
+
+    benchmark.pedantic(
+        lambda gathered: list(
+            _classify_groups(gathered, stages["cdi"], stages["lexer"])
+        ),
+        setup=setup,
+        rounds=20,
+    )
+
+
+def test_generate_rest(benchmark, stages):
+    benchmark(lambda: "".join(_generate_rest(stages["classified"])))
+
+
+# Convert the reST to HTML using docutils, as `code_to_html_string` does.
+def test_publish_string(benchmark, stages):
+    def publish_string():
+        settings = copy.copy(_html_settings())
+        settings.warning_stream = False
+        return core.publish_string(
+            stages["rest"], writer_name="html", settings=settings
+        )
+
+    benchmark.pedantic(publish_string, rounds=5)
@@ -0,0 +1,192 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# **********************************
+# |docname| - Corpora for benchmarks
+# **********************************
+# The benchmarks convert each of these corpora: synthetic files in several languages, synthetic files which are mostly comments or mostly code, and real files from this project.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+from pathlib import Path
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+# None.
+
+# Synthetic corpora
+# =================
+# The number of times each synthetic corpus repeats its block of code; each block is about 20 lines.
+REPEATS = 200
+
+
+def _c(i):
+    return f"""// Function {i}
+// ===========
+// Compute a value, using the *loop* below. See `func_{i}`.
+int func_{i}(int a, int b) {{
+    /* A block comment
+       spanning two lines. */
+    int sum = 0;  // An inline comment.
+    for (int j = 0; j < a; j++) {{
+        sum += j * b;
+    }}
+    return sum;
+}}
+
+"""
+
+
+def _python(i):
+    return f'''# Function {i}
+# ===========
+# Compute a value, using the *loop* below. See `func_{i}`.
+def func_{i}(a, b):
+    """A docstring,
+    spanning two lines."""
+    total = 0  # An inline comment.
+    for j in range(a):
+        total += j * b
+    return total
+
+
+'''
+
+
+def _html(i):
+    return f"""<!-- Section {i}
+     ==========
+     Some *text* in a comment. -->
+<div class="section-{i}">
+    <p>Paragraph {i}, with a <a href="#{i}">link</a>.</p>
+    <!-- An indented comment. -->
+    <ul>
+        <li>One</li>
+        <li>Two</li>
+    </ul>
+</div>
+
+"""
+
+
+def _rust(i):
+    return f"""// Function {i}
+// ===========
+// Compute a value, using the *loop* below. See `func_{i}`.
+fn func_{i}(a: i32, b: i32) -> i32 {{
+    /* A block comment
+       spanning two lines. */
+    let mut sum = 0; // An inline comment.
+    for j in 0..a {{
+        sum += j * b;
+    }}
+    sum
+}}
+
+"""
+
+
+def _comment_heavy(i):
+    return f"""# Section {i}
+# ==========
+# This paragraph explains the code which follows. It contains *emphasis*,
+# ``literals``, and a `link <https://example.com/{i}>`_, spanning several
+# lines, as literate programs do.
+#
+# -   A bulleted list.
+# -   With two items.
+#
+#   # A comment indented as a block quote.
+x_{i} = {i}
+
+"""
+
+
+def _code_heavy(i):
+    return f"""// Function {i}.
+int func_{i}(int a, int b) {{
+    int sum = 0;
+    for (int j = 0; j < a; j++) {{
+        if (j % 2) {{
+            sum += j * b;
+        }} else {{
+            sum -= j;
+        }}
+        sum ^= (sum << 3) | (b >> 2);
+    }}
+    while (sum > 1000) {{
+        sum /= 2;
+    }}
+    return sum;
+}}
+
+"""
+
+
+# Minified files contain many tokens on each (very long) line.
+def _minified_js(i):
+    return f"function f{i}(a,b){{var c=a+b,d=[{i},2,3];for(var e=0;e<d.length;e++)c+=d[e]*b;return c>{i}?c:-c}}var x{i}=f{i}(1,'s');"
+
+
+def _minified_css(i):
+    return f".c{i}{{color:#{i:03x};margin:0 {i}px;padding:1em 2em}}.c{i} a:hover,.c{i}>p{{text-decoration:none;font-weight:700}}"
+
+
+# For each synthetic corpus, give its filename (which selects a lexer) and the function producing each block of code.
+_SYNTHETIC = {
+    "c": ("synthetic.c", _c),
+    "python": ("synthetic.py", _python),
+    "html": ("synthetic.html", _html),
+    "rust": ("synthetic.rs", _rust),
+    "comment_heavy": ("comment_heavy.py", _comment_heavy),
+    "code_heavy": ("code_heavy.c", _code_heavy),
+    "minified_js": ("minified.min.js", _minified_js),
+    "minified_css": ("minified.min.css", _minified_css),
+}
+
+# Real corpora
+# ============
+# Files from this project, given as paths relative to its root directory.
+_ROOT = Path(__file__).parent.parent
+_REAL = {
+    "real_cpp": "docs/style_guide.cpp",
+    "real_python": "CodeChat/SourceClassifier.py",
+    "real_html": "test/style_test.py.html",
+    "real_css": "CodeChat/css/CodeChat.css",
+}
+
+
+# Fixtures
+# ========
+# Provide ``(filename, code)`` for each corpus.
+@pytest.fixture(scope="session", params=[*_SYNTHETIC, *_REAL])
+def corpus(request):
+    name = request.param
+    if name in _SYNTHETIC:
+        filename, block = _SYNTHETIC[name]
+        return filename, "".join(block(i) for i in range(REPEATS))
+    path = _ROOT / _REAL[name]
+    return path.name, path.read_text(encoding="utf-8")
@@ -0,0 +1,247 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# **************************************************************
+# |docname| - Unit testing for `../CodeChat/CodeToRestSphinx.py`
+# **************************************************************
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+from difflib import unified_diff
+import json
+import logging
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+from types import SimpleNamespace
+
+# Third-party imports
+# -------------------
+from docutils import nodes
+from docutils.core import publish_doctree
+from pygments.lexers import TextLexer
+import sphinx.highlighting
+from sphinx.highlighting import PygmentsBridge
+
+# Local application imports
+# -------------------------
+from CodeChat.CodeToRest import code_to_rest_string
+from CodeChat.CodeToRestSphinx import (
+    _build_finished,
+    _doctree_read,
+    _env_merge_info,
+    _env_purge_doc,
+    _highlight_block,
+    _profiles,
+    _saved_block_tokens,
+    _saved_tokens,
+    _sphinx_highlight_block,
+)
+from CodeChat.SourceClassifier import (
+    collect_profiles,
+    collect_tokens,
+    get_lexer,
+    use_engine,
+)
+
+
+# Tests
+# =====
+def test_1():
+    root_path = Path(__file__).parents[1]
+    try:
+        # See `../codechat_config.yaml` for an explanation of these arguments.
+        cp = subprocess.run(
+            ["sphinx-build", "-E", ".", "_build"],
+            capture_output=True,
+            encoding="utf-8",
+            check=True,
+            cwd=str(root_path),
+        )
+
+        # Check errors and warnings.
+        assert "ERROR" not in cp.stderr
+        # Myst cross-refs don't work. TOOD: fix this!
+        assert "WARNING: Unknown source document 'docs" in cp.stderr
+
+        # Check styling.
+        diff_files(root_path, "docs/style_test.py.html", "style_test.py.html")
+        # Check Markdown rendering.
+        diff_files(root_path, "docs/style_guide.md.cpp.html", "style_guide.md.cpp.html")
+        # Check CodeChat_lexer_for_glob rendering.
+        diff_files(root_path, ".flake8.html", ".flake8.html")
+
+    except Exception as e:
+        if isinstance(e, subprocess.CalledProcessError):
+            cp = e
+        # Print out the Sphinx results on any test failure.
+        print(cp.stdout)
+        print(cp.stderr)
+        raise
+
+
+# Profiles from parallel builds are merged, then summarized at the end of the build.
+def test_2(tmp_path, caplog):
+    app = SimpleNamespace(
+        config=SimpleNamespace(CodeChat_profile=True),
+        env=SimpleNamespace(),
+        doctreedir=str(tmp_path),
+    )
+    # Simulate a parallel read, where another process converts ``b.c``.
+    other = SimpleNamespace()
+    for env, docname, code_str, alias in (
+        (app.env, "a.py", "# a\nx = 1\n", "python"),
+        (other, "b.c", "// b\nint b;\n", "c"),
+        (app.env, "c.py", "# c\n", "python"),
+    ):
+        with collect_profiles() as reports:
+            code_to_rest_string(code_str, alias=alias)
+        reports[0]["docname"] = docname
+        _profiles(env)[docname] = reports[0]
+    _env_merge_info(app, app.env, ["b.c"], other)
+    _env_purge_doc(app, app.env, "c.py")
+
+    with caplog.at_level(logging.INFO):
+        _build_finished(app, None)
+    reports = json.loads((tmp_path / "CodeChat-profile.json").read_text())
+    assert sorted(report["docname"] for report in reports) == ["a.py", "b.c"]
+    assert "CodeChat profile: 2 files converted" in caplog.text
+    assert "a.py (Python, 2 lines)" in caplog.text
+    assert "C (1 files)" in caplog.text
+
+
+# Fenced code is highlighted using the tokens saved when it was converted, producing the same result as lexing it again.
+def test_3(monkeypatch):
+    code_str = (
+        "# A comment.\n"
+        "\n"
+        "def foo(a):\n"
+        '\tx = """A\n'
+        "\n"
+        '  string.\t"""  \n'
+        "\n"
+        "# Another comment.\n"
+        "\f\n"
+        "y = 1\n"
+    )
+    # Don't expand tabs, so that the reST parser does.
+    lexer = get_lexer(alias="python", tabsize=0)
+    with collect_tokens() as token_lists:
+        rest = code_to_rest_string(code_str, lexer=lexer)
+    saved = (lexer, *token_lists[0])
+    app = SimpleNamespace(env=SimpleNamespace(temp_data={"CodeChat_tokens": saved}))
+    doctree = publish_doctree(rest, source_path="foo.py")
+    # Test the patch even if this version of Sphinx doesn't use it.
+    monkeypatch.setattr(PygmentsBridge, "highlight_block", _highlight_block)
+    monkeypatch.setattr(
+        "CodeChat.CodeToRestSphinx._saved_block_tokens", _saved_block_tokens.copy()
+    )
+    _doctree_read(app, doctree)
+    assert not app.env.temp_data
+    # The tokens aren't stored in the doctree; they're found again after Sphinx pickles it.
+    doctree = pickle.loads(pickle.dumps(doctree))
+    blocks = list(doctree.findall(nodes.literal_block))
+    assert len(blocks) == 2
+    assert not [key for node in blocks for key in node.attributes if "CodeChat" in key]
+    for dest in ("html", "latex"):
+        bridge = PygmentsBridge(dest)
+        for node in blocks:
+            assert _saved_tokens(node.rawsource, "python", None, False, node)
+            assert bridge.highlight_block(
+                node.rawsource, "python", location=node
+            ) == _sphinx_highlight_block(
+                bridge, node.rawsource, "python", location=node
+            )
+
+    # Sphinx lexes the code if it's highlighted using another lexer or with options, or if its text changed.
+    node = blocks[0]
+    assert _saved_tokens(node.rawsource, "python", None, False, node)
+    assert _saved_tokens(node.rawsource, "c", None, False, node) is None
+    assert _saved_tokens(node.rawsource, "python", {"a": 1}, False, node) is None
+    assert _saved_tokens(node.rawsource + "x", "python", None, False, node) is None
+
+    # Sphinx also lexes the code if a custom lexer was registered for its language, as ``app.add_lexer`` does.
+    with monkeypatch.context() as m:
+        m.setitem(sphinx.highlighting.lexer_classes, "python", TextLexer)
+        assert _saved_tokens(node.rawsource, "python", None, False, node) is None
+        bridge = PygmentsBridge("html")
+        custom_html = bridge.highlight_block(node.rawsource, "python", location=node)
+        assert custom_html == _sphinx_highlight_block(
+            bridge, node.rawsource, "python", location=node
+        )
+    assert custom_html != bridge.highlight_block(
+        node.rawsource, "python", location=node
+    )
+
+    # The fast engine doesn't run the Pygments lexer, so it provides no tokens.
+    with collect_tokens() as token_lists, use_engine("fast"):
+        code_to_rest_string(code_str, lexer=lexer)
+    assert token_lists == []
+
+    # Without the patch, ``_doctree_read`` saves no tokens.
+    monkeypatch.setattr(PygmentsBridge, "highlight_block", _sphinx_highlight_block)
+    monkeypatch.setattr("CodeChat.CodeToRestSphinx._saved_block_tokens", {})
+    app.env.temp_data["CodeChat_tokens"] = saved
+    _doctree_read(app, doctree)
+    assert not app.env.temp_data
+    assert _saved_tokens(node.rawsource, "python", None, False, node) is None
+
+
+def diff_files(
+    # Root of this repo.
+    root_path,
+    # The actual file produced by Sphinx, relative to the Sphinx output directory.
+    actual_relpath,
+    # The expected results, relative to the test directory.
+    expected_relapth,
+):
+    root_path = Path(__file__).parents[1]
+
+    # Compare rendering of `../docs/style_test.py` to a known good copy.
+    with open(
+        root_path / "_build" / actual_relpath, encoding="utf-8"
+    ) as actual_file, open(
+        Path(__file__).parent / expected_relapth, encoding="utf-8"
+    ) as expected_file:
+        actual = remove_navigation(actual_file.readlines())
+        expected = remove_navigation(expected_file.readlines())
+        # If the files differ, show the diff.
+        if actual != expected:
+            sys.stderr.writelines(
+                unified_diff(
+                    actual,
+                    expected,
+                    "Actual - {}".format(actual_relpath),
+                    "Expected - {}".format(expected_relapth),
+                )
+            )
+            assert False
+
+
+def remove_navigation(lines):
+    for index, line in enumerate(lines):
+        if line == "<h3>Navigation</h3>\n":
+            return lines[:index]
+
+    # We didn't find the navigation heading.
+    assert False
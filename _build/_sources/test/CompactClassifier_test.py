@@ -0,0 +1,132 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the CompactClassifier module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+from pathlib import Path
+import random
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+from CodeChat.CompactClassifier import compact_source_lexer
+from CodeChat.SourceClassifier import get_lexer, source_lexer
+
+c_code = (
+    "#include <stdio.h>\n"
+    "\n"
+    "// A comment.\n"
+    "int main() {\n"
+    "    /* A multi-\n"
+    "       line comment. */\n"
+    "    /* A single-line comment. */   \n"
+    "    /* One. */ /* Two. */\n"
+    "    /*\n"
+    "     * A delimiter-indented\n"
+    "     *   comment.\n"
+    "     */\n"
+    "    return 0;\f\n"
+    "}"
+)
+
+py_code = (
+    '"""Module docstring."""\n'
+    "\n"
+    "# A comment.\n"
+    "def foo():\n"
+    '    """Function docstring.\n'
+    "\n"
+    "        More.\n"
+    '    """\n'
+    "\tpass  # Not a reST comment.\n"
+)
+
+
+# Check that the compact classification matches `source_lexer`.
+def check(code_str, lexer, docstrings=True):
+    err, classified_lines = source_lexer(code_str, lexer, docstrings)
+    classified_lines = list(classified_lines)
+    compact_err, compact_lines = compact_source_lexer(code_str, lexer, docstrings)
+    assert compact_err == err
+    assert list(compact_lines) == classified_lines
+    assert len(compact_lines) == len(classified_lines)
+    assert [compact_lines[i] for i in range(len(compact_lines))] == classified_lines
+    return compact_lines
+
+
+class TestCompactClassifier:
+    # The classification matches `source_lexer`.
+    def test_1(self):
+        check(c_code, get_lexer(alias="c"))
+        check(py_code, get_lexer(alias="python"))
+        check(py_code, get_lexer(alias="python"), False)
+        check("", get_lexer(alias="python"))
+        check("<!-- A comment. -->\n<p>Text</p>\n", get_lexer(alias="html"))
+
+    # Lines are stored as offsets; only lines which can't be are stored as strings.
+    def test_2(self):
+        compact_lines = check(c_code * 100, get_lexer(alias="c"))
+        assert len(compact_lines._strings) == 100
+        assert compact_lines[-1] == (-1, "}\n")
+        assert compact_lines[6] == (4, "A single-line comment.    \n")
+        with pytest.raises(IndexError):
+            compact_lines[len(compact_lines)]
+
+    # A lexer's filters may change the text of its tokens.
+    def test_3(self):
+        lexer = type(get_lexer(alias="c"))()
+        lexer.add_filter("keywordcase", case="upper")
+        compact_lines = check(c_code, lexer)
+        assert "RETURN 0;" in compact_lines.text
+
+    # Randomly-assembled source matches, as do this project's own source files.
+    def test_4(self):
+        rng = random.Random(0)
+        fragments = [
+            "x = 1",
+            "  ",
+            "\n",
+            "\f",
+            "// c",
+            "/* a */",
+            "/*\n",
+            " * b\n",
+            " */",
+            "/* c\n   d */\n",
+            "*/",
+        ]
+        lexer = get_lexer(alias="c")
+        for _ in range(200):
+            check(
+                "".join(rng.choice(fragments) for _ in range(rng.randint(0, 20))),
+                lexer,
+            )
+        for path in (Path(__file__).parents[1] / "CodeChat").glob("*.py"):
+            check(path.read_text(encoding="utf-8"), get_lexer(alias="python"))
@@ -0,0 +1,166 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the IncrementalClassifier module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+import random
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+from CodeChat.IncrementalClassifier import IncrementalClassifier
+from CodeChat.SourceClassifier import get_lexer, source_lexer
+
+c_code = (
+    "#include <stdio.h>\n"
+    "\n"
+    "// A comment.\n"
+    "int main() {\n"
+    "    /* A multi-\n"
+    "       line comment. */\n"
+    "    return 0;\n"
+    "}\n"
+)
+
+py_code = (
+    '"""Module docstring."""\n'
+    "\n"
+    "# A comment.\n"
+    "def foo():\n"
+    '    """Function docstring."""\n'
+    "    pass\n"
+)
+
+
+# Check that the incremental classification matches a classification from scratch.
+def check(ic):
+    err, classified_lines = source_lexer("".join(ic.lines), ic.lexer, ic.docstrings)
+    assert ic.classified_lines == list(classified_lines)
+    assert ic.ast_syntax_error == err
+
+
+class TestIncrementalClassifier:
+    # The initial classification matches `source_lexer`.
+    def test_1(self):
+        check(IncrementalClassifier(c_code, get_lexer(alias="c")))
+        check(IncrementalClassifier(py_code, get_lexer(alias="python")))
+
+    # Editing one line of code reclassifies only nearby lines.
+    def test_2(self):
+        ic = IncrementalClassifier(c_code * 100, get_lexer(alias="c"))
+        start, old_end, new_end = ic.edit(406, 407, "    return 1;\n")
+        check(ic)
+        assert 400 <= start <= 406 < new_end <= 410
+        assert old_end == new_end
+        assert ic.classified_lines[406] == (-1, "    return 1;\n")
+
+    # Inserting and deleting lines.
+    def test_3(self):
+        ic = IncrementalClassifier(c_code, get_lexer(alias="c"))
+        ic.edit(2, 2, "// Another comment.\n// And another.\n")
+        check(ic)
+        assert len(ic.classified_lines) == 10
+        start, old_end, new_end = ic.edit(2, 4, "")
+        assert start <= 2 and old_end - new_end == 2
+        check(ic)
+        assert ic.lines == c_code.splitlines(True)
+
+    # Opening a block comment changes every following line; closing it restores them.
+    def test_4(self):
+        ic = IncrementalClassifier(c_code, get_lexer(alias="c"))
+        ic.edit(1, 1, "/*\n")
+        check(ic)
+        ic.edit(8, 8, "*/\n")
+        check(ic)
+        # CSS lexes an unterminated comment as code, rather than as a comment.
+        ic = IncrementalClassifier("a {}\n" * 10, get_lexer(alias="css"))
+        ic.edit(2, 2, "/*\n")
+        check(ic)
+        ic.edit(8, 8, "*/\n")
+        check(ic)
+        assert ic.classified_lines[3] == (0, "a {}\n")
+
+    # Python docstrings.
+    def test_5(self):
+        ic = IncrementalClassifier(py_code, get_lexer(alias="python"))
+        # Removing the function changes its docstring to a string.
+        ic.edit(3, 4, "if 1:\n")
+        check(ic)
+        assert ic.classified_lines[4] == (-1, '    """Function docstring."""\n')
+        # A syntax error makes all docstrings into strings.
+        assert ic.edit(5, 5, "    if (1 <> 2):\n") == (0, 6, 7)
+        check(ic)
+        assert ic.ast_syntax_error
+        assert ic.classified_lines[0] == (-1, '"""Module docstring."""\n')
+
+    # Newlines and tabs are normalized; a missing final newline is added.
+    def test_6(self):
+        ic = IncrementalClassifier("a = 1\r\n\tb = 2", get_lexer(alias="python"))
+        assert ic.lines == ["a = 1\n", "    b = 2\n"]
+        ic.edit(2, 2, "# Comment")
+        assert ic.lines[2] == "# Comment\n"
+        check(ic)
+
+    # Invalid line ranges.
+    def test_7(self):
+        ic = IncrementalClassifier(c_code, get_lexer(alias="c"))
+        with pytest.raises(ValueError):
+            ic.edit(3, 2, "")
+        with pytest.raises(ValueError):
+            ic.edit(0, 9, "")
+
+    # Random edits produce the same classification as classifying from scratch.
+    @pytest.mark.parametrize(
+        "code, alias",
+        [(c_code * 5, "c"), (py_code * 5, "python"), (c_code * 5, "css")],
+    )
+    def test_8(self, code, alias):
+        ic = IncrementalClassifier(code, get_lexer(alias=alias))
+        snippets = [
+            "",
+            "/*\n",
+            "*/\n",
+            '"""\n',
+            "# A comment.\n",
+            "x = 1;\n",
+            "def foo():\n",
+        ]
+        rand = random.Random(0)
+        for _ in range(50):
+            start_line = rand.randrange(len(ic.lines) + 1)
+            end_line = min(len(ic.lines), start_line + rand.randrange(3))
+            replacement = "".join(
+                rand.choice(snippets) for _ in range(rand.randrange(3))
+            )
+            old_classified_lines = list(ic.classified_lines)
+            start, old_end, new_end = ic.edit(start_line, end_line, replacement)
+            check(ic)
+            assert ic.classified_lines[:start] == old_classified_lines[:start]
+            assert ic.classified_lines[new_end:] == old_classified_lines[old_end:]
@@ -0,0 +1 @@
+Search.setIndex({"docnames": [".flake8", ".gitignore", ".travis.yml", "CodeChat/BatchConvert.py", "CodeChat/CFamilyScanner.py", "CodeChat/CodeToMarkdown.py", "CodeChat/CodeToPretext.py", "CodeChat/CodeToRest.py", "CodeChat/CodeToRestSphinx.py", "CodeChat/CommentDelimiterInfo.py", "CodeChat/ConversionCache.py", "CodeChat/IncrementalClassifier.py", "CodeChat/LICENSE", "CodeChat/PythonScanner.py", "CodeChat/RestToCode.py", "CodeChat/Server.py", "CodeChat/SourceClassifier.py", "CodeChat/__init__.py", "CodeChat/css/CodeChat.css", "CodeChat/css/CodeChat_sphinx_rtd_theme.css", "CodeChat/css/__init__.py", "CodeChat/css/docutils.css", "CodeChat/mdbook_CodeChat.py", "MANIFEST.in", "README", "appveyor.yml", "benchmarks/Pipeline_test.py", "benchmarks/conftest.py", "codechat_config.yaml", "conf.py", "docs/dev-toctree", "docs/history", "docs/install", "docs/reference_manual", "docs/rest-primer", "docs/style_guide.cpp", "docs/style_guide.md.cpp", "docs/style_test.py", "docs/supporting_literature", "docs/tutorial", "index", "pyproject.toml", "readthedocs.yml", "setup.cfg", "setup.py", "test/BatchConvert_test.py", "test/CFamilyScanner_test.py", "test/CodeToMarkdown_test.py", "test/CodeToPretext_test.py", "test/CodeToRestSphinx_test.py", "test/CodeToRest_test.py", "test/CommentDelimiterInfo_test.py", "test/ConversionCache_test.py", "test/HtmlToCode_test.py", "test/IncrementalClassifier_test.py", "test/PythonScanner_test.py", "test/RestToCode_test.py", "test/Server_test.py", "test/mdbook_CodeChat_test.py"], "filenames": [".flake8", ".gitignore", ".travis.yml", "CodeChat/BatchConvert.py", "CodeChat/CFamilyScanner.py", "CodeChat/CodeToMarkdown.py", "CodeChat/CodeToPretext.py", "CodeChat/CodeToRest.py", "CodeChat/CodeToRestSphinx.py", "CodeChat/CommentDelimiterInfo.py", "CodeChat/ConversionCache.py", "CodeChat/IncrementalClassifier.py", "CodeChat/LICENSE.rst", "CodeChat/PythonScanner.py", "CodeChat/RestToCode.py", "CodeChat/Server.py", "CodeChat/SourceClassifier.py", "CodeChat/__init__.py", "CodeChat/css/CodeChat.css", "CodeChat/css/CodeChat_sphinx_rtd_theme.css", "CodeChat/css/__init__.py", "CodeChat/css/docutils.css", "CodeChat/mdbook_CodeChat.py", "MANIFEST.in", "README.rst", "appveyor.yml", "benchmarks/Pipeline_test.py", "benchmarks/conftest.py", "codechat_config.yaml", "conf.py", "docs/dev-toctree.rst", "docs/history.rst", "docs/install.rst", "docs/reference_manual.rst", "docs/rest-primer.rst", "docs/style_guide.cpp", "docs/style_guide.md.cpp", "docs/style_test.py", "docs/supporting_literature.rst", "docs/tutorial.rst", "index.rst", "pyproject.toml", "readthedocs.yml", "setup.cfg", "setup.py", "test/BatchConvert_test.py", "test/CFamilyScanner_test.py", "test/CodeToMarkdown_test.py", "test/CodeToPretext_test.py", "test/CodeToRestSphinx_test.py", "test/CodeToRest_test.py", "test/CommentDelimiterInfo_test.py", "test/ConversionCache_test.py", "test/HtmlToCode_test.py", "test/IncrementalClassifier_test.py", "test/PythonScanner_test.py", "test/RestToCode_test.py", "test/Server_test.py", "test/mdbook_CodeChat_test.py"], "titles": ["<span>.flake8</span> - Flake8 configuration", "&lt;no title&gt;", "<span>.travis.yml</span> - Travis CI configuration", "<span>BatchConvert.py</span> - Convert many source files in parallel", "<span>CFamilyScanner.py</span> - A fast scanner for C-family languages", "<span>CodeToMarkdown.py</span> - a module to translate source code to Markdown", "<span>CodeToPretext.py</span> - a module to translate source code to PreTeXt", "<span>CodeToRest.py</span> - a module to translate source code to reST", "<span>CodeToRestSphinx.py</span> - a Sphinx extension to translate source code to reST", "<span>CommentDelimiterInfo.py</span> - Info on comment delimiters for many languages", "<span>ConversionCache.py</span> - An on-disk cache of source code converted to markup", "<span>IncrementalClassifier.py</span> - Incrementally classify source code as it\u2019s being edited", "GNU General Public License", "<span>PythonScanner.py</span> - A fast scanner for Python", "<span>RestToCode.py</span> - a module to translate reST to source code", "<span>Server.py</span> - A persistent conversion server", "<span>SourceClassifier.py</span> - a module to lex source code", "<span>__init__.py</span> - CodeChat Package", "<span>CodeChat.css</span> - Style sheet for CodeChat documents", "<span>CodeChat_sphinx_rtd_theme.css</span> - Style sheet for CodeChat with the ReadTheDocs theme", "<span>__init__.py</span> - CodeChat CSS data files", "<span>docutils.css</span> - Style sheet for docutils", "<span>mdbook_CodeChat.py</span> - A CodeChat preprocessor for mdbook", "<span>MANIFEST.in</span> - Non-source files to include in setup package", "CodeChat", "<span>appveyor.yml</span> - Appveyor CI configuration", "<span>Pipeline_test.py</span> - Benchmarks for the conversion pipeline", "<span>conftest.py</span> - Corpora for benchmarks", "<span>codechat_config.yaml</span> - Configuration for a CodeChat project", "<span>conf.py</span> - Sphinx configuration for generating CodeChat\u2019s documentation", "Developer documentation", "History of changes", "Installation instructions", "Reference manual", "reStructuredText Primer", "<span>style_guide.cpp</span> - Style recommendations for CodeChat with reStructuredText markup", "style_guide.md.cpp - Style recommendations for CodeChat using Markdown", "<span>style_test.py</span> - Styling tests for CodeChat", "Supporting literature", "Tutorial", "CodeChat", "<span>pyproject.toml</span> - Configuration for black and pytest", "<span>readthedocs.yml</span> - ReadTheDocs config file", "<span>setup.cfg</span> - Additional configuration for packaging", "<span>setup.py</span> - Package and install CodeChat", "<span>BatchConvert_test.py</span> - Unit testing", "<span>CFamilyScanner_test.py</span> - Unit testing", "<span>CodeToMarkdown_test.py</span> - Unit testing", "<span>CodeToPretext_test.py</span> - Unit tests for PreTeXt", "<span>CodeToRestSphinx_test.py</span> - Unit testing for <code class=\"xref any docutils literal notranslate\"><span class=\"pre\">../CodeChat/CodeToRestSphinx.py</span></code>", "<span>CodeToRest_test.py</span> - Unit testing", "<span>CommentDelimiterInfo_test.py</span> - Unit testing", "<span>ConversionCache_test.py</span> - Unit testing", "HtmlToCode_test.py - Unit testing", "<span>IncrementalClassifier_test.py</span> - Unit testing", "<span>PythonScanner_test.py</span> - Unit testing", "RestToCode_test.py - Unit testing", "<span>Server_test.py</span> - Unit testing", "<span>mdbook_CodeChat_test.py</span> - Unit testing"], "terms": {"see": [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 22, 24, 27, 29, 30, 31, 33, 35, 36, 39, 40, 42, 43, 44, 47, 48, 49, 50, 53, 56], "doc": [0, 2, 3, 4, 7, 8, 9, 13, 16, 22, 25, 27, 29, 31, 39, 41, 42, 43, 44, 46, 49, 50, 51, 52, 55, 56], "more": [0, 4, 7, 12, 16, 18, 22, 24, 26, 29, 30, 31, 34, 35, 36, 37, 39, 40, 50, 55], "detail": [0, 7, 10, 12, 36, 39, 40, 42], "although": [0, 12, 35], "i": [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 22, 24, 25, 26, 27, 29, 30, 31, 33, 34, 35, 36, 37, 39, 40, 41, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "max": [0, 4, 10, 11, 22, 35, 46, 52], "length": [0, 4, 7, 8, 14, 16, 27], "set": [0, 3, 4, 7, 8, 9, 10, 14, 15, 16, 22, 25, 26, 29, 31, 33, 35, 37, 39, 42, 47, 48, 51, 52, 53, 56], "thi": [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 24, 25, 26, 27, 28, 29, 30, 31, 33, 34, 35, 36, 37, 39, 40, 41, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "still": [0, 3, 7, 11, 14, 16, 18, 35, 44], "produc": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 22, 24, 25, 26, 27, 28, 31, 33, 34, 35, 39, 40, 49, 50, 52, 53, 54, 57, 58], "lot": [0, 44], "error": [0, 3, 4, 5, 6, 7, 8, 11, 13, 14, 15, 16, 18, 25, 29, 31, 34, 39, 47, 48, 49, 50, 54, 56, 57], "about": [0, 7, 8, 10, 11, 12, 27, 29, 30, 50], "long": [0, 7, 9, 12, 15, 27, 34, 44], "line": [0, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 16, 19, 21, 25, 27, 28, 30, 31, 32, 33, 34, 35, 39, 44, 45, 46, 47, 48, 49, 51, 52, 53, 54, 55, 56, 57, 58], "even": [0, 3, 8, 12, 13, 14, 16, 36, 37, 39, 40, 49], "those": [0, 3, 12, 14, 31, 40, 51], "ar": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 21, 22, 26, 27, 28, 29, 31, 33, 34, 35, 37, 39, 40, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "just": [0, 4, 7, 16, 25, 34, 35, 50], "comment": [0, 4, 5, 6, 11, 13, 14, 15, 18, 19, 27, 29, 30, 31, 35, 37, 38, 39, 45, 46, 47, 48, 49, 52, 53, 54, 55, 56, 57, 58], "The": [0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 22, 24, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 39, 40, 44, 45, 46, 47, 48, 49, 50, 51, 52, 54, 55, 56, 58], "state": [0, 4, 5, 6, 7, 12, 13, 15, 16, 29, 35, 40], "appli": [0, 4, 7, 9, 13, 16, 31, 35, 36], "all": [0, 2, 3, 4, 5, 6, 7, 8, 10, 11, 12, 14, 15, 16, 18, 22, 29, 30, 31, 33, 35, 39, 40, 50, 54, 56, 57], "includ": [0, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14, 16, 26, 29, 30, 31, 33, 35, 39, 44, 46, 48, 50, 51, 54, 56], "unless": [0, 3, 8, 12, 14, 16, 22, 29, 30, 31, 45], "thei": [0, 7, 8, 9, 11, 12, 13, 14, 16, 22, 29, 31, 35, 37, 39, 45, 49, 56], "contain": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 20, 22, 24, 27, 28, 29, 30, 31, 35, 36, 37, 39, 40, 50], "url": [0, 18, 29, 44], "string": [0, 3, 4, 5, 6, 7, 8, 9, 11, 13, 14, 15, 16, 22, 28, 29, 31, 33, 44, 46, 47, 49, 50, 53, 54, 56], "so": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 19, 22, 25, 26, 29, 31, 37, 39, 44, 47, 49, 50, 56], "allow": [0, 6, 7, 8, 9, 10, 11, 12, 14, 16, 18, 22, 24, 25, 30, 31, 40], "50000": 0, "extend": [0, 4, 8, 9, 11, 12, 13, 14, 16, 41], "ignor": [0, 7, 8, 9, 11, 14, 29], "black": [0, 9, 16, 21, 30, 37, 44], "format": [0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 15, 16, 24, 25, 29, 31, 35, 39, 40, 41, 45, 47, 49, 50, 51, 52, 53, 55], "differ": [0, 4, 5, 8, 11, 12, 14, 16, 41, 46, 47, 48, 49, 50, 53, 56], "e203": 0, "sphinx": [0, 7, 9, 10, 16, 18, 21, 28, 30, 31, 34, 35, 36, 40, 42, 44], "gener": [0, 5, 6, 7, 14, 16, 24, 28, 31, 36, 39, 40, 44, 47], "conf": [0, 8, 10, 19, 30, 31], "py": [0, 1, 2, 19, 25, 30, 31, 32, 33, 35, 39, 40, 41], "file": [0, 2, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 21, 22, 24, 25, 27, 28, 29, 30, 31, 33, 34, 35, 36, 37, 38, 39, 40, 41, 44, 45, 47, 48, 49, 50, 55, 56], "break": [0, 4, 7, 8, 10, 11, 13, 14, 16, 22, 31, 34], "rule": [0, 4, 7, 11, 12, 13, 16, 18, 35, 36, 46], "e265": 0, "per": [0, 2, 4, 5, 6, 7, 8, 9, 10, 15, 16, 24, 29, 30, 35, 37, 40, 41, 50], "indent": [0, 4, 5, 6, 8, 9, 13, 14, 19, 27, 31, 34, 47, 48, 56, 58], "j": [0, 3, 7, 9, 15, 27, 35, 38, 45, 50, 51, 56], "code": [0, 3, 4, 9, 13, 15, 18, 19, 24, 26, 27, 29, 31, 33, 35, 36, 37, 38, 39, 40, 45, 46, 47, 48, 51, 52, 54, 55, 56, 57, 58], "make": [0, 2, 7, 8, 11, 12, 14, 16, 18, 22, 24, 25, 29, 31, 35, 37, 39, 40, 44, 45, 46, 50, 52, 54, 55, 56], "unhappi": 0, "codechat": [0, 2, 3, 5, 6, 7, 8, 9, 10, 11, 14, 15, 23, 25, 26, 27, 30, 31, 32, 33, 34, 42, 43, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "sourceclassifi": [0, 3, 4, 5, 6, 7, 8, 11, 13, 15, 22, 26, 27, 30, 46, 49, 50, 54, 55], "e131": 0, "exclud": [0, 8, 9, 12, 16, 31, 41], "test": [0, 2, 4, 5, 7, 16, 25, 27, 29, 31, 41, 44], "weird": [0, 41], "build": [0, 3, 7, 8, 10, 15, 16, 22, 25, 28, 29, 30, 31, 33, 36, 42, 44, 49, 58], "_build": [0, 28, 29, 30, 49], "commentdelimiterinfo": [0, 3, 8, 14, 16, 22, 30, 39, 45, 50, 51, 58], "codetorest_test": [0, 9, 30, 41], "venv": [0, 1, 2, 29], "rlib": 1, "cargo": 1, "lock": [1, 15], "test_output": 1, "txt": [1, 31, 45, 58], "bench_output": 1, "review_diff": 1, "patch": [1, 33, 49], "__pycache__": [1, 29], "cod": 1, "pytest_cach": [1, 29], "mypy_cach": 1, "ruff_cach": 1, "tox": 1, "nox": 1, "egg": 1, "info": [1, 8, 10, 14, 16, 29, 30, 31, 39, 49, 52], "request": [1, 3, 8, 16, 27, 31, 33, 40, 52, 57], "jsonl": 1, "feature_request": 1, "md": [1, 3, 5, 22, 31, 38, 40, 45, 47, 49, 58], "gitignor": [1, 29], "http": [2, 7, 12, 16, 25, 27, 29, 38, 39, 40, 44, 50, 53, 56], "com": [2, 7, 25, 27, 50, 53], "user": [2, 7, 8, 10, 25, 31, 44, 53, 56], "multi": [2, 9, 11, 16, 46, 50, 54, 56], "o": [2, 3, 7, 8, 9, 10, 14, 15, 16, 22, 25, 29, 31, 34, 42, 44, 45, 56], "linux": [2, 31, 32], "languag": [2, 7, 8, 12, 13, 14, 16, 22, 27, 29, 30, 31, 33, 39, 44, 46, 49, 51], "python": [2, 3, 7, 8, 9, 11, 14, 15, 16, 17, 20, 22, 25, 26, 27, 28, 29, 30, 31, 32, 33, 35, 42, 44, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "3": [2, 4, 5, 7, 8, 9, 11, 13, 14, 22, 24, 25, 27, 31, 34, 35, 36, 40, 42, 44, 47, 48, 50, 53, 54, 55, 56, 58], "9": [2, 3, 4, 10, 16, 17, 22, 31, 54], "8": [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 25, 26, 27, 29, 31, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "before_instal": 2, "perform": [2, 8, 11, 12, 15, 16], "manual": [2, 31, 35, 36, 39, 40], "step": [2, 12], "x": [2, 4, 8, 9, 16, 21, 27, 29, 31, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 58], "instal": [2, 8, 9, 12, 16, 17, 22, 25, 26, 28, 30, 31, 33, 35, 39, 40, 42, 50, 51], "python3": [2, 16, 29, 32, 50], "activ": [2, 12, 14], "sinc": [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 18, 22, 31, 37, 50], "support": [2, 3, 4, 5, 6, 8, 12, 15, 22, 23, 24, 26, 29, 31, 33, 34, 36, 39, 40, 44, 45, 46, 50, 51, 55], "avail": [2, 8, 12, 14, 16, 35, 38, 50], "list": [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 21, 22, 24, 26, 27, 29, 30, 31, 35, 39, 40, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "unsupport": [2, 8, 16], "follow": [2, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 18, 19, 22, 27, 28, 31, 33, 35, 37, 39, 44, 47, 48, 50, 54], "approach": [2, 16], "base": [2, 7, 9, 11, 12, 16, 22, 25, 28, 29, 31, 35, 39, 40, 44, 48, 50], "workaround": [2, 31], "wa": [2, 4, 7, 8, 9, 10, 11, 12, 13, 14, 16, 21, 22, 25, 28, 29, 30, 31, 39, 44, 49, 56], "modifi": [2, 4, 7, 8, 16, 22, 26, 29, 31, 36, 39, 40], "instruct": [2, 14, 24, 31, 40], "multipl": [2, 7, 9, 14, 16, 35, 37, 39, 50], "version": [2, 4, 7, 8, 9, 10, 16, 17, 25, 29, 31, 34, 36, 40, 42, 44, 46, 49, 50, 52, 55], "also": [2, 4, 7, 8, 9, 11, 12, 14, 15, 16, 18, 23, 24, 28, 29, 31, 33, 35, 36, 39, 40, 45, 46, 49], "pyenv": 2, "graphviz": [2, 25, 35], "sudo": 2, "apt": 2, "get": [2, 4, 7, 8, 9, 10, 12, 13, 14, 15, 16, 22, 34, 35, 37, 39, 44, 52, 56], "y": [2, 29, 45, 46, 47, 48, 49, 50, 52, 55], "sure": [2, 7, 12, 14, 16, 25, 37, 50, 56], "we": [2, 5, 7, 8, 9, 11, 12, 16, 22, 25, 39, 44, 49, 50], "re": [2, 4, 6, 7, 8, 9, 11, 13, 16, 22, 25, 29, 31, 35, 37, 44, 46, 49, 50], "us": [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 18, 19, 21, 22, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 37, 38, 39, 40, 41, 44, 45, 46, 49, 50, 51, 52, 55, 56], "latest": [2, 25, 29, 31, 44], "pip": [2, 25, 26, 30, 32, 42, 44], "which": [2, 3, 4, 5, 6, 7, 8, 10, 11, 12, 13, 14, 15, 16, 17, 22, 24, 25, 26, 27, 28, 29, 31, 33, 34, 35, 39, 40, 41, 44, 45, 46, 47, 48, 50, 55, 58], "appveyor": [2, 30], "requir": [2, 4, 8, 9, 10, 14, 15, 16, 25, 28, 31, 36, 41, 42, 44, 57, 58], "keep": [2, 3, 5, 6, 7, 8, 10, 11, 12, 15, 16, 22, 29, 35], "close": [2, 4, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15, 16, 22, 31, 37, 48, 50, 52, 54, 56, 58], "possibl": [2, 7, 12, 16, 22, 29, 34], "m": [2, 3, 4, 9, 11, 13, 14, 16, 21, 22, 25, 28, 31, 38, 44, 45, 46, 49, 55, 57], "u": [2, 4, 25, 44], "here": [2, 7, 8, 11, 16, 22, 29, 35, 36, 37, 39, 44, 46, 50], "e": [2, 3, 7, 8, 12, 14, 15, 16, 25, 26, 27, 29, 30, 44, 45, 49, 50, 51, 58], "run": [2, 3, 4, 7, 8, 9, 10, 11, 12, 14, 15, 16, 22, 26, 28, 29, 30, 34, 39, 40, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "script": [2, 12, 16, 25], "travis_os_nam": 2, "osx": 2, "sourc": [2, 15, 22, 24, 26, 28, 29, 30, 31, 32, 33, 35, 36, 38, 39, 40, 44, 45, 47, 55], "terryfi": 2, "test_tool": 2, "sh": [2, 9], "fi": [2, 5, 6, 7, 14], "On": [2, 4, 8, 10, 58], "paramet": [2, 4, 15, 16, 35], "discov": 2, "other": [2, 4, 7, 8, 9, 10, 11, 13, 14, 16, 18, 22, 24, 29, 35, 39, 40, 45, 46, 49, 51, 52, 55], "fail": [2, 3, 12, 16, 18, 26, 45, 50, 52], "try": [2, 3, 4, 7, 8, 9, 11, 13, 14, 15, 16, 22, 31, 39, 46, 49, 50, 55, 56, 57], "avoid": [2, 3, 5, 6, 7, 8, 9, 10, 12, 16, 22, 25, 28, 31, 33, 35, 44], "invok": [2, 7, 8, 16, 28, 33], "refer": [2, 12, 14, 16, 24, 29, 30, 31, 34, 35, 40, 44, 53], "system": [2, 7, 12, 24, 29, 31, 32, 34, 39, 40, 44, 56], "modul": [2, 4, 8, 9, 10, 11, 13, 28, 29, 30, 31, 33, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57], "select": [2, 4, 8, 10, 13, 15, 16, 27, 31, 33, 35, 46, 50], "pytest": [2, 25, 26, 27, 30, 44, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57, 58], "two": [5, 6, 7, 12, 14, 16, 26, 27, 29, 34, 37, 50, 52, 56], "function": [3, 4, 5, 6, 7, 8, 10, 12, 15, 16, 27, 29, 30, 31, 33, 35, 37, 46, 47, 50, 54, 55, 57], "It": [3, 5, 6, 7, 8, 10, 12, 13, 14, 16, 21, 24, 27, 28, 33, 34, 35, 39, 40, 58], "reli": [5, 6, 7, 9, 11, 12, 39], "implement": [4, 5, 6, 8, 11, 12, 13, 24, 30, 38, 40, 46, 50, 54], "To": [4, 5, 6, 7, 9, 10, 12, 15, 16, 19, 26, 30, 33, 39, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57, 58], "output": [3, 5, 6, 7, 8, 10, 11, 12, 14, 16, 22, 26, 28, 30, 31, 33, 35, 45, 47, 48, 49, 50, 52, 53, 57, 58], "html": [5, 6, 7, 8, 9, 12, 15, 16, 22, 23, 26, 27, 28, 31, 33, 34, 35, 39, 44, 49, 50, 53, 56], "commonmark": 5, "from": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 21, 22, 24, 25, 26, 27, 29, 30, 31, 32, 34, 35, 39, 40, 41, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "md_str": [5, 47], "1": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 17, 22, 24, 25, 26, 27, 29, 30, 31, 34, 35, 37, 38, 39, 40, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 56, 57, 58], "2": [4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 21, 22, 27, 29, 31, 33, 34, 39, 42, 44, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 57, 58], "render": [5, 7, 8, 12, 16, 22, 28, 29, 34, 39, 44, 49], "print": [3, 5, 10, 15, 16, 22, 25, 47, 48, 49, 50, 51], "": [3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 14, 15, 16, 18, 19, 21, 22, 24, 25, 26, 27, 28, 30, 31, 33, 34, 35, 36, 39, 40, 44, 46, 49, 50, 55], "These": [3, 4, 5, 6, 7, 8, 10, 11, 13, 14, 15, 16, 22, 26, 27, 28, 29, 34, 35, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "order": [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 22, 25, 26, 27, 37, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "prescrib": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "pep": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "io": [7, 8, 13, 14, 15, 29, 44, 50, 53, 56, 58], "stringio": [13, 15, 50, 53, 58], "none": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 18, 21, 22, 25, 26, 27, 29, 37, 45, 46, 47, 48, 49, 50, 51, 52, 55, 56, 57, 58], "source_lex": [5, 6, 7, 46, 54, 55], "get_lex": [3, 5, 6, 7, 8, 15, 22, 26, 31, 33, 46, 49, 50, 54, 55], "_debug_print": [5, 6, 7, 16], "codechat_styl": [5, 7, 16, 18, 47], "routin": [5, 6, 7, 8, 33], "provid": [3, 5, 6, 7, 8, 9, 11, 12, 15, 16, 20, 21, 22, 24, 27, 28, 29, 30, 31, 32, 33, 35, 39, 40, 47, 48, 49, 50, 51], "easi": [5, 6, 7, 14, 16, 29, 39, 44, 50], "access": [5, 6, 7, 8, 12, 20, 25], "core": [5, 6, 7, 26, 49, 50], "preserv": [5, 6, 12, 16, 31, 34, 35], "both": [5, 6, 7, 8, 12, 14, 16, 22, 29, 30, 44, 50], "do": [3, 4, 5, 6, 7, 8, 12, 16, 18, 24, 25, 27, 29, 35, 39, 40, 46, 55], "charact": [4, 5, 6, 7, 8, 9, 13, 14, 16, 22, 34, 35, 47], "strip": [5, 6, 7, 8, 11, 15, 16, 31, 50], "place": [3, 4, 5, 6, 7, 8, 12, 14, 16, 29, 31, 35, 39], "insid": [4, 5, 6, 7, 8, 11, 12, 14, 16, 25, 50], "fenc": [5, 6, 7, 8, 14, 16, 18, 31, 33, 49, 56], "block": [4, 5, 6, 7, 8, 9, 11, 14, 27, 31, 35, 46, 49, 54, 56], "def": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 37, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "code_str": [5, 6, 7, 10, 11, 15, 16, 46, 47, 48, 49, 50, 55], "option": [3, 5, 6, 7, 10, 11, 12, 15, 16, 21, 22, 28, 30, 31, 33, 34, 36, 40, 41, 49, 50, 52], "captur": [7, 16, 24, 40, 50], "write": [5, 6, 7, 8, 9, 10, 12, 14, 15, 16, 24, 29, 31, 33, 35, 38, 40, 50, 58], "output_md": [], "header": [5, 7, 34], "some": [5, 7, 9, 11, 12, 13, 16, 27, 29, 31, 34, 35, 37, 39, 40, 50], "style": [5, 8, 9, 14, 29, 31, 33, 39, 40, 46, 47, 49, 50, 53], "n": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 30, 37, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "ast_syntax_error": [5, 6, 7, 11, 13, 16, 26, 50, 54], "classified_lin": [5, 6, 7, 8, 11, 16, 46, 54, 55], "return": [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 22, 26, 27, 31, 33, 34, 35, 44, 45, 46, 47, 48, 49, 50, 54, 55, 57, 58], "getvalu": [50, 58], "path": [3, 5, 6, 7, 8, 9, 10, 14, 15, 16, 22, 25, 27, 28, 29, 30, 31, 42, 44, 46, 49, 50, 51, 55], "process": [3, 5, 6, 7, 8, 10, 14, 15, 22, 24, 25, 28, 31, 33, 36, 39, 40, 44, 45, 47, 48, 49, 50, 56, 58], "source_path": [3, 5, 6, 7, 14, 22, 28, 47, 48, 49, 50, 56, 58], "destin": [5, 6, 7, 14, 31], "creat": [3, 5, 6, 7, 8, 10, 14, 15, 16, 29, 31, 34, 35, 38, 44, 45, 56], "overwritten": [5, 6, 7, 14], "alreadi": [3, 4, 5, 6, 7, 8, 12, 13, 14, 15, 16, 22, 29, 37], "exist": [3, 5, 6, 7, 8, 10, 14, 16, 50, 52], "If": [5, 6, 7, 8, 11, 12, 13, 14, 16, 22, 29, 30, 32, 36, 40, 49], "specifi": [5, 6, 7, 8, 12, 14, 16, 22, 31, 44], "md_path": 5, "encod": [5, 6, 7, 8, 9, 10, 14, 15, 16, 22, 27, 29, 31, 44, 46, 49, 50, 53, 55, 57, 58], "input": [5, 6, 7, 14, 22, 24, 40, 48, 56, 57, 58], "default": [3, 4, 5, 6, 7, 8, 9, 10, 11, 14, 15, 16, 21, 22, 28, 29, 31, 50, 51], "detect": [5, 6, 7, 14, 16, 22, 29], "input_encod": [5, 6, 7, 14], "utf": [5, 6, 7, 8, 9, 10, 14, 15, 16, 22, 27, 29, 44, 46, 49, 50, 53, 55, 57, 58], "output_encod": [5, 6, 7, 14, 50], "rst_path": [5, 6, 7], "open": [4, 5, 6, 7, 8, 9, 10, 11, 14, 15, 16, 35, 39, 44, 49, 54, 56], "read": [5, 6, 7, 10, 12, 14, 15, 17, 29, 30, 31, 39, 44, 49, 51, 56, 58], "present": [5, 6, 7, 12, 14, 16, 29, 30, 33, 35, 36, 38], "filenam": [3, 5, 6, 7, 8, 9, 14, 15, 22, 23, 26, 27, 29, 31, 39, 45, 51], "help": [3, 5, 6, 7, 10, 15, 29, 35, 39, 50], "identifi": [4, 5, 6, 7, 12, 16], "lexer": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 22, 26, 27, 29, 31, 33, 45, 46, 49, 51, 52, 54, 55, 56, 58], "setdefault": [3, 5, 6, 7, 16], "rst": [3, 7, 8, 14, 29, 31, 39, 43, 44, 45, 50, 51, 56], "w": [4, 9, 12, 13, 16, 24, 40, 55], "fo": [7, 14, 16], "hope": [5, 12, 36, 40], "doesn": [3, 4, 5, 7, 8, 9, 10, 11, 13, 14, 16, 22, 26, 31, 36, 49, 50, 51, 52, 55], "t": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 18, 22, 25, 26, 30, 31, 35, 36, 37, 41, 44, 45, 46, 49, 50, 51, 52, 55, 56], "_fenc": [5, 47], "100": [5, 10, 29, 54], "machin": [5, 6, 7, 12, 38, 40], "where": [3, 4, 5, 6, 7, 8, 10, 11, 12, 13, 14, 16, 22, 30, 49, 52], "current_typ": [5, 6, 7], "defin": [5, 6, 7, 8, 9, 12, 15, 16, 17, 20, 28, 29, 30, 31, 36, 46, 47, 48, 50], "when": [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 19, 22, 26, 28, 29, 31, 33, 35, 39, 44, 46, 49, 55, 58], "chang": [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 16, 22, 24, 29, 35, 39, 40, 49, 50, 54, 58], "exit": [3, 5, 6, 7, 10, 15, 22, 35], "previou": [5, 6, 7, 11, 12, 16, 26, 31, 36], "div": [5, 7, 14, 16, 18, 19, 21, 27, 47, 50, 53, 56], "enter": [4, 5, 6, 7, 12], "new": [4, 5, 6, 7, 8, 9, 10, 15, 16, 30, 33, 38, 44, 50, 52], "an": [3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15, 16, 18, 22, 24, 26, 27, 28, 29, 30, 31, 34, 36, 38, 39, 40, 44, 46, 47, 48, 49, 50, 51, 54, 55, 56, 58], "iter": [3, 5, 6, 7, 9, 16, 22], "type": [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 28, 31, 46, 49, 55], "pair": [4, 5, 6, 7, 8, 9, 13, 14, 16], "one": [3, 4, 5, 6, 7, 8, 11, 12, 13, 14, 15, 16, 22, 24, 25, 31, 33, 34, 35, 37, 39, 40, 45, 50, 54], "A": [3, 6, 7, 8, 10, 11, 12, 14, 16, 27, 28, 29, 30, 31, 33, 34, 35, 36, 38, 39, 40, 44, 45, 46, 48, 49, 50, 52, 53, 54, 55, 57, 58], "like": [4, 5, 6, 7, 9, 11, 12, 14, 16, 31, 44], "text": [4, 5, 6, 7, 8, 10, 11, 13, 14, 15, 16, 21, 22, 27, 29, 32, 34, 35, 37, 39, 44, 46, 49, 50, 51, 53, 55, 57, 58], "written": [6, 7, 12, 14, 15, 16, 24, 28, 29, 31, 40, 47, 48, 50], "out_fil": [], "track": [4, 5, 6, 7, 16], "current": [5, 6, 7, 8, 9, 11, 14, 16, 26, 28, 29, 31, 50], "begin": [4, 5, 6, 7, 8, 9, 11, 13, 14, 16, 26, 31, 35, 39, 47, 48, 50, 56], "neither": [5, 6, 9, 12], "nor": [5, 6, 12], "number": [3, 4, 5, 6, 7, 8, 10, 11, 12, 13, 14, 15, 16, 17, 22, 27, 30, 31, 34, 35, 39, 40, 44, 46, 47, 50], "type_": [5, 6, 7, 8, 16], "emit": [5, 6, 7, 11, 14], "non": [5, 7, 8, 14, 16, 22, 29, 30, 31, 34], "zero": [5, 7, 14, 16], "els": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 27, 48], "add": [3, 4, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 19, 29, 31, 33, 39, 50], "need": [3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 16, 19, 21, 29, 31, 33, 35, 45, 50, 56], "0": [3, 4, 5, 6, 7, 8, 10, 11, 13, 14, 15, 16, 21, 22, 26, 27, 29, 30, 31, 35, 44, 45, 46, 47, 49, 50, 51, 52, 54, 55, 57, 58], "class": [3, 4, 5, 7, 8, 9, 10, 11, 12, 14, 15, 16, 18, 22, 27, 31, 35, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56], "margin": [5, 7, 14, 16, 18, 21, 27, 37, 47, 50, 53], "left": [5, 7, 14, 15, 16, 18, 21, 47, 50, 53], "em": [5, 7, 14, 47, 50], "5": [4, 5, 7, 8, 14, 16, 25, 26, 29, 31, 38, 44, 46, 47, 50, 52, 54, 57], "updat": [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 16, 22, 29, 31, 33, 35, 44, 52], "done": [5, 6, 7, 8, 16, 25, 56], "last": [4, 5, 6, 7, 10, 11, 13, 14, 16, 21, 25, 26, 29, 44, 48, 53], "classif": [5, 6, 7, 11, 16, 33, 46, 50, 54, 55], "end": [4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 16, 21, 22, 29, 31, 34, 47, 48, 49, 50, 55], "elif": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16], "initi": [3, 4, 5, 6, 7, 8, 12, 16, 22, 31, 35, 38, 50, 54], "noth": [4, 5, 6, 7, 8, 12, 13, 14, 16, 50, 51], "pass": [3, 4, 6, 7, 8, 10, 12, 13, 14, 15, 16, 22, 31, 33, 37, 46, 50, 54, 55, 58], "output_ptx": [], "remov": [6, 7, 8, 10, 11, 12, 14, 15, 16, 18, 29, 31, 44, 52, 54, 56], "newlin": [4, 6, 7, 8, 11, 13, 16, 54], "syntax": [6, 7, 11, 16, 31, 37, 39, 44, 47, 48, 54], "match": [3, 4, 6, 7, 8, 9, 11, 13, 14, 15, 16, 22, 29, 31, 46, 47, 48, 50, 51, 54, 55, 56], "exactli": [4, 6, 13, 16, 34, 46, 55], "f": [4, 6, 7, 8, 9, 11, 12, 13, 14, 22, 27, 44, 46, 48, 49, 55, 57], "warn": [6, 7, 8, 15, 29, 31, 39, 48, 49], "pars": [6, 7, 8, 11, 13, 14, 16, 22, 31, 44, 46, 48, 55], "escap": [6, 7, 8, 13, 34, 55], "fals": [3, 4, 6, 7, 8, 9, 11, 14, 16, 22, 26, 29, 34, 49, 50, 51, 52, 55, 58], "program": [6, 14, 22, 24, 27, 35, 36, 38, 39, 40, 44, 47, 48, 50, 53, 56], "ptx": [3, 6, 48], "pt_path": 6, "regex": [4, 6, 16, 22, 41, 44], "part": [4, 6, 7, 11, 12, 14, 16, 22, 35, 36, 40, 58], "xml": [6, 9, 14, 31, 48], "tag": [6, 14, 18, 29, 30, 44, 48], "context": [6, 8, 12, 16, 22, 46, 49, 55, 58], "lead": [6, 7, 11, 16, 50], "whitespac": [4, 6, 7, 8, 11, 13, 16, 22, 31, 35, 39, 50], "At": [4, 6, 8, 13, 14, 31, 35, 36], "time": [3, 6, 7, 8, 9, 10, 11, 12, 14, 16, 22, 26, 27, 31, 33, 38, 44], "must": [4, 6, 7, 8, 9, 12, 13, 15, 16, 22, 23, 28, 29, 31, 34, 35, 39, 44, 50], "alwai": [6, 10, 16, 29, 44], "p": [4, 6, 7, 14, 16, 21, 25, 27, 31, 38, 45, 48, 50, 53], "xml_partial_opening_tag_regex": 6, "compil": [3, 4, 6, 7, 8, 9, 12, 13, 14, 15, 16, 22, 24, 40], "r": [4, 6, 7, 9, 11, 13, 16, 22, 27, 44, 46, 50, 54, 55], "xml_closing_tag_regex": 6, "determin": [3, 4, 7, 8, 9, 10, 12, 14, 16, 22, 35, 39], "newline_char": [], "undo": 55, "seek": [], "tell": [8, 12, 14, 44], "search": [3, 4, 6, 7, 8, 11, 14, 16, 35, 44, 45, 50], "through": [6, 7, 12, 14, 16, 22, 35, 50], "appropri": [6, 7, 12, 16], "One": [7, 11, 27, 35, 37, 39], "being": [6, 7, 8, 12, 14, 16, 29, 30, 31, 45], "wasn": 6, "append": [4, 7, 8, 9, 10, 11, 13, 14, 16, 22, 29, 31, 52, 55, 58], "back": [4, 7, 8, 11, 14, 16, 21, 22, 31, 33, 39, 46, 55, 56, 58], "up": [3, 4, 6, 7, 8, 9, 11, 13, 14, 16, 19, 29, 31, 35, 44, 45, 47, 48, 50, 53, 56], "four": [7, 14, 37], "either": [7, 11, 12, 14, 16, 24, 36, 40], "specif": [7, 8, 12, 16, 29, 37, 39], "convers": [3, 7, 8, 10, 14, 16, 29, 30, 31, 33, 44, 50, 52, 53], "importlib": 7, "resourc": 7, "pathlib": [7, 8, 9, 10, 22, 27, 46, 49, 51, 55], "docutil": [7, 8, 14, 15, 18, 26, 30, 31, 39, 44, 49, 50, 53, 56], "node": [7, 8, 16, 31, 46, 49], "parser": [3, 7, 8, 9, 10, 14, 15, 28, 31, 40, 44, 49], "bodi": [7, 11, 12, 16, 21, 31, 34, 50, 53], "codeblock": 7, "writer": [7, 15], "html4css1": [7, 18], "statemachin": 7, "util": [7, 16, 22, 33, 35, 50], "rais": [4, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 44, 46, 49, 50, 52, 54, 55], "valueerror": [7, 8, 9, 11, 14, 15, 16, 22, 46, 54], "unabl": [7, 44], "output_rst": [], "don": [7, 8, 9, 10, 11, 13, 16, 18, 22, 31, 35, 37, 41, 44, 45, 49], "put": [7, 10, 14, 22, 24, 25, 40, 47, 48, 50, 52], "separ": [4, 7, 8, 12, 13, 14, 22, 31, 34, 35, 50, 52, 58], "have": [7, 8, 10, 11, 14, 16, 22, 25, 29, 34, 36, 40, 44, 50], "wai": [7, 8, 11, 12, 16, 18, 24, 25, 29, 30, 34, 39, 40, 47, 48], "rest_codechat_styl": [7, 14], "better": [7, 14, 16, 21, 31, 35, 40], "handl": [7, 9, 13, 14, 16, 22], "sniff": [7, 14], "note": [7, 9, 14, 16, 21, 29, 31, 35, 36, 37, 39, 47, 48, 50, 53, 56], "automat": [7, 14, 31], "themselv": 14, "after": [3, 4, 7, 8, 10, 11, 12, 14, 15, 16, 21, 22, 29, 31, 33, 35, 49, 50, 53], "fileinput": [7, 14, 56], "fileoutput": [7, 14], "destination_path": [7, 14], "object": [7, 8, 9, 12, 14, 15, 22, 29, 47, 48, 50, 56], "send": [7, 15, 22], "them": [3, 4, 7, 8, 11, 12, 14, 16, 22, 26, 29, 30, 31, 34, 35, 50, 54], "stderr": [7, 15, 16, 22, 33, 49, 50], "warning_stream": [7, 15, 26, 50], "publish_str": [7, 26, 50], "writer_nam": [7, 26, 50], "settings_overrid": 50, "our": [7, 12, 16], "custom": [7, 8, 12, 29, 49], "css": [7, 8, 9, 11, 14, 16, 23, 27, 29, 30, 31, 44, 50, 54, 56], "sheet": [7, 8, 14, 16, 29, 31], "dir": [3, 7, 29, 45, 51], "stylesheet_path": 7, "join": [3, 4, 5, 6, 7, 8, 9, 11, 13, 14, 15, 16, 26, 27, 44, 46, 47, 48, 50, 53, 54, 55, 57], "default_stylesheet": 7, "stylesheet_dir": 7, "default_stylesheet_dir": 7, "html_static_path": [7, 29, 31], "unicod": [7, 8, 16, 31, 50, 58], "everywher": 7, "stop": [7, 8, 11, 13, 14, 35, 45], "matter": [4, 7], "what": [7, 9, 11, 12, 14, 16, 30, 35, 39, 40], "halt_level": 7, "store": [3, 5, 6, 7, 8, 9, 10, 16, 22, 31, 49, 52], "save": [7, 8, 10, 26, 31, 39, 49], "anoth": [7, 8, 10, 14, 29, 30, 43, 45, 46, 49, 50, 54, 55], "name": [3, 4, 7, 9, 10, 11, 12, 13, 14, 15, 16, 22, 26, 27, 29, 30, 31, 35, 36, 39, 44, 45, 50, 56, 58], "hold": [5, 6, 7, 16], "suppli": [7, 8, 16], "assum": [7, 11, 12, 16, 39], "html_path": 7, "programmat": 7, "static": [4, 7, 29, 46], "should": [4, 7, 8, 11, 12, 13, 14, 16, 29, 35, 36, 40, 41, 44, 50], "assign": 7, "There": [7, 14, 16, 29, 34, 44], "onli": [3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 16, 19, 22, 24, 29, 31, 33, 35, 38, 39, 40, 44, 47, 48, 50, 52, 54, 58], "rel": [7, 8, 16, 22, 27, 28, 29, 30, 49], "directori": [3, 7, 8, 9, 10, 16, 17, 20, 22, 26, 27, 28, 29, 30, 31, 39, 45, 49], "todo": [7, 9, 53, 56], "won": [7, 31, 35], "correctli": [7, 16, 31, 33, 35, 37, 47, 50], "temp": [7, 25], "zip": [7, 8, 16, 22, 50], "as_fil": 7, "str": [7, 8, 10, 14, 15, 16, 22, 30, 45, 46, 47, 48, 49, 50, 52], "correct": [7, 12, 14, 16, 30, 31, 50], "document": [7, 8, 11, 12, 14, 16, 21, 24, 31, 33, 34, 35, 37, 39, 44, 49, 50, 56], "raw": [4, 7, 14, 44, 46, 50], "difficulti": 7, "aris": [7, 12], "empti": [4, 7, 8, 11, 14, 15, 16, 26, 39, 50, 51, 56], "In": [4, 7, 8, 9, 11, 12, 14, 16, 25, 31, 35, 38, 39], "exampl": [3, 4, 7, 8, 9, 11, 12, 15, 16, 22, 27, 31, 34, 35, 36, 39, 44, 50, 53], "examin": [7, 9, 10, 11, 14, 16, 29, 52], "result": [3, 4, 7, 9, 10, 11, 12, 13, 15, 16, 22, 26, 29, 31, 33, 34, 35, 39, 49, 50, 51, 56, 57], "full": [4, 7, 8, 12, 29, 33, 39, 44, 52], "pictur": [7, 35], "below": [4, 7, 11, 12, 13, 16, 27, 28, 29, 35, 37, 44, 50], "therefor": [7, 8, 12, 16, 24, 39, 40, 50], "transform": [7, 8, 16, 22, 24, 29, 40, 47], "first": [3, 5, 6, 7, 9, 11, 12, 13, 14, 15, 16, 21, 22, 31, 39, 47, 48, 50, 53, 56, 58], "consid": [7, 8, 11, 12, 14, 16], "method": [4, 6, 7, 12, 15, 42, 50, 57], "simplifi": [7, 34], "someth": [7, 34, 44], "foo": [3, 7, 8, 9, 16, 30, 34, 35, 37, 47, 48, 49, 50, 51, 54, 55], "bar": [7, 8, 29, 30, 31, 34, 35, 50], "pre": [7, 14, 18, 21, 31, 50, 53], "blank": [7, 11, 14, 24, 40, 50], "lost": 7, "liter": [4, 7, 8, 14, 16, 21, 24, 27, 34, 35, 36, 39, 40, 44, 50, 53], "bock": 7, "between": [4, 7, 8, 10, 12, 13, 14, 16, 18, 22, 31], "each": [3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 22, 26, 27, 29, 31, 33, 35, 45, 46, 47, 50, 52, 57], "solv": [7, 35], "hackeri": 7, "tighten": 7, "space": [4, 7, 8, 13, 14, 16, 18, 21, 31, 34, 35, 39, 47], "addit": [7, 9, 15, 16, 29, 30, 39, 44], "dure": [7, 8, 17, 31, 33, 56], "becom": [7, 14, 35], "same": [3, 4, 7, 8, 9, 11, 12, 13, 14, 16, 26, 28, 29, 30, 33, 36, 44, 45, 47, 49, 50, 52, 53, 54, 56, 57, 58], "without": [3, 4, 7, 8, 9, 11, 12, 14, 15, 16, 18, 22, 29, 31, 36, 40, 49, 52, 55, 58], "consum": [7, 11, 12, 16], "No": [7, 10, 16, 34, 40, 50, 52, 56], "With": [7, 22, 27, 39], "ad": [6, 7, 8, 11, 12, 14, 16, 18, 24, 29, 31, 33, 40, 48, 52, 54], "difficult": [7, 24, 35, 40], "blockquot": [7, 50], "common": [7, 9, 12, 46, 50], "ani": [3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 22, 26, 29, 30, 31, 35, 36, 37, 40, 44, 47, 49, 51, 52], "distanc": 7, "three": [7, 8, 12, 16, 37], "second": [3, 7, 8, 10, 16, 26, 34, 39, 50, 58], "half": 7, "size": [4, 7, 8, 10, 11, 14, 16, 19, 21, 22, 29, 35, 47, 50, 52], "fix": [7, 8, 9, 12, 19, 29, 31, 39, 49], "insert": [7, 10, 11, 16, 29, 31, 35, 47, 50, 54], "element": [7, 8, 11, 14, 16, 33, 35], "how": [4, 7, 11, 16, 22, 35, 39, 53], "mani": [7, 10, 14, 15, 16, 27, 30, 31, 33, 39, 44, 50, 56], "0em": [7, 50, 53], "5em": [7, 21], "care": 7, "taken": [3, 7, 8, 9, 14, 44], "content": [7, 12, 14, 21, 22, 24, 29, 31, 33, 35, 40, 45, 50, 53, 58], "For": [3, 4, 7, 8, 9, 12, 13, 14, 15, 16, 22, 27, 31, 34, 35, 39, 44, 50], "notic": [7, 12, 39], "simpli": [7, 8, 10, 16, 24, 36, 40], "unind": 7, "hard": 7, "its": [3, 4, 6, 7, 8, 10, 11, 12, 13, 14, 15, 16, 22, 26, 27, 29, 31, 33, 35, 45, 46, 47, 49, 50, 54, 55], "inlin": [4, 7, 9, 11, 13, 14, 16, 27, 31, 39, 46, 50, 55, 56], "mean": [7, 8, 11, 12, 14, 16, 26, 30, 44], "trail": [7, 8, 11, 50], "backtick": 7, "instead": [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 18, 22, 26, 29, 31, 33, 35, 36, 41, 44, 46, 55], "incorrectli": [7, 29], "markup": [7, 8, 24, 29, 30, 37, 39, 40, 44], "can": [3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 22, 24, 25, 29, 31, 34, 36, 40, 44, 46, 50, 55, 56], "boil": 7, "down": [7, 14], "basic": [7, 16, 31, 36], "preced": [4, 7, 11, 14, 16, 22, 35, 50], "marker": [7, 31, 34, 50], "befor": [3, 4, 6, 7, 8, 10, 11, 14, 15, 16, 22, 24, 26, 29, 31, 35, 39, 40, 44, 58], "accur": [7, 16], "report": [3, 7, 8, 11, 15, 16, 31, 33, 39, 40, 45, 46, 49, 50, 55], "isn": [3, 4, 7, 8, 11, 13, 14, 16, 26, 30, 35, 51], "necessari": [7, 8, 10, 12, 16, 31, 35], "occur": [7, 8, 12, 16, 39], "mai": [3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 22, 28, 31, 35, 44], "would": [3, 4, 7, 8, 12, 15, 16, 25, 30, 47, 50], "termin": [4, 7, 11, 32], "syntact": 7, "discuss": [7, 36], "4": [4, 7, 8, 9, 14, 15, 17, 22, 31, 34, 35, 44, 47, 50, 52, 54, 58], "presum": 7, "discard": [7, 14, 15, 16, 22, 58], "drop": [7, 16, 31], "treat": [4, 7, 9, 11, 12, 13, 50], "everyth": [4, 7, 10, 16, 18, 22, 35], "inform": [7, 9, 12, 14, 16, 22, 24, 30, 35, 36, 39, 40, 50], "self": [7, 8, 9, 10, 11, 15, 16, 22, 45, 46, 47, 48, 50, 51, 52, 54, 55, 56], "least": [7, 10, 11, 12, 22, 29, 34, 39, 50, 52], "len": [3, 4, 7, 8, 10, 11, 13, 14, 16, 22, 47, 48, 49, 50, 54], "By": [7, 8, 12, 15, 16, 51], "pygment": [3, 4, 7, 8, 9, 10, 11, 13, 14, 15, 22, 26, 29, 31, 33, 44, 46, 49, 50, 51, 55], "stripnl": [7, 11, 16], "true": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 29, 34, 44, 45, 46, 49, 50, 51, 54, 55, 57, 58], "caus": [7, 12, 16, 18, 29, 35, 44], "until": [4, 6, 7, 10, 11, 12, 14, 15, 16, 22, 35], "reach": [7, 14, 16], "processedallcont": 7, "enumer": [7, 8, 11, 16, 22, 37, 49, 57], "ve": [7, 16, 35, 44], "seen": [7, 8], "again": [7, 8, 10, 14, 16, 22, 30, 31, 33, 35, 39, 49, 52, 55, 56, 58], "d": [3, 4, 7, 9, 12, 16, 22, 27, 29, 30, 38, 45, 46, 50, 52, 55, 56, 58], "unnecessari": [7, 12, 31], "otherwis": [3, 7, 8, 11, 12, 13, 15, 16, 22, 29, 31, 33, 44], "walk": [3, 7, 14, 16, 22, 31, 46], "backward": [7, 8], "_": [4, 7, 11, 13, 14, 16, 26, 27, 46, 54, 55, 56, 57], "recal": 7, "index": [3, 7, 8, 9, 10, 11, 13, 14, 15, 22, 29, 31, 39, 40, 49, 51, 57], "while": [4, 7, 8, 9, 10, 11, 13, 14, 16, 18, 22, 24, 27, 34, 35, 39, 40, 44, 50], "offset": [7, 8], "indic": [7, 11, 12, 16], "mark": [7, 8, 11, 12, 16, 35, 47, 50, 51, 53, 54, 57, 58], "now": [3, 7, 8, 10, 14, 16, 31, 35, 39, 44], "nodelist": 7, "highlight_arg": 7, "highlight": [7, 16, 18, 29, 31, 33, 49], "normal": [7, 8, 10, 11, 12, 18, 21, 54], "parseabl": 7, "quot": [7, 13, 16, 27, 28, 37, 55, 58], "link": [7, 8, 12, 16, 18, 21, 27, 29, 31, 33, 34, 35, 36, 39, 53], "snippet": [7, 54, 55], "want": [7, 12, 13, 14, 16], "around": [7, 8, 14, 18, 34], "forc": [3, 7, 8, 12, 45], "skip": [3, 7, 13, 14, 22, 26, 31, 45, 50, 51, 53, 58], "found": [4, 7, 10, 11, 12, 13, 14, 16, 22, 26, 31, 44, 49, 52, 58], "highlight_block": [7, 33, 49], "argument": [3, 7, 9, 10, 15, 16, 28, 49], "htmlwriter": 7, "visit_literal_block": 7, "fragment": [7, 46], "ha": [7, 8, 9, 11, 12, 14, 15, 16, 22, 24, 34, 40], "singl": [4, 7, 8, 9, 11, 12, 14, 15, 16, 18, 31, 35, 44, 50, 56], "literal_block": [7, 8, 49], "htmlformatt": 7, "formatt": [7, 8], "lineanchor": 7, "uniqu": [7, 9, 30], "id": [7, 10, 14, 15, 32, 53, 57], "enabl": [7, 8, 12, 16, 28, 31], "futur": [3, 7, 12, 15, 22, 40, 57], "ctag": [7, 30], "restart": [7, 25], "extract": [7, 24, 40], "linenostart": 7, "state_machin": 7, "input_lin": 7, "item": [7, 8, 10, 11, 12, 16, 22, 27, 34, 35, 45, 50], "line_offset": 7, "10": [7, 8, 14, 16, 26, 31, 38, 50, 52, 54], "regardless": [7, 12, 29, 53], "actual": [7, 12, 14, 16, 22, 31, 35, 44, 49, 50], "locat": [7, 8, 29, 39, 49], "required_argu": 7, "optional_argu": 7, "final_argument_whitespac": 7, "option_spec": 7, "has_cont": 7, "int": [3, 7, 8, 10, 11, 13, 14, 15, 16, 22, 27, 30, 34, 35, 46, 50, 54, 55], "viewlist": 7, "maintain": [7, 12, 14], "data": [7, 9, 12, 14, 22, 30, 44], "give": [3, 4, 7, 8, 10, 12, 13, 14, 15, 16, 17, 22, 26, 27, 33, 35, 39], "il": 7, "renumb": [7, 31], "current_sourc": 7, "parent": [3, 7, 9, 10, 14, 25, 27, 46, 49, 55, 58], "rewrit": [7, 16], "effect": [7, 12, 14], "line_": 7, "rang": [7, 8, 11, 14, 16, 22, 27, 46, 54, 55, 57], "old_offset": 7, "been": [6, 7, 8, 11, 12, 14, 15, 16], "adjust": 7, "move": [7, 8, 16, 31, 50], "parent_offset": 7, "docnam": [7, 8, 29, 31, 33, 35, 49], "attr": 7, "tupl": [3, 7, 9, 11, 13, 16, 22, 30], "valu": [3, 7, 8, 9, 10, 13, 14, 15, 16, 22, 27, 28, 29, 31, 33, 35, 36, 40, 46, 51], "tree": [3, 7, 14, 16, 22, 28, 31, 33, 45], "point": [7, 8, 11, 22, 35], "interpret": [7, 16, 35], "encount": 7, "messag": [7, 14, 15, 16, 29, 31], "immedi": [4, 7, 9, 10, 39], "rolenam": 7, "entir": [5, 6, 7, 9, 10, 11, 12, 14, 16, 52], "problemat": 7, "problem": [7, 12, 18, 24, 34, 35, 39, 40], "rawtext": 7, "lineno": [7, 11, 16], "call": [7, 8, 9, 10, 11, 12, 15, 16, 22, 25, 29, 31, 35, 44, 50, 57], "sever": [4, 7, 8, 10, 11, 13, 16, 22, 27, 39, 50, 57], "attribut": [4, 7, 9, 12, 14, 16, 49], "dictionari": [7, 8, 14], "doughellmann": 7, "blog": 7, "2010": 7, "05": [7, 35, 50], "09": 7, "env": [7, 8, 46, 49, 55], "getattr": [7, 8, 11, 13, 16], "path_compon": 7, "except": [3, 4, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 22, 25, 31, 49, 50, 58], "msg": 7, "invalid": [7, 11, 12, 14, 15, 50, 54], "compon": [7, 12, 46], "prb": 7, "prepend": [7, 25, 29], "potenti": 7, "wide": [7, 12, 31], "metadata": [7, 8, 31, 43], "know": [4, 7, 11, 12, 37], "safe": [7, 10, 11, 16], "demot": 7, "find": [4, 7, 8, 9, 10, 11, 12, 13, 14, 16, 22, 25, 26, 29, 31, 35, 40, 44, 45, 49], "right": [7, 14, 16, 21], "tocdepth": 7, "nocom": 7, "orphan": 7, "multilin": [7, 16], "alias": [7, 8, 9, 16, 22, 46], "might": [4, 7, 8, 11, 12, 14, 16], "slight": 7, "modif": [7, 12], "mostli": [7, 9, 27, 36], "copi": [4, 7, 11, 14, 15, 16, 21, 22, 26, 29, 31, 36, 39, 40, 49, 58], "directli": [7, 12, 16, 24, 40], "misc": [7, 29], "21": [7, 31], "lex": [4, 7, 8, 9, 13, 26, 30, 31, 33, 46, 49, 50, 54], "given": [4, 5, 6, 7, 8, 11, 12, 13, 14, 16, 22, 26, 27, 29, 30, 31, 37, 45, 50, 56], "start": [3, 4, 7, 8, 9, 11, 12, 13, 14, 15, 16, 22, 29, 31, 33, 35, 50, 52, 54, 57], "unchang": [7, 10, 16, 29, 33, 46, 50], "tab": [7, 8, 11, 14, 16, 35, 49, 54], "width": [7, 21], "unchanged_requir": 7, "class_opt": 7, "standard_include_path": 7, "__file__": [7, 9, 27, 44, 46, 49, 55], "depend": [7, 8, 11, 22, 25, 31, 44, 45], "clip": 7, "stream": [7, 14, 15, 16, 29, 33, 53], "file_insertion_en": 7, "disabl": [7, 9, 16, 29, 37], "startswith": [3, 4, 7, 8, 9, 11, 14, 16, 52, 55], "endswith": [6, 7, 8, 11, 16], "_base": 7, "relative_path": 7, "e_handl": 7, "input_encoding_error_handl": 7, "tab_width": [7, 8], "include_fil": 7, "error_handl": 7, "unicodeencodeerror": [7, 50], "cannot": [7, 12, 16, 25, 47, 48, 50], "wrong": [7, 11, 16, 35], "oserror": [3, 7, 9, 15, 16], "error_str": [7, 56], "record_depend": 7, "startlin": 7, "endlin": 7, "readlin": [7, 13, 49, 57], "unicodeerror": 7, "restrict": [7, 12], "v": [7, 8, 11, 13, 16, 29, 31, 44], "boundari": [7, 35], "after_text": 7, "incl": 7, "after_index": 7, "ntext": 7, "before_text": 7, "before_index": 7, "code_to_rest_opt": 7, "lexer_alia": [7, 8, 22, 29], "alia": [7, 8, 14, 15, 16, 22, 46, 47, 48, 49, 50, 52, 54, 55, 56, 57, 58], "configur": [7, 22, 30, 31, 33, 36, 40, 49], "lfg": [7, 8], "app": [7, 8, 49], "config": [7, 8, 22, 29, 30, 49, 58], "codechat_lexer_for_glob": [7, 8, 29, 31, 33, 49], "glob": [3, 7, 8, 9, 22, 23, 29, 31, 45, 46, 51, 55], "wrap": [7, 11, 50], "include_lin": 7, "string2lin": 7, "convert_whitespac": 7, "line_length_limit": 7, "exce": [7, 14], "limit": [7, 14, 39], "delet": [4, 7, 10, 11, 31, 54], "prevent": [7, 12, 14, 31, 37], "circular": 7, "inclus": [7, 12, 44], "clip_opt": 7, "include_log": 7, "log": [7, 8, 10, 29, 39, 49], "entri": [7, 8, 10, 14, 16, 52], "master_path": 7, "pth": 7, "opt": [7, 8], "revers": [7, 14], "inclusion_chain": 7, "dummi": 7, "new_docu": 7, "clean": [7, 11, 16, 31], "doctre": [7, 8, 29, 30, 49], "complet": [5, 6, 7, 11, 14, 24, 40, 47, 48, 50, 53, 56], "populate_from_compon": 7, "apply_transform": 7, "children": [7, 14, 16, 33, 58], "cf": 7, "insert_input": 7, "regist": [7, 16, 25, 49], "register_direct": 7, "imit": 7, "convent": [7, 17], "literalinclud": 7, "codeinclud": [7, 31, 33], "register_local_rol": 7, "convert": [8, 13, 15, 16, 22, 26, 27, 29, 30, 31, 33, 44, 45, 49, 50, 52, 53, 57, 58], "overal": [8, 18], "design": [8, 12, 24, 40], "intact": [8, 12], "check": [4, 6, 8, 9, 14, 16, 25, 37, 46, 49, 51, 54, 55, 56, 57, 58], "contextlib": [8, 16], "dict": [8, 9, 10, 15, 16, 22, 26, 29, 30], "builder": 8, "project": [8, 9, 19, 26, 27, 30, 31, 44, 46, 49, 55], "deprec": [8, 31], "v5": 8, "version_info": [8, 44], "osutil": 8, "path_stabil": 8, "filetypenotfounderror": 8, "v2": 8, "codetorest": [3, 8, 14, 15, 16, 26, 29, 30, 31, 44, 45, 47, 49, 50, 51, 52, 53, 56, 57], "code_to_rest_str": [8, 10, 15, 33, 45, 49, 50, 52, 56, 57], "add_highlight_languag": 8, "codetomarkdown": [3, 8, 15, 22, 30, 45, 47, 52, 57, 58], "code_to_markdown_str": [8, 10, 15, 22, 33, 45, 47, 52, 57, 58], "supported_glob": [9, 31, 51], "__version__": [8, 9, 10, 16, 17, 29, 44, 51, 52], "__init__": [8, 9, 10, 11, 15, 16, 22, 30, 44], "often": [8, 16], "small": [8, 21, 37, 45], "reduc": 8, "nois": 8, "app_": 8, "pattern": [3, 8, 9, 12, 16, 29, 38, 51], "maximum": [8, 10, 16, 22, 29], "byte": [8, 10, 11, 14, 22, 29], "max_siz": [8, 10, 52], "init": [8, 25], "srcdir": 8, "root_path": [8, 49], "slightli": 8, "ineffici": [8, 39], "exclude_pattern": [8, 29], "relative_to": 8, "as_posix": 8, "stat": [8, 15], "st_size": 8, "connect": [8, 10, 12, 15, 52, 57], "logger": 8, "issu": [8, 16, 35, 40, 50], "getlogg": 8, "__name__": [3, 8, 9, 10, 15, 16, 22], "markdown": [3, 8, 10, 22, 29, 30, 31, 33, 40, 45, 47, 49, 52, 58], "_source_read": 8, "typic": [8, 11, 12, 15, 16, 33], "whose": [3, 4, 8, 12, 13, 14, 15, 16, 21, 33, 36, 45, 50], "is_source_cod": [8, 31], "source_fil": [3, 8, 22], "path_docnam": 8, "failur": [3, 8, 12, 45, 49], "is_markdown_docnam": 8, "keyerror": [8, 22], "classnotfound": [8, 22, 50], "environ": [8, 16, 25, 28, 29, 31, 33, 39, 50], "ask": [8, 9, 12, 14, 22], "c": [3, 8, 9, 11, 12, 13, 14, 16, 22, 24, 25, 27, 29, 30, 31, 33, 35, 36, 38, 40, 45, 46, 49, 51, 52, 53, 54, 55, 56, 58], "look": [4, 6, 8, 9, 11, 16, 21, 29, 31, 50], "docname_ext": 8, "docname_suffix": 8, "suffix": [3, 8, 9, 16, 22, 29, 31, 56], "recogn": [3, 4, 8, 9, 12, 14, 16, 25, 31, 35, 56], "source_suffix": [8, 29, 31, 36], "natur": [8, 12, 18, 24, 40, 44], "work": [3, 8, 12, 14, 16, 22, 28, 31, 35, 37, 40, 44, 47, 48, 49, 50, 53, 56, 58], "h": [4, 8, 10, 16, 34, 45, 46, 50, 54, 55], "indistinguish": 8, "my": [8, 35], "post": [8, 35], "off": [8, 9, 14, 16, 37], "accomplish": [8, 16], "come": [8, 12, 16, 29], "79": 8, "7": [4, 8, 14, 16, 25, 31, 33, 50, 53, 54], "6": [4, 8, 16, 31, 50, 52, 54], "_path2doc": 8, "pathlik": 8, "absolut": [8, 12, 28, 29], "_path_to_docnam": 8, "isab": 8, "suppress": 8, "relpath": 8, "basenam": [8, 16], "removesuffix": 8, "is_supported_languag": [8, 22], "doe": [4, 7, 8, 9, 10, 12, 13, 14, 16, 24, 26, 29, 35, 36, 37, 40, 41, 46, 47, 48, 49, 50, 53, 55, 56], "recomput": 8, "variabl": [8, 14, 16, 29, 30, 31, 33, 50], "global": [3, 8, 16], "source_suffixpattern": [8, 22, 58], "bool": [8, 11, 14], "_config": 8, "kei": [3, 8, 9, 10, 11, 12, 14, 15, 16, 22, 26, 36, 49, 52], "path_filenam": [], "next": [3, 7, 8, 9, 11, 12, 14, 16, 22, 29, 31, 35, 39], "_doc2path": 8, "_docname_to_path": 8, "case": [4, 8, 9, 10, 11, 12, 13, 14, 16, 18, 32, 35, 38, 46, 55], "isfil": [3, 8], "compat": [8, 9, 31], "_first_source_suffix": 8, "_get_filetyp": 8, "filetyp": 8, "restructuredtext": [7, 8, 24, 29, 33, 37, 40], "sphinx_vers": 8, "renam": 8, "_modulewrapp": 8, "henc": [8, 16], "_modul": 8, "member": 8, "longer": [8, 14, 15, 31], "direct": [4, 8, 12, 16, 29, 30, 31, 33, 34, 35, 39, 40, 47, 50], "i18n": 8, "standalonehtmlbuild": 8, "get_doc_context": 8, "sourcenam": 8, "fine": 8, "howev": [8, 9, 12, 16, 18, 36], "doubl": [8, 18, 31], "_html_page_context": 8, "canon": 8, "page": [8, 9, 18, 24, 29, 31, 39, 40], "slash": [4, 8, 39, 41], "pagenam": 8, "templat": [4, 8, 14, 22, 29, 31, 39, 46], "templatenam": 8, "engin": [4, 8, 13, 22, 26, 29, 31, 33, 38, 46, 49, 55], "alon": [3, 8, 16], "ext": [8, 16, 29, 30, 56], "html_sourcelink_suffix": [8, 29], "sphinx_ext": 8, "double_ext": 8, "take": [7, 8, 10, 11, 12, 14, 15, 16, 22, 24, 35, 39, 40], "ensur": [8, 12, 48, 56], "enough": [8, 14], "require_sphinx": 8, "hook": [8, 40], "add_css_fil": 8, "add_config_valu": 8, "ugli": [8, 29], "hack": [8, 16], "load": [8, 9, 15, 16, 22, 31, 46, 49, 50, 55, 57, 58], "aren": [4, 8, 9, 11, 13, 15, 16, 22, 49], "yet": [6, 8, 10, 14, 15, 16], "later": [8, 11, 12, 15, 16, 26, 36, 40, 44], "parallel_read_saf": 8, "knowledg": [9, 12, 39], "consist": [8, 9, 12, 14, 16, 31, 35, 44], "larg": [9, 10, 14, 16, 21, 22, 29, 35], "tabl": [9, 10, 14, 16, 21, 31, 35, 40, 50], "get_all_lex": [9, 16, 51], "explicitli": [3, 9, 12], "wikipedia": [9, 16], "fmt": [9, 16, 37], "comment_delimiter_info": [9, 14, 16, 50], "java": [9, 16, 31, 46, 50, 56], "actionscript": [9, 50, 56], "nest": [4, 9, 14, 16, 22, 34, 46, 50, 53], "rest": [3, 9, 10, 13, 16, 26, 29, 30, 31, 33, 34, 35, 39, 44, 52, 56], "go": [9, 11, 15, 16, 31, 46, 50, 56], "javascript": [9, 16, 18, 31, 46, 50, 56], "rust": [9, 16, 27, 31, 46, 50, 56], "well": [9, 12, 35, 39, 50], "rustdoc": [9, 31], "scala": [9, 50, 56], "swift": [9, 50, 56], "verilog": [9, 50, 56], "systemverilog": [9, 50, 56], "dart": [9, 50, 56], "juttl": [9, 50, 56], "typescript": [9, 16, 31, 46, 50, 56], "arduino": [9, 50, 56], "clai": [9, 50, 56], "cuda": [9, 50, 56], "ec": [9, 44, 50, 56], "mql": [9, 50, 56], "nesc": [9, 50, 56], "pike": [9, 50, 56], "swig": [9, 50, 56], "vala": [9, 50, 56], "zephir": [9, 50, 56], "hax": [9, 50, 56], "thrift": [9, 31, 50], "kotlin": [9, 31, 50], "php": [9, 11, 31, 50], "nasm": [9, 50], "endcom": 9, "pic24": [9, 50], "docstr": [3, 5, 6, 7, 8, 9, 10, 11, 13, 15, 16, 22, 26, 27, 29, 31, 47, 48, 52, 54, 55], "cover": [9, 12, 14, 35], "csh": 9, "claim": [9, 12, 16, 50], "anywher": [9, 11], "man": 9, "bash": [9, 11, 50, 52], "tcsh": 9, "valid": [9, 11, 12, 14, 16, 28, 56], "rem": [9, 50], "classifi": [4, 9, 13, 16, 26, 29, 30, 31, 33, 38, 44, 46, 54, 55], "Not": [9, 16, 29, 45, 46, 50, 55, 58], "lower": [9, 14, 16, 30], "compar": [9, 16, 26, 49, 50], "lowercas": 9, "batchfil": 9, "matlab": [9, 16, 31, 50], "sql": [9, 50], "pl": [9, 16, 31], "pgsql": [9, 31], "powershel": [9, 25, 50], "ga": [9, 50], "arm": [9, 31], "autohotkei": [9, 50], "prolog": [9, 47, 48, 50], "autoit": [9, 50], "ce": [9, 50], "pod": [9, 16, 50], "perl": [9, 16, 29, 50], "perl6": [9, 50], "conflict": [9, 30], "rubi": [9, 50], "bird": 9, "haskel": [9, 50], "delphi": [9, 50], "applescript": [9, 31, 50], "lisp": [9, 50], "lua": [9, 50], "clojur": [9, 50], "scheme": [9, 44, 50], "embed": [9, 18, 31, 35, 39, 50], "symbol": 9, "xslt": [9, 31], "mxml": [9, 31, 50], "fortran": [9, 50], "apl": [9, 50], "makefil": [9, 31, 50, 51, 57], "rpmspec": [9, 50], "nimrod": [9, 50], "continu": [4, 8, 9, 11, 12, 13, 14, 16, 22, 50], "nsi": [9, 31, 50], "tex": [9, 24, 40, 50], "erlang": [9, 50], "qbasic": [9, 50], "vb": [9, 50], "net": [9, 39, 50], "rebol": [9, 50], "llvm": [9, 50], "ini": [9, 29, 31, 50], "ada": [9, 50], "eiffel": [9, 50], "vhdl": [9, 50], "six": [9, 37], "special": [9, 12, 16, 28, 34], "cobol": [9, 16, 31, 50], "yaml": [9, 30, 49, 50], "toml": [9, 30, 31, 50], "mako": [9, 31, 50], "django": [9, 31], "jinja": [9, 31], "comput": [9, 10, 12, 16, 24, 26, 27, 31, 35, 38, 40, 51], "pick": [9, 16], "out": [8, 9, 12, 14, 16, 24, 29, 31, 35, 39, 40, 45, 49, 50, 51, 52], "longnam": [9, 16], "filename_pattern": [9, 16], "mimetyp": [9, 15, 16], "29": [12, 31], "june": [12, 38], "2007": 12, "copyright": [12, 29, 36, 40], "free": [10, 12, 14, 36, 40], "softwar": [12, 36, 40, 44], "foundat": [12, 36, 40], "inc": 12, "fsf": 12, "org": [12, 16, 38, 39, 40, 44, 56], "everyon": 12, "permit": 12, "distribut": [12, 23, 36, 40, 44], "copyleft": 12, "kind": [4, 12, 14, 16], "most": [9, 10, 12, 22, 24, 25, 32, 39, 40, 44], "practic": 12, "awai": 12, "share": [3, 10, 12, 16], "contrast": 12, "intend": [12, 21, 44], "guarante": 12, "remain": [4, 9, 11, 12, 14, 15], "releas": [12, 29, 31], "author": [12, 34, 36, 40, 44], "you": [12, 16, 29, 31, 32, 34, 35, 36, 39, 40, 44, 56], "too": [10, 12, 16, 34, 35, 50], "speak": [12, 15], "price": 12, "charg": 12, "wish": 12, "receiv": [12, 15, 36, 40], "piec": [5, 6, 7, 12, 14, 16, 22, 31, 33, 47, 48, 50], "thing": [12, 44], "deni": [12, 25], "certain": [7, 12], "respons": [12, 15, 57], "respect": 12, "whether": [4, 6, 11, 12, 14], "grati": 12, "fee": 12, "And": [12, 16, 54], "show": [6, 10, 11, 12, 15, 16, 29, 31, 35, 39, 40, 47, 49, 50, 56], "develop": [12, 22, 24, 25, 35, 44, 47, 48, 50, 53, 56], "gpl": [12, 23, 31], "assert": [4, 11, 12, 14, 16, 35, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "offer": [12, 16], "clearli": 12, "explain": [12, 27, 28, 35, 40], "sake": 12, "erron": 12, "devic": 12, "manufactur": 12, "fundament": 12, "incompat": 12, "aim": 12, "systemat": 12, "abus": 12, "area": 12, "product": [12, 44], "individu": [12, 29], "precis": [10, 12], "unaccept": 12, "prohibit": 12, "substanti": 12, "domain": [12, 15, 31, 35, 57], "stand": 12, "readi": [12, 15, 16, 33, 39], "provis": 12, "final": [4, 9, 11, 12, 15, 16, 22, 39, 46, 50, 54, 55, 57], "everi": [3, 4, 8, 9, 10, 11, 12, 13, 14, 16, 22, 29, 31, 54], "threaten": 12, "constantli": 12, "purpos": [12, 36, 40], "danger": 12, "could": [4, 12, 16, 28, 44], "proprietari": 12, "assur": 12, "semiconductor": 12, "mask": 12, "under": [12, 36, 40], "license": 12, "address": [12, 24, 40], "organ": [12, 35], "adapt": [12, 13], "fashion": 12, "than": [3, 4, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15, 16, 21, 22, 24, 26, 31, 33, 34, 35, 40, 45, 54, 58], "exact": 12, "earlier": [7, 8, 11, 12, 15, 16], "unmodifi": 12, "propag": [7, 12], "anyth": [4, 11, 12], "secondarili": 12, "liabl": 12, "infring": 12, "applic": [12, 17], "execut": [10, 12, 16, 26, 28, 30, 32, 35, 36, 44, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57, 58], "privat": [4, 12, 46], "countri": 12, "parti": 12, "mere": 12, "interact": [8, 12], "network": 12, "transfer": 12, "interfac": [4, 12, 50, 52], "displai": [12, 18, 29, 31, 34, 50], "extent": 12, "conveni": [12, 29], "promin": 12, "visibl": [11, 12, 35, 39], "featur": [12, 16, 36, 39, 40, 44], "view": [12, 24, 26, 29, 34, 39, 40, 50], "command": [12, 25, 26, 31, 32, 33, 39, 40, 44, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57, 58], "menu": 12, "meet": [11, 12], "criterion": 12, "prefer": [12, 32, 44], "standard": [12, 29, 31, 34, 47, 50, 58], "offici": 12, "particular": [12, 16, 36, 40], "among": 12, "librari": [12, 31, 56], "whole": [11, 12, 14], "packag": [4, 12, 20, 31, 35, 47, 48, 50, 53, 56], "major": [12, 16], "b": [4, 12, 14, 27, 29, 34, 38, 45, 46, 47, 48, 49, 50, 52, 53, 54, 55, 58], "serv": [12, 29, 36, 37, 57], "essenti": [12, 35], "kernel": 12, "window": [3, 12, 29, 32, 39], "oper": [4, 12, 13, 14, 16, 29, 44], "correspond": [4, 12, 16], "control": [12, 14], "tool": [12, 15, 24, 39, 40, 41, 42, 44], "associ": [12, 38], "dynam": [12, 31, 33], "subprogram": 12, "intim": 12, "commun": 12, "flow": [12, 24, 35, 40], "regener": 12, "grant": [12, 40], "irrevoc": 12, "met": 12, "affirm": 12, "unlimit": 12, "constitut": 12, "acknowledg": [12, 31], "fair": 12, "equival": [12, 47], "sole": 12, "exclus": 12, "facil": 12, "compli": [12, 44], "materi": [12, 40, 56], "thu": 12, "behalf": 12, "outsid": [11, 12, 16], "relationship": 12, "circumst": 12, "sublicens": 12, "shall": 12, "deem": 12, "technolog": 12, "measur": [12, 16], "fulfil": 12, "oblig": 12, "articl": [12, 16], "wipo": 12, "treati": 12, "adopt": 12, "20": [10, 12, 22, 26, 27, 29, 31], "decemb": 12, "1996": 12, "similar": [12, 14, 16, 35], "waiv": 12, "power": [12, 39], "forbid": 12, "exercis": [12, 45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57, 58], "intent": 12, "enforc": 12, "against": [4, 9, 12, 16, 31], "third": 12, "medium": [12, 21], "conspicu": 12, "publish": [7, 12, 36, 40], "accord": 12, "absenc": 12, "along": [12, 14, 31, 36, 40, 43], "carri": 12, "relev": [12, 35, 44], "date": [3, 9, 12, 16, 29, 31, 44, 45, 51], "anyon": 12, "who": 12, "possess": 12, "independ": [12, 30, 44], "extens": [3, 12, 14, 16, 18, 28, 29, 30, 31, 33, 36, 39, 50, 56], "combin": [9, 12, 16], "larger": [10, 12, 21, 22, 29], "volum": 12, "storag": 12, "aggreg": 12, "beyond": [10, 12], "readabl": [12, 24, 35, 39, 40], "embodi": 12, "physic": 12, "accompani": 12, "durabl": [10, 12], "customarili": 12, "interchang": 12, "year": [12, 24, 40], "spare": 12, "model": 12, "reason": [12, 50, 57], "cost": [3, 9, 10, 11, 12, 15, 22, 33], "server": [12, 29, 30, 31, 33, 39, 44, 57], "altern": [12, 44, 56], "occasion": 12, "noncommerci": 12, "subsect": [12, 35], "6b": 12, "further": [11, 12, 29], "clear": [8, 10, 12, 14, 16, 21, 52], "sai": 12, "host": [12, 31, 50], "satisfi": 12, "peer": [12, 38], "transmiss": 12, "6d": 12, "portion": [12, 16], "tangibl": 12, "person": 12, "properti": [10, 12], "famili": [12, 13, 16, 21, 30, 33], "household": 12, "sold": 12, "incorpor": [12, 31], "dwell": 12, "doubt": 12, "resolv": 12, "favor": 12, "coverag": 12, "statu": [12, 31, 44], "expect": [12, 16, 22, 25, 49, 50, 51, 53, 58], "commerci": 12, "industri": 12, "repres": [12, 16], "signific": 12, "mode": [8, 12, 14, 31], "procedur": 12, "suffic": 12, "interf": 12, "becaus": [11, 12, 14, 16, 39, 56], "made": [8, 10, 12, 35], "transact": 12, "perpetu": 12, "character": 12, "But": [12, 50], "retain": 12, "abil": [12, 16, 24, 39, 40], "rom": 12, "servic": 12, "itself": [7, 8, 9, 12, 16, 40], "advers": 12, "affect": [4, 12], "violat": 12, "protocol": 12, "across": [11, 12, 16], "publicli": 12, "password": 12, "unpack": 12, "supplement": 12, "though": [12, 16, 18], "were": [3, 12, 16, 22], "govern": 12, "regard": 12, "own": [8, 11, 12, 13, 15, 26, 39, 55], "notwithstand": 12, "holder": 12, "misrepresent": 12, "origin": [12, 16, 29, 58], "licensor": 12, "declin": 12, "trademark": 12, "trade": [10, 12], "indemnif": 12, "contractu": 12, "assumpt": [11, 12], "impos": 12, "within": [12, 16, 29, 32], "relicens": 12, "surviv": [8, 12], "statement": [4, 12, 16, 31, 35, 50, 52], "abov": [12, 14, 16, 22, 26, 28, 35], "expressli": 12, "attempt": [12, 24, 40], "void": [4, 12, 34, 35, 46], "paragraph": [12, 16, 27, 29, 31, 34], "ceas": 12, "reinstat": 12, "provision": 12, "perman": 12, "notifi": 12, "prior": [12, 21], "60": [10, 12], "dai": 12, "cessat": 12, "moreov": 12, "cure": 12, "30": 12, "receipt": 12, "qualifi": [12, 16], "ancillari": 12, "consequ": 12, "likewis": [3, 12, 13, 16], "action": [3, 11, 12, 13, 39], "subject": 12, "complianc": 12, "entiti": [12, 48], "asset": 12, "subdivid": 12, "merg": [4, 8, 11, 12, 13, 16, 49], "whatev": [12, 16], "predecessor": 12, "interest": 12, "had": 12, "plu": [12, 30], "effort": 12, "royalti": 12, "litig": 12, "cross": [12, 29, 49], "counterclaim": 12, "lawsuit": 12, "alleg": 12, "sell": 12, "sale": 12, "import": [12, 18, 21, 25, 29, 31, 39, 44], "contributor": 12, "acquir": 12, "hereaft": 12, "manner": 12, "worldwid": 12, "express": [3, 4, 9, 12, 15, 16, 39, 40], "agreement": 12, "commit": [12, 24, 26, 40, 44], "denomin": 12, "coven": 12, "sue": 12, "knowingli": 12, "readili": 12, "arrang": 12, "depriv": 12, "yourself": 12, "benefit": 12, "believ": 12, "pursuant": 12, "procur": 12, "convey": 12, "discriminatori": 12, "scope": [12, 26, 27, 30], "busi": 12, "payment": 12, "primarili": 12, "28": 12, "march": 12, "constru": 12, "impli": [12, 36, 40, 50], "defens": 12, "court": 12, "contradict": 12, "excus": 12, "simultan": 12, "pertin": 12, "agre": [12, 13, 51], "collect": [8, 10, 12, 14, 22, 31, 33], "whom": 12, "refrain": 12, "concern": 12, "Such": 12, "spirit": 12, "distinguish": 12, "choos": 12, "ever": 12, "proxi": 12, "decid": 12, "THERE": 12, "NO": 12, "FOR": [12, 36, 40], "THE": 12, "TO": 12, "BY": [10, 12], "IN": 12, "OR": [10, 12], "AS": 12, "OF": [12, 21], "BUT": 12, "NOT": [10, 12, 47, 48, 50, 53, 56], "merchant": [12, 36, 40], "fit": [10, 12, 36, 40, 52], "risk": 12, "qualiti": 12, "WITH": 12, "prove": [12, 52], "defect": 12, "repair": 12, "event": [12, 14, 16], "WILL": 12, "BE": 12, "damag": 12, "incident": 12, "consequenti": 12, "inabl": 12, "loss": 12, "BEING": 12, "inaccur": 12, "sustain": 12, "IF": [10, 12], "SUCH": 12, "advis": 12, "local": [12, 25, 29], "review": 12, "approxim": 12, "waiver": 12, "civil": 12, "greatest": 12, "best": [12, 16], "achiev": 12, "redistribut": [12, 36, 40], "attach": [12, 38], "safest": 12, "pointer": 12, "brief": [12, 35, 43], "idea": [12, 16, 24, 40], "www": [12, 38, 40], "contact": 12, "electron": 12, "paper": [12, 24, 40], "mail": 12, "short": [3, 7, 12, 16, 29, 50], "welcom": 12, "hypothet": 12, "Of": 12, "cours": [12, 40], "gui": [12, 24, 32, 35, 40], "box": [12, 18], "employ": 12, "programm": [12, 24, 40], "school": 12, "sign": 12, "subroutin": 12, "lesser": 12, "pleas": [12, 14, 16, 40, 56], "philosophi": 12, "why": 12, "lgpl": 12, "find_lexer_class": [14, 16], "lxml": [14, 15, 44], "section": [14, 22, 27, 30, 35, 58], "main": [3, 4, 10, 14, 15, 16, 44, 45, 46, 50, 52, 54, 56, 58], "rest_to_code_str": [14, 50, 56], "rest_to_code_fil": [14, 56], "find_file_ext": [14, 56], "lang": [8, 14, 56], "lexer_class": [3, 8, 14, 16, 49], "grab": 14, "file_ext_raw": 14, "file_ext_list": 14, "split": [4, 8, 11, 14, 16, 29, 31, 50, 53], "file_ext": 14, "language_comment_typ": 14, "comment_delimit": 14, "delimit": [4, 11, 14, 16, 30, 31, 35, 39, 56], "ex": [14, 25], "sequenc": [14, 16, 28, 31, 50], "formulate_com": 14, "000": 14, "consecut": 14, "turn": [4, 9, 14, 31, 39], "is_block_com": 14, "boolean": [4, 14], "overrul": 14, "posit": [4, 11, 14, 22], "integ": [10, 14, 16], "line_count": 14, "reformat": 14, "decrement": 14, "onc": [6, 7, 8, 10, 11, 14, 15, 16, 22, 31, 44], "constant": [14, 22, 46], "has_inline_com": 14, "has_block_com": 14, "formul": 14, "formulate_block_com": 14, "round": [14, 22, 26, 56], "trip": [14, 22, 56], "stabl": [14, 44, 56], "regular": [3, 4, 9, 14, 15], "front": 14, "visual": [14, 39], "appeal": 14, "source_rst_path": 14, "out_path": 14, "obtain": [14, 16], "file_name_list": 14, "rsplit": [14, 56], "file_nam": [14, 56], "gather": [5, 6, 7, 8, 14, 16, 26, 50], "sing": 14, "rest_str": 14, "remove_codechat_styl": [14, 50], "snip": [14, 50], "fed": 14, "replac": [8, 9, 10, 11, 14, 15, 16, 22, 28, 29, 31, 35, 44, 54, 56], "promot": 14, "healthi": 14, "habit": 14, "line_list": [14, 16], "string_out": 14, "catch": [4, 14, 16, 26], "unexpect": [11, 14, 16, 47, 48], "suppos": 14, "over": [3, 8, 11, 14, 15, 16, 22, 24, 31, 33, 39, 40, 44, 50, 57], "setlin": 14, "rather": [3, 4, 5, 6, 7, 9, 10, 14, 15, 16, 22, 24, 31, 33, 35, 39, 40, 54, 58], "s2": 14, "float": [14, 21, 22], "loop": [11, 14, 16, 27], "13": [14, 31, 44], "temp_i": [], "10000": [14, 50], "forev": [], "due": [], "your": [14, 19, 29, 35, 36, 39, 40, 44, 56], "html_to_code_fil": [14, 53], "html_to_code_str": [14, 31, 53], "source_html_path": 14, "html_str": [14, 53], "traverse_etre": [], "nonloc": 14, "isinst": [8, 11, 13, 14, 15, 16, 22, 46, 49], "nonetyp": 14, "topic": [14, 21, 44, 53], "tail": 14, "span": [4, 14, 16, 21, 27, 34, 35, 50, 53], "target": [14, 33, 53, 57], "tt": [14, 21, 53], "child": [14, 16], "div_end": [47, 50], "intern": [14, 16, 33], "href": [14, 27, 53], "extern": [14, 35, 53], "mess": 14, "html_list": 14, "html_list2": 14, "dtd": 14, "preprocess": [4, 11, 13, 14, 16], "middl": 14, "tic": 14, "spot": 14, "root": [4, 11, 13, 14, 16, 22, 26, 27, 28, 29, 30, 46, 49, 58], "fromstr": 14, "recurs": [3, 14, 22, 31], "level": [30, 56], "has_code_block": 14, "html_to_run": 14, "html_to_pars": 14, "convert_text": 14, "ast": [11, 16, 31, 46], "enum": [4, 16, 46], "inspect": [10, 13, 16, 31, 33], "get_lexer_for_filenam": 16, "get_lexer_by_nam": [16, 50], "get_lexer_for_mimetyp": 16, "guess_lexer_for_filenam": [16, 50], "guess_lex": 16, "guess_decod": 16, "_encoding_map": 16, "token": [4, 8, 11, 13, 26, 27, 31, 33, 49, 50], "filter": [4, 11, 13, 16, 46, 50, 55], "apply_filt": 16, "mime": 16, "guess": [15, 16, 22, 31, 50], "tabsiz": [11, 16, 49, 50, 52], "lexer_": 16, "debug": [4, 16, 35, 50], "val": 16, "uncom": 16, "heart": [16, 22], "algorithm": [16, 24, 40], "analyz": [16, 29], "cdi": [11, 16, 26], "comment_is_inlin": [16, 26], "comment_is_block": [16, 26], "token_it": [16, 26, 50], "ast_docstr": [11, 13, 16, 26, 50], "_pygments_lex": [13, 16, 26, 46, 50, 55], "group": [4, 10, 11, 13, 16, 21, 22, 26, 31, 44, 50], "token_group": [16, 50], "_group_lexer_token": [4, 11, 13, 16, 26, 50], "ws_len": 16, "gathered_group": [16, 50], "_gather_groups_on_newlin": [11, 16, 26, 50], "_classify_group": [8, 11, 16, 26, 50], "properli": [16, 31, 35, 37, 50], "bottom": [16, 18, 21, 29], "top": [16, 18, 21, 29, 30, 31, 35], "prece": 16, "structur": [16, 30, 35, 39], "codechat_notop": [16, 18], "codechat_nobottom": [16, 18], "codechat_dostyl": [16, 33], "walk_tre": 16, "dom": 16, "walker": 16, "prevelements": 16, "func_walk": 16, "lastelementchild": 16, "func_child": 16, "arrai": [16, 22], "let": [3, 4, 8, 13, 16, 27, 46], "walk_children": 16, "sibl": [14, 16], "ascend": 16, "parentel": 16, "push": [4, 11, 13, 16, 29], "typeof": [4, 16], "undefin": 16, "getelementsbyclassnam": 16, "extra": [16, 22, 31, 42], "nextelements": 16, "firstelementchild": 16, "map": [4, 13, 15, 16, 22, 29], "classlist": 16, "previouselements": 16, "addeventlisten": 16, "domcontentload": 16, "cleanup": [16, 31], "correl": 16, "preprocessed_code_str": 16, "_pygments_get_tokens_preprocess": [4, 13, 16, 46, 55], "truli": 16, "pythonlex": [13, 16], "rruu": 16, "bygroup": 16, "tripl": [13, 16], "meaning": 16, "ll": [4, 16, 39], "0257": 16, "evalu": 16, "arbitrari": [16, 50], "__doc__": 16, "perhap": [16, 22, 30], "scan": [16, 35, 58], "tricki": [16, 37], "probabl": 16, "unfortun": 16, "cleandoc": [13, 16], "ending_line_number_of_the_com": 16, "g": [16, 29, 44, 46, 55], "get_docstr": 16, "bug": [16, 40], "issue16806": 16, "end_lineno": 16, "introduc": [11, 16, 24, 30, 31, 34, 40], "attributeerror": 9, "typeerror": 16, "syntaxerror": [13, 16, 47, 48, 50, 55], "err": [16, 46, 50, 52, 54, 55, 58], "unknown": [15, 16, 49], "_pygments_get_tokens_postprocess": [11, 16], "get_token": 16, "unfilt": 16, "tokentyp": [8, 11, 13, 16], "mechan": 16, "bypass": [16, 50], "expand": [8, 11, 16, 49], "chardet": 16, "importerror": [16, 22, 46, 55], "feedpars": 16, "bom": 16, "decod": [15, 16, 22, 50], "enc": 16, "1024": 16, "1kb": 16, "ufeff": [8, 11, 16], "stripal": [11, 16], "expandtab": [8, 11, 16], "ensurenl": [16, 50], "edit": [16, 22, 24, 30, 31, 33, 35, 39, 40, 54, 58], "few": [9, 11, 13, 16, 31, 39], "streamer": 16, "get_tokens_unprocess": [8, 11, 13, 16], "yield": [4, 5, 6, 7, 11, 13, 14, 16, 22, 31, 33, 47, 48, 50, 51, 52, 55], "iter_token": 16, "current_str": 16, "current_group": 16, "token_lineno": 16, "increas": 16, "count": [4, 10, 11, 16, 52], "token_docstr": 16, "_group_for_tokentyp": 16, "accumul": [7, 11, 16], "far": [11, 13, 15, 16, 44], "newli": [16, 25], "_group": [4, 11, 13, 16, 50], "group_for_tokentyp": 16, "inline_com": [4, 11, 13, 16, 50], "block_com": [4, 13, 16, 50], "block_comment_start": [16, 50], "block_comment_bodi": [16, 50], "repeat": [16, 27, 35, 50], "block_comment_end": [16, 50], "tiebreak": 16, "goofi": 16, "bitbucket": 16, "birkenfeld": 16, "1251": 16, "commentsinglelin": 16, "singlelin": 16, "comment_leading_whitespace_length": 16, "group_lexer_token": [16, 26], "iter_group": 16, "comment_delim_info": 16, "_list": 16, "len_opening_block_com": 16, "apart": 16, "splitlin": [8, 16, 54, 57], "spread": [3, 16, 22], "label": [4, 16, 34], "column": [8, 13, 16, 34], "group_": 16, "ws_len_": 16, "string_": 16, "past": [11, 16], "veri": [14, 16, 27, 35, 37, 39], "last_delim_char": 16, "_is_space_indented_lin": 16, "is_indented_lin": 16, "_is_delim_indented_lin": [16, 50], "inconsist": [16, 50], "signal": 16, "split_str": 16, "is_next_to_last_lin": 16, "reset": [11, 16], "1234567890234567": 16, "letter": [16, 29], "lack": [16, 31, 39], "leav": [3, 10, 16, 18, 22, 29, 31, 46, 50], "less": [10, 16, 35, 50], "suffici": 16, "indent_len": 16, "placehold": 16, "is_delim_indented_lin": 16, "delim": [4, 16], "is_last": 16, "isspac": [13, 16, 22], "factor": 16, "line_except_closing_delim": 16, "1234567890123456789": 16, "asterisk": 16, "accept": [15, 16, 24, 31, 40, 45], "total": [10, 16, 27], "usual": 16, "char": [4, 8, 16, 46, 50], "gather_groups_on_newlin": 16, "destruct": 16, "invert": 16, "group1": 16, "string1_no_newlin": 16, "group2": 16, "string2_no_newlin": 16, "groupn": 16, "stringn_ending_newlin": 16, "iter_gathered_group": 16, "is_block_rest_com": 16, "_is_rest_com": 16, "first_group": 16, "first_ws_len": 16, "first_str": 16, "pop": [4, 8, 11, 13, 14, 15, 16, 22], "_is_block_body_or_end": 16, "_remove_comment_delim": [16, 50], "Or": [16, 34], "len_opening_block_comment_delim": 16, "len_closing_block_comment_delim": 16, "unlik": [8, 11, 16], "inline_comment_delim_seq": 16, "string_low": 16, "inline_comment_delim": 16, "_remove_beginning_comment_delim": 16, "beginning_comment_delim_seq": 16, "bcd": 16, "panic": 16, "remove_comment_char": 16, "classify_group": 16, "group_tupl": 16, "ws_len_tupl": 16, "string_tupl": 16, "first_comment_index": 16, "simpler": [16, 31], "first_comment_text": 16, "first_char_is_rest": 16, "setup": [17, 25, 26, 29, 30, 31, 32, 35, 39, 40], "chosen": 17, "goal": 18, "appear": [16, 18, 22], "omit": [3, 9, 18, 22, 29, 35, 45], "border": [18, 21], "mix": [18, 50], "pad": [8, 18, 21, 27], "0px": 18, "webkit": 18, "shadow": 18, "sourceclassif": 18, "overrid": [4, 18, 21, 31, 46], "preceed": [18, 50], "html_css_file": 19, "font": [19, 21, 27, 35, 40], "10pt": [19, 21], "nicer": 21, "much": [4, 11, 16, 21, 33, 35], "pyinstal": [21, 25, 40], "verdana": 21, "arial": 21, "san": [21, 38], "serif": 21, "background": 21, "color": [21, 27, 57], "white": 21, "monospac": [21, 35], "95em": 21, "ecf0f3": 21, "1px": 21, "1em": [21, 27], "20px": 21, "30px": 21, "dl": 21, "2em": [21, 27], "h1": [21, 50], "h2": 21, "h3": [21, 49], "h4": 21, "h5": 21, "h6": 21, "f2f2f2": 21, "solid": 21, "cccccc": 21, "20435c": 21, "trebuchet": 21, "weight": [21, 27], "10px": 21, "3px": 21, "align": [11, 21, 35], "center": 21, "variant": [21, 24, 40], "cap": 21, "titl": [21, 22, 29, 34, 35, 39, 50], "35": 21, "visit": [14, 21, 31, 58], "006699": 21, "hover": [21, 27], "decor": [4, 21, 27], "inherit": [3, 21, 50], "red": [21, 57], "unterlin": 21, "ddccee": 21, "collaps": 21, "td": 21, "th": 21, "eeeeff": 21, "2px": 21, "5px": 21, "field": [16, 21], "footnot": 21, "eedde": 21, "ccaacc": 21, "docinfo": 21, "thin": 21, "eeddff": 21, "colspan": 21, "kbd": 21, "nowrap": 21, "ffd596": 21, "bold": [21, 53], "head": [16, 21, 24, 31, 39, 40, 49, 50], "15px": 21, "dt": 21, "eeffcc": 21, "aacc99": 21, "333333": 21, "height": 21, "120": 21, "4em": 21, "sidebar": [21, 29], "smaller": 21, "outset": 21, "ie": 21, "ffffee": 21, "90": 21, "admonit": [21, 31], "integr": [22, 31, 32, 39, 40], "chapter": [22, 31, 58], "sy": [3, 10, 15, 16, 22, 28, 29, 44, 46, 49, 51, 55, 57, 58], "json": [8, 9, 15, 16, 22, 23, 29, 31, 33, 49, 50, 51, 57, 58], "sub_item": [22, 58], "process_sect": [22, 58], "lexer_for_glob": [22, 58], "etc": [29, 35, 39], "argv": [3, 10, 15, 22, 46, 58], "delai": [3, 22], "phase": 22, "book": [31, 58], "represent": 22, "stdin": [15, 22, 57, 58], "dump": [8, 9, 15, 16, 22, 49, 51, 57, 58], "via": [22, 29, 33], "stdout": [15, 22, 49, 51, 57, 58], "__main__": [3, 9, 10, 15, 22], "licens": [23, 31, 35, 36, 43, 44], "web": [24, 29, 34, 35, 39, 40], "beauti": [24, 39, 40], "descript": [3, 10, 15, 24, 29, 35, 40, 44], "hyperlink": [24, 31, 35, 39, 40], "diagram": [24, 35, 40], "imag": [24, 29, 39, 40], "form": [8, 9, 11, 16, 24, 34, 40, 55], "rich": [24, 40], "insight": [24, 40], "slate": [24, 40], "plan": [24, 40], "ahead": [10, 24, 40], "sketch": [24, 40], "lai": [24, 40], "evolv": [24, 40], "paradigm": [24, 40], "think": [24, 40, 56], "intermingl": [24, 35, 37, 40], "dramat": [24, 40], "improv": [24, 31, 40], "lp": [24, 40], "realiz": [24, 40], "fellow": [24, 40], "nice": [24, 40], "intermix": [24, 40], "explanatori": [24, 40], "prose": [24, 40], "donald": [24, 40], "knuth": [24, 40], "hi": [24, 40], "semin": [24, 40], "figur": [24, 35, 40], "tangl": [24, 40], "woven": [24, 40], "digest": [24, 40], "2a": [24, 40], "unread": [24, 40], "plethora": [24, 40], "inspir": [24, 40], "gain": [24, 40], "widespread": [24, 40], "doxygen": [24, 28, 40], "javadoc": [24, 40], "weak": [24, 40], "emploi": [24, 40], "human": [24, 39, 40], "faster": [3, 11, 16, 22, 24, 33, 40], "easier": [24, 35, 40], "readm": [24, 39, 44, 51], "github": [25, 31, 50], "blob": 25, "matrix": 25, "python38": 25, "python_vers": 25, "python_arch": 25, "32": [4, 25, 50], "python37": 25, "echo": [25, 50], "cmd": 25, "architectur": 25, "struct": [4, 25, 46], "calcsiz": 25, "traceback": [7, 25], "recent": [10, 22, 25, 29, 52], "python35": 25, "lib": 25, "shutil": [25, 50], "381": 25, "_rmtree_unsaf": 25, "unlink": [15, 25], "fullnam": 25, "permissionerror": 25, "winerror": 25, "appdata": 25, "dghcgnoj": 25, "uninstal": 25, "choco": 25, "png": 25, "dot": [16, 25], "test_script": 25, "output_path": [3, 28], "arg": [3, 10, 15, 22, 28, 45, 50, 52, 58], "project_path": 28, "sys_execut": 28, "virtual": 28, "surround": [28, 34, 50], "confus": 28, "html_ext": 28, "project_typ": 28, "pretext": [3, 10, 28, 30, 31, 52], "restructur": 29, "quickstart": 29, "hand": [16, 29], "execfil": 29, "autogener": 29, "codetorestsphinx": [16, 29, 30, 31, 33, 44, 50, 51], "autodoc": 29, "abspath": [29, 44], "shown": [29, 35, 39], "2022": [29, 31, 36, 40], "bryan": [29, 36, 38, 40, 44], "jone": [29, 36, 38, 40, 44], "act": 29, "variou": [29, 31], "throughout": 29, "built": [16, 29, 31, 44], "alpha": 29, "beta": [29, 33], "rc": 29, "todai": 29, "today_fmt": 29, "strftime": 29, "highlight_languag": [29, 31], "pygments_styl": 29, "add_function_parenthes": 29, "func": [29, 46], "add_module_nam": 29, "unit": [29, 30, 31], "show_author": 29, "sectionauthor": 29, "moduleauthor": 29, "modindex_common_prefix": 29, "prefix": [4, 8, 13, 29, 35], "sort": [3, 8, 10, 15, 16, 22, 29, 45, 49, 50, 57], "minim": 29, "needs_sphinx": 29, "ones": [16, 29], "mandatori": 29, "translat": [9, 16, 29, 30, 31, 33, 48, 50, 56], "myst_pars": [29, 36], "templates_path": 29, "rst_epilog": 29, "_docname_rol": [29, 33], "spec": [29, 31, 50], "auto": [29, 31], "lasso": 29, "manifest": [29, 30], "flake8": [29, 30, 44, 49], "source_encod": 29, "sig": 29, "master_doc": 29, "master": [29, 31], "toctre": [29, 30, 39, 40], "dist": [29, 44], "sphinx_templ": [29, 31], "thumb": 29, "db": 29, "ds_store": 29, "vscode": 29, "default_rol": 29, "role": [29, 31, 33], "keep_warn": 29, "offend": 29, "html_theme": 29, "theme": [29, 30, 31, 39], "alabast": 29, "html_theme_opt": 29, "feel": 29, "html_style": 29, "html_theme_path": 29, "html_titl": 29, "html_short_titl": 29, "shorter": 29, "navig": [29, 35, 49], "html_logo": 29, "html_favicon": 29, "favicon": 29, "icon": [29, 51], "ico": 29, "16x16": 29, "32x32": 29, "pixel": 29, "builtin": 29, "overwrit": 29, "html_last_updated_fmt": 29, "timestamp": 29, "html_sidebar": 29, "relat": 29, "searchbox": 29, "donat": 29, "html_additional_pag": 29, "html_domain_indic": 29, "html_use_index": 29, "html_split_index": 29, "html_copy_sourc": 29, "_sourc": 29, "html_show_sourcelink": 29, "html_show_sphinx": 29, "footer": 29, "html_show_copyright": 29, "html_use_opensearch": 29, "opensearch": 29, "finish": [3, 8, 16, 22, 29], "html_file_suffix": 29, "xhtml": 29, "intersphinx_map": 29, "codechat_system": 29, "readthedoc": [29, 30, 31, 44], "en": [29, 44], "inv": 29, "graphviz_output_format": 29, "svg": 29, "codetopretext": [3, 15, 30, 48, 52, 57], "resttocod": [30, 33, 50, 53, 56], "mdbook_codechat": [30, 44, 58], "preprocessor": [4, 30, 31, 35, 39, 44, 58], "mdbook": [30, 31, 44, 58], "pyproject": 30, "webpag": 30, "codechat_sphinx_rtd_them": 30, "codetomarkdown_test": 30, "codetopretext_test": 30, "codetorestsphinx_test": 30, "htmltocode_test": 30, "resttocode_test": [30, 53], "travi": [30, 31], "yml": 30, "ci": [30, 31], "style_test": [27, 30, 49], "codechat_config": [22, 30, 49], "cfg": [30, 31, 46], "cach": [3, 5, 6, 7, 8, 22, 26, 29, 30, 31, 33, 44, 45, 52, 58], "ref": [30, 49], "referenc": 30, "That": [30, 39], "zot": 30, "emb": [30, 35], "profil": [29, 30, 33, 49], "slow": [3, 9, 16, 30, 46], "dev": 30, "oct": 31, "2023": 31, "aug": 31, "jun": 31, "apr": 31, "nov": 31, "2021": 31, "rpm": 31, "sep": [9, 31], "assembli": [31, 50], "27": [31, 38], "jul": 31, "11": [31, 42], "exclude_small_fil": [31, 33], "19": [4, 11, 13, 16, 31, 33, 38], "jan": 31, "2020": 31, "crash": 31, "26": [31, 44], "dec": [31, 46], "24": [31, 38], "nsf": 31, "outdat": 31, "enki": [31, 50], "preview": [11, 15, 31, 33], "plugin": [3, 9, 22, 29, 31, 45, 51], "tutori": [31, 40], "_codeinclud": [31, 33], "reorgan": 31, "broken": [31, 34], "22": [31, 42], "feb": 31, "style_guid": [27, 31, 39, 40, 46, 49], "cpp": [4, 27, 31, 39, 40, 46, 49], "recommend": [31, 39, 40], "18": [8, 31, 38], "2019": [31, 38], "older": [31, 44], "codechat_exclud": 31, "25": [31, 46, 52], "2018": [31, 38], "bit": [31, 37, 50], "refactor": 31, "code_to_xxx_fil": 31, "2017": 31, "substitut": [31, 33], "definit": [4, 31, 35, 46], "underli": 31, "minimum": 31, "duplic": [3, 31], "guid": [31, 33, 39, 44, 46], "v1": 31, "31": 31, "15": [31, 52], "treatment": 31, "incorrect": [31, 50], "feedback": [31, 38], "2016": 31, "mar": 31, "port": 31, "resid": 31, "subdirectori": [31, 39], "12": [13, 31], "2015": [31, 44], "sconscript": 31, "modern": 31, "usag": [31, 39], "memori": [5, 6, 7, 14, 31], "intermedi": 31, "creation": 31, "cleanli": 31, "layout": 31, "dock": 31, "useless": 31, "progress": 31, "unus": 31, "pyqt": 31, "languagespecificopt": 31, "17": 31, "2014": 31, "16": [4, 14, 31, 38, 52, 53], "rework": 31, "codelink": 31, "revamp": 31, "cleaner": 31, "varieti": 32, "editor": [11, 15, 31, 32, 39], "prompt": 32, "upgrad": 32, "pip3": 32, "mac": 32, "download": [32, 39], "unzip": [32, 39], "clone": 32, "repositori": 32, "explan": [33, 49], "concept": [4, 33], "_fencedcodeblock": [8, 33], "_setlin": 33, "code_to_rest_fil": [3, 31, 33, 50, 56], "code_to_html_str": [15, 26, 31, 33], "code_to_html_fil": [33, 56], "code_to_markdown_fil": [3, 31, 33, 47], "reference_manu": 33, "excel": 34, "meant": 34, "side": [26, 34], "quit": 34, "simpl": [34, 40, 44, 47, 48, 50], "emphasi": [27, 34], "ital": [34, 53], "strong": 34, "boldfac": 34, "sampl": [34, 44], "bullet": [27, 34, 35], "autonumb": 34, "grid": 34, "row": [10, 13, 34], "underlin": 34, "overlin": [34, 35], "punctuat": [4, 34], "commonli": [34, 50], "word": [4, 13, 34], "backslash": 34, "sub": [8, 34, 44, 45], "exemplifi": [35, 36], "principl": 35, "carefulli": 35, "toc": 35, "Then": 35, "finer": 35, "grain": 35, "demonstr": 35, "subsubsect": 35, "subsubsubsect": 35, "i_sum": 35, "fact": 35, "extrem": 35, "overind": 35, "seri": 35, "assist": 35, "eat": 35, "balanc": 35, "diet": 35, "dietbalanc": 35, "banana": 35, "amount": 35, "pound": 35, "bananas_for_balanced_diet": 35, "appl": 35, "unsign": 35, "orang": 35, "myplat": 35, "calcul": 35, "mass": 35, "quick": [35, 39], "overview": 35, "predict": 35, "stick": 35, "construct": [11, 35, 39], "magic": 35, "stack": [4, 11, 14, 22, 35], "overflow": 35, "promis": 35, "didn": [11, 35, 49], "api": 35, "cooper": 35, "endif": [4, 35, 46], "hit": [16, 22, 35, 50, 52, 58], "ratio": 35, "dump_obj": 35, "23": 35, "test_": 35, "highli": 35, "remind": 35, "hide": 35, "chart": 35, "pain": 35, "snap": 35, "draw": 35, "screenshot": 35, "graphic": 35, "datasheet": 35, "choic": [3, 35, 46, 54, 55], "gp": 35, "smart": 35, "phone": 35, "describ": [3, 11, 16, 35], "2012": [36, 40], "term": [36, 40], "gnu": [36, 40, 44], "public": [4, 36, 40, 44, 46], "warranti": [36, 40], "bed": 37, "linter": 37, "complaint": 37, "to_cod": 37, "to_indented_cod": 37, "dedent": [13, 37, 48, 50], "shouldn": 37, "plain": [37, 39], "nd": 37, "doctest_block": 37, "and_back": 37, "indented_doctest_block": 37, "behavior": 37, "five": 37, "seven": 37, "eight": 37, "ine": 37, "ten": 37, "eleven": 37, "twelv": 37, "realli": 37, "beck": 38, "mohammadi": 38, "aragh": 38, "archibald": 38, "explor": [38, 39], "learn": 38, "techniqu": 38, "real": [10, 31, 38], "american": 38, "societi": 38, "educ": 38, "annual": 38, "confer": 38, "exposit": 38, "usa": 38, "tampa": 38, "fl": 38, "onlin": 38, "ase": 38, "file_serv": 38, "0010": 38, "6958": 38, "asee_2019_an_initial_exploration_of_ml_techniques_to_classify_source_code_com": 38, "pdf": 38, "k": 38, "barton": 38, "studi": 38, "codebook": 38, "analysi": [38, 44], "31943": 38, "jean": 38, "metacognit": 38, "introductori": 38, "ieee": 38, "frontier": 38, "fie": 38, "jose": 38, "ca": 38, "pp": [4, 38], "doi": 38, "1109": 38, "8658973": 38, "rees": 38, "jankun": 38, "kelli": 38, "coder": 38, "qualit": 38, "investig": 38, "student": 38, "salt": 38, "lake": 38, "citi": 38, "utah": 38, "phylli": 38, "ami": 38, "donna": 38, "monika": 38, "proceed": 38, "acm": 38, "sigcs": 38, "technic": 38, "symposium": 38, "scienc": [38, 40], "baltimor": 38, "mahna": 38, "abstract": [4, 38], "49th": 38, "machineri": 38, "york": 38, "ny": [38, 53], "1078": 38, "1145": 38, "3159450": 38, "3162304": 38, "supporting_literatur": 38, "studio": 39, "plaintext": 39, "primer": [39, 40], "sourceforg": 39, "familiar": 39, "experi": 39, "disk": [30, 31, 39], "remedi": 39, "intellig": 39, "togeth": [4, 39], "hierarch": 39, "maxdepth": 39, "forward": [6, 39], "demo": 39, "switch": [4, 39], "categor": 40, "microprocessor": 40, "histori": 40, "literatur": 40, "tracker": 40, "contribut": 40, "upon": 40, "nation": 40, "1612132": 40, "opinion": 40, "conclus": 40, "necessarili": 40, "reflect": 40, "enclos": [41, 50], "ini_opt": 41, "testpath": 41, "ubuntu": 42, "04": 42, "extra_requir": 42, "mention": 43, "setuptool": [43, 44], "pypa": 43, "license_fil": 43, "speed": [10, 29, 44], "distutil": 44, "upload": 44, "pypi": 44, "wheel": 44, "twine": 44, "known": [13, 16, 44, 49], "evil": 44, "long_descript": 44, "dirnam": [3, 44], "ouch": 44, "ifram": 44, "flag": [13, 44, 50], "dotal": [44, 50], "kwarg": [8, 26, 44, 50], "utf8": 44, "fp": 44, "find_vers": 44, "file_path": 44, "version_fil": 44, "version_match": 44, "runtimeerror": 44, "higher": 44, "python_requir": 44, "seem": 44, "0426": 44, "pep440": 44, "bad": 44, "homepag": 44, "author_email": 44, "bjone": 44, "msstate": 44, "edu": 44, "gplv3": 44, "audienc": 44, "osi": 44, "approv": 44, "v3": 44, "english": 44, "keyword": [4, 11, 13, 44], "install_requir": 44, "extras_requir": 44, "myst": [44, 49], "include_package_data": 44, "entry_point": 44, "console_script": 44, "bench": [45, 46, 47, 48, 50, 51, 52, 53, 54, 55, 56, 57, 58], "period": [9, 47, 48, 50, 53, 56], "_generate_rest": [8, 26, 47, 50], "testcodetomarkdown": 47, "expected_md_str": [47, 48], "pure": [47, 48], "test_1": [45, 46, 47, 48, 49, 50, 51, 52, 54, 55, 56, 57, 58], "test_2": [45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "test_3": [45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "test_4": [45, 46, 47, 48, 50, 51, 52, 54, 55, 56, 57, 58], "test_5": [45, 46, 47, 48, 50, 52, 54, 56, 57, 58], "textwrap": [48, 50], "code_to_pretext_str": [10, 15, 33, 48, 52, 57], "epilog": 48, "testcodetopretext": 48, "parse_error": [15, 48, 57], "ptx_str": 48, "amp": 48, "lt": 48, "test_6": [47, 48, 50, 52, 54], "difflib": 49, "unified_diff": 49, "subprocess": [49, 51, 57], "cp": [49, 57], "capture_output": [49, 51, 57], "cwd": 49, "tood": 49, "diff_fil": 49, "calledprocesserror": 49, "repo": 49, "actual_relpath": 49, "expected_relapth": 49, "good": 49, "actual_fil": 49, "expected_fil": 49, "remove_navig": 49, "diff": 49, "writelin": [16, 49, 50], "verbos": 50, "summari": [8, 29, 50], "bf": 50, "ef": 50, "sl": 50, "comment_lin": 50, "c_comment_delimiter_info": 50, "py_comment_delimiter_info": 50, "c_lexer": 50, "code_to_rest": 50, "testcodetorest": 50, "mt": [50, 56], "expected_rest_str": 50, "alias_seq": [50, 56], "expected_code_str": 50, "rest2": 50, "code2": [50, 56], "test_5a": 50, "singli": 50, "test_7": [48, 50, 54], "doubli": 50, "test_8": [48, 50, 54], "test_9": 50, "test_9_tab": 50, "test_9_tab2": 50, "tcode": [50, 56], "transit": [11, 50, 56], "test_9a": 50, "test_10": 50, "test_12": 50, "test_13": 50, "\u044e": 50, "test_14": 50, "test_15": 50, "test_16": 50, "test_17": 50, "test_18": 50, "test_19": 50, "test_19_1": 50, "test_19_a": 50, "test_19_b": 50, "test_19_1_1": 50, "test_19_1_2": 50, "littl": 50, "test_19_1_3": 50, "test_19_1_4": 50, "test_19_1_5": 50, "test_19_1_6": 50, "test_19_1_7": 50, "test_19_1_8": 50, "test_19_2": 50, "test_19_3": 50, "test_19_4": 50, "test_19_5": 50, "test_20": 50, "test_21": 50, "test_22": 50, "test_23": 50, "test_24": 50, "test_25": 50, "bra": 50, "skipif": [50, 57], "test_25a": 50, "test_26": 50, "hello": [50, 56], "world": 50, "test_27": 50, "comment1": 50, "comment2": 50, "comment3": 50, "batch": [15, 33, 50, 57], "test_28": 50, "test_29": 50, "test_30": 50, "test_31": 50, "test_32": 50, "test_33": 50, "column0": 50, "column1": 50, "test_34": 50, "abett": 50, "interlac": 50, "ourtestunit": 50, "test_35": 50, "test_36": 50, "test_37_a": 50, "test_37_b": 50, "test_39_a": 50, "test_39_b": 50, "msgbox": 50, "test_40": 50, "nmulti": 50, "test_41": 50, "test_42": 50, "test_43": 50, "consolewrit": 50, "test_44": 50, "test_45": 50, "test_46": 50, "test_49": 50, "test_50": 50, "test_52": 50, "putstrln": 50, "test_53": 50, "test_54": 50, "writeln": 50, "test_55": 50, "test_56_a": 50, "test_56_b": 50, "test_56_c": 50, "dialog": 50, "test_57": 50, "test_58": 50, "princ": 50, "69": 50, "test_59": 50, "test_60": 50, "test_61": 50, "test_62": 50, "test_63": 50, "test_65": 50, "test_101": 50, "test_66": 50, "test_67": 50, "test_68": 50, "test_69": 50, "test_70_a": 50, "test_70_b": 50, "test_71_a": 50, "test_71_b": 50, "test_71_c": 50, "detailprint": 50, "test_72_d": 50, "test_72": 50, "test_73": 50, "test_74": 50, "test_75": 50, "consol": 50, "test_76": 50, "test_77_a": 50, "test_77_b": 50, "test_78": 50, "put_lin": 50, "test_79": 50, "test_80": 50, "test_81_a": 50, "test_81_b": 50, "test_81_c": 50, "test_82_a": 50, "test_82_b": 50, "test_83_a": 50, "test_83_b": 50, "invoic": 50, "34843": 50, "test_83_1": 50, "owner": 50, "tom": 50, "preston": 50, "werner": 50, "dob": 50, "1979": 50, "27t07": 50, "00": 50, "08": 50, "preproc": 50, "1841": 50, "test_83_2": 50, "test_84_a": 50, "test_84_b": 50, "test_85": 50, "test_86": 50, "testresttohtml": 50, "bodymo": 50, "divmo": 50, "har": 50, "verifi": 50, "complain": 50, "test_11": 50, "testcodetohtmlfil": 50, "tmpdir": 50, "test_fil": 50, "test_file_dest": 50, "copyfil": 50, "testcodetorestnew": 50, "test_py_cod": 50, "nan_identifi": 50, "test_token_list": 50, "an_identifi": 50, "token_list": [8, 16, 49, 50], "test_c_cod": 50, "stdio": [31, 46, 50, 54], "group_list": 50, "string_list": 50, "commnet": 50, "expected_group": 50, "test_4a": 50, "test_4b": [50, 56], "test_4c": 50, "test_4d": 50, "test_4f": 50, "test_4g": 50, "test_4h": 50, "test_4i": 50, "test_4j": 50, "test_4k": 50, "test_4_1": 50, "test_4_2": 50, "test_4_3": 50, "test_4_4": 50, "test_4aa1": 50, "test_4aa": 50, "test_4ab": 50, "test_4ac": 50, "test_4ad": 50, "test_4af": 50, "test_4ag1": 50, "test_4ag2": 50, "test_4ag": 50, "test_4ah": 50, "test_4ai": 50, "test_4aj": 50, "test_4ak": 50, "test_4al": 50, "test_4am": 50, "test_4an": 50, "test_4ao": 50, "test_4ao1": 50, "test_4ap": 50, "test_4aq": 50, "test_4ar": 50, "test_4at": 50, "test_4au": 50, "test_4av": 50, "test_4aw": 50, "cg": 50, "classified_group": [16, 50], "out_stringio": 50, "ncomment": 50, "xtest_1": 53, "austin": [53, 56], "desktop": [53, 56], "tempfil": [56, 57], "mkstemp": 56, "rest_to_cod": 56, "understand": 56, "testresttocodeerrcatch": 56, "et": 56, "fene": 56, "testresttocodestr": 56, "given_cod": 56, "expected_cod": 56, "test_2b": 56, "test_3b": 56, "testresttocodefiletest": 56, "rt_given_fil": 56, "code_file_nam": 56, "temporari": [16, 50, 56], "fr": 56, "rest_fil": 56, "fm1": 56, "modded_code_file1": 56, "fm2": 56, "modded_code_file2": 56, "twice": [8, 56], "f1": 56, "f2": 56, "code1": 56, "stabil": 56, "fd": 56, "tmp_path": [45, 47, 48, 49, 50, 51, 52, 56, 58], "test_find_file_ext_1": 56, "test_find_file_ext_2": 56, "pthon": 56, "test_find_file_ext_3": 56, "xtest_delet": 56, "smartgit": 56, "codechat_jon": 56, "functool": [7, 9, 16], "lru_cach": [7, 9, 16], "_cached_lex": 16, "instanc": [3, 16, 31, 50], "instanti": 16, "bound": [14, 16, 31], "thread": [15, 16, 57], "add_filt": [16, 46, 55], "lexer_cache_s": 16, "256": 16, "_lexer_lookup": 16, "lambda": [4, 8, 16, 22, 26, 55, 58], "possibli": [4, 11, 16], "options_kei": 16, "hash": [4, 10, 16, 50], "unhash": 16, "_lexer_for_kei": 16, "lookup": [16, 50], "maxsiz": [7, 9, 16], "miss": [9, 10, 11, 16, 22, 50, 54, 58], "lexer_cache_info": [33, 50], "cache_info": [16, 50], "statist": [10, 16], "clear_lexer_cach": [26, 33, 50], "cache_clear": [16, 46, 55], "currsiz": 50, "fnmatch": [9, 16], "_unambiguous_lexer_class": [3, 16], "candid": 16, "analyse_text": 16, "guess_lexer_prefix_length": 16, "wast": 16, "win": 16, "ambigu": [16, 50], "16384": 16, "_simple_suffix_regex": 16, "_get_filename_index": [3, 15, 16, 22], "_filename_index": 16, "suffix_index": 16, "other_pattern": 16, "primari": [10, 16], "alias_filenam": 16, "mo": 16, "fullmatch": 16, "sensit": 16, "rpartit": 16, "never": [4, 9, 10, 11], "2041": [], "monkeypatch": [46, 49, 50, 51, 52, 55, 58], "no_guess": 50, "setattr": [46, 49, 50, 51, 52, 55, 58], "proport": [7, 11, 16], "_set_line_regex": 7, "z": [4, 50], "findal": [8, 49, 50], "repeatedli": [10, 14, 16, 31], "codechat_docstr": [7, 8, 29, 31, 33], "_docstring_nod": 16, "_docstring_node_typ": 16, "_statement_list_field": 16, "classdef": 16, "functiondef": 16, "asyncfunctiondef": 16, "handler": 16, "claus": 16, "orels": 16, "finalbodi": 16, "test_87": 50, "test_88": 50, "live": [11, 15, 31, 33], "reclassifi": [11, 54], "buffer": [11, 15, 22, 58], "keystrok": 11, "nearest": 11, "resynchron": 11, "soon": [3, 11, 14, 15], "bisect": 11, "bisect_left": 11, "bisect_right": 11, "itertool": [4, 8, 11, 13], "extendedregexlex": 11, "regexlex": [11, 13], "_tokentyp": [11, 13], "_lexer_comment_info": [11, 13, 16, 26], "_python_docstr": [11, 13, 16, 55], "divid": 11, "record": [4, 10, 11, 16, 46, 52], "untermin": [4, 11, 54], "_source_lin": 11, "_classified_lin": 11, "_may_be_untermin": 11, "code_str_": [], "docstrings_": [], "_comment_delim_info": 11, "_comment_is_inlin": 11, "_comment_is_block": 11, "_split_lin": 11, "old_len": 11, "_ast_docstr": 11, "_find_docstr": 11, "_segment": 11, "_lex_seg": 11, "start_lin": [11, 54], "end_lin": [11, 54], "old_end": [11, 54], "new_end": [11, 54], "equal": [11, 14], "new_lin": 11, "line_delta": 11, "new_end_lin": 11, "old_ast_docstr": 11, "source_start": 11, "classified_start": 11, "first_seg": 11, "min": [11, 22, 27, 54], "relex_start": 11, "new_seg": 11, "new_classified_lin": 11, "next_start": 11, "end_seg": 11, "began": 11, "old": [10, 11], "old_next_start": 11, "weren": 11, "_docstrings_outsid": 11, "last_lin": 11, "caller": [9, 11], "segment_start": 11, "is_saf": 11, "is_default_st": 11, "_lex_with_st": 11, "_classify_seg": 11, "segment_end": 11, "may_be_untermin": 11, "Its": [4, 11, 14], "rememb": [9, 11], "brace": [11, 13], "_regex_lexer_get_tokens_unprocess": 11, "state_index": 11, "po": [4, 11, 13], "tokendef": [11, 13], "_token": [11, 13], "statestack": [11, 13], "statetoken": [11, 13], "rexmatch": [11, 13], "new_stat": [11, 13], "random": [11, 46, 54, 55], "ab": [11, 13], "del": [11, 13, 14, 22, 51, 57], "eol": 11, "indexerror": [11, 14], "first_lineno": 16, "incrementalclassifi": [30, 31, 33, 54], "increment": [14, 30, 31, 54], "incrementalclassifier_test": 30, "c_code": 54, "py_cod": [54, 55], "scratch": 54, "ic": 54, "testincrementalclassifi": 54, "nearbi": 54, "406": 54, "407": 54, "400": 54, "410": 54, "restor": 54, "tb": 54, "parametr": [51, 53, 54, 58], "rand": 54, "50": [26, 54], "randrang": 54, "old_classified_lin": 54, "grow": [10, 11, 22, 29], "startinlin": 11, "_code_to_markdown": 5, "_code_to_pretext": 6, "conversioncach": [3, 7, 8, 22, 29, 30, 31, 33, 44, 52, 58], "_code_to_rest": [7, 52], "default_max_s": [8, 10, 22], "_conversion_cach": 8, "codechat_cache_dir": [8, 10, 29, 31, 33], "_builder_init": 8, "cache_dir": [3, 8, 10, 22, 31, 52], "confdir": 8, "codechat_cache_max_s": [8, 29, 31, 33], "rebuilt": [8, 10], "stale": 10, "evict": [10, 22, 52], "sqlite": 10, "databas": [10, 22], "parallel": [8, 10, 30, 31, 33, 49, 58], "prune": [10, 31, 33, 52], "argpars": [3, 10, 15], "namedtupl": 10, "hashlib": 10, "sqlite3": 10, "_database_nam": 10, "conversioncacheinfo": 10, "_connect": [10, 52], "_connection_": 10, "_connection_pid": 10, "output_format": [3, 10], "sha256": 10, "repr": 10, "surrogatepass": 10, "improperli": 10, "unpair": 10, "surrog": 10, "hexdigest": 10, "fetchon": 10, "last_us": 10, "lexer_nam": [8, 10, 22], "INTO": 10, "_evict": 10, "coalesc": 10, "sum": [8, 10, 27, 50, 52], "rowcount": 10, "staticmethod": [], "entry_s": 10, "executemani": 10, "fork": [3, 10], "getpid": [10, 16], "mkdir": [10, 45], "exist_ok": 10, "wait": [10, 15], "timeout": 10, "sync": 10, "pragma": [10, 46], "journal_mod": 10, "wal": 10, "synchron": 10, "conversions_last_us": 10, "ON": 10, "argumentpars": [3, 10, 15], "prog": [3, 10, 15], "add_argu": [3, 10, 15], "subpars": 10, "add_subpars": 10, "dest": [3, 8, 10, 49], "add_pars": 10, "prune_pars": 10, "parse_arg": [3, 10, 15], "is_fil": [10, 45], "rebuild": [22, 29, 31], "conversioncache_test": 30, "reus": [3, 16, 33], "manag": [16, 44], "fixtur": [26, 52], "testconversioncach": 52, "nx": [15, 45, 46, 47, 48, 49, 50, 52, 57, 58], "tx": [49, 52], "capsi": [45, 50, 52, 58], "systemexit": 52, "readouterr": [45, 50, 52, 58], "pool": [3, 22, 45], "src": [3, 51], "concurr": [3, 15, 22, 57], "processpoolexecutor": [3, 22], "code_to_pretext_fil": [3, 31, 48], "_convert": 3, "hidden": [3, 45], "git": 3, "find_source_fil": [3, 45], "isdir": 3, "dirpath": 3, "_is_support": 3, "newer": [3, 45], "_is_up_to_d": 3, "getmtim": 3, "worker": [3, 22, 31, 45], "_worker_cach": 3, "_warm_lex": [], "pai": [3, 15], "_init_work": 3, "success": 3, "_convert_fil": 3, "perf_count": [3, 16], "narg": 3, "job": [3, 15, 22, 31, 45, 58], "cpu_count": [3, 22], "cpu": [3, 22, 31], "store_tru": 3, "store_fals": 3, "to_convert": 3, "flush": [3, 15, 16, 58], "_report": 3, "initarg": 3, "executor": [3, 15, 22, 57], "2f": 3, "1f": 3, "1000": [3, 27], "batchconvert": [30, 33, 44, 45, 51], "batchconvert_test": 30, "make_tre": 45, "nint": [45, 49], "write_text": [8, 45, 47, 48, 50, 51], "testbatchconvert": 45, "read_text": [27, 45, 46, 47, 48, 49, 50, 55], "a_rst": 45, "utim": 45, "is_dir": 45, "get_supported_glob": [3, 8, 22, 31, 33, 51, 58], "ipython": 9, "snapshot": [3, 9, 22, 23, 29, 31, 45, 51], "supportedglob": [9, 23, 51], "_snapshot_path": [9, 51], "use_snapshot": [3, 9, 22, 31, 45, 51], "_supported_glob": [9, 45, 51], "frozenset": [9, 51], "globs_for_languag": [9, 51], "_read_snapshot": [9, 51], "_globs_for_languag": [9, 51], "lazili": 9, "__getattr__": 9, "pygments_vers": [9, 51], "_write_snapshot": 9, "sort_kei": 9, "commentdelimiterinfo_test": 30, "ship": [3, 29, 31], "testsupportedglob": 51, "snapshot_path": 51, "globmatch": [3, 8, 22, 31, 33, 51, 58], "_supported_globs_match": 3, "purepath": [9, 51], "hundr": 9, "gz": [9, 51], "tar": [9, 51], "wildcard": 9, "_suffix": 9, "_name": 9, "name_regex": 9, "_path_pattern": 9, "insensit": 9, "platform": [9, 15], "normcas": 9, "_has_wildcard": 9, "_name_regex": 9, "4096": 9, "_match": 9, "matcher": [9, 51], "memoiz": [9, 16, 31, 51], "testglobmatch": 51, "am": 51, "bashrc": 51, "bash_profil": 51, "php5": 51, "xpm": 51, "quadrat": 14, "code_lin": 14, "next_lin": 14, "_lines_match": 14, "expected_lin": 14, "chain": 14, "comparison": 14, "mismatch": 14, "actual_lin": 14, "2000": 56, "etre": 14, "_html_prefix": 14, "_iter_html_tre": 14, "iter_html_to_cod": [14, 31, 53], "stai": 14, "html_file": 14, "binari": 14, "chunk_siz": [14, 53], "htmlpullpars": 14, "open_el": 14, "subtre": 14, "held": [6, 14], "held_el": 14, "finished_el": 14, "process_ev": 14, "read_ev": 14, "_free_html_el": 14, "_html_tail_tag": 14, "_html_start": 14, "_html_is_cont": 14, "_html_end": 14, "feed": [8, 14, 55], "descend": 14, "deepli": [14, 22, 53], "visit_children": 14, "keep_tail": 14, "getpar": 14, "getprevi": 14, "html_doc": 53, "lit": 53, "eral": 53, "chunk": [22, 47, 48, 50, 53], "bytesio": [53, 58], "deep": 53, "200": [27, 53], "_iter_markdown": 5, "_iter_pretext": 6, "truncat": 16, "_iter_rest": 7, "iter_rest": [31, 33, 50], "iter_markdown": [31, 33, 47], "iter_pretext": [31, 33, 48], "_file": 33, "nif": [47, 48, 50], "_xml_partial_opening_tag_search": 6, "_xml_closing_tag_search": 6, "lookahead": 6, "sink": 6, "hasn": 6, "last_str": 6, "last_output": 6, "gt": 48, "_html_set": [7, 26], "dependencylist": 7, "set_compon": 7, "standalon": 7, "get_set": 7, "rpc": [15, 31, 33], "socket": [15, 31, 57], "listen": 15, "unix": [15, 31, 57], "arriv": [3, 15], "to_rest": [15, 57], "to_markdown": [15, 57], "to_pretext": [15, 57], "to_html": [15, 57], "jsonrpc": [15, 57], "param": [15, 27, 57], "threadpoolexecutor": [15, 57], "socketserv": 15, "32700": 15, "invalid_request": [15, 57], "32600": 15, "method_not_found": [15, 57], "32601": 15, "invalid_param": [15, 57], "32602": 15, "conversion_error": [15, 57], "32000": 15, "_code_to_html": 15, "_method": 15, "_optional_param": 15, "notif": [15, 57], "handle_request": 15, "_error_respons": 15, "id_": [15, 57], "handle_lin": [15, 57], "reader": 15, "serve_stream": 15, "serial": 15, "write_lock": 15, "haven": 15, "pend": 15, "write_respons": 15, "submit": [3, 15], "add_done_callback": 15, "hasattr": [8, 15, 57], "threadingunixstreamserv": 15, "_unixserv": 15, "daemon_thread": 15, "socket_path": [15, 57], "super": [4, 15], "_connectionhandl": 15, "streamrequesthandl": 15, "textiowrapp": [15, 58], "rfile": 15, "wfile": 15, "serve_forev": [15, 57], "make_socket_serv": [15, 57], "s_issock": 15, "st_mode": 15, "filenotfounderror": 15, "_warm_up": 15, "keyboardinterrupt": 15, "server_clos": [15, 57], "persist": [30, 31, 33], "server_test": 30, "error_cod": 57, "to_noth": 57, "xxx": 57, "af_unix": 57, "temporarydirectori": 57, "temp_dir": 57, "sock": 57, "sendal": 57, "shutdown": [22, 57], "came": 22, "flatten_chapt": [22, 58], "_convert_chapt": [22, 58], "chunksiz": 22, "pickl": [8, 22, 49], "mdbook_codechat_test": 30, "parttitl": 58, "intro": 58, "xyz": 58, "deepcopi": [26, 58], "sent": 22, "_get_chapter_lex": 22, "contend": 22, "reconvert": 22, "cache_max_s": [22, 31], "scanstr": 22, "orjson": [22, 31, 58], "msgspec": [22, 31, 58], "_fast_dump": [22, 58], "_fast_load": [22, 58], "nearli": 22, "_whitespac": 22, "_scalar": 22, "ee": [4, 22], "null": 22, "_constant": 22, "_copy_s": 22, "idx": 22, "_expect": 22, "_skip": [13, 22], "_valu": 22, "book_start": 22, "book_end": 22, "_copi": 22, "compact": 22, "_object": 22, "_arrai": 22, "obj": 22, "content_span": 22, "input_": 22, "scanner": [16, 22, 30, 31, 46, 58], "bookscann": 58, "\u00e9": 58, "draft": 58, "5e3": 58, "ensure_ascii": 58, "fast": [8, 16, 26, 29, 30, 31, 33, 46, 49, 55, 58], "benchmark": [1, 31, 44], "regress": 26, "autosav": 26, "grew": 26, "importorskip": 26, "pytest_benchmark": 26, "noqa": 26, "e402": 26, "corpu": [26, 27], "_run_stag": 26, "session": [8, 26, 27], "test_get_lex": 26, "pedant": 26, "test_pygments_lex": 26, "pygments_lex": 26, "test_group_lexer_token": 26, "test_gather_groups_on_newlin": 26, "test_classify_group": 26, "test_generate_rest": 26, "test_publish_str": 26, "_c": 27, "func_": 27, "_python": 27, "_html": 27, "ul": 27, "li": 27, "_rust": 27, "fn": [4, 27, 46], "i32": 27, "mut": 27, "_comment_heavi": 27, "x_": 27, "_code_heavi": 27, "_synthet": 27, "comment_heavi": 27, "code_heavi": 27, "_root": 27, "_real": 27, "real_cpp": 27, "real_python": 27, "real_html": 27, "real_css": 27, "pipeline_test": 30, "pipelin": [30, 31], "conftest": 30, "corpora": [26, 30], "stage": [8, 16, 31, 33, 46, 50, 55], "synthet": 31, "_profile_output": [5, 6, 7, 16], "profile_env_var": [8, 16, 50], "collect_profil": [8, 31, 33, 46, 49, 50, 55], "_is_profil": 8, "nullcontext": 8, "_profil": [8, 16, 49], "codechat_profil": [8, 16, 29, 31, 33, 49], "purg": 8, "_env_purge_doc": [8, 49], "_env_merge_info": [8, 49], "other_profil": 8, "profile_summary_length": 8, "slowest": [8, 29], "spent": [8, 16, 31, 33], "_build_finish": [8, 49], "profile_path": 8, "doctreedir": [8, 49], "3f": 8, "contextmanag": 16, "contextvar": 16, "spend": 16, "wall": 16, "innermost": 16, "_profile_report": 16, "begun": 16, "deliv": 16, "_profiledstag": 16, "upstream_second": 16, "pull": 16, "_iter": 16, "_finish": 16, "__iter__": 16, "__next__": 16, "stopiter": 16, "_start_profil": 16, "_profile_stag": 16, "simplenamespac": 49, "summar": 49, "caplog": 49, "simul": 49, "at_level": 49, "approx": 50, "setenv": [46, 50], "ident": [4, 13], "_block_comment_ind": [], "slice": [], "typecod": [], "q": [], "_string": [], "_start": [], "_end": [], "_tail_start": [], "_tail_end": [], "__len__": [], "__getitem__": [], "tail_start": [], "tail_end": [], "_append": [], "adjac": [4, 13], "rewritten": [], "_classify_offset": [], "_gather_offsets_on_newlin": [], "_line_boundari": [], "x1c": [], "x1d": [], "x1e": [], "x85": [], "u2028": [], "u2029": [], "_non_spac": [], "line_end": [], "findit": [4, 13], "end_": [], "start_": [], "line_start": 13, "_is_rest_comment_offset": [], "first_start": [], "first_end": [], "_comment_delim_offset": [], "_isspace_offset": [], "_strip_offset": [], "_first_char_offset": [], "len_delim": [], "new_start": [], "compactclassifi": [], "compactclassifier_test": [], "compact_source_lex": [], "tpass": [], "compact_err": [], "compact_lin": [], "testcompactclassifi": [], "keywordcas": [46, 55], "upper": [46, 55], "randomli": [46, 55], "assembl": [46, 55], "rng": [46, 55], "randint": [46, 55], "_get_group_t": [11, 13, 16], "group_tabl": [11, 13, 16], "hierarchi": [16, 31], "distinct": 16, "_grouptabl": 16, "__missing__": 16, "_group_tabl": 16, "minifi": 27, "_minified_j": 27, "var": [4, 27, 46], "_minified_css": 27, "03x": 27, "px": 27, "700": 27, "minified_j": 27, "minified_css": 27, "lump": 4, "quirk": 4, "lifetim": 4, "cfamilyscanner_test": [4, 30], "fall": [4, 16, 46, 55], "_unsupport": 13, "groupbi": [4, 8, 13], "itemgett": [4, 13], "clexer": 4, "cpplexer": 4, "golex": 4, "javalex": 4, "javascriptlex": 4, "rustlex": 4, "typescriptlex": 4, "js_ident": 4, "_w": [4, 13], "_inlin": [4, 13], "_block": [4, 13], "_other": [4, 13], "reproduc": [4, 13], "_scanner": 4, "_append_cod": 4, "_ws_or_not": 4, "lastgroup": 4, "_space": 4, "c_cpp": 4, "cfamilylex": 4, "_c_ws1": 4, "_c_line_if0": 4, "_c_line_hash": 4, "1ur": 4, "_c_number": 4, "xx": 4, "ffll": 4, "bb": 4, "01": 4, "_hexpart": 4, "_decpart": 4, "_intsuffix": 4, "_c_ident": 4, "9a": 4, "fa": 4, "_c_token": 4, "f0": 4, "_c_word": 4, "_c_case": 4, "_cpp_namespac": 4, "namespac": [4, 46], "_c_label": 4, "protect": 4, "_c_case_end": 4, "_c_space_keyword": 4, "union": 4, "_cpp_space_keyword": 4, "typenam": 4, "_cpp_raw_prefix": 4, "lr": 4, "ur": 4, "u8r": [4, 46], "_cpp_raw": 4, "luu": 4, "u8": 4, "tri": 4, "_c_macro": 4, "_c_includ": 4, "_c_if0": 4, "el": 4, "se": 4, "_scan_c": 4, "depth": 4, "parenthes": 4, "after_paren": 4, "space_keyword": 4, "classnam": 4, "enumnam": 4, "_scan_c_if0": 4, "_scan_c_macro": 4, "is_nam": 4, "_c_paren": 4, "parenthesi": 4, "rfind": 4, "jvm": 4, "_java_id": 4, "_java_token": 4, "text_block": 4, "9_": 4, "ffdd": 4, "f_": 4, "01_": 4, "7_": 4, "_java_keyword": 4, "goto": 4, "instanceof": 4, "throw": 4, "declar": 4, "_java_method": 4, "_java_record": 4, "strictfp": 4, "_java_label": 4, "_java_st": 4, "_java_state_keyword": 4, "_scan_java": 4, "_scan_java_st": 4, "_append_java_method": 4, "is_class": 4, "_js_comment": 4, "_js_regex_st": 4, "gimuysd": 4, "bad_regex": 4, "_js_root": 4, "oo": 4, "reserv": 4, "constructor": 4, "await": 4, "async": [4, 55], "export": 4, "debugg": 4, "const": [4, 46], "za": 4, "z_": 4, "_js_token": 4, "_ts_token": 4, "ts_keyword": 4, "readonli": 4, "ts_type": 4, "ts_modul": 4, "ts_annot": 4, "ts_decor": 4, "_js_action": 4, "_js_line_start": 4, "_js_hashbang": 4, "interpol": 4, "_js_templat": 4, "_js_template_st": 4, "_js_interpolation_st": 4, "_scan_j": 4, "token_r": 4, "expression_": 4, "_go_token": 4, "abfnrtv": 4, "_go_group": 4, "_scan_go": 4, "_rust_token": 4, "doc_block": 4, "macro": [4, 46], "macro_paramet": 4, "type_path": 4, "name_keyword": 4, "mod": 4, "type_keyword": 4, "nrt": 4, "0b": 4, "0o": 4, "ui": 4, "64": 4, "_rust_shebang": 4, "_rust_com": 4, "_rust_str": 4, "_rust_attribut": 4, "_rust_lifetim": 4, "_rust_typenam": 4, "builtin_funcs_typ": 4, "keyword_typ": 4, "_scan_rust": 4, "_rust_comment_end": 4, "_scan_rust_typenam": 4, "_scan_rust_attribut": 4, "deriv": [4, 46], "bracket": 4, "use_engin": [8, 31, 33, 46, 49], "codechat_engin": [8, 16, 29, 31, 33], "_fast_lex": [16, 26, 46, 55], "cfamilyscann": [13, 16, 30, 46], "consult": 16, "engine_env_var": [16, 46], "_engin": 16, "_check_engin": 16, "_get_engin": 16, "scan_c_famili": [16, 46], "test_fast_lex": 26, "argc": 46, "printf": 46, "usr": [46, 55], "bin": [46, 55], "divis": 46, "fast_err": [46, 55], "fast_lin": [46, 55], "testcfamilyscann": 46, "nlabel": 46, "u1234": 46, "300": [46, 55], "setup_second": 16, "As": 13, "elsewher": 13, "soft": 13, "_scan_python": 13, "tokenerror": 13, "text_": [], "_newlin": 13, "tok_typ": 13, "col": 13, "end_row": 13, "end_col": 13, "generate_token": 13, "_hashbang": 13, "_string_start": 13, "_doc_prefix": 13, "doc_start": 13, "_append_pyg": 13, "_fstring_start": 13, "_code": 13, "soft_keyword_end": 13, "_soft_keyword_end": 13, "_soft_keyword": 13, "_soft_keyword_inn": 13, "_lex_pyg": 13, "earli": 13, "unmatch": 13, "rruubb": 13, "inner": 13, "nl": 13, "endmark": 13, "op": 13, "fstring_start": 13, "pythonscann": [16, 30, 55], "scan_python": [16, 55], "pythonscanner_test": 30, "testpythonscann": 55, "python2": 55, "rb": 55, "rf": 55, "a_": 55, "t2": 55, "string_to_tokentyp": [], "texescap": 8, "collect_token": [8, 31, 33, 49], "_doctree_read": [8, 16, 49], "temp_data": [8, 49], "codechat_token": [8, 49], "block_token": 8, "_fenced_code_token": 8, "travers": 8, "v0": 8, "rawsourc": [8, 49], "codechat_lex": [], "token_lin": 8, "is_cod": 8, "_fenced_code_block": 8, "content_token": 8, "line_token": 8, "newline_tokentyp": 8, "vertic": 8, "rest_lin": 8, "_rst_whitespac": 8, "rstrip": 8, "_padding_tokentyp": 8, "code_index": 8, "region": 8, "padding_offset": 8, "pygmentsbridg": [8, 49], "_highlight_block": [8, 49], "_saved_token": [8, 49], "_sphinx_highlight_block": [8, 49], "get_formatt": 8, "hlsourc": 8, "memo": 8, "hlescap": 8, "latex_engin": 8, "retri": 8, "relax": 8, "fill": [10, 16], "proce": 16, "_token_list": 16, "_append_each": 16, "publish_doctre": 49, "latex": 49, "bridg": 49, "fast_engine_pygments_vers": [4, 13, 16, 46, 55], "minor": 16, "_fast_scann": [16, 46, 55], "_pygments_vers": 16, "fast_stag": [46, 55], "setitem": [46, 49, 55], "get_all_lexers_with_plugin": 51, "add_lex": [8, 49], "_sphinx_lexer_class": 8, "textlex": 49, "custom_html": 49, "last_used_interv": [10, 52], "minut": 10, "default_last_used_interv": 10, "fraction": 10, "room": 10, "_evict_fract": 10, "ago": 10, "_size": [10, 52], "set_trace_callback": 52, "as_complet": 3, "_write_fil": [5, 6, 7, 16], "codechat_use_snapshot": [8, 29, 31, 33], "temp_path": 16, "tmp": 16, "get_id": 16, "baseexcept": 16, "u00e9": 50, "ascii": 50, "iterdir": 50, "_is_highlight_block_patch": 8, "_saved_block_token": [8, 49], "highlight_block_sphinx_vers": 8, "_lexer_filenam": [3, 45], "lexer_filenam": 3, "spawn": 3, "maco": 3, "convert_chapt": 58, "python_docstr": [13, 16, 55], "_is_python": 16}, "objects": {}, "objtypes": {}, "objnames": {}, "titleterms": {"flake8": 0, "configur": [0, 2, 25, 28, 29, 41, 43], "travi": 2, "yml": [2, 25, 42], "ci": [2, 25], "codetomarkdown": 5, "py": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 17, 20, 22, 26, 27, 29, 37, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "modul": [5, 6, 7, 14, 16], "translat": [5, 6, 7, 8, 14, 49], "sourc": [3, 5, 6, 7, 8, 10, 11, 12, 14, 16, 23, 34, 49], "code": [5, 6, 7, 8, 10, 11, 12, 14, 16, 22, 30, 34, 44, 49, 50], "markdown": [5, 36], "content": [3, 4, 5, 6, 8, 10, 11, 15, 16, 37, 39], "import": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "standard": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 16, 22], "librari": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 57, 58], "third": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "parti": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "local": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "applic": [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 14, 15, 16, 22, 26, 27, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "api": [5, 6, 7, 33], "code_to_markdown_str": 5, "code_to_markdown_fil": 5, "convert": [3, 5, 6, 7, 10, 14], "classifi": [5, 6, 7, 11, 50], "_generate_markdown": 5, "_exit_st": [5, 6, 7], "codetopretext": 6, "pretext": [6, 48], "code_to_pretext_str": 6, "code_to_pretext_fil": 6, "_generate_pretext": 6, "codetorest": 7, "rest": [7, 8, 14, 37, 49, 50], "code_to_rest_str": 7, "code_to_rest_fil": 7, "code_to_html_str": 7, "code_to_html_fil": [7, 50], "style": [7, 16, 18, 19, 21, 30, 35, 36, 37], "approach": 7, "preserv": [7, 50], "indent": [7, 16, 35, 37, 50], "mix": 7, "comment": [7, 9, 16, 50], "summari": 7, "implement": [7, 16], "_generate_rest": 7, "support": [7, 9, 10, 11, 14, 16, 38], "direct": [7, 37], "role": 7, "_fencedcodeblock": 7, "_setlin": 7, "_docname_rol": 7, "add_highlight_languag": 7, "_codeinclud": 7, "codetorestsphinx": [8, 49], "sphinx": [8, 29, 33, 39, 49], "extens": [8, 9, 49], "util": 8, "exclude_small_fil": 8, "read": [8, 22], "event": 8, "monkeypatch": [8, 16], "path2doc": 8, "patch": 8, "doc2path": 8, "get_filetyp": 8, "correct": [8, 35], "name": 8, "show": 8, "option": [8, 29, 37], "setup": [8, 23, 43, 44], "commentdelimiterinfo": 9, "info": 9, "delimit": [9, 50], "mani": [3, 9], "languag": [4, 9, 50], "These": [9, 12], "have": [9, 12], "unit": [9, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "test": [9, 30, 37, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58], "which": 9, "pass": 9, "lack": 9, "fail": 9, "gnu": 12, "gener": [12, 29, 30, 50], "public": 12, "licens": [12, 40], "preambl": 12, "term": 12, "AND": 12, "condit": 12, "0": 12, "definit": [12, 16, 37], "1": [12, 16], "2": [12, 16], "basic": [12, 39], "permiss": 12, "3": [12, 16], "protect": 12, "user": [12, 40], "legal": 12, "right": 12, "from": 12, "anti": 12, "circumvent": 12, "law": 12, "4": [12, 16], "convei": 12, "verbatim": 12, "copi": [12, 44], "5": 12, "modifi": 12, "version": 12, "6": 12, "non": [12, 23], "form": 12, "7": 12, "addit": [12, 43], "8": 12, "termin": 12, "9": 12, "accept": 12, "Not": 12, "requir": 12, "10": 12, "automat": 12, "downstream": 12, "recipi": 12, "11": 12, "patent": 12, "12": 12, "No": 12, "surrend": 12, "other": [12, 50], "freedom": 12, "13": 12, "us": [12, 36], "affero": 12, "14": 12, "revis": 12, "thi": 12, "15": 12, "disclaim": 12, "warranti": 12, "16": 12, "limit": 12, "liabil": 12, "17": 12, "interpret": 12, "section": [12, 34, 37], "how": 12, "appli": 12, "your": 12, "new": [12, 39], "program": 12, "resttocod": 14, "function": 14, "core": [14, 30], "sourceclassifi": 16, "lex": [11, 16], "routin": [10, 11, 16], "get_lex": 16, "codechat": [16, 17, 18, 19, 20, 22, 24, 28, 29, 35, 36, 37, 39, 40, 44], "step": 16, "source_lex": 16, "pygment": 16, "block": [16, 34, 37, 50], "process": 16, "__init__": [17, 20], "packag": [17, 23, 30, 43, 44], "css": [18, 19, 20, 21], "sheet": [18, 19, 21, 30], "document": [18, 29, 30, 40], "codechat_sphinx_rtd_them": 19, "readthedoc": [19, 42], "theme": 19, "data": 20, "file": [3, 20, 23, 42], "docutil": [21, 33], "mdbook_codechat": 22, "A": [4, 13, 15, 22, 37], "preprocessor": 22, "mdbook": 22, "main": 22, "manifest": 23, "includ": 23, "background": [24, 40], "get": 24, "start": 24, "appveyor": 25, "codechat_config": 28, "yaml": 28, "project": [28, 29, 39], "conf": 29, "": [11, 29], "inform": 29, "html": [14, 29], "output": 29, "intersphinx": 29, "graphviz": 29, "develop": [30, 40], "idea": [30, 31], "todo": 30, "item": 30, "histori": 31, "chang": 31, "futur": 31, "instal": [32, 44], "instruct": 32, "refer": [33, 39], "manual": 33, "syntax": [33, 35, 36, 50], "javascript": [4, 33], "restructuredtext": [34, 35, 39], "primer": 34, "inlin": 34, "markup": [10, 34, 35], "list": [34, 37], "quot": 34, "like": [34, 50], "tabl": [34, 37], "hyperlink": 34, "imag": 34, "gotcha": 34, "style_guid": [35, 36], "cpp": [35, 36], "recommend": [35, 36], "guidelin": 35, "head": 35, "bad": 35, "anoth": 35, "an": [10, 35, 37], "unind": 35, "md": 36, "advic": 36, "style_test": 37, "docstr": [37, 50], "all": 37, "type": 37, "back": 37, "transit": 37, "paragraph": 37, "bullet": 37, "field": 37, "liter": 37, "line": [3, 10, 15, 37, 50], "doctest": 37, "admonit": 37, "attent": 37, "nest": 37, "bodi": 37, "element": 37, "literatur": 38, "paper": 38, "poster": 38, "tutori": 39, "creat": 39, "exampl": 40, "help": 40, "search": 40, "acknowledg": 40, "pyproject": 41, "toml": 41, "black": 41, "pytest": 41, "config": 42, "cfg": 43, "note": 44, "To": 44, "script": 44, "pypa": 44, "my": 44, "codetomarkdown_test": 47, "codetopretext_test": 48, "global": 48, "codetorestsphinx_test": 49, "codetorest_test": 50, "c": [4, 50], "remov": 50, "space": 50, "fenc": 50, "check": 50, "newlin": 50, "without": 50, "highlight": [8, 50], "poor": 50, "coverag": 50, "lexer_to_cod": 50, "subroutin": 50, "remove_comment_char": 50, "_is_space_indented_lin": 50, "_is_rest_com": 50, "htmltocode_test": 53, "resttocode_test": 56, "lexer": [16, 50], "cach": [10, 16, 50], "lexer_cache_info": 16, "clear_lexer_cach": 16, "filenam": [16, 50], "index": [16, 50], "set": 50, "incrementalclassifi": 11, "increment": 11, "being": 11, "edit": 11, "segment": 11, "state": 11, "incrementalclassifier_test": 54, "conversioncach": 10, "disk": 10, "command": [3, 10, 15], "interfac": [3, 10, 15], "conversioncache_test": 52, "batchconvert": 3, "parallel": 3, "find": 3, "batchconvert_test": 45, "get_supported_glob": 9, "commentdelimiterinfo_test": 51, "globmatch": 9, "iter_markdown": 5, "iter_pretext": 6, "iter_rest": 7, "stream": 50, "server": 15, "persist": 15, "convers": [15, 26], "protocol": 15, "handl": 15, "request": 15, "serv": 15, "client": 15, "server_test": 57, "mdbook_codechat_test": 58, "write": 22, "book": 22, "bookscann": 22, "pipeline_test": 26, "benchmark": [26, 27, 30], "pipelin": 26, "stage": 26, "conftest": 27, "corpora": 27, "synthet": 27, "real": 27, "fixtur": 27, "profil": [8, 16, 50], "collect_profil": 16, "compactclassifi": [], "compact": [], "offset": [], "base": [], "classif": [], "classifiedlin": [], "compact_source_lex": [], "gather": [], "compactclassifier_test": [], "cfamilyscann": 4, "fast": [4, 13], "scanner": [4, 13], "famili": 4, "scan": [4, 13], "scan_c_famili": 4, "java": 4, "typescript": 4, "go": 4, "rust": 4, "engin": 16, "use_engin": 16, "cfamilyscanner_test": 46, "_unsupport": 4, "pythonscann": 13, "python": 13, "scan_python": 13, "pythonscanner_test": 55, "highlight_block": 8, "token": 16, "collect": 16, "collect_token": 16}, "envversion": {"sphinx.domains.c": 3, "sphinx.domains.changeset": 1, "sphinx.domains.citation": 1, "sphinx.domains.cpp": 9, "sphinx.domains.index": 1, "sphinx.domains.javascript": 3, "sphinx.domains.math": 2, "sphinx.domains.python": 4, "sphinx.domains.rst": 2, "sphinx.domains.std": 2, "sphinx.ext.intersphinx": 1, "sphinx": 60}, "alltitles": {".flake8 - Flake8 configuration": [[0, "docname-flake8-configuration"]], ".travis.yml - Travis CI configuration": [[2, "docname-travis-ci-configuration"]], "BatchConvert.py - Convert many source files in parallel": [[3, "docname-convert-many-source-files-in-parallel"]], "Contents": [[3, "contents"], [4, "contents"], [5, "contents"], [6, "contents"], [8, "contents"], [10, "contents"], [11, "contents"], [15, "contents"], [16, "contents"], [39, "contents"]], "Imports": [[3, "imports"], [4, "imports"], [5, "imports"], [6, "imports"], [7, "imports"], [8, "imports"], [9, "imports"], [10, "imports"], [11, "imports"], [13, "imports"], [14, "imports"], [15, "imports"], [16, "imports"], [22, "imports"], [26, "imports"], [27, "imports"], [45, "imports"], [46, "imports"], [47, "imports"], [48, "imports"], [49, "imports"], [50, "imports"], [51, "imports"], [52, "imports"], [53, "imports"], [54, "imports"], [55, "imports"], [56, "imports"], [57, "imports"], [58, "imports"]], "Standard library": [[3, "standard-library"], [4, "standard-library"], [5, "standard-library"], [6, "standard-library"], [7, "standard-library"], [8, "standard-library"], [9, "standard-library"], [10, "standard-library"], [11, "standard-library"], [13, "standard-library"], [15, "standard-library"], [16, "standard-library"], [22, "standard-library"]], "Third-party imports": [[3, "third-party-imports"], [4, "third-party-imports"], [5, "third-party-imports"], [6, "third-party-imports"], [7, "third-party-imports"], [8, "third-party-imports"], [9, "third-party-imports"], [10, "third-party-imports"], [11, "third-party-imports"], [13, "third-party-imports"], [14, "third-party-imports"], [15, "third-party-imports"], [16, "third-party-imports"], [22, "third-party-imports"], [26, "third-party-imports"], [27, "third-party-imports"], [45, "third-party-imports"], [46, "third-party-imports"], [47, "third-party-imports"], [48, "third-party-imports"], [49, "third-party-imports"], [50, "third-party-imports"], [51, "third-party-imports"], [52, "third-party-imports"], [53, "third-party-imports"], [54, "third-party-imports"], [55, "third-party-imports"], [56, "third-party-imports"], [57, "third-party-imports"], [58, "third-party-imports"]], "Local application imports": [[3, "local-application-imports"], [4, "local-application-imports"], [5, "local-application-imports"], [6, "local-application-imports"], [7, "local-application-imports"], [8, "local-application-imports"], [9, "local-application-imports"], [10, "local-application-imports"], [11, "local-application-imports"], [13, "local-application-imports"], [14, "local-application-imports"], [15, "local-application-imports"], [16, "local-application-imports"], [22, "local-application-imports"], [26, "local-application-imports"], [27, "local-application-imports"], [45, "local-application-imports"], [46, "local-application-imports"], [47, "local-application-imports"], [48, "local-application-imports"], [49, "local-application-imports"], [50, "local-application-imports"], [51, "local-application-imports"], [52, "local-application-imports"], [53, "local-application-imports"], [54, "local-application-imports"], [55, "local-application-imports"], [56, "local-application-imports"], [57, "local-application-imports"], [58, "local-application-imports"]], "Finding source files": [[3, "finding-source-files"]], "Converting files": [[3, "converting-files"]], "Command-line interface": [[3, "command-line-interface"], [10, "command-line-interface"], [15, "command-line-interface"]], "CFamilyScanner.py - A fast scanner for C-family languages": [[4, "docname-a-fast-scanner-for-c-family-languages"]], "Scanning": [[4, "scanning"], [13, "scanning"]], "scan_c_family": [[4, "scan-c-family"]], "_Unsupported": [[4, "unsupported"]], "C and C++": [[4, "c-and-c"]], "Java": [[4, "java"]], "JavaScript and TypeScript": [[4, "javascript-and-typescript"]], "Go": [[4, "go"]], "Rust": [[4, "rust"]], "CodeToMarkdown.py - a module to translate source code to Markdown": [[5, "docname-a-module-to-translate-source-code-to-markdown"]], "API": [[5, "api"], [6, "api"], [7, "api"], [33, "api"]], "code_to_markdown_string": [[5, "code-to-markdown-string"]], "iter_markdown": [[5, "iter-markdown"]], "code_to_markdown_file": [[5, "code-to-markdown-file"]], "Converting classified code to markdown": [[5, "converting-classified-code-to-markdown"]], "_generate_markdown": [[5, "generate-markdown"]], "_exit_state": [[5, "exit-state"], [6, "exit-state"], [7, "exit-state"]], "CodeToPretext.py - a module to translate source code to PreTeXt": [[6, "docname-a-module-to-translate-source-code-to-pretext"]], "code_to_pretext_string": [[6, "code-to-pretext-string"]], "iter_pretext": [[6, "iter-pretext"]], "code_to_pretext_file": [[6, "code-to-pretext-file"]], "Converting classified code to PreTeXt": [[6, "converting-classified-code-to-pretext"]], "_generate_pretext": [[6, "generate-pretext"]], "CodeToRest.py - a module to translate source code to reST": [[7, "docname-a-module-to-translate-source-code-to-rest"]], "code_to_rest_string": [[7, "code-to-rest-string"]], "iter_rest": [[7, "iter-rest"]], "code_to_rest_file": [[7, "code-to-rest-file"]], "code_to_html_string": [[7, "code-to-html-string"]], "code_to_html_file": [[7, "code-to-html-file"]], "Styling": [[7, "styling"]], "Converting classified code to reST": [[7, "converting-classified-code-to-rest"]], "Approach": [[7, "approach"]], "Preserving indentation": [[7, "preserving-indentation"]], "Mixed code and comments": [[7, "mixed-code-and-comments"]], "Summary and implementation": [[7, "summary-and-implementation"]], "_generate_rest": [[7, "generate-rest"]], "Supporting reST directives and roles": [[7, "supporting-rest-directives-and-roles"]], "_FencedCodeBlock": [[7, "fencedcodeblock"]], "_SetLine": [[7, "setline"]], "_docname_role": [[7, "docname-role"]], "add_highlight_language": [[7, "add-highlight-language"]], "_CodeInclude": [[7, "codeinclude"]], "CodeToRestSphinx.py - a Sphinx extension to translate source code to reST": [[8, "docname-a-sphinx-extension-to-translate-source-code-to-rest"]], "Utility": [[8, "utility"]], "exclude_small_files": [[8, "exclude-small-files"]], "source-read event": [[8, "source-read-event"]], "Highlighting": [[8, "highlighting"]], "Profiling": [[8, "profiling"], [16, "profiling"]], "Monkeypatch": [[8, "monkeypatch"]], "path2doc patch": [[8, "path2doc-patch"]], "doc2path patch": [[8, "doc2path-patch"]], "get_filetype patch": [[8, "get-filetype-patch"]], "highlight_block patch": [[8, "highlight-block-patch"]], "Correct naming for the \u201cshow source\u201d option": [[8, "correct-naming-for-the-show-source-option"]], "Extension setup": [[8, "extension-setup"]], "CommentDelimiterInfo.py - Info on comment delimiters for many languages": [[9, "docname-info-on-comment-delimiters-for-many-languages"]], "Supported languages": [[9, "supported-languages"]], "These languages have unit tests which pass": [[9, "these-languages-have-unit-tests-which-pass"]], "These languages lack unit tests": [[9, "these-languages-lack-unit-tests"]], "These languages have failing unit tests": [[9, "these-languages-have-failing-unit-tests"]], "Supported extensions": [[9, "supported-extensions"]], "get_supported_globs": [[9, "get-supported-globs"]], "GlobMatcher": [[9, "globmatcher"]], "ConversionCache.py - An on-disk cache of source code converted to markup": [[10, "docname-an-on-disk-cache-of-source-code-converted-to-markup"]], "Cache": [[10, "cache"]], "ConversionCache": [[10, "conversioncache"]], "Supporting routines": [[10, "supporting-routines"], [11, "supporting-routines"], [16, "supporting-routines"], [16, "id13"]], "IncrementalClassifier.py - Incrementally classify source code as it\u2019s being edited": [[11, "docname-incrementally-classify-source-code-as-it-s-being-edited"]], "Segments": [[11, "segments"]], "IncrementalClassifier": [[11, "incrementalclassifier"]], "Lexing with states": [[11, "lexing-with-states"]], "GNU General Public License": [[12, "gnu-general-public-license"]], "Preamble": [[12, "preamble"]], "TERMS AND CONDITIONS": [[12, "terms-and-conditions"]], "0. Definitions": [[12, "definitions"]], "1. Source Code": [[12, "source-code"]], "2. Basic Permissions": [[12, "basic-permissions"]], "3. Protecting Users\u2019 Legal Rights From Anti-Circumvention Law": [[12, "protecting-users-legal-rights-from-anti-circumvention-law"]], "4. Conveying Verbatim Copies": [[12, "conveying-verbatim-copies"]], "5. Conveying Modified Source Versions": [[12, "conveying-modified-source-versions"]], "6. Conveying Non-Source Forms": [[12, "conveying-non-source-forms"]], "7. Additional Terms": [[12, "additional-terms"]], "8. Termination": [[12, "termination"]], "9. Acceptance Not Required for Having Copies": [[12, "acceptance-not-required-for-having-copies"]], "10. Automatic Licensing of Downstream Recipients": [[12, "automatic-licensing-of-downstream-recipients"]], "11. Patents": [[12, "patents"]], "12. No Surrender of Others\u2019 Freedom": [[12, "no-surrender-of-others-freedom"]], "13. Use with the GNU Affero General Public License": [[12, "use-with-the-gnu-affero-general-public-license"]], "14. Revised Versions of this License": [[12, "revised-versions-of-this-license"]], "15. Disclaimer of Warranty": [[12, "disclaimer-of-warranty"]], "16. Limitation of Liability": [[12, "limitation-of-liability"]], "17. Interpretation of Sections 15 and 16": [[12, "interpretation-of-sections-15-and-16"]], "How to Apply These Terms to Your New Programs": [[12, "how-to-apply-these-terms-to-your-new-programs"]], "PythonScanner.py - A fast scanner for Python": [[13, "docname-a-fast-scanner-for-python"]], "scan_python": [[13, "scan-python"]], "RestToCode.py - a module to translate reST to source code": [[14, "docname-a-module-to-translate-rest-to-source-code"]], "Supporting Functions": [[14, "supporting-functions"]], "Core Functions": [[14, "core-functions"]], "Supporting functions for converting HTML": [[14, "supporting-functions-for-converting-html"]], "Server.py - A persistent conversion server": [[15, "docname-a-persistent-conversion-server"]], "Protocol": [[15, "protocol"]], "Handling requests": [[15, "handling-requests"]], "Serving clients": [[15, "serving-clients"]], "SourceClassifier.py - a module to lex source code": [[16, "docname-a-module-to-lex-source-code"]], "get_lexer": [[16, "get-lexer"]], "Lexer cache": [[16, "lexer-cache"]], "lexer_cache_info": [[16, "lexer-cache-info"]], "clear_lexer_cache": [[16, "clear-lexer-cache"]], "Filename index": [[16, "filename-index"]], "collect_profiles": [[16, "collect-profiles"]], "Engines": [[16, "engines"]], "use_engine": [[16, "use-engine"]], "Token collection": [[16, "token-collection"]], "collect_tokens": [[16, "collect-tokens"]], "Implementation": [[16, "implementation"]], "CodeChat style": [[16, "codechat-style"]], "Step 1 of source_lexer": [[16, "step-1-of-source-lexer"]], "Pygments monkeypatching": [[16, "pygments-monkeypatching"]], "Step 2 of source_lexer": [[16, "step-2-of-source-lexer"]], "Supporting routines and definitions": [[16, "supporting-routines-and-definitions"]], "Step #3 of source_lexer": [[16, "step-3-of-source-lexer"]], "Block comment indentation processing": [[16, "block-comment-indentation-processing"]], "Step #4 of source_lexer": [[16, "step-4-of-source-lexer"]], "__init__.py - CodeChat Package": [[17, "docname-codechat-package"]], "CodeChat.css - Style sheet for CodeChat documents": [[18, "docname-style-sheet-for-codechat-documents"]], "CodeChat_sphinx_rtd_theme.css - Style sheet for CodeChat with the ReadTheDocs theme": [[19, "docname-style-sheet-for-codechat-with-the-readthedocs-theme"]], "__init__.py - CodeChat CSS data files": [[20, "docname-codechat-css-data-files"]], "docutils.css - Style sheet for docutils": [[21, "docname-style-sheet-for-docutils"]], "mdbook_CodeChat.py - A CodeChat preprocessor for mdbook": [[22, "docname-a-codechat-preprocessor-for-mdbook"]], "Code": [[22, "code"]], "Reading and writing the book": [[22, "reading-and-writing-the-book"]], "BookScanner": [[22, "bookscanner"]], "main": [[22, "main"]], "MANIFEST.in - Non-source files to include in setup package": [[23, "docname-non-source-files-to-include-in-setup-package"]], "CodeChat": [[24, "codechat"], [40, "codechat"]], "Background": [[24, "background"], [40, "background"]], "Getting started": [[24, "getting-started"]], "appveyor.yml - Appveyor CI configuration": [[25, "docname-appveyor-ci-configuration"]], "Pipeline_test.py - Benchmarks for the conversion pipeline": [[26, "docname-benchmarks-for-the-conversion-pipeline"]], "Library imports": [[26, "library-imports"], [27, "library-imports"], [45, "library-imports"], [46, "library-imports"], [47, "library-imports"], [48, "library-imports"], [49, "library-imports"], [50, "library-imports"], [51, "library-imports"], [52, "library-imports"], [53, "library-imports"], [54, "library-imports"], [55, "library-imports"], [57, "library-imports"], [58, "library-imports"]], "Stages": [[26, "stages"]], "conftest.py - Corpora for benchmarks": [[27, "docname-corpora-for-benchmarks"]], "Synthetic corpora": [[27, "synthetic-corpora"]], "Real corpora": [[27, "real-corpora"]], "Fixtures": [[27, "fixtures"]], "codechat_config.yaml - Configuration for a CodeChat project": [[28, "docname-configuration-for-a-codechat-project"]], "conf.py - Sphinx configuration for generating CodeChat\u2019s documentation": [[29, "docname-sphinx-configuration-for-generating-codechat-s-documentation"]], "Project information": [[29, "id1"]], "General configuration": [[29, "id2"]], "Options for HTML output": [[29, "id3"]], "Intersphinx": [[29, "intersphinx"]], "Options for Graphviz output": [[29, "options-for-graphviz-output"]], "Developer documentation": [[30, "developer-documentation"], [40, "developer-documentation"]], "Core code": [[30, "core-code"]], "Style sheets": [[30, "style-sheets"]], "Testing": [[30, "testing"]], "Benchmarks": [[30, "benchmarks"]], "Documentation generation": [[30, "documentation-generation"]], "Packaging": [[30, "packaging"]], "Ideas / todo items": [[30, "ideas-todo-items"]], "History of changes": [[31, "history-of-changes"]], "Ideas for the future": [[31, "ideas-for-the-future"]], "Installation instructions": [[32, "installation-instructions"]], "Reference manual": [[33, "reference-manual"]], "Syntax": [[33, "syntax"], [35, "syntax"], [36, "syntax"]], "Docutils": [[33, "docutils"]], "JavaScript": [[33, "javascript"]], "Sphinx": [[33, "sphinx"], [39, "sphinx"]], "reStructuredText Primer": [[34, "restructuredtext-primer"]], "Inline markup": [[34, "inline-markup"]], "Lists and Quote-like blocks": [[34, "lists-and-quote-like-blocks"]], "Source Code": [[34, "source-code"]], "Tables": [[34, "tables"], [37, "tables"]], "Hyperlinks": [[34, "hyperlinks"]], "Sections": [[34, "sections"], [37, "sections"], [37, "id1"]], "Images": [[34, "images"]], "Gotchas": [[34, "gotchas"]], "style_guide.cpp - Style recommendations for CodeChat with reStructuredText markup": [[35, "docname-style-recommendations-for-codechat-with-restructuredtext-markup"]], "Guidelines": [[35, "guidelines"]], "Indented heading \u2013 bad": [[35, "indented-heading-bad"]], "Another indented heading \u2013 bad": [[35, "another-indented-heading-bad"]], "An unindented heading \u2013 correct": [[35, "an-unindented-heading-correct"]], "style_guide.md.cpp - Style recommendations for CodeChat using Markdown": [[36, "style-guide-md-cpp-style-recommendations-for-codechat-using-markdown"]], "Use": [[36, "use"]], "Advice": [[36, "advice"]], "style_test.py - Styling tests for CodeChat": [[37, "docname-styling-tests-for-codechat"]], "Docstrings": [[37, "docstrings"]], "All reST types": [[37, "all-rest-types"]], "and back": [[37, "and-back"], [37, "id2"]], "Transitions": [[37, "transitions"]], "Paragraphs": [[37, "paragraphs"]], "Bulleted lists": [[37, "bulleted-lists"]], "Definition lists": [[37, "definition-lists"]], "Field lists": [[37, "field-lists"]], "Option lists": [[37, "option-lists"]], "Literal blocks": [[37, "literal-blocks"]], "Line blocks": [[37, "line-blocks"]], "Doctest blocks": [[37, "doctest-blocks"]], "Directives": [[37, "directives"]], "Admonitions": [[37, "id3"]], "Attention": [[37, "attention"]], "contents": [[37, "contents"]], "A table of contents": [[37, "a-table-of-contents"], [37, "id5"]], "and back.": [[37, "id4"], [37, "id6"], [37, "id7"], [37, "id9"]], "An indented table of contents": [[37, "an-indented-table-of-contents"], [37, "id8"]], "Nested body elements": [[37, "nested-body-elements"]], "Supporting literature": [[38, "supporting-literature"]], "Papers": [[38, "papers"]], "Posters": [[38, "posters"]], "Tutorial": [[39, "tutorial"]], "Basic restructuredText": [[39, "basic-restructuredtext"]], "Basic CodeChat": [[39, "basic-codechat"]], "Creating a new Sphinx project": [[39, "creating-a-new-sphinx-project"]], "Reference": [[39, "reference"]], "Examples": [[40, "examples"]], "User documentation": [[40, "user-documentation"]], "Help": [[40, "help"]], "License": [[40, "license"]], "Search": [[40, "search"]], "Acknowledgements": [[40, "acknowledgements"]], "pyproject.toml - Configuration for black and pytest": [[41, "docname-configuration-for-black-and-pytest"]], "readthedocs.yml - ReadTheDocs config file": [[42, "docname-readthedocs-config-file"]], "setup.cfg - Additional configuration for packaging": [[43, "docname-additional-configuration-for-packaging"]], "setup.py - Package and install CodeChat": [[44, "docname-package-and-install-codechat"]], "Packaging notes": [[44, "packaging-notes"]], "To package": [[44, "to-package"]], "Packaging script": [[44, "packaging-script"]], "PyPA copied code": [[44, "pypa-copied-code"]], "My code": [[44, "my-code"]], "BatchConvert_test.py - Unit testing": [[45, "docname-unit-testing"]], "CFamilyScanner_test.py - Unit testing": [[46, "docname-unit-testing"]], "CodeToMarkdown_test.py - Unit testing": [[47, "docname-unit-testing"]], "CodeToPretext_test.py - Unit tests for PreTeXt": [[48, "docname-unit-tests-for-pretext"]], "Globals": [[48, "globals"]], "Tests": [[48, "tests"], [49, "tests"]], "CodeToRestSphinx_test.py - Unit testing for CodeToRestSphinx.py - a Sphinx extension to translate source code to reST": [[49, "docname-unit-testing-for-codechat-codetorestsphinx-py"]], "CodeToRest_test.py - Unit testing": [[50, "docname-unit-testing"]], "C-like language tests": [[50, "c-like-language-tests"]], "Block comment indent removal: indents with spaces": [[50, "block-comment-indent-removal-indents-with-spaces"]], "Block comment indent removal: indents with delimiters": [[50, "block-comment-indent-removal-indents-with-delimiters"]], "Other block comment testing": [[50, "other-block-comment-testing"]], "Other languages": [[50, "other-languages"]], "DocString Testing": [[50, "docstring-testing"]], "Fenced code block testing": [[50, "fenced-code-block-testing"]], "Check newline preservation without syntax highlighting": [[50, "check-newline-preservation-without-syntax-highlighting"]], "Check newline preservation with syntax highlighting": [[50, "check-newline-preservation-with-syntax-highlighting"]], "Poor coverage of code_to_html_file": [[50, "poor-coverage-of-code-to-html-file"]], "Tests of lexer_to_code and subroutines": [[50, "tests-of-lexer-to-code-and-subroutines"]], "remove_comment_chars tests": [[50, "remove-comment-chars-tests"]], "_is_space_indented_line tests": [[50, "is-space-indented-line-tests"]], "_is_rest_comment tests": [[50, "is-rest-comment-tests"]], "Classifier tests": [[50, "classifier-tests"]], "reST generation tests": [[50, "rest-generation-tests"]], "Lexer cache tests": [[50, "lexer-cache-tests"]], "Filename index tests": [[50, "filename-index-tests"]], "Set-line tests": [[50, "set-line-tests"]], "Streaming tests": [[50, "streaming-tests"]], "Profiling tests": [[50, "profiling-tests"]], "CommentDelimiterInfo_test.py - Unit testing": [[51, "docname-unit-testing"]], "ConversionCache_test.py - Unit testing": [[52, "docname-unit-testing"]], "HtmlToCode_test.py - Unit testing": [[53, "htmltocode-test-py-unit-testing"]], "IncrementalClassifier_test.py - Unit testing": [[54, "docname-unit-testing"]], "PythonScanner_test.py - Unit testing": [[55, "docname-unit-testing"]], "RestToCode_test.py - Unit testing": [[56, "resttocode-test-py-unit-testing"]], "Server_test.py - Unit testing": [[57, "docname-unit-testing"]], "mdbook_CodeChat_test.py - Unit testing": [[58, "docname-unit-testing"]]}, "indexentries": {}})
\ No newline at end of file
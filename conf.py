@@ -150,6 +150,41 @@ CodeChat_lexer_for_glob = {
     ".flake8": "INI",
 }
 
+# **CodeChat note:** _`CodeChat_use_snapshot`: True to find source files
+# using the snapshot of the `supported globs <get_supported_globs>` which ships
+# with CodeChat, instead of examining every Pygments lexer. This speeds up
+# the start of a build, but omits globs for lexers provided by plugins.
+##CodeChat_use_snapshot = False
+
+# **CodeChat note:** _`CodeChat_docstrings`: True to render Python docstrings
+# as comments; False to leave them as code. See `docstrings <docstrings>`.
+CodeChat_docstrings = True
+
+# **CodeChat note:** _`CodeChat_cache_dir`: a directory in which to cache
+# source code converted to reST or Markdown, so that rebuilding unchanged
+# source files reads the converted result from the cache; a relative path is
+# relative to the directory containing this file. None disables the cache. See
+# `ConversionCache`.
+CodeChat_cache_dir = None
+
+# **CodeChat note:** _`CodeChat_cache_max_size`: the maximum size of this
+# cache, in bytes. When the cache grows larger, it removes the least-recently
+# used results.
+##CodeChat_cache_max_size = 100 * 2**20
+
+# **CodeChat note:** _`CodeChat_profile`: True to `profile <Profiling>` each
+# conversion of source code, then write these profiles to
+# ``CodeChat-profile.json`` in the doctree directory and log a summary of the
+# slowest files and languages at the end of the build. Setting the
+# ``CODECHAT_PROFILE`` environment variable does the same.
+##CodeChat_profile = False
+
+# **CodeChat note:** _`CodeChat_engine`: the `engine <Engines>` used to
+# classify source code: ``"pygments"`` or ``"fast"``. None uses the
+# ``CODECHAT_ENGINE`` environment variable if it's set, or ``"pygments"``
+# otherwise.
+##CodeChat_engine = None
+
 # `source_encoding <https://www.sphinx-doc.org/en/master/usage/configuration.html#confval-source_encoding>`_:
 # The encoding of source files.
 ##source_encoding = 'utf-8-sig'
@@ -179,12 +179,18 @@ setup(
     extras_require={
         "test": ["pytest", "sphinx>=3", "myst-parser", "black", "flake8"],
         "sphinx": ["sphinx>=3", "myst-parser"],
+        "benchmark": ["pytest-benchmark"],
     },
     # To package data files, I'm using ``include_package_data=True``. See `including data
     # files <http://pythonhosted.org/setuptools/setuptools.html#including-data-files>`_.
     include_package_data=True,
-    # Make it easy to run the mdbooks CodeChat preprocessor.
+    # Make it easy to run the mdbooks CodeChat preprocessor, to manage the conversion cache, and to convert many files at once.
     entry_points={
-        "console_scripts": ["mdbook-CodeChat = CodeChat.mdbook_CodeChat:main"]
+        "console_scripts": [
+            "mdbook-CodeChat = CodeChat.mdbook_CodeChat:main",
+            "CodeChat-cache = CodeChat.ConversionCache:main",
+            "CodeChat-convert = CodeChat.BatchConvert:main",
+            "CodeChat-server = CodeChat.Server:main",
+        ]
     },
 )
@@ -0,0 +1,122 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the BatchConvert module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+import os
+
+# Third-party imports
+# -------------------
+# None.
+#
+# Local application imports
+# -------------------------
+from CodeChat.BatchConvert import _lexer_filenames, find_source_files, main
+import CodeChat.CommentDelimiterInfo
+from CodeChat.CodeToRest import code_to_rest_string
+from CodeChat.CodeToMarkdown import code_to_markdown_string
+
+
+# Create a small tree of source files to convert.
+def make_tree(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    files = {
+        "a.py": "# A comment.\nx = 1\n",
+        "sub/b.c": "// A comment.\nint x;\n",
+        ".hidden/c.py": "y = 2\n",
+        "d.txt": "Not source code.\n",
+    }
+    for name, contents in files.items():
+        (tmp_path / name).write_text(contents)
+    return files
+
+
+class TestBatchConvert:
+    # Directories are searched for supported files, skipping hidden directories; globs and files are also accepted.
+    def test_1(self, tmp_path):
+        make_tree(tmp_path)
+        a, b, c = (str(tmp_path / p) for p in ("a.py", "sub/b.c", ".hidden/c.py"))
+        assert find_source_files([str(tmp_path)]) == sorted([a, b])
+        assert find_source_files([str(tmp_path / "**" / "*.c"), a, a]) == sorted([a, b])
+        assert find_source_files([c, str(tmp_path / "*.none")]) == [c]
+        # The snapshot of the supported globs finds the same files, unless they need a lexer from a plugin.
+        assert find_source_files([str(tmp_path)], use_snapshot=True) == sorted([a, b])
+        assert True in CodeChat.CommentDelimiterInfo._supported_globs
+
+    # Convert a tree, then skip files which are up to date.
+    def test_2(self, tmp_path, capsys):
+        files = make_tree(tmp_path)
+        assert main([str(tmp_path), "--jobs", "1"]) == 0
+        out = capsys.readouterr().out
+        assert "Converting 2 of 2 files." in out
+        assert "Converted 2 files" in out
+        for name in ("a.py", "sub/b.c"):
+            assert (tmp_path / (name + ".rst")).read_text() == code_to_rest_string(
+                files[name], filename=name
+            )
+
+        assert main([str(tmp_path), "--jobs", "1"]) == 0
+        assert "Converting 0 of 2 files." in capsys.readouterr().out
+
+        # Make a source file newer than its output.
+        a_rst = tmp_path / "a.py.rst"
+        os.utime(a_rst, (0, 0))
+        assert main([str(tmp_path), "--jobs", "1"]) == 0
+        out = capsys.readouterr().out
+        assert "Converting 1 of 2 files." in out
+        assert " ms  {}".format(tmp_path / "a.py") in out
+
+        assert main([str(tmp_path), "--jobs", "1", "--force"]) == 0
+        assert "Converting 2 of 2 files." in capsys.readouterr().out
+
+    # Convert using a pool of processes, a cache, another output format, and the snapshot of the supported globs.
+    def test_3(self, tmp_path, capsys):
+        files = make_tree(tmp_path)
+        args = [str(tmp_path), "--jobs", "2", "--format", "markdown", "--use-snapshot"]
+        assert main(args + ["--cache-dir", str(tmp_path / ".cache")]) == 0
+        assert "Converted 2 files" in capsys.readouterr().out
+        assert (tmp_path / "a.py.md").read_text() == code_to_markdown_string(
+            files["a.py"], filename="a.py"
+        )
+        assert (tmp_path / ".cache").is_dir()
+
+    # Failures are reported, but don't stop other files from being converted.
+    def test_4(self, tmp_path, capsys):
+        make_tree(tmp_path)
+        assert main([str(tmp_path / "a.py"), str(tmp_path / "d.txt"), "-j", "1"]) == 1
+        out = capsys.readouterr().out
+        assert "d.txt  FAILED: " in out
+        assert "Converted 2 files in" in out and "1 failed." in out
+        assert (tmp_path / "a.py.rst").is_file()
+
+    # Each worker is given one file for each lexer it needs to create, omitting files whose lexer depends on their contents.
+    def test_5(self):
+        assert _lexer_filenames(["a.py", "b.c", "sub/c.py", "d.h", "e.txt"]) == [
+            "a.py",
+            "b.c",
+        ]
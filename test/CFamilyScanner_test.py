@@ -0,0 +1,313 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the CFamilyScanner module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+import ast
+from pathlib import Path
+import random
+import sys
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+from CodeChat.CFamilyScanner import scan_c_family
+import CodeChat.SourceClassifier
+from CodeChat.SourceClassifier import (
+    ENGINE_ENV_VAR,
+    _fast_scanners,
+    _pygments_get_tokens_preprocess,
+    collect_profiles,
+    get_lexer,
+    source_lexer,
+    use_engine,
+)
+
+# The aliases of the lexers this module supports.
+ALIASES = ("c", "cpp", "go", "java", "javascript", "rust", "typescript")
+
+code = {
+    "c": (
+        "#include <stdio.h>\n"
+        "#define MAX(a, b) ((a) > (b) ? (a) : (b)) // A macro.\n"
+        "\n"
+        "// A comment.\n"
+        "int main(int argc, char *argv[]) {\n"
+        "    /* A multi-\n"
+        "       line comment. */\n"
+        '    printf("%s // not a comment\\n", argv[0]);\n'
+        "    char c = '\"';\n"
+        "#if 0\n"
+        "    Not code.\n"
+        "#endif\n"
+        "    return 0;\n"
+        "}\n"
+    ),
+    "cpp": (
+        "// A comment.\n"
+        "class A : public B {\n"
+        "public:\n"
+        '    const char *s = R"x(A raw /* string */)x";\n'
+        "    /* A comment. */ void m() const;\n"
+        "};\n"
+    ),
+    "go": (
+        "// A comment.\n"
+        "func main() {\n"
+        "    s := `A raw // string`\n"
+        "    /* A comment. */\n"
+        "    r := '\\''\n"
+        "}\n"
+    ),
+    "java": (
+        "// A comment.\n"
+        "public class A {\n"
+        "    /* A comment. */\n"
+        '    String s = """\n'
+        "        A text /* block */.\n"
+        '        """;\n'
+        "    @Override public void m(int a) { } // Inline.\n"
+        "}\n"
+    ),
+    "javascript": (
+        "#!/usr/bin/env node\n"
+        "// A comment.\n"
+        "const re = /a\\/* b/g;\n"
+        "const t = `A ${x /* comment */} template // string`;\n"
+        "/* A\n"
+        "   comment. */\n"
+        "x = a / b; // Division.\n"
+    ),
+    "rust": (
+        "//! A doc comment.\n"
+        "// A comment.\n"
+        "fn f<'a>(s: &'a str) -> char {\n"
+        "    /* Nested /* comments */ here. */\n"
+        '    let r = r#"A raw // "string"#;\n'
+        "    #[cfg(test)]\n"
+        "    'x'\n"
+        "}\n"
+    ),
+    "typescript": (
+        "// A comment.\n"
+        "@Component\n"
+        "class A implements B {\n"
+        "    private x: number = 1 / 2; /* A comment. */\n"
+        "}\n"
+    ),
+}
+
+
+# Check that the fast engine classifies ``code_str`` exactly as Pygments does. Return True if the fast engine supports this code, instead of falling back to Pygments.
+def check(code_str, lexer):
+    err, classified_lines = source_lexer(code_str, lexer, engine="pygments")
+    fast_err, fast_lines = source_lexer(code_str, lexer, engine="fast")
+    assert fast_err == err
+    assert list(fast_lines) == list(classified_lines)
+    return (
+        scan_c_family(_pygments_get_tokens_preprocess(lexer, code_str), lexer)
+        is not None
+    )
+
+
+class TestCFamilyScanner:
+    # The fast engine supports, and matches Pygments on, code in each language.
+    def test_1(self):
+        for alias in ALIASES:
+            assert check(code[alias], get_lexer(alias=alias))
+        # C code is also C++ code.
+        assert check(code["c"], get_lexer(alias="cpp"))
+        assert check("", get_lexer(alias="c"))
+
+    # The fast engine falls back to Pygments when it can't match its classification.
+    def test_2(self):
+        # Other languages.
+        assert not check("# A comment.\nx = 1\n", get_lexer(alias="python"))
+        # Lexers with filters.
+        lexer = type(get_lexer(alias="c"))()
+        lexer.add_filter("keywordcase", case="upper")
+        assert not check(code["c"], lexer)
+        # Code which the C lexer's rule for function definitions lexes differently.
+        lexer = get_lexer(alias="c")
+        assert not check("int f(int a /* ) */, int b)\n{\n}\n", lexer)
+        assert not check("int f(int a)\n#if 0\n#endif\n{\n}\n", lexer)
+
+    # Select an engine.
+    def test_3(self, monkeypatch):
+        lexer = get_lexer(alias="c")
+
+        def stages():
+            with collect_profiles() as reports:
+                list(source_lexer(code["c"], lexer)[1])
+            return [stage["stage"] for stage in reports[0]["stages"]]
+
+        assert stages()[0] == "_pygments_lexer"
+        with use_engine("fast"):
+            assert stages()[0] == "_fast_lexer"
+            # None leaves the engine unchanged.
+            with use_engine(None):
+                assert stages()[0] == "_fast_lexer"
+        monkeypatch.setenv(ENGINE_ENV_VAR, "fast")
+        assert stages()[0] == "_fast_lexer"
+        with use_engine("pygments"):
+            assert stages()[0] == "_pygments_lexer"
+        with pytest.raises(ValueError):
+            with use_engine("slow"):
+                pass
+        with pytest.raises(ValueError):
+            source_lexer(code["c"], lexer, engine="slow")
+
+    # Randomly-assembled code matches Pygments, as do the strings in this project's tests and its C++ style guide.
+    def test_4(self):
+        common = [
+            "x",
+            " ",
+            "\n",
+            "  ",
+            "\t",
+            "// c )\n",
+            "/* a */",
+            "/*\n",
+            " * b\n",
+            "*/",
+            "(",
+            ")",
+            ";",
+            "{",
+            "}",
+            '"s"',
+            '"',
+            "'",
+            "'a'",
+            "\\",
+            "\\\n",
+            "/",
+            "*",
+            "1.5",
+            "#",
+        ]
+        fragments = {
+            "c": [
+                "#define X 1\n",
+                "#if 0\n",
+                "#endif\n",
+                "#include <a.h>\n",
+                "  # if 0 \n",
+                "/* c */ #pragma\n",
+                "struct\n  ",
+                "case",
+                ":",
+                "\nlabel:",
+            ],
+            "cpp": ['R"(x)"', 'R"d(x)"d', "u8R", "class\n  ", "namespace", "enum"],
+            "go": ["`raw`", "'\\n'", "'\\u1234'", "func"],
+            "java": [
+                "class",
+                "import static",
+                "var",
+                "record",
+                '"""\n',
+                '"""',
+                "@A",
+                "void m(",
+                "\n\nlabel:",
+            ],
+            "javascript": [
+                "/re/g",
+                "`",
+                "${",
+                "`a${b}c`",
+                "<!--",
+                "return",
+                "[",
+                "]",
+                "=>",
+            ],
+            "rust": [
+                "'a",
+                "b'x'",
+                'r#"x"#',
+                "#[derive(X)]",
+                "/*/**/*/",
+                "/** d */",
+                "/// d\n",
+                "struct",
+                ": &'a",
+                "$x",
+            ],
+        }
+        fragments["cpp"] += fragments["c"]
+        fragments["typescript"] = fragments["javascript"] + ["x : y", "@dec", "type"]
+        rng = random.Random(0)
+        for alias in ALIASES:
+            lexer = get_lexer(alias=alias)
+            choices = common + fragments[alias]
+            for _ in range(300):
+                check(
+                    "".join(rng.choice(choices) for _ in range(rng.randint(0, 25))),
+                    lexer,
+                )
+
+        root = Path(__file__).parents[1]
+        strings = [(root / "docs/style_guide.cpp").read_text(encoding="utf-8")]
+        for path in (root / "test").glob("*.py"):
+            strings += [
+                node.value
+                for node in ast.walk(ast.parse(path.read_text(encoding="utf-8")))
+                if isinstance(node, ast.Constant) and isinstance(node.value, str)
+            ]
+        for alias in ALIASES:
+            lexer = get_lexer(alias=alias)
+            for string in strings:
+                check(string, lexer)
+
+    # The fast engine uses Pygments with another version of Pygments, or if its scanners can't be loaded.
+    def test_5(self, monkeypatch):
+        lexer = get_lexer(alias="c")
+
+        def fast_stage():
+            _fast_scanners.cache_clear()
+            with collect_profiles() as reports, use_engine("fast"):
+                list(source_lexer(code["c"], lexer)[1])
+            return reports[0]["stages"][0]["stage"]
+
+        try:
+            assert fast_stage() == "_fast_lexer"
+            with monkeypatch.context() as m:
+                m.setattr(
+                    CodeChat.SourceClassifier, "FAST_ENGINE_PYGMENTS_VERSION", (2, 1)
+                )
+                assert fast_stage() == "_pygments_lexer"
+            with monkeypatch.context() as m:
+                # This makes importing the module raise an ImportError.
+                m.setitem(sys.modules, "CodeChat.CFamilyScanner", None)
+                assert fast_stage() == "_pygments_lexer"
+        finally:
+            _fast_scanners.cache_clear()
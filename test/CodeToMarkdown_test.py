@@ -38,7 +38,13 @@
 
 # Local application imports
 # -------------------------
-from CodeChat.CodeToMarkdown import code_to_markdown_string, _fence, codechat_style
+from CodeChat.CodeToMarkdown import (
+    code_to_markdown_string,
+    code_to_markdown_file,
+    iter_markdown,
+    _fence,
+    codechat_style,
+)
 
 
 # Define the Markdown put at the beginning of any the outputs of ``code_to_markdown_string``.
@@ -116,3 +122,15 @@ class TestCodeToMarkdown(object):
             + code(" x = 1\n"),
             "Python",
         )
+
+    # The pieces yielded by ``iter_markdown`` and the file written by ``code_to_markdown_file`` match the output of ``code_to_markdown_string``.
+    def test_6(self, tmp_path):
+        code_str = "# a\nx = 1\nif 1:\n    # b\n    y = 2\n"
+        output = code_to_markdown_string(code_str, alias="python")
+        chunks = list(iter_markdown(code_str, alias="python"))
+        assert len(chunks) > 1
+        assert "".join(chunks) == output
+        source_path = tmp_path / "foo.py"
+        source_path.write_text(code_str)
+        code_to_markdown_file(str(source_path))
+        assert (tmp_path / "foo.py.md").read_text() == output
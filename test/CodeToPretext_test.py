@@ -38,7 +38,11 @@ from textwrap import dedent
 #
 # Local application imports
 # -------------------------
-from CodeChat.CodeToPretext import code_to_pretext_string
+from CodeChat.CodeToPretext import (
+    code_to_pretext_string,
+    code_to_pretext_file,
+    iter_pretext,
+)
 
 
 # Globals
@@ -113,3 +117,22 @@ class TestCodeToPretext(object):
             "Python",
             parse_error="CodeChat parse error: SyntaxError: unexpected indent (line 1). Docstrings cannot be processed.",
         )
+
+    # A closing ``</p>`` is added based on the last line of a comment, not the line which follows it.
+    def test_7(self):
+        self.run("# <p>a</p>\nx = 1\n", "<p>a</p>\nx = 1\n", "Python")
+        self.run(
+            "# a\nx = '</p>'\n", "<p>a</p>\nx = '&lt;/p&gt;'\n", "Python"
+        )
+
+    # The pieces yielded by ``iter_pretext`` and the file written by ``code_to_pretext_file`` match the output of ``code_to_pretext_string``.
+    def test_8(self, tmp_path):
+        code_str = "# a\nx = 1\nif 1:\n    # b\n    y = 2\n"
+        output = code_to_pretext_string(code_str, alias="python")
+        chunks = list(iter_pretext(code_str, alias="python"))
+        assert len(chunks) > 1
+        assert "".join(chunks) == output
+        source_path = tmp_path / "foo.py"
+        source_path.write_text(code_str)
+        code_to_pretext_file(str(source_path))
+        assert (tmp_path / "foo.py.ptx").read_text() == output
@@ -27,17 +27,42 @@
 # Library imports
 # ---------------
 from difflib import unified_diff
+import json
+import logging
 from pathlib import Path
+import pickle
 import subprocess
 import sys
+from types import SimpleNamespace
 
 # Third-party imports
 # -------------------
-# None.
+from docutils import nodes
+from docutils.core import publish_doctree
+from pygments.lexers import TextLexer
+import sphinx.highlighting
+from sphinx.highlighting import PygmentsBridge
 
 # Local application imports
 # -------------------------
-# None.
+from CodeChat.CodeToRest import code_to_rest_string
+from CodeChat.CodeToRestSphinx import (
+    _build_finished,
+    _doctree_read,
+    _env_merge_info,
+    _env_purge_doc,
+    _highlight_block,
+    _profiles,
+    _saved_block_tokens,
+    _saved_tokens,
+    _sphinx_highlight_block,
+)
+from CodeChat.SourceClassifier import (
+    collect_profiles,
+    collect_tokens,
+    get_lexer,
+    use_engine,
+)
 
 
 # Tests
@@ -75,6 +100,113 @@ def test_1():
         raise
 
 
+# Profiles from parallel builds are merged, then summarized at the end of the build.
+def test_2(tmp_path, caplog):
+    app = SimpleNamespace(
+        config=SimpleNamespace(CodeChat_profile=True),
+        env=SimpleNamespace(),
+        doctreedir=str(tmp_path),
+    )
+    # Simulate a parallel read, where another process converts ``b.c``.
+    other = SimpleNamespace()
+    for env, docname, code_str, alias in (
+        (app.env, "a.py", "# a\nx = 1\n", "python"),
+        (other, "b.c", "// b\nint b;\n", "c"),
+        (app.env, "c.py", "# c\n", "python"),
+    ):
+        with collect_profiles() as reports:
+            code_to_rest_string(code_str, alias=alias)
+        reports[0]["docname"] = docname
+        _profiles(env)[docname] = reports[0]
+    _env_merge_info(app, app.env, ["b.c"], other)
+    _env_purge_doc(app, app.env, "c.py")
+
+    with caplog.at_level(logging.INFO):
+        _build_finished(app, None)
+    reports = json.loads((tmp_path / "CodeChat-profile.json").read_text())
+    assert sorted(report["docname"] for report in reports) == ["a.py", "b.c"]
+    assert "CodeChat profile: 2 files converted" in caplog.text
+    assert "a.py (Python, 2 lines)" in caplog.text
+    assert "C (1 files)" in caplog.text
+
+
+# Fenced code is highlighted using the tokens saved when it was converted, producing the same result as lexing it again.
+def test_3(monkeypatch):
+    code_str = (
+        "# A comment.\n"
+        "\n"
+        "def foo(a):\n"
+        '\tx = """A\n'
+        "\n"
+        '  string.\t"""  \n'
+        "\n"
+        "# Another comment.\n"
+        "\f\n"
+        "y = 1\n"
+    )
+    # Don't expand tabs, so that the reST parser does.
+    lexer = get_lexer(alias="python", tabsize=0)
+    with collect_tokens() as token_lists:
+        rest = code_to_rest_string(code_str, lexer=lexer)
+    saved = (lexer, *token_lists[0])
+    app = SimpleNamespace(env=SimpleNamespace(temp_data={"CodeChat_tokens": saved}))
+    doctree = publish_doctree(rest, source_path="foo.py")
+    # Test the patch even if this version of Sphinx doesn't use it.
+    monkeypatch.setattr(PygmentsBridge, "highlight_block", _highlight_block)
+    monkeypatch.setattr(
+        "CodeChat.CodeToRestSphinx._saved_block_tokens", _saved_block_tokens.copy()
+    )
+    _doctree_read(app, doctree)
+    assert not app.env.temp_data
+    # The tokens aren't stored in the doctree; they're found again after Sphinx pickles it.
+    doctree = pickle.loads(pickle.dumps(doctree))
+    blocks = list(doctree.findall(nodes.literal_block))
+    assert len(blocks) == 2
+    assert not [key for node in blocks for key in node.attributes if "CodeChat" in key]
+    for dest in ("html", "latex"):
+        bridge = PygmentsBridge(dest)
+        for node in blocks:
+            assert _saved_tokens(node.rawsource, "python", None, False, node)
+            assert bridge.highlight_block(
+                node.rawsource, "python", location=node
+            ) == _sphinx_highlight_block(
+                bridge, node.rawsource, "python", location=node
+            )
+
+    # Sphinx lexes the code if it's highlighted using another lexer or with options, or if its text changed.
+    node = blocks[0]
+    assert _saved_tokens(node.rawsource, "python", None, False, node)
+    assert _saved_tokens(node.rawsource, "c", None, False, node) is None
+    assert _saved_tokens(node.rawsource, "python", {"a": 1}, False, node) is None
+    assert _saved_tokens(node.rawsource + "x", "python", None, False, node) is None
+
+    # Sphinx also lexes the code if a custom lexer was registered for its language, as ``app.add_lexer`` does.
+    with monkeypatch.context() as m:
+        m.setitem(sphinx.highlighting.lexer_classes, "python", TextLexer)
+        assert _saved_tokens(node.rawsource, "python", None, False, node) is None
+        bridge = PygmentsBridge("html")
+        custom_html = bridge.highlight_block(node.rawsource, "python", location=node)
+        assert custom_html == _sphinx_highlight_block(
+            bridge, node.rawsource, "python", location=node
+        )
+    assert custom_html != bridge.highlight_block(
+        node.rawsource, "python", location=node
+    )
+
+    # The fast engine doesn't run the Pygments lexer, so it provides no tokens.
+    with collect_tokens() as token_lists, use_engine("fast"):
+        code_to_rest_string(code_str, lexer=lexer)
+    assert token_lists == []
+
+    # Without the patch, ``_doctree_read`` saves no tokens.
+    monkeypatch.setattr(PygmentsBridge, "highlight_block", _sphinx_highlight_block)
+    monkeypatch.setattr("CodeChat.CodeToRestSphinx._saved_block_tokens", {})
+    app.env.temp_data["CodeChat_tokens"] = saved
+    _doctree_read(app, doctree)
+    assert not app.env.temp_data
+    assert _saved_tokens(node.rawsource, "python", None, False, node) is None
+
+
 def diff_files(
     # Root of this repo.
     root_path,
@@ -31,6 +31,7 @@
 # Library imports
 # ---------------
 from io import StringIO
+import json
 import re
 import shutil
 from textwrap import dedent
@@ -46,8 +47,15 @@ import pytest
 
 # Local application imports
 # -------------------------
+import CodeChat.SourceClassifier
 from CodeChat.RestToCode import rest_to_code_string, remove_codechat_style
-from CodeChat.CodeToRest import code_to_rest_string, code_to_html_file, _generate_rest
+from CodeChat.CodeToRest import (
+    code_to_rest_string,
+    code_to_rest_file,
+    code_to_html_file,
+    iter_rest,
+    _generate_rest,
+)
 from CodeChat.SourceClassifier import (
     _remove_comment_delim,
     _group_lexer_tokens,
@@ -58,6 +66,11 @@ from CodeChat.SourceClassifier import (
     _is_delim_indented_line,
     _GROUP,
     _pygments_lexer,
+    get_lexer,
+    lexer_cache_info,
+    clear_lexer_cache,
+    collect_profiles,
+    PROFILE_ENV_VAR,
 )
 from CodeChat.CommentDelimiterInfo import COMMENT_DELIMITER_INFO
 
@@ -1180,6 +1193,38 @@ class TestCodeToRest:
             ["Python3"],
         )
 
+    # A docstring nested inside other statements.
+    def test_87(self):
+        self.mt(
+            "try:\n"
+            "    def foo():\n"
+            '        """Docstring."""\n'
+            "except:\n"
+            "    pass\n",
+            bf
+            + " try:\n"
+            "     def foo():\n"
+            + ef
+            + div(4.0, -1)
+            + "Docstring.\n"
+            + div_end
+            + bf
+            + " except:\n"
+            "     pass\n"
+            + ef,
+            ["Python3"],
+        )
+
+    # Docstrings left as code.
+    def test_88(self):
+        rest = code_to_rest_string(
+            "def foo():\n" '    """Docstring."""\n', alias="Python3", docstrings=False
+        )
+        assert (
+            remove_codechat_style(rest)
+            == bf + " def foo():\n" '     """Docstring."""\n' + ef
+        )
+
 
 # Fenced code block testing
 # =========================
@@ -1984,7 +2029,7 @@ main(){
     # ---------------------
     def test_11(self):
         out_stringio = StringIO()
-        _generate_rest([(-1, "\n"), (-1, "code\n"), (-1, "\n")], out_stringio)
+        out_stringio.writelines(_generate_rest([(-1, "\n"), (-1, "code\n"), (-1, "\n")]))
         assert (
             out_stringio.getvalue() ==
             # Note: Not using a """ string, since the string trailing whitespace option in
@@ -1995,7 +2040,7 @@ main(){
 
     def test_12(self):
         out_stringio = StringIO()
-        _generate_rest([(0, "\n"), (0, "comment\n"), (0, "\n")], out_stringio)
+        out_stringio.writelines(_generate_rest([(0, "\n"), (0, "comment\n"), (0, "\n")]))
         assert (
             out_stringio.getvalue()
             == sl(-3)
@@ -2007,5 +2052,134 @@ comment
 
     def test_13(self):
         out_stringio = StringIO()
-        _generate_rest([(3, "\n"), (3, "comment\n"), (3, "\n")], out_stringio)
+        out_stringio.writelines(_generate_rest([(3, "\n"), (3, "comment\n"), (3, "\n")]))
         assert out_stringio.getvalue() == div(1.5, -3) + "\ncomment\n\n" + div_end
+
+    # Lexer cache tests
+    # -----------------
+    # Repeated lookups return the same lexer instance.
+    def test_14(self):
+        clear_lexer_cache()
+        lexer = get_lexer(alias="c")
+        assert get_lexer(alias="c") is lexer
+        cache_info = lexer_cache_info()
+        assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+    # Lookups with different options produce different lexers.
+    def test_15(self):
+        clear_lexer_cache()
+        assert get_lexer(alias="c") is not get_lexer(alias="c", tabsize=8)
+        assert get_lexer(filename="foo.c") is get_lexer(filename="bar/foo.c")
+        assert lexer_cache_info().misses == 3
+
+    # Options which can't be hashed bypass the cache.
+    def test_16(self):
+        clear_lexer_cache()
+        lexer = get_lexer(alias="c", filters=["whitespace"])
+        assert lexer is not get_lexer(alias="c", filters=["whitespace"])
+        assert lexer_cache_info().currsize == 0
+
+    # Filename index tests
+    # --------------------
+    # A file whose extension only one lexer claims doesn't need a guess.
+    def test_17(self, monkeypatch):
+        def no_guess(*args, **kwargs):
+            assert False
+
+        monkeypatch.setattr(
+            CodeChat.SourceClassifier, "guess_lexer_for_filename", no_guess
+        )
+        assert get_lexer(filename="foo.c", code="int i;\n").name == "C"
+        assert get_lexer(filename="Makefile", code="all:\n").name == "Makefile"
+
+    # A file with an ambiguous extension is guessed from the beginning of its contents.
+    def test_18(self):
+        code = "@interface Foo\n@end\n"
+        assert get_lexer(filename="foo.h", code=code).name == "Objective-C"
+        code = "int i;\n" * 10000 + code
+        assert get_lexer(filename="foo.h", code=code).name == "C"
+
+    # Set-line tests
+    # --------------
+    # Errors in comments which follow several set-line directives, including one in an indented comment, report the correct line.
+    def test_19(self):
+        rest = code_to_rest_string(
+            "# a\n"
+            "x = 1\n"
+            "# *b\n"
+            "y = 2\n"
+            "if 1:\n"
+            "    # *c\n"
+            "    z = 3\n"
+            "# d\n"
+            "#\n"
+            "# *e\n",
+            alias="python",
+        )
+        warning_stream = StringIO()
+        core.publish_string(
+            rest,
+            writer_name="html",
+            settings_overrides={"warning_stream": warning_stream},
+        )
+        assert re.findall(r"<string>:(\d+):", warning_stream.getvalue()) == [
+            "3",
+            "6",
+            "10",
+        ]
+
+    # Streaming tests
+    # ---------------
+    # The pieces yielded by ``iter_rest`` and the file written by ``code_to_rest_file`` match the output of ``code_to_rest_string``.
+    def test_20(self, tmp_path):
+        code_str = "# a\nx = 1\nif 1:\n    # b\n    y = 2\n"
+        rest = code_to_rest_string(code_str, alias="python")
+        chunks = list(iter_rest(code_str, alias="python"))
+        assert len(chunks) > 1
+        assert "".join(chunks) == rest
+        source_path = tmp_path / "foo.py"
+        source_path.write_text(code_str)
+        code_to_rest_file(str(source_path), None)
+        assert (tmp_path / "foo.py.rst").read_text() == rest
+
+        # An error while writing the file leaves the existing file unchanged, and no temporary file.
+        source_path.write_text("# \u00e9\n" + code_str, encoding="utf-8")
+        with pytest.raises(UnicodeEncodeError):
+            code_to_rest_file(str(source_path), None, output_encoding="ascii")
+        assert (tmp_path / "foo.py.rst").read_text() == rest
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "foo.py",
+            "foo.py.rst",
+        ]
+
+    # Profiling tests
+    # ---------------
+    # A profile reports each stage of a conversion, without changing its output.
+    def test_21(self):
+        code_str = "# a\nx = 1\n# b\n"
+        with collect_profiles() as reports:
+            rest = code_to_rest_string(code_str, alias="python")
+        assert rest == code_to_rest_string(code_str, alias="python")
+        (report,) = reports
+        assert (report["lexer"], report["chars"]) == ("Python", len(code_str))
+        assert [stage["stage"] for stage in report["stages"]] == [
+            "_pygments_lexer",
+            "_group_lexer_tokens",
+            "_gather_groups_on_newlines",
+            "_classify_groups",
+            "_generate_rest",
+        ]
+        assert report["stages"][3]["items"] == 3
+        assert all(stage["seconds"] >= 0 for stage in report["stages"])
+        assert report["seconds"] == pytest.approx(
+            sum(stage["seconds"] for stage in report["stages"])
+        )
+
+    # The environment variable writes each report to stderr; without it, nothing is written.
+    def test_22(self, monkeypatch, capsys):
+        code_to_rest_string("# a\n", alias="python")
+        assert capsys.readouterr().err == ""
+        monkeypatch.setenv(PROFILE_ENV_VAR, "1")
+        code_to_rest_string("# a\n", alias="python")
+        report = json.loads(capsys.readouterr().err)
+        assert report["stages"][-1]["stage"] == "_generate_rest"
@@ -0,0 +1,152 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the CommentDelimiterInfo module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+import json
+from pathlib import PurePath
+import subprocess
+import sys
+
+# Third-party imports
+# -------------------
+import pygments
+import pytest
+
+# Local application imports
+# -------------------------
+import CodeChat.CommentDelimiterInfo
+from CodeChat.CommentDelimiterInfo import (
+    GlobMatcher,
+    _globs_for_language,
+    _read_snapshot,
+    get_supported_globs,
+)
+
+
+class TestSupportedGlobs:
+    # The snapshot matches the globs computed from the installed Pygments.
+    def test_1(self):
+        globs_for_language = _read_snapshot()
+        if globs_for_language is None:
+            pytest.skip(
+                "The snapshot doesn't match Pygments {}.".format(pygments.__version__)
+            )
+        assert globs_for_language == _globs_for_language(plugins=False)
+        assert get_supported_globs(use_snapshot=True) == frozenset(
+            glob for globs in globs_for_language.values() for glob in globs
+        )
+        assert get_supported_globs(use_snapshot=True) <= get_supported_globs()
+        assert CodeChat.CommentDelimiterInfo.SUPPORTED_GLOBS is get_supported_globs()
+        assert {"*.py", "*.c", "*.js"} <= get_supported_globs()
+
+    # An out-of-date snapshot isn't used.
+    def test_2(self, tmp_path, monkeypatch):
+        snapshot_path = tmp_path / "SupportedGlobs.json"
+        monkeypatch.setattr(
+            CodeChat.CommentDelimiterInfo, "_SNAPSHOT_PATH", snapshot_path
+        )
+        assert _read_snapshot() is None
+        globs_for_language = {language: ["*.x"] for language in _globs_for_language()}
+        snapshot = {"pygments_version": "0.0", "globs_for_language": globs_for_language}
+        snapshot_path.write_text(json.dumps(snapshot))
+        assert _read_snapshot() is None
+        snapshot["pygments_version"] = pygments.__version__
+        snapshot_path.write_text(json.dumps(snapshot))
+        assert _read_snapshot() == globs_for_language
+        del globs_for_language["C"]
+        snapshot_path.write_text(json.dumps(snapshot))
+        assert _read_snapshot() is None
+
+    # By default, the supported globs include those of lexers provided by plugins; the snapshot doesn't.
+    def test_3(self, monkeypatch):
+        get_all_lexers = CodeChat.CommentDelimiterInfo.get_all_lexers
+
+        def get_all_lexers_with_plugin(plugins=True):
+            yield from get_all_lexers(plugins)
+            if plugins:
+                yield ("Python", ("plugin",), ("*.plugin",), ())
+
+        monkeypatch.setattr(
+            CodeChat.CommentDelimiterInfo, "get_all_lexers", get_all_lexers_with_plugin
+        )
+        monkeypatch.setattr(CodeChat.CommentDelimiterInfo, "_supported_globs", {})
+        assert "*.plugin" in get_supported_globs()
+        assert "*.plugin" in CodeChat.CommentDelimiterInfo.SUPPORTED_GLOBS
+        if _read_snapshot() is not None:
+            assert "*.plugin" not in get_supported_globs(use_snapshot=True)
+
+    # Importing CodeChat doesn't compute the supported globs.
+    def test_4(self):
+        code = (
+            "import CodeChat.CodeToRest, CodeChat.CodeToRestSphinx, CodeChat.BatchConvert; "
+            "import CodeChat.CommentDelimiterInfo as c; "
+            "print(c._supported_globs)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out == "{}\n"
+
+
+class TestGlobMatcher:
+    # The matcher agrees with ``Path.match``.
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "foo.py",
+            "dir/foo.c",
+            "foo.tar.gz",
+            ".py",
+            "foo.PY",
+            "foo..py",
+            "foo.py.rst",
+            "Makefile",
+            "Makefile.am",
+            "src/makefile",
+            ".bashrc",
+            ".bash_profile",
+            "index.php5",
+            "icon.xpm",
+            "README",
+            "docs/code.js",
+            "other/docs/code.js",
+            "code.js",
+            "dir/",
+        ],
+    )
+    def test_1(self, filename):
+        patterns = get_supported_globs() | {"docs/*.js", "*.tar.gz", "READ?E"}
+        matcher = GlobMatcher(patterns)
+        expected = any(PurePath(filename).match(pattern) for pattern in patterns)
+        assert matcher.match(filename) == expected
+        # Check the memoized result.
+        assert matcher.match(filename) == expected
+
+    # An empty set of patterns matches nothing.
+    def test_2(self):
+        assert not GlobMatcher([]).match("foo.py")
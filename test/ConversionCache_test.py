@@ -0,0 +1,152 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the ConversionCache module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+# None.
+#
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+from CodeChat.CodeToMarkdown import code_to_markdown_string
+from CodeChat.CodeToPretext import code_to_pretext_string
+from CodeChat.CodeToRest import code_to_rest_string
+import CodeChat.CodeToRest
+from CodeChat.ConversionCache import ConversionCache, main
+from CodeChat import __version__
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    yield cache
+    cache.close()
+
+
+class TestConversionCache:
+    # A cached conversion produces the same output without converting again.
+    def test_1(self, cache, monkeypatch):
+        code = "# A comment.\nx = 1\n"
+        rest = code_to_rest_string(code, alias="python", cache=cache)
+        assert rest == code_to_rest_string(code, alias="python")
+        assert cache.info().entries == 1
+
+        # Prove that a cache hit doesn't convert.
+        def fail(*args):
+            assert False
+
+        monkeypatch.setattr(CodeChat.CodeToRest, "_code_to_rest", fail)
+        assert code_to_rest_string(code, alias="python", cache=cache) == rest
+
+    # Each output format, lexer, lexer option, and docstrings option is cached separately.
+    def test_2(self, cache):
+        code = '"""Doc."""\n# A comment.\n\tx = 1\n'
+        outputs = [
+            code_to_rest_string(code, alias="python", cache=cache),
+            code_to_rest_string(code, alias="python", docstrings=False, cache=cache),
+            code_to_rest_string(code, alias="python", tabsize=8, cache=cache),
+            code_to_rest_string(code, alias="bash", cache=cache),
+            code_to_markdown_string(code, alias="python", cache=cache),
+            code_to_pretext_string(code, alias="python", cache=cache),
+        ]
+        info = cache.info()
+        assert info.entries == 6
+        assert info.counts == {
+            ("markdown", __version__): 1,
+            ("pretext", __version__): 1,
+            ("rest", __version__): 4,
+        }
+        assert outputs[1] == code_to_rest_string(code, alias="python", docstrings=False)
+        assert outputs[2] == code_to_rest_string(code, alias="python", tabsize=8)
+        assert outputs[5] == code_to_pretext_string(code, alias="python")
+
+    # Adding to a full cache evicts the least-recently used entries.
+    def test_3(self, tmp_path):
+        cache = ConversionCache(tmp_path, max_size=25, last_used_interval=0)
+        keys = ["a", "b", "c"]
+        for key in keys:
+            cache.put(key, "rest", "Python", "x" * 10)
+        # Only two entries fit.
+        assert cache.info().entries == 2
+        assert cache.get("a") is None
+        # Using ``b`` makes ``c`` the least-recently used entry.
+        assert cache.get("b") == "x" * 10
+        cache.put("d", "rest", "Python", "y" * 10)
+        assert cache.get("c") is None
+        assert cache.get("b") == "x" * 10
+        assert cache.get("d") == "y" * 10
+        cache.close()
+
+    # Pruning removes entries from other versions of CodeChat, then evicts to the requested size.
+    def test_4(self, cache):
+        cache.put("a", "rest", "Python", "x" * 10)
+        cache.put("b", "rest", "Python", "x" * 10)
+        cache.put("c", "rest", "Python", "x" * 10)
+        cache._connection.execute(
+            "UPDATE conversions SET version = '0.0' WHERE key = 'a'"
+        )
+        assert cache.prune(15) == 2
+        assert cache.get("c") == "x" * 10
+        assert cache.clear() == 1
+        assert cache.info() == (0, 0, {})
+
+    # The command-line interface.
+    def test_5(self, cache, capsys):
+        with pytest.raises(SystemExit):
+            main([str(cache.cache_dir), "info"])
+        assert "No cache found" in capsys.readouterr().err
+
+        code_to_rest_string("x = 1\n", alias="python", cache=cache)
+        main([str(cache.cache_dir), "info"])
+        out = capsys.readouterr().out
+        assert "Entries: 1\n" in out
+        assert "rest (CodeChat {}): 1".format(__version__) in out
+        main([str(cache.cache_dir), "prune", "--max-size", "0"])
+        assert capsys.readouterr().out == "Removed 1 entries.\n"
+        main([str(cache.cache_dir), "clear"])
+        assert capsys.readouterr().out == "Removed 0 entries.\n"
+
+    # Storing and using outputs doesn't examine the entire cache, or record each use.
+    def test_6(self, cache):
+        cache.put("a", "rest", "Python", "x" * 10)
+        statements = []
+        cache._connection.set_trace_callback(statements.append)
+        cache.put("b", "rest", "Python", "x" * 10)
+        cache.put("b", "rest", "Python", "x" * 5)
+        assert cache.get("a") == "x" * 10
+        assert not any("SUM" in statement for statement in statements)
+        assert not any(statement.startswith("UPDATE") for statement in statements)
+        assert cache._size == cache.info().size == 15
+
+        # A new connection starts with the size of the existing cache.
+        other = ConversionCache(cache.cache_dir)
+        other.put("c", "rest", "Python", "x")
+        assert other._size == 16
+        other.close()
@@ -29,15 +29,63 @@
 # These are listed in the order prescribed by `PEP 8
 # <http://www.python.org/dev/peps/pep-0008/#imports>`_.
 #
+# Library imports
+# ---------------
+import io
+
 # Third-party imports
 # -------------------
-# None.
-#
+import pytest
+
 # Local application imports
 # -------------------------
-from CodeChat.RestToCode import html_to_code_file
+from CodeChat.RestToCode import (
+    html_to_code_file,
+    html_to_code_string,
+    iter_html_to_code,
+)
+
+html_doc = (
+    "<html><body>"
+    '<p id="a-b">Text <b>bold</b> and <i>italic</i>, '
+    '<a class="reference external" href="http://example.com">a link</a>, '
+    '<span class="target">target</span>, '
+    '<tt class="docutils literal">lit<span>eral</span></tt>.</p>'
+    '<div class="contents topic"><p>Skipped.</p></div>'
+    '<div style="margin-left:1.0em"><pre>x = 1\ny = 2\n</pre></div>'
+    "<!-- A comment. --><b>bold<i>nested</i></b> after</body></html>"
+)
 
 
 # TODO. See last test in RestToCode_test.py.
 def xtest_1():
     html_to_code_file("Python", "C:\\Users\\Austin\\Desktop\\Test\\RestToCode.html")
+
+
+# Streaming conversion produces the same output as converting a string, regardless of how the HTML is split into chunks.
+@pytest.mark.parametrize("chunk_size", [1, 7, 2**16])
+def test_2(chunk_size):
+    expected = html_to_code_string(html_doc, "Python")
+    assert "**bold**" in expected and "Skipped" not in expected
+    assert (
+        "".join(iter_html_to_code(io.StringIO(html_doc), "Python", chunk_size))
+        == expected
+    )
+    assert (
+        "".join(
+            iter_html_to_code(
+                io.BytesIO(html_doc.encode("utf-8")), "Python", chunk_size
+            )
+        )
+        == expected
+    )
+
+
+# Deeply-nested HTML.
+def test_3():
+    html_str = "<html><body>{}<p>deep</p>{}</body></html>".format(
+        "<div>" * 200, "</div>" * 200
+    )
+    expected = "\n.. set-line:: -3\n\n..\n\n" * 2 + "deep\n"
+    assert html_to_code_string(html_str, "Python") == expected
+    assert "".join(iter_html_to_code(io.StringIO(html_str), "Python")) == expected
@@ -0,0 +1,186 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the PythonScanner module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+from pathlib import Path
+import random
+import sys
+
+# Third-party imports
+# -------------------
+# None.
+
+# Local application imports
+# -------------------------
+import CodeChat.PythonScanner
+from CodeChat.PythonScanner import scan_python
+import CodeChat.SourceClassifier
+from CodeChat.SourceClassifier import (
+    _fast_scanners,
+    _pygments_get_tokens_preprocess,
+    collect_profiles,
+    get_lexer,
+    source_lexer,
+)
+
+py_code = (
+    "#!/usr/bin/env python\n"
+    '"""Module docstring."""\n'
+    "\n"
+    "# A comment.\n"
+    "def foo(a, b):  # An inline comment.\n"
+    '    r"""Function docstring.\n'
+    "\n"
+    "        More.\n"
+    '    """\n'
+    '    x = f"{a + b!r:>{w}} {{ }}"\n'
+    "    y = 1 + \\\n"
+    "        2\n"
+    "    yield from  x\n"
+    "    yield from x\n"
+    "    match x:\n"
+    "        case [a, _]:\n"
+    "            pass\n"
+    "        case _:\n"
+    '            return "{a[" + x + "]}"\n'
+)
+
+
+# Check that the fast engine classifies ``code_str`` exactly as Pygments does. Return True if this module supports this code, instead of falling back to Pygments.
+def check(code_str, lexer, docstrings=True):
+    err, classified_lines = source_lexer(code_str, lexer, docstrings, "pygments")
+    fast_err, fast_lines = source_lexer(code_str, lexer, docstrings, "fast")
+    assert fast_err == err
+    assert list(fast_lines) == list(classified_lines)
+    return (
+        scan_python(_pygments_get_tokens_preprocess(lexer, code_str), lexer, docstrings)
+        is not None
+    )
+
+
+class TestPythonScanner:
+    # The fast engine supports, and matches Pygments on, Python code.
+    def test_1(self):
+        lexer = get_lexer(alias="python")
+        assert check(py_code, lexer)
+        assert check(py_code, lexer, False)
+        assert check("", lexer)
+        assert check("x = 1", lexer)
+
+    # The fast engine falls back to Pygments when it can't match its classification.
+    def test_2(self, monkeypatch):
+        lexer = get_lexer(alias="python")
+        # Code which doesn't parse, with or without docstrings.
+        assert not check("def foo(:\n    pass\n", lexer)
+        assert not check("def foo(:\n    pass\n", lexer, False)
+        # Falling back doesn't parse the code again.
+        python_docstrings = CodeChat.SourceClassifier._python_docstrings
+        parsed = []
+        for module in (CodeChat.SourceClassifier, CodeChat.PythonScanner):
+            monkeypatch.setattr(
+                module,
+                "_python_docstrings",
+                lambda text: parsed.append(text) or python_docstrings(text),
+            )
+        err, classified_lines = source_lexer("def foo(:\n", lexer, True, "fast")
+        assert err.startswith("SyntaxError: ")
+        assert parsed == ["def foo(:\n"]
+        monkeypatch.undo()
+        # Pygments ends this docstring at the escaped quotes.
+        assert not check('def foo():\n    """A \\""""\n', lexer)
+        # Lexers with filters.
+        lexer = type(lexer)()
+        lexer.add_filter("keywordcase", case="upper")
+        assert not check(py_code, lexer)
+        # Other lexers.
+        assert not check("x = 1\n", get_lexer(alias="python2"))
+        assert not check("int x;\n", get_lexer(alias="c"))
+
+    # Randomly-assembled code matches Pygments, as do this project's own source files.
+    def test_3(self):
+        snippets = [
+            '"""Doc."""',
+            "'''Doc.\n\n   More.\n'''",
+            'rb"""x"""',
+            'r"""a\\""""',
+            "x = 1  # c",
+            "# comment",
+            'x = f"""\n{ a\n  + b }\n"""',
+            "x = f'{x=}'",
+            'x = rf"\\{x}"',
+            "def g():\n    yield from  x\n    yield  from x",
+            "async def h():\n    async for a in b: pass",
+            "match x:\n    case _:\n        pass\n    case {'a_': _}: pass",
+            'x = "{a[" + y + "]}"',
+            'x = "%s %d" % (a, b)',
+            'x = "{:^}".format(1)',
+            "x = '\\''",
+            'x = (\n    """Not a docstring."""\n    "s")',
+            "x = 1 + \\\n    2",
+            'def f(): \\\n"""Doc."""',
+            'class C:\n    """Doc.\n\n    More.\n    """\n    x = 1',
+            "from . import (a,\n    b)",
+            "raise X from None",
+            "x = [\n  1,  # c\n  2]",
+            "\f# A form feed.",
+            "x = (1,\n\t2)",
+        ]
+        lexer = get_lexer(alias="python")
+        rng = random.Random(0)
+        for _ in range(300):
+            check(
+                "\n".join(rng.choice(snippets) for _ in range(rng.randint(1, 8))),
+                lexer,
+                rng.random() < 0.8,
+            )
+        for path in (Path(__file__).parents[1] / "CodeChat").glob("*.py"):
+            assert check(path.read_text(encoding="utf-8"), lexer)
+
+    # The fast engine uses Pygments for Python with another version of Pygments, or if this module can't be loaded.
+    def test_4(self, monkeypatch):
+        lexer = get_lexer(alias="python")
+
+        def fast_stage():
+            _fast_scanners.cache_clear()
+            with collect_profiles() as reports:
+                list(source_lexer(py_code, lexer, True, "fast")[1])
+            return reports[0]["stages"][0]["stage"]
+
+        try:
+            assert fast_stage() == "_fast_lexer"
+            with monkeypatch.context() as m:
+                m.setattr(
+                    CodeChat.SourceClassifier, "FAST_ENGINE_PYGMENTS_VERSION", (3, 0)
+                )
+                assert fast_stage() == "_pygments_lexer"
+            with monkeypatch.context() as m:
+                # This makes importing the module raise an ImportError.
+                m.setitem(sys.modules, "CodeChat.PythonScanner", None)
+                assert fast_stage() == "_pygments_lexer"
+        finally:
+            _fast_scanners.cache_clear()
@@ -159,6 +159,11 @@ class TestRestToCodeString(object):
             "CSS",
         )
 
+    # Many alternating comments and code blocks, including ``<div>`` comments.
+    def test_5(self):
+        code = "// Comment\n" "Code\n" "\n" "\t// Indented\n" "\tCode\n"
+        self.mt(code * 2000, code.replace("\t", "    ") * 2000, "C")
+
 
 class TestRestToCodeFileTests(object):
     # Round trip testing in files with a given name
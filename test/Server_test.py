@@ -0,0 +1,155 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the Server module. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+from concurrent.futures import ThreadPoolExecutor
+import json
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+from CodeChat.CodeToMarkdown import code_to_markdown_string
+from CodeChat.CodeToPretext import code_to_pretext_string
+from CodeChat.CodeToRest import code_to_rest_string
+from CodeChat.Server import (
+    CONVERSION_ERROR,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    handle_line,
+    make_socket_server,
+)
+
+code = "# A comment.\nx = 1\n"
+
+
+# Return a JSON-encoded request.
+def request(id_, method, **params):
+    return json.dumps({"jsonrpc": "2.0", "id": id_, "method": method, "params": params})
+
+
+# Each method produces the same output as the function it calls.
+def test_1():
+    for method, convert in (
+        ("to_rest", code_to_rest_string),
+        ("to_markdown", code_to_markdown_string),
+        ("to_pretext", code_to_pretext_string),
+    ):
+        response = json.loads(
+            handle_line(request(1, method, code=code, alias="python"))
+        )
+        assert response == {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": convert(code, alias="python"),
+        }
+    response = json.loads(handle_line(request(2, "to_html", code=code, alias="python")))
+    assert "A comment." in response["result"]
+
+
+# Errors.
+def test_2():
+    def error_code(line):
+        return json.loads(handle_line(line))["error"]["code"]
+
+    assert error_code("{") == PARSE_ERROR
+    assert error_code("[]") == INVALID_REQUEST
+    assert error_code('{"id": 1}') == INVALID_REQUEST
+    assert error_code(request(1, "to_nothing", code=code)) == METHOD_NOT_FOUND
+    assert error_code(request(1, "to_rest")) == INVALID_PARAMS
+    assert error_code(request(1, "to_rest", code=code, color="red")) == INVALID_PARAMS
+    assert error_code(request(1, "to_rest", code=code, alias="xxx")) == CONVERSION_ERROR
+
+
+# Notifications produce no response; a batch produces a list of responses.
+def test_3():
+    notification = json.loads(request(1, "to_rest", code=code, alias="python"))
+    del notification["id"]
+    assert handle_line(json.dumps(notification)) is None
+    batch = [
+        json.loads(request(1, "to_markdown", code=code, alias="python")),
+        notification,
+        json.loads(request(2, "to_pretext", code=code, alias="python")),
+    ]
+    responses = json.loads(handle_line(json.dumps(batch)))
+    assert [response["id"] for response in responses] == [1, 2]
+
+
+# Serve requests over stdin and stdout.
+def test_4():
+    lines = [request(i, "to_markdown", code=code, alias="python") for i in range(5)]
+    cp = subprocess.run(
+        [sys.executable, "-m", "CodeChat.Server"],
+        input="\n".join(lines) + "\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    responses = [json.loads(line) for line in cp.stdout.splitlines()]
+    assert sorted(response["id"] for response in responses) == list(range(5))
+    assert all(
+        response["result"] == code_to_markdown_string(code, alias="python")
+        for response in responses
+    )
+
+
+# Serve several connections over a Unix domain socket.
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Requires Unix sockets.")
+def test_5():
+    with tempfile.TemporaryDirectory() as temp_dir, ThreadPoolExecutor(2) as executor:
+        socket_path = temp_dir + "/CodeChat.sock"
+        server = make_socket_server(socket_path, executor)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            connections = [socket.socket(socket.AF_UNIX) for _ in range(2)]
+            for index, connection in enumerate(connections):
+                connection.connect(socket_path)
+                connection.sendall(
+                    (
+                        request(index, "to_rest", code=code, alias="python") + "\n"
+                    ).encode()
+                )
+            for index, connection in enumerate(connections):
+                with connection, connection.makefile(encoding="utf-8") as f:
+                    response = json.loads(f.readline())
+                assert response["id"] == index
+                assert response["result"] == code_to_rest_string(code, alias="python")
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
@@ -0,0 +1,225 @@
+# .. Copyright (C) 2012-2022 Bryan A. Jones.
+#
+#    This file is part of CodeChat.
+#
+#    CodeChat is free software: you can redistribute it and/or modify it under
+#    the terms of the GNU General Public License as published by the Free
+#    Software Foundation, either version 3 of the License, or (at your option)
+#    any later version.
+#
+#    CodeChat is distributed in the hope that it will be useful, but WITHOUT ANY
+#    WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#    FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+#    details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with CodeChat.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ************************
+# |docname| - Unit testing
+# ************************
+# This test bench exercises the mdbook preprocessor. To run, execute ``pytest`` from the command line.
+#
+# Imports
+# =======
+# These are listed in the order prescribed by `PEP 8
+# <http://www.python.org/dev/peps/pep-0008/#imports>`_.
+#
+# Library imports
+# ---------------
+import copy
+import io
+import json
+import sys
+
+# Third-party imports
+# -------------------
+import pytest
+
+# Local application imports
+# -------------------------
+from CodeChat.CodeToMarkdown import code_to_markdown_string
+from CodeChat.CommentDelimiterInfo import GlobMatcher, get_supported_globs
+from CodeChat.ConversionCache import ConversionCache
+from CodeChat import mdbook_CodeChat
+from CodeChat.mdbook_CodeChat import BookScanner, flatten_chapters, process_sections
+
+
+# Return an mdbook chapter.
+def chapter(source_path, content, *sub_items):
+    return {
+        "Chapter": {
+            "name": source_path,
+            "content": content,
+            "source_path": source_path,
+            "sub_items": list(sub_items),
+        }
+    }
+
+
+code = "# A comment.\nx = 1\n"
+
+
+def book():
+    return [
+        {"PartTitle": "Part 1"},
+        chapter("intro.md", "# Intro\n"),
+        chapter(
+            "a.py",
+            code,
+            chapter("b.py", "# B.\n", chapter("c.xyz", "# C.\n")),
+            "Separator",
+        ),
+        chapter("d.txt", "Not code.\n"),
+        chapter("e.py", "# E.\n"),
+    ]
+
+
+# Chapters are visited in book order, parents before their children.
+def test_1():
+    assert [chapter["source_path"] for chapter in flatten_chapters(book())] == [
+        "intro.md",
+        "a.py",
+        "b.py",
+        "c.xyz",
+        "d.txt",
+        "e.py",
+    ]
+
+
+# Converting in parallel produces the same book as converting in this process.
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_2(jobs):
+    sections = book()
+    original = copy.deepcopy(sections)
+    process_sections(
+        sections,
+        GlobMatcher(get_supported_globs() | {"*.xyz"}),
+        {"*.xyz": "python"},
+        True,
+        jobs,
+    )
+    contents = [chapter["content"] for chapter in flatten_chapters(sections)]
+    assert contents == [
+        "# Intro\n",
+        code_to_markdown_string(code, alias="python"),
+        code_to_markdown_string("# B.\n", alias="python"),
+        code_to_markdown_string("# C.\n", alias="python"),
+        "Not code.\n",
+        code_to_markdown_string("# E.\n", alias="python"),
+    ]
+    # Only chapter contents change.
+    for chapter in flatten_chapters(sections):
+        chapter["content"] = None
+    for chapter in flatten_chapters(original):
+        chapter["content"] = None
+    assert sections == original
+
+
+# A cache converts only the chapters which changed.
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_3(jobs, tmp_path, capsys, monkeypatch):
+    cache = ConversionCache(tmp_path)
+    source_suffixpatterns = GlobMatcher(get_supported_globs() | {"*.xyz"})
+
+    def build(sections):
+        process_sections(
+            sections, source_suffixpatterns, {"*.xyz": "python"}, True, jobs, cache
+        )
+        return capsys.readouterr().err
+
+    first = book()
+    assert "CodeChat cache: 0 hits, 4 misses." in build(first)
+    second = book()
+    second[-1]["Chapter"]["content"] = "# Edited.\n"
+    err = build(second)
+    assert "CodeChat cache: 3 hits, 1 misses." in err
+    assert "Converted e.py" in err and "Converted a.py" not in err
+    assert [chapter["content"] for chapter in flatten_chapters(second)][:-1] == [
+        chapter["content"] for chapter in flatten_chapters(first)
+    ][:-1]
+    assert second[-1]["Chapter"]["content"] == code_to_markdown_string(
+        "# Edited.\n", alias="python"
+    )
+
+    # On a cache miss, the lexer found when checking the cache is passed on, rather than found again.
+    if jobs == 1:
+        work = []
+        convert_chapter = mdbook_CodeChat._convert_chapter
+        monkeypatch.setattr(
+            mdbook_CodeChat,
+            "_convert_chapter",
+            lambda args: work.append(args) or convert_chapter(args),
+        )
+        third = book()
+        third[2]["Chapter"]["content"] = "# Edited again.\n"
+        build(third)
+        assert work == [("a.py", "# Edited again.\n", "python", True)]
+    cache.close()
+
+
+# The scanner reads the same book as the standard library, except that it discards the content of Markdown chapters.
+def test_4():
+    sections = book()
+    sections[1]["Chapter"]["content"] = 'Quotes "\\" and \\\\", unicode é.\n'
+    sections.append({"Chapter": {"content": "Draft.", "source_path": None}})
+    context = {"config": {"content": "x"}, "n": [1, -2.5e3, True, False, None]}
+    for text in (
+        json.dumps([context, {"sections": sections}]),
+        json.dumps([context, {"sections": sections}], indent=3, ensure_ascii=False),
+    ):
+        scanner = BookScanner(text)
+        assert scanner.context == context
+        scanned = scanner.book["sections"]
+        assert scanned[0] == sections[0]
+        assert scanned[1]["Chapter"]["content"] is BookScanner.DISCARDED
+        assert scanned[2:] == sections[2:]
+
+        # Without changes, the scanner writes back the input.
+        output = io.StringIO()
+        scanner.dump(output.write)
+        assert json.loads(output.getvalue()) == {"sections": sections}
+        assert output.getvalue() in text
+
+        # It writes the changed content of converted chapters.
+        scanned[2]["Chapter"]["content"] = "Converted é."
+        scanned[-1]["Chapter"]["content"] = "Draft 2."
+        output = io.StringIO()
+        scanner.dump(output.write)
+        expected = copy.deepcopy(sections)
+        expected[2]["Chapter"]["content"] = "Converted é."
+        expected[-1]["Chapter"]["content"] = "Draft 2."
+        assert json.loads(output.getvalue()) == {"sections": expected}
+
+
+# The preprocessor produces the same book, with or without a fast JSON library.
+@pytest.mark.parametrize("fast", [False, True])
+def test_5(fast, monkeypatch):
+    if fast and not mdbook_CodeChat._fast_loads:
+        pytest.skip("Requires orjson or msgspec.")
+    if not fast:
+        monkeypatch.setattr(mdbook_CodeChat, "_fast_loads", None)
+        monkeypatch.setattr(mdbook_CodeChat, "_fast_dumps", None)
+    context = {
+        "root": ".",
+        "config": {"preprocessor": {"CodeChat": {"lexer_for_glob": {}, "jobs": 1}}},
+    }
+    stdin = io.TextIOWrapper(
+        io.BytesIO(json.dumps([context, {"sections": book()}]).encode("utf-8")),
+        encoding="utf-8",
+    )
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["mdbook-CodeChat"])
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(sys, "stdout", stdout)
+    mdbook_CodeChat.main()
+    stdout.flush()
+    output = json.loads(stdout.buffer.getvalue())
+    assert [chapter["content"] for chapter in flatten_chapters(output["sections"])] == [
+        "# Intro\n",
+        code_to_markdown_string(code, alias="python"),
+        code_to_markdown_string("# B.\n", alias="python"),
+        "# C.\n",
+        "Not code.\n",
+        code_to_markdown_string("# E.\n", alias="python"),
+    ]